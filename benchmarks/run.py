@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Run the parser benchmark suite and compare against a stored baseline.
+
+Usage:
+    uv run python benchmarks/run.py                 # compare with baseline.json
+    uv run python benchmarks/run.py --save          # record a new baseline
+    uv run python benchmarks/run.py --only parse.   # run matching stages only
+    uv run python benchmarks/run.py --threshold 10  # fail above +10%
+
+Each stage is repeated --repeat times and its best (minimum) time is
+compared with the baseline's; a stage slower than baseline by more than
+--threshold percent is a regression and makes the run exit with status 1.
+Baselines are machine-specific: record one on the machine you compare on.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stages import Fixture, Stage, build_stages  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_THRESHOLD = 20.0
+DEFAULT_REPEAT = 7
+
+
+def measure(stage: Stage, repeat: int) -> dict:
+    """
+    Time one stage.
+
+    Returns:
+        {"min": seconds, "median": seconds, "repeat": n}
+    """
+    times = []
+    for _ in range(repeat):
+        state = stage.setup()
+        start = time.perf_counter()
+        stage.run(state)
+        times.append(time.perf_counter() - start)
+    return {"min": min(times), "median": statistics.median(times), "repeat": repeat}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Names of stages whose best time regressed past threshold percent.
+
+    Stages missing from the baseline are not compared.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result["min"] > base["min"] * (1 + threshold / 100):
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Baseline JSON file (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Write results as the new baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed slowdown in percent (default: {DEFAULT_THRESHOLD:g})",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Repetitions per stage (default: {DEFAULT_REPEAT})",
+    )
+    parser.add_argument(
+        "--only", default="", help="Only run stages whose name contains this"
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline.exists() and not args.save:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["stages"]
+
+    fx = Fixture()
+    try:
+        results = {}
+        for stage in build_stages(fx):
+            if args.only not in stage.name:
+                continue
+            result = measure(stage, args.repeat)
+            results[stage.name] = result
+
+            line = f"{stage.name:32} {result['min'] * 1000:10.3f} ms"
+            base = baseline.get(stage.name)
+            if base:
+                change = (result["min"] / base["min"] - 1) * 100
+                line += f"  ({change:+6.1f}% vs baseline)"
+            print(line)
+    finally:
+        fx.close()
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "stages": results,
+    }
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.save:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nRegressed by more than {args.threshold:g}%:")
+        for name in regressions:
+            print(f"  - {name}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
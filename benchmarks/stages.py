@@ -0,0 +1,194 @@
+"""
+Benchmark stages for the save parser.
+
+Each stage is a (setup, run) pair: setup builds whatever the measured call
+needs and is not timed; run is the timed call. setup runs before every
+repetition so stages that mutate a save always start from a clean one.
+
+All stages use the sanitized fixture shipped with the tests.
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import zipfile
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from er_save_manager.parser import EventFlags, Save, UserDataX, load_save
+from er_save_manager.parser.buffer_reader import BufferReader
+from er_save_manager.parser.gaitem_map import GaitemMap
+from er_save_manager.parser.inventory_ops import add_item, remove_item, set_quantity
+from er_save_manager.parser.slot_rebuild import rebuild_slot
+from er_save_manager.parser.user_data_10 import UserData10
+
+FIXTURE_ZIP = (
+    Path(__file__).parent.parent / "tests" / "fixtures" / "ER0000_sanitized.co2.zip"
+)
+FIXTURE_NAME = "ER0000_sanitized.co2"
+
+SLOT_DATA_SIZE = 0x280000
+
+# Synthetic item IDs, same as tests/test_inventory_ops.py
+WEAPON_ID = 0x00000000 | 88880000
+GOODS_ID = 0x40000000 | 88880000
+
+
+@dataclass
+class Stage:
+    name: str
+    run: Callable[[object], object]
+    setup: Callable[[], object] = lambda: None
+
+
+class Fixture:
+    """Extracted copy of the sanitized save plus a scratch directory."""
+
+    def __init__(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="er_bench_")
+        self.dir = Path(self._tmp.name)
+        with zipfile.ZipFile(FIXTURE_ZIP) as zf:
+            zf.extract(FIXTURE_NAME, self.dir)
+        self.path = self.dir / FIXTURE_NAME
+        self.save = load_save(str(self.path))
+        self.data = self.path.read_bytes()
+        self.slot_idx = next(
+            i for i, slot in enumerate(self.save.character_slots) if not slot.is_empty()
+        )
+        self.slot_start = self.save.slot_data_offset(self.slot_idx)
+
+    def fresh_save(self) -> Save:
+        return load_save(str(self.path))
+
+    def scratch_copy(self) -> Path:
+        dest = self.dir / "scratch.co2"
+        shutil.copyfile(self.path, dest)
+        return dest
+
+    def close(self) -> None:
+        self._tmp.cleanup()
+
+
+def _flag_ids(count: int = 2000) -> list[int]:
+    """Event flag IDs spread over every block in the BST map."""
+    blocks = sorted(EventFlags._load_bst_map())
+    step = max(1, len(blocks) * 8 // count)
+    return [
+        blocks[i // 8] * EventFlags.FLAG_DIVISOR + (i * 131) % EventFlags.FLAG_DIVISOR
+        for i in range(0, len(blocks) * 8, step)
+    ][:count]
+
+
+def build_stages(fx: Fixture) -> list[Stage]:
+    """All benchmark stages, in report order."""
+    path = str(fx.path)
+    slot = fx.save.character_slots[fx.slot_idx]
+    start = fx.slot_start
+    gaitem_count = len(slot.gaitem_map)
+    gaitem_start = start + slot.gaitem_offsets[0]
+    ud10_start = fx.save._user_data_10_offset
+    flag_ids = _flag_ids()
+
+    def parse_slot(_):
+        f = BufferReader(fx.data, start)
+        return UserDataX.read(f, fx.save.is_ps, start, SLOT_DATA_SIZE)
+
+    def parse_user_data_10(_):
+        f = BufferReader(fx.data, ud10_start)
+        return UserData10.read(f, fx.save.is_ps)
+
+    def dirty_one_slot():
+        save = fx.fresh_save()
+        save.patch(save.slot_data_offset(fx.slot_idx) + 0x100, b"\x01")
+        return save
+
+    def edited_copy():
+        target = fx.scratch_copy()
+        save = load_save(str(target))
+        save.patch(save.slot_data_offset(fx.slot_idx) + 0x100, b"\x01")
+        save.recalculate_checksums()
+        return save, target
+
+    def with_goods():
+        save = fx.fresh_save()
+        add_item(save, fx.slot_idx, GOODS_ID, quantity=1, location="held")
+        return save
+
+    def with_weapon():
+        save = fx.fresh_save()
+        add_item(save, fx.slot_idx, WEAPON_ID, quantity=1, location="held")
+        return save
+
+    def flags_copy():
+        return bytearray(slot.event_flags)
+
+    def get_flags(ef):
+        get = EventFlags.get_flag
+        return [get(ef, flag_id) for flag_id in flag_ids]
+
+    def set_flags(ef):
+        set_flag = EventFlags.set_flag
+        for flag_id in flag_ids:
+            set_flag(ef, flag_id, True)
+
+    return [
+        # Parsing
+        Stage("parse.from_file", lambda _: load_save(path)),
+        Stage("parse.from_file_lazy", lambda _: load_save(path, lazy=True)),
+        Stage("parse.open_mmap", lambda _: Save.open_mmap(path).close()),
+        Stage("parse.user_data_x", parse_slot),
+        Stage(
+            "parse.gaitem_map",
+            lambda _: GaitemMap.decode(fx.data, gaitem_start, gaitem_count, start),
+        ),
+        Stage("parse.user_data_10", parse_user_data_10),
+        # Serialization and checksums
+        Stage("serialize.rebuild_slot", lambda _: rebuild_slot(slot)),
+        Stage(
+            "checksums.full",
+            lambda save: save.recalculate_checksums(full=True),
+            fx.fresh_save,
+        ),
+        Stage(
+            "checksums.incremental",
+            lambda save: save.recalculate_checksums(),
+            dirty_one_slot,
+        ),
+        # Writes
+        Stage(
+            "write.to_file",
+            lambda state: state[0].to_file(str(state[1])),
+            edited_copy,
+        ),
+        Stage(
+            "write.to_file_journaled",
+            lambda state: state[0].to_file(str(state[1]), journaled=True),
+            edited_copy,
+        ),
+        # Inventory ops
+        Stage(
+            "inventory.add_item_goods",
+            lambda save: add_item(save, fx.slot_idx, GOODS_ID, 1, location="held"),
+            fx.fresh_save,
+        ),
+        Stage(
+            "inventory.add_item_weapon",
+            lambda save: add_item(save, fx.slot_idx, WEAPON_ID, 1, location="held"),
+            fx.fresh_save,
+        ),
+        Stage(
+            "inventory.remove_item_weapon",
+            lambda save: remove_item(save, fx.slot_idx, WEAPON_ID, location="held"),
+            with_weapon,
+        ),
+        Stage(
+            "inventory.set_quantity",
+            lambda save: set_quantity(save, fx.slot_idx, GOODS_ID, 50, location="held"),
+            with_goods,
+        ),
+        # Event flags
+        Stage("event_flags.get_flag", get_flags, flags_copy),
+        Stage("event_flags.set_flag", set_flags, flags_copy),
+    ]
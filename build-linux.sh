@@ -33,6 +33,9 @@ else
     echo "Warning: libreadline.so.8 not found, skipping bundle"
 fi
 
+echo "Compiling event flag index..."
+python scripts/compile_flag_index.py
+
 echo "Building GUI with PyInstaller..."
 # shellcheck disable=SC2086
 pyinstaller --clean --noconfirm \
@@ -9,6 +9,7 @@ Usage with pip (activate venv first):
     python build-windows.py build
 """
 
+import subprocess
 import sys
 import sysconfig
 import warnings
@@ -41,6 +42,12 @@ warnings.filterwarnings("ignore", category=SyntaxWarning)
 if sys.platform != "win32":
     sys.exit("This script must be run on Windows to build a Windows binary.")
 
+# Ship the compiled event flag index with src/resources/
+subprocess.run(
+    [sys.executable, str(Path(__file__).parent / "scripts" / "compile_flag_index.py")],
+    check=True,
+)
+
 
 def find_compiled_extension_packages() -> set[str]:
     """Return top-level package names that ship a compiled .pyd extension.
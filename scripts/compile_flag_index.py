@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""Compile eventflag_bst.txt and the flag databases into eventflag_bst.idx."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from er_save_manager.parser.flag_index import (  # noqa: E402
+    compile_flag_index,
+    get_flag_index,
+)
+
+if __name__ == "__main__":
+    index_path = compile_flag_index()
+    index = get_flag_index()
+    print(f"{index_path}: {len(index.blocks)} blocks, {len(index.flag_ids)} flags")
@@ -8,6 +8,7 @@ import os
 import re
 import shutil
 import threading
+import weakref
 import zipfile
 from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
@@ -95,6 +96,13 @@ class BackupManager:
     BACKUP_FOLDER_SUFFIX = ".backups"
     METADATA_FILE = "metadata.json"
 
+    # File states (Save._synced) that checkpoint() has backed up this session,
+    # and the undo histories started from one. A history follows the app's
+    # own writes and reloads (snapshots.carry_over), so a save the game
+    # rewrote comes back with a new history and gets a new backup.
+    _session_backups: set[tuple] = set()
+    _session_histories: weakref.WeakSet = weakref.WeakSet()
+
     def __init__(self, save_path: str | Path):
         """
         Initialize backup manager for a save file.
@@ -351,6 +359,53 @@ class BackupManager:
             save=save,
         )
 
+    def checkpoint(
+        self,
+        description: str = "",
+        operation: str = "",
+        save: Save | None = None,
+    ) -> Path | None:
+        """
+        Mark an undo point before an edit.
+
+        Pushes an in-memory snapshot (parser.snapshots) that stores only the
+        bytes the edit changes, and writes a full file backup unless the file
+        is in a state this session already backed up or has only been
+        written by this app since. Use create_backup() for an explicit
+        on-disk backup.
+
+        Args:
+            description: Optional description of the backup
+            operation: Operation being performed, used as the undo label
+            save: Save object being edited (no snapshot without it)
+
+        Returns:
+            Path to the backup file, or None if none was written
+        """
+        from er_save_manager.parser.save import _file_state
+
+        history = None
+        state = None
+        if save is not None:
+            from er_save_manager.parser.snapshots import snapshots
+
+            history = snapshots(save)
+            history.checkpoint(operation or description)
+            state = save._synced
+        if state is None:
+            state = _file_state(self.save_path)
+
+        backup_path = None
+        if (
+            state not in BackupManager._session_backups
+            and history not in BackupManager._session_histories
+        ):
+            backup_path, _ = self.create_backup(description, operation, save)
+            BackupManager._session_backups.add(state)
+        if history is not None:
+            BackupManager._session_histories.add(history)
+        return backup_path
+
     def list_backups(self) -> list[BackupMetadata]:
         """
         List all backups for this save file.
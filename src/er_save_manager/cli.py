@@ -9,7 +9,8 @@ from pathlib import Path
 from er_save_manager import __version__
 from er_save_manager.backup import BackupManager
 from er_save_manager.fixes import ALL_FIXES, TELEPORT_LOCATIONS, TeleportFix
-from er_save_manager.parser import load_save
+from er_save_manager.parser import Save, load_save
+from er_save_manager.parser import trace as parse_trace
 
 
 def _eprint(msg: str) -> None:
@@ -56,7 +57,9 @@ def cmd_gui(args: argparse.Namespace) -> int:
 def cmd_list(args: argparse.Namespace) -> int:
     """List characters in a save file."""
     save_path = Path(args.save).expanduser()
-    save = load_save(str(save_path))
+    # Read-only listing: memory-mapped, slots are only fully parsed for the
+    # corruption scan (skipped with --quick)
+    save = Save.open_mmap(str(save_path))
 
     print(f"Save file: {save_path.name}")
     print(f"Platform: {'PlayStation' if save.is_ps else 'PC'}")
@@ -73,8 +76,8 @@ def cmd_list(args: argparse.Namespace) -> int:
         level = slot.get_level()
         map_id = slot.map_id.to_decimal() if slot.map_id else "Unknown"
 
-        # Check for issues
-        has_issues, issues = slot.has_corruption()
+        # Check for issues (needs the full slot parse)
+        has_issues, issues = (False, []) if args.quick else slot.has_corruption()
         status = " [ISSUES]" if has_issues else ""
 
         print(f"  Slot {slot_idx + 1}: {name} (Lv.{level}) - Map: {map_id}{status}")
@@ -89,7 +92,7 @@ def cmd_list(args: argparse.Namespace) -> int:
 def cmd_check(args: argparse.Namespace) -> int:
     """Check save file for corruption."""
     save_path = Path(args.save).expanduser()
-    save = load_save(str(save_path))
+    save = Save.open_mmap(str(save_path))
 
     found_issues = False
 
@@ -158,9 +161,9 @@ def cmd_fix(args: argparse.Namespace) -> int:
             print(f"  - Teleport: {result.description}")
 
     if applied_fixes:
-        # Recalculate checksums and save
-        save.recalculate_checksums()
-        save.to_file(str(save_path))
+        # Re-hash every slot (a repair run) and save
+        save.recalculate_checksums(full=True)
+        save.to_file(str(save_path), journaled=True)
         print(f"\nFixed {len(applied_fixes)} issue(s). Save file updated.")
     else:
         print("\nNo fixes needed.")
@@ -168,6 +171,115 @@ def cmd_fix(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_compact(args: argparse.Namespace) -> int:
+    """Compact the gaitem map of a character slot."""
+    from er_save_manager.parser.gaitem_compact import compact_gaitem_map
+
+    save_path = Path(args.save).expanduser()
+    save = load_save(str(save_path))
+    slot_idx = args.slot
+
+    slot = save.character_slots[slot_idx]
+    if slot.is_empty():
+        _eprint(f"Slot {slot_idx + 1} is empty")
+        return 1
+
+    name = slot.get_character_name() or f"Character {slot_idx + 1}"
+    print(f"Compacting gaitem map of slot {slot_idx + 1} ({name})...")
+
+    backup_mgr = BackupManager(save_path)
+    backup_path = backup_mgr.create_pre_write_backup(save, "compact")
+    print(f"Backup created: {backup_path.name}")
+
+    try:
+        report = compact_gaitem_map(save, slot_idx)
+    except ValueError as e:
+        _eprint(f"Compaction failed: {e}")
+        return 1
+
+    print(f"  Entries moved: {report.moved}")
+    print(f"  Duplicate entries freed: {report.freed}")
+    print(f"  Free entries kept for Ashes of War: {report.gem_pool}")
+    print(f"  Bytes reclaimed: {report.reclaimed_bytes}")
+    print(
+        f"  Trailing padding: {report.trailing_zeros_before} -> "
+        f"{report.trailing_zeros_after} bytes"
+    )
+
+    if report.changed:
+        save.recalculate_checksums()
+        save.to_file(str(save_path), journaled=True)
+        print("\nSave file updated.")
+    else:
+        print("\nGaitem map already compact.")
+
+    return 0
+
+
+def _load_backup(save_path: Path, backup_name: str) -> Save:
+    """Parse a backup of save_path (zip, gzip or plain) without restoring it."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / save_path.name
+        BackupManager(save_path).restore_to_new_file(backup_name, target)
+        return load_save(str(target), lazy=True)
+
+
+def cmd_flag_diff(args: argparse.Namespace) -> int:
+    """List event flags that differ between two character slots."""
+    from er_save_manager.parser.flag_diff import diff_slots
+
+    save_path = Path(args.save).expanduser()
+    save = load_save(str(save_path), lazy=True)
+    slot_idx = args.slot
+    other_slot_idx = slot_idx if args.against_slot is None else args.against_slot
+
+    if args.backup:
+        try:
+            other = _load_backup(save_path, args.backup)
+        except FileNotFoundError as e:
+            _eprint(str(e))
+            return 1
+        source = f"backup {args.backup}"
+    elif args.against:
+        other = load_save(str(Path(args.against).expanduser()), lazy=True)
+        source = Path(args.against).name
+    else:
+        other = save
+        source = save_path.name
+    source = f"{source} slot {other_slot_idx + 1}"
+
+    try:
+        diff = diff_slots(other, other_slot_idx, save, slot_idx)
+    except ValueError as e:
+        _eprint(f"Cannot compare: {e}")
+        return 1
+
+    changes = [c for c in diff.changes if c.known] if args.known else diff.changes
+    print(f"Event flags changed from {source} to {save_path.name} slot {slot_idx + 1}:")
+    print(
+        f"  {len(diff.turned_on)} turned on, {len(diff.turned_off)} turned off"
+        + (f", {len(changes)} known" if args.known else "")
+    )
+    print()
+    for change in changes:
+        parts = [change.name] if change.name else []
+        if change.category:
+            category = " / ".join(filter(None, (change.category, change.subcategory)))
+            parts.append(f"[{category}]")
+        if change.quests:
+            parts.append(f"(quest: {', '.join(change.quests)})")
+        label = " ".join(parts)
+        print(
+            f"  {'+' if change.after else '-'} {change.flag_id:>10}  {label}".rstrip()
+        )
+    if diff.unmapped_bytes:
+        print(f"\n  {diff.unmapped_bytes} changed bytes outside any known flag block")
+
+    return 0
+
+
 def cmd_backup_create(args: argparse.Namespace) -> int:
     """Create a backup of the save file."""
     save_path = Path(args.save).expanduser()
@@ -222,6 +334,31 @@ def cmd_backup_restore(args: argparse.Namespace) -> int:
         return 1
 
 
+def cmd_trace(args: argparse.Namespace) -> int:
+    """Show a JSON load/save trace."""
+    data = parse_trace.load(Path(args.file).expanduser())
+    events = data["events"]
+
+    print(f"Trace: {args.file} ({len(events)} events)")
+    print()
+    print(parse_trace.format_summary(events))
+
+    if args.events:
+        print()
+        for event in events:
+            indent = "  " * event.get("depth", 0)
+            extra = {
+                k: v
+                for k, v in event.items()
+                if k not in ("name", "start_ms", "duration_ms", "depth")
+            }
+            print(
+                f"{event['start_ms']:10.2f} ms  {indent}{event['name']} "
+                f"{event['duration_ms']:.2f} ms {extra if extra else ''}".rstrip()
+            )
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build argument parser."""
     p = argparse.ArgumentParser(
@@ -229,6 +366,11 @@ def build_parser() -> argparse.ArgumentParser:
         description="Elden Ring Save Manager - Editor, Backup Manager, and Corruption Fixer",
     )
     p.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    p.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Record per-stage load/save timings and write them to FILE as JSON",
+    )
 
     sub = p.add_subparsers(dest="command", metavar="COMMAND")
 
@@ -241,6 +383,12 @@ def build_parser() -> argparse.ArgumentParser:
     p_list.add_argument("--save", required=True, help="Path to save file")
     p_list.add_argument("-a", "--all", action="store_true", help="Show empty slots")
     p_list.add_argument("-v", "--verbose", action="store_true", help="Show issues")
+    p_list.add_argument(
+        "-q",
+        "--quick",
+        action="store_true",
+        help="Skip the corruption scan ([ISSUES] markers) for a faster listing",
+    )
     p_list.set_defaults(_handler=cmd_list)
 
     # check command
@@ -261,6 +409,42 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_fix.set_defaults(_handler=cmd_fix)
 
+    # compact command
+    p_compact = sub.add_parser(
+        "compact", help="Compact the gaitem map of a character slot"
+    )
+    p_compact.add_argument("--save", required=True, help="Path to save file")
+    p_compact.add_argument(
+        "--slot", required=True, type=_parse_slot, help="Character slot (1-10)"
+    )
+    p_compact.set_defaults(_handler=cmd_compact)
+
+    # flag-diff command
+    p_flag_diff = sub.add_parser(
+        "flag-diff",
+        help="List event flags that differ from a backup, another save or slot",
+    )
+    p_flag_diff.add_argument("--save", required=True, help="Path to save file")
+    p_flag_diff.add_argument(
+        "--slot", required=True, type=_parse_slot, help="Character slot (1-10)"
+    )
+    p_flag_against = p_flag_diff.add_mutually_exclusive_group()
+    p_flag_against.add_argument(
+        "--backup", help="Compare against this backup of the save (filename)"
+    )
+    p_flag_against.add_argument("--against", help="Compare against another save file")
+    p_flag_diff.add_argument(
+        "--against-slot",
+        type=_parse_slot,
+        help="Slot to compare against (1-10, default: --slot)",
+    )
+    p_flag_diff.add_argument(
+        "--known",
+        action="store_true",
+        help="Only list flags named in the event flag or quest databases",
+    )
+    p_flag_diff.set_defaults(_handler=cmd_flag_diff)
+
     # backup commands
     p_backup = sub.add_parser("backup", help="Backup management")
     backup_sub = p_backup.add_subparsers(dest="backup_command", metavar="ACTION")
@@ -279,8 +463,13 @@ def build_parser() -> argparse.ArgumentParser:
     p_backup_restore.add_argument("--backup", required=True, help="Backup filename")
     p_backup_restore.set_defaults(_handler=cmd_backup_restore)
 
-    p_gui = sub.add_parser("gui", help="Launch graphical interface")
-    p_gui.set_defaults(_handler=cmd_gui)
+    # trace command
+    p_trace = sub.add_parser("trace", help="Show a load/save trace (see --trace)")
+    p_trace.add_argument("file", help="Trace JSON file")
+    p_trace.add_argument(
+        "--events", action="store_true", help="Also list every recorded event"
+    )
+    p_trace.set_defaults(_handler=cmd_trace)
 
     return p
 
@@ -303,6 +492,9 @@ def main(argv: list[str] | None = None) -> int:
         parser.print_help()
         return 2
 
+    if args.trace:
+        parse_trace.enable()
+
     try:
         return int(handler(args))
     except SystemExit:
@@ -316,6 +508,11 @@ def main(argv: list[str] | None = None) -> int:
 
             traceback.print_exc()
         return 1
+    finally:
+        if args.trace:
+            trace = parse_trace.disable()
+            if trace is not None:
+                trace.save(Path(args.trace).expanduser())
 
 
 if __name__ == "__main__":
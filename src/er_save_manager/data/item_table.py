@@ -0,0 +1,773 @@
+"""
+Elden Ring Item Traits Table
+
+Everything inventory code needs to know about an item id before adding it -
+category, key or common list, gaitem entry size, largest stack held and in
+storage, reinforcement and upgrade cap - packed into one 64-bit word per
+full item id, so one dict lookup answers all of it.
+
+The table is generated from the ItemDatabase (the CSVs under data/items)
+and KEY_ITEM_BASE_IDS, and cached next to the CSVs in item_table.bin. The
+cache is keyed on the item files' sizes and mtimes, the key id list and the
+word format; a stale cache is rebuilt, and one that cannot be written (a
+read-only install) only means the table is built once per process.
+
+Word layout, low bit first:
+  0-3    category (full id >> 28)
+  4      key item (stored in key_items, not common_items)
+  5      known (in the item files or KEY_ITEM_BASE_IDS)
+  6-7    gaitem size: 0 none, 1 = 8 (gem), 2 = 16 (armor), 3 = 21 (weapon)
+  8-9    reinforcement: 0 standard, 1 somber, 2 ash, 3 none
+  10-14  explicit upgrade cap + 1, 0 to derive it from the reinforcement
+  16-31  max stack held, 0 if unknown
+  32-47  max stack in storage, 0 if unknown
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from er_save_manager.data.item_database import Item, ItemDatabase
+
+ITEMS_DIR = Path(__file__).parent / "items"
+CACHE_PATH = ITEMS_DIR / "item_table.bin"
+
+# Upgrade caps by reinforcement type; Convergence caps standard/somber at 15
+UPGRADE_CAPS = {"standard": 25, "somber": 10, "ash": 10, "none": 0}
+CONVERGENCE_UPGRADE_CAP = 15
+
+_CAT_WEAPON = 0x00000000
+_CAT_GOODS = 0x40000000
+
+# Bump when the word layout or how a word is derived from an Item changes
+_FORMAT = 1
+_MAGIC = b"ERIT"
+_HEADER = struct.Struct("<4sI16sII")  # magic, format, signature, counts
+
+_GAITEM_SIZES = (0, 8, 16, 21)
+_GAITEM_SIZE_BY_CATEGORY = {0x0: 21, 0x1: 16, 0x8: 8}  # weapon, armor, gem
+_REINFORCEMENTS = ("standard", "somber", "ash", "none")
+
+# Goods base IDs (without 0x40000000) that go in key_items, not common_items.
+# Sourced from KeyItems.csv plus cookbooks/whetblades which appear in separate
+# CSVs. The goods CSVs do not carry the game's goods type, so key placement
+# cannot be derived from them and this list stays the source for that bit.
+KEY_ITEM_BASE_IDS: frozenset[int] = frozenset(
+    [
+        # Multiplayer items
+        100,  # Tarnished's Furled Finger
+        101,  # Duelist's Furled Finger
+        102,  # Bloody Finger
+        103,  # Finger Severer
+        104,  # White Cipher Ring
+        105,  # Blue Cipher Ring
+        106,  # Tarnished's Wizened Finger
+        107,  # Phantom Bloody Finger
+        108,  # Taunter's Tongue
+        109,  # Small Golden Effigy
+        110,  # Small Red Effigy
+        111,  # Festering Bloody Finger
+        112,  # Recusant Finger
+        113,  # Phantom Bloody Finger
+        114,  # Phantom Recusant Finger
+        115,  # Memory of Grace
+        130,  # Spectral Steed Whistle
+        135,  # Phantom Great Rune
+        # Great Runes (powered)
+        191,  # Godrick's Great Rune
+        192,  # Radahn's Great Rune
+        193,  # Morgott's Great Rune
+        194,  # Rykard's Great Rune
+        195,  # Mohg's Great Rune
+        196,  # Malenia's Great Rune
+        # Other key items
+        2090,  # Deathroot
+        8000,  # Stonesword Key
+        8010,  # Rusty Key
+        8102,  # Lucent Baldachin's Blessing
+        8105,  # Dectus Medallion (Left)
+        8106,  # Dectus Medallion (Right)
+        8107,  # Rold Medallion
+        8109,  # Academy Glintstone Key
+        8111,  # Carian Inverted Statue
+        8121,  # Dark Moon Ring
+        8126,  # Fingerprint Grape
+        8127,  # Letter from Volcano Manor
+        8128,  # Tonic of Forgetfulness
+        8129,  # Serpent's Amnion
+        8130,  # Rya's Necklace
+        8131,  # Irina's Letter
+        8132,  # Letter from Volcano Manor
+        8133,  # Red Letter
+        8134,  # Drawing-Room Key
+        8136,  # Rya's Necklace
+        8137,  # Volcano Manor Invitation
+        8142,  # Amber Starlight
+        8143,  # Seluvis's Introduction
+        8144,  # Sellen's Primal Glintstone
+        8146,  # Miniature Ranni
+        # Great Runes (unpowered)
+        8148,  # Godrick's Great Rune (Unpowered)
+        8149,  # Radahn's Great Rune (Unpowered)
+        8150,  # Morgott's Great Rune (Unpowered)
+        8151,  # Rykard's Great Rune (Unpowered)
+        8152,  # Mohg's Great Rune (Unpowered)
+        8153,  # Malenia's Great Rune (Unpowered)
+        # Quest items continued
+        8154,  # Lord of Blood's Favor
+        8155,  # Lord of Blood's Favor (Soaked)
+        8156,  # Burial Crow's Letter
+        8158,  # Spirit Calling Bell
+        8159,  # Fingerslayer Blade
+        8161,  # Sewing Needle
+        8162,  # Gold Sewing Needle
+        8163,  # Tailoring Tools
+        8164,  # Seluvis's Potion
+        8166,  # Amber Draught
+        8167,  # Letter to Patches
+        8168,  # Dancer's Castanets
+        8169,  # Sellian Sealbreaker
+        8171,  # Chrysalids' Memento
+        8172,  # Black Knifeprint
+        8173,  # Letter to Bernahl
+        8174,  # Academy Glintstone Key (Spare)
+        8175,  # Haligtree Secret Medallion (Left)
+        8176,  # Haligtree Secret Medallion (Right)
+        8181,  # Burial Crow's Letter
+        8182,  # Mending Rune of Perfect Order
+        8183,  # Mending Rune of the Death-Prince
+        8184,  # Mending Rune of the Fell Curse
+        8185,  # Larval Tear
+        8186,  # Imbued Sword Key
+        8187,  # Miniature Ranni (Lifeless)
+        8188,  # Golden Tailoring Tools
+        8189,  # Iji's Confession
+        8190,  # Knifeprint Clue
+        8191,  # Cursemark of Death
+        8192,  # Asimi's Husk
+        8193,  # Seedbed Curse
+        8194,  # The Stormhawk King
+        8196,  # Unalloyed Gold Needle
+        8197,  # Sewer-Gaol Key
+        8198,  # Meeting Place Map
+        8199,  # Discarded Palace Key
+        # Crafting
+        8500,  # Crafting Kit
+        # Whetstone / whetblades
+        8590,  # Whetstone Knife
+        8970,  # Iron Whetblade
+        8971,  # Red-Hot Whetblade
+        8972,  # Sanctified Whetblade
+        8973,  # Glintstone Whetblade
+        8974,  # Black Whetblade
+        8975,  # Unalloyed Gold Needle (Snapped)
+        8976,  # Unalloyed Gold Needle (Repaired)
+        8977,  # Valkyrie's Prosthesis
+        8978,  # Sellia's Secret
+        8979,  # Beast Eye
+        8980,  # Weathered Dagger
+        # Great Rune of the Unborn
+        10080,
+        10060,  # Dragon Heart
+        10070,  # Lost Ashes of War
+        # Containers and upgrades
+        10030,  # Memory Stone
+        10040,  # Talisman Pouch
+        9500,  # Cracked Pot
+        9501,  # Ritual Pot
+        9510,  # Perfume Bottle
+        2009500,  # Hefty Cracked Pot
+        # Vanilla cookbooks
+        9300,
+        9301,
+        9302,
+        9303,
+        9305,
+        9306,
+        9307,
+        9308,
+        9309,
+        9310,
+        9311,
+        9312,
+        9313,
+        9320,
+        9321,
+        9322,
+        9323,
+        9325,
+        9326,
+        9327,
+        9328,
+        9329,
+        9330,
+        9331,
+        9340,
+        9341,
+        9342,
+        9343,
+        9344,
+        9345,
+        9346,
+        9347,
+        9348,
+        9360,
+        9361,
+        9363,
+        9364,
+        9365,
+        9380,
+        9383,
+        9384,
+        9385,
+        9386,
+        9387,
+        9388,
+        9389,
+        9390,
+        9391,
+        9392,
+        9400,
+        9401,
+        9402,
+        9403,
+        9420,
+        9421,
+        9422,
+        9423,
+        9440,
+        9441,
+        # DLC key items
+        2008000,  # Miquella's Great Rune
+        2008003,  # Igon's Furled Finger
+        2008004,  # Well Depths Key
+        2008005,  # Gaol Upper Level Key
+        2008006,  # Gaol Lower Level Key
+        2008007,  # Cross Map
+        2008008,  # Hole-Laden Necklace
+        2008011,  # Heart of Bayle
+        2008012,  # New Cross Map
+        2008013,  # Storeroom Key
+        2008014,  # Secret Rite Scroll
+        2008019,  # Black Syrup
+        2008021,  # Messmer's Kindling
+        2008023,  # Keep Wall Key
+        2008033,  # Larval Tear (Spirit)
+        2008036,  # Prayer Room Key
+        # Crystal Tears
+        11000,  # Crimsonspill Crystal Tear
+        11001,  # Greenspill Crystal Tear
+        11002,  # Crimson Crystal Tear
+        11003,  # Crimson Crystal Tear
+        11004,  # Cerulean Crystal Tear
+        11005,  # Cerulean Crystal Tear
+        11006,  # Speckled Hardtear
+        11007,  # Crimson Bubbletear
+        11008,  # Opaline Bubbletear
+        11009,  # Crimsonburst Crystal Tear
+        11010,  # Greenburst Crystal Tear
+        11011,  # Opaline Hardtear
+        11012,  # Winged Crystal Tear
+        11013,  # Thorny Cracked Tear
+        11014,  # Spiked Cracked Tear
+        11015,  # Windy Crystal Tear
+        11016,  # Ruptured Crystal Tear
+        11017,  # Ruptured Crystal Tear
+        11018,  # Leaden Hardtear
+        11019,  # Twiggy Cracked Tear
+        11020,  # Crimsonwhorl Bubbletear
+        11021,  # Strength-knot Crystal Tear
+        11022,  # Dexterity-knot Crystal Tear
+        11023,  # Intelligence-knot Crystal Tear
+        11024,  # Faith-knot Crystal Tear
+        11025,  # Cerulean Hidden Tear
+        11026,  # Stonebarb Cracked Tear
+        11027,  # Purifying Crystal Tear
+        11028,  # Flame-Shrouding Cracked Tear
+        11029,  # Magic-Shrouding Cracked Tear
+        11030,  # Lightning-Shrouding Cracked Tear
+        11031,  # Holy-Shrouding Cracked Tear
+        # DLC Crystal Tears
+        2011000,  # Viridian Hidden Tear
+        2011010,  # Crimsonburst Dried Tear
+        2011020,  # Crimson-Sapping Cracked Tear
+        2011030,  # Cerulean-Sapping Cracked Tear
+        2011040,  # Oil-Soaked Tear
+        2011050,  # Bloodsucking Cracked Tear
+        2011060,  # Glovewort Crystal Tear
+        2011070,  # Deflecting Hardtear
+        # Maps
+        8600,  # Map: Limgrave
+        8601,  # Map: Weeping Peninsula
+        8602,  # Map: Limgrave
+        8603,  # Map: Liurnia
+        8604,  # Map: Liurnia
+        8605,  # Map: Liurnia
+        8606,  # Map: Altus Plateau
+        8607,  # Map: Leyndell
+        8608,  # Map: Mt. Gelmir
+        8609,  # Map: Caelid
+        8610,  # Map: Dragonbarrow
+        8611,  # Map: Mountaintops of the Giants
+        8612,  # Map: Mountaintops of the Giants
+        8613,  # Map: Ainsel River
+        8614,  # Map: Lake of Rot
+        8615,  # Map: Siofra River
+        8616,  # Map: Mohgwyn Palace
+        8617,  # Map: Deeproot Depths
+        8618,  # Map: Consecrated Snowfield
+        # DLC Maps
+        2008600,  # Map: Gravesite Plain
+        2008601,  # Map: Scadu Altus
+        2008602,  # Map: Southern Shore
+        2008603,  # Map: Rauh Ruins
+        2008604,  # Map: Abyss
+        # Convergence Maps (separate IDs from base game)
+        8620,  # Map: Limgrave
+        8621,  # Map: Caelid
+        8622,  # Map: Liurnia
+        8623,  # Map: Altus Plateau
+        8624,  # Map: Mountaintops of the Giants
+        8625,  # Map: Consecrated Snowfield
+        8626,  # Map: Farum Azula
+        8627,  # Map: Underground
+        8628,  # Map: Realm of Shadow
+        8660,  # Map: Mirage Riddle
+        # Bell Bearings and Spellbooks (MerchantItems)
+        8850,  # Conspectus Scroll
+        8851,  # Royal House Scroll
+        8855,  # Fire Monks' Prayerbook
+        8856,  # Giant's Prayerbook
+        8857,  # Godskin Prayerbook
+        8858,  # Two Fingers' Prayerbook
+        8859,  # Assassin's Prayerbook
+        8860,  # Erdtree Prayerbook
+        8861,  # Erdtree Codex
+        8862,  # Golden Order Principia
+        8863,  # Golden Order Principles
+        8864,  # Dragon Cult Prayerbook
+        8865,  # Ancient Dragon Prayerbook
+        8866,  # Academy Scroll
+        8910,  # Pidia's Bell Bearing
+        8911,  # Seluvis's Bell Bearing
+        8912,  # Patches' Bell Bearing
+        8913,  # Sellen's Bell Bearing
+        8915,  # D's Bell Bearing
+        8916,  # Bernahl's Bell Bearing
+        8917,  # Miriel's Bell Bearing
+        8918,  # Gostoc's Bell Bearing
+        8919,  # Thops's Bell Bearing
+        8920,  # Kale's Bell Bearing
+        8921,  # Nomadic Merchant's Bell Bearing [1]
+        8922,  # Nomadic Merchant's Bell Bearing [2]
+        8923,  # Nomadic Merchant's Bell Bearing [3]
+        8924,  # Nomadic Merchant's Bell Bearing [4]
+        8925,  # Nomadic Merchant's Bell Bearing [5]
+        8926,  # Isolated Merchant's Bell Bearing [1]
+        8927,  # Isolated Merchant's Bell Bearing [2]
+        8928,  # Nomadic Merchant's Bell Bearing [6]
+        8929,  # Hermit Merchant's Bell Bearing [1]
+        8930,  # Nomadic Merchant's Bell Bearing [7]
+        8931,  # Nomadic Merchant's Bell Bearing [8]
+        8932,  # Nomadic Merchant's Bell Bearing [9]
+        8933,  # Nomadic Merchant's Bell Bearing [10]
+        8934,  # Nomadic Merchant's Bell Bearing [11]
+        8935,  # Isolated Merchant's Bell Bearing [3]
+        8936,  # Hermit Merchant's Bell Bearing [2]
+        8937,  # Abandoned Merchant's Bell Bearing
+        8938,  # Hermit Merchant's Bell Bearing [3]
+        8939,  # Imprisoned Merchant's Bell Bearing
+        8940,  # Iji's Bell Bearing
+        8941,  # Rogier's Bell Bearing
+        8942,  # Blackguard's Bell Bearing
+        8943,  # Corhyn's Bell Bearing
+        8944,  # Gowry's Bell Bearing
+        8945,  # Bone Peddler's Bell Bearing
+        8946,  # Meat Peddler's Bell Bearing
+        8947,  # Medicine Peddler's Bell Bearing
+        8948,  # Gravity Stone Peddler's Bell Bearing
+        8951,  # Smithing-Stone Miner's Bell Bearing [1]
+        8952,  # Smithing-Stone Miner's Bell Bearing [2]
+        8953,  # Smithing-Stone Miner's Bell Bearing [3]
+        8954,  # Smithing-Stone Miner's Bell Bearing [4]
+        8955,  # Somberstone Miner's Bell Bearing [1]
+        8956,  # Somberstone Miner's Bell Bearing [2]
+        8957,  # Somberstone Miner's Bell Bearing [3]
+        8958,  # Somberstone Miner's Bell Bearing [4]
+        8959,  # Somberstone Miner's Bell Bearing [5]
+        8960,  # Glovewort Picker's Bell Bearing [1]
+        8961,  # Glovewort Picker's Bell Bearing [2]
+        8962,  # Glovewort Picker's Bell Bearing [3]
+        8963,  # Ghost-Glovewort Picker's Bell Bearing [1]
+        8964,  # Ghost-Glovewort Picker's Bell Bearing [2]
+        8965,  # Ghost-Glovewort Picker's Bell Bearing [3]
+        # DLC Bell Bearings
+        2008900,  # Moore's Bell Bearing
+        2008901,  # Ymir's Bell Bearing
+        2008902,  # Herbalist's Bell Bearing
+        2008903,  # Mushroom-Seller's Bell Bearing [1]
+        2008904,  # Mushroom-Seller's Bell Bearing [2]
+        2008905,  # Greasemonger's Bell Bearing
+        2008906,  # Moldmonger's Bell Bearing
+        2008907,  # Igon's Bell Bearing
+        2008908,  # Spellmachinist's Bell Bearing
+        2008909,  # String-Seller's Bell Bearing
+        # Convergence Crystal Tears
+        11032,  # Stone-Shrouding Cracked Tear
+        11033,  # Arcane-Knot Crystal Tear
+        11034,  # Knight's Crystal Tear
+        11035,  # Battlemage's Crystal Tear
+        11036,  # Templar's Crystal Tear
+        11037,  # Barbarian's Crystal Tear
+        11038,  # Assassin's Crystal Tear
+        11039,  # Inquisitor's Crystal Tear
+        11040,  # Rogue's Crystal Tear
+        11041,  # Zealot's Crystal Tear
+        11042,  # Witch's Crystal Tear
+        11043,  # Cultist's Crystal Tear
+        11050,  # Waterblade Cracked Tear
+        11051,  # Stonetalon Cracked Tear
+        11052,  # Windbarb Cracked Tear
+        11053,  # Shadowblade Cracked Tear
+        11054,  # Stoneblade Cracked Tear
+        11055,  # Stonehoof Cracked Tear
+        11056,  # Ceruleanburst Crystal Tear
+        11057,  # Ceruleanspill Crystal Tear
+        # Convergence Bell Bearings
+        8981,  # Shadow Stone Miner's Bell Bearing [1]
+        8982,  # Shadow Stone Miner's Bell Bearing [2]
+        8983,  # Shadow Stone Miner's Bell Bearing [3]
+        8984,  # Somber Shadow Stone Miner's Bell Bearing [1]
+        8985,  # Somber Shadow Stone Miner's Bell Bearing [2]
+        8986,  # Somber Shadow Stone Miner's Bell Bearing [3]
+        # Convergence Steeds
+        2500,  # Funeral Steed
+        2501,  # Frenzied Mule
+        2502,  # Carian Knight Steed
+        2503,  # Erdtree Steed
+        # Convergence Keystones
+        8060,  # Keystone 1
+        8061,  # Keystone 2
+        8062,  # Keystone 3
+        8063,  # Keystone 4
+        8064,  # Keystone 5
+        # Convergence Perfumer items and Putrid Key
+        8138,  # Putrid Key
+        8510,  # Perfumer Hammer Shell
+        8511,  # Perfumer's Fire Core
+        8512,  # Perfumer's Frost Core
+        8513,  # Perfumer's Lightning Core
+        8514,  # Perfumer's Frenzy Core
+        # DLC cookbooks
+        2009301,
+        2009302,
+        2009303,
+        2009304,
+        2009305,
+        2009306,
+        2009307,
+        2009308,
+        2009309,
+        2009310,
+        2009311,
+        2009312,
+        2009313,
+        2009314,
+        2009315,
+        2009316,
+        2009317,
+        2009318,
+        2009319,
+        2009320,
+        2009321,
+        2009322,
+        2009323,
+        2009324,
+        2009325,
+        2009326,
+        2009327,
+        2009328,
+        2009329,
+        2009330,
+        2009331,
+        2009332,
+        2009333,
+        2009334,
+        2009335,
+        2009336,
+        2009337,
+        2009338,
+        2009339,
+        2009340,
+        2009341,
+        2009342,
+        2009343,
+        2009344,
+        2009345,
+    ]
+)
+
+
+class ItemTraits(NamedTuple):
+    """Decoded table word for one item id."""
+
+    category: int  # category bits, full id & 0xF0000000
+    key_item: bool  # goes in key_items rather than common_items
+    gaitem_size: int  # gaitem entry size, 0 for direct-handle items
+    max_held: int  # largest stack held, 0 if unknown
+    max_storage: int  # largest stack in storage, 0 if unknown
+    reinforcement: str  # standard | somber | ash | none
+    max_upgrade: int  # explicit upgrade cap, -1 to derive from reinforcement
+    known: bool  # in the item files or KEY_ITEM_BASE_IDS
+
+    def max_stack(self, location: str) -> int:
+        """Largest stack allowed in location ("held" or "storage"), 0 if unknown."""
+        return self.max_storage if location == "storage" else self.max_held
+
+    def upgrade_cap(
+        self, convergence: bool = False, reinforcement: str | None = None
+    ) -> int:
+        """
+        Highest upgrade level the item accepts.
+
+        Args:
+            convergence: Apply the Convergence standard/somber cap.
+            reinforcement: Use instead of the item's own reinforcement.
+        """
+        if self.max_upgrade >= 0:
+            return self.max_upgrade
+        reinforcement = reinforcement or self.reinforcement
+        if convergence and reinforcement in ("standard", "somber"):
+            return CONVERGENCE_UPGRADE_CAP
+        return UPGRADE_CAPS.get(reinforcement, UPGRADE_CAPS["standard"])
+
+
+def max_quantity(item: Item, location: str) -> int:
+    """Largest stack of item allowed in location ("held" or "storage")."""
+    max_arrow = item.max_arrow_quantity
+    if location == "storage":
+        if item.max_repository_num > 0:
+            return item.max_repository_num
+        return max_arrow if max_arrow > 1 else item.max_num
+    if max_arrow > 1:
+        return max_arrow
+    return item.max_num
+
+
+# ---- word encoding ----------------------------------------------------------
+
+
+def _pack(
+    category: int,
+    key_item: bool = False,
+    known: bool = False,
+    reinforcement: str = "standard",
+    max_upgrade: int = -1,
+    max_held: int = 0,
+    max_storage: int = 0,
+) -> int:
+    code = category >> 28
+    return (
+        code
+        | key_item << 4
+        | known << 5
+        | _GAITEM_SIZES.index(_GAITEM_SIZE_BY_CATEGORY.get(code, 0)) << 6
+        | _REINFORCEMENTS.index(reinforcement) << 8
+        | min(max(max_upgrade + 1, 0), 0x1F) << 10
+        | min(max_held, 0xFFFF) << 16
+        | min(max_storage, 0xFFFF) << 32
+    )
+
+
+@cache
+def _decode(word: int) -> ItemTraits:
+    # Few distinct words exist, so decoded traits are shared
+    return ItemTraits(
+        category=(word & 0xF) << 28,
+        key_item=bool(word >> 4 & 1),
+        gaitem_size=_GAITEM_SIZES[word >> 6 & 3],
+        max_held=word >> 16 & 0xFFFF,
+        max_storage=word >> 32 & 0xFFFF,
+        reinforcement=_REINFORCEMENTS[word >> 8 & 3],
+        max_upgrade=(word >> 10 & 0x1F) - 1,
+        known=bool(word >> 5 & 1),
+    )
+
+
+def _item_word(item: Item) -> int:
+    full_id = item.full_id
+    reinforcement = item.reinforcement
+    if reinforcement not in _REINFORCEMENTS:
+        reinforcement = "standard"
+    if item.category == _CAT_GOODS and "Ashes" in item.category_name:
+        reinforcement = "ash"
+    return _pack(
+        full_id & 0xF0000000,
+        key_item=(
+            item.category == _CAT_GOODS and (full_id & 0x0FFFFFFF) in KEY_ITEM_BASE_IDS
+        ),
+        known=True,
+        reinforcement=reinforcement,
+        max_upgrade=item.max_upgrade,
+        max_held=max_quantity(item, "held"),
+        max_storage=max_quantity(item, "storage"),
+    )
+
+
+# ---- table ------------------------------------------------------------------
+
+
+class ItemTable:
+    """Traits words by full item id, with Convergence overrides kept apart."""
+
+    def __init__(self, words: dict[int, int], convergence: dict[int, int]):
+        self.words = words
+        self.convergence = convergence
+
+    def _word(self, full_item_id: int, convergence: bool) -> int | None:
+        if convergence:
+            word = self.convergence.get(full_item_id)
+            if word is not None:
+                return word
+        return self.words.get(full_item_id)
+
+    def traits(self, full_item_id: int, convergence: bool = False) -> ItemTraits:
+        """
+        Traits of an item id.
+
+        Weapon ids with infusion and upgrade folded in resolve to their base
+        weapon. Ids in neither the item files nor the key list get traits
+        from their category bits alone, with known False and no stack sizes.
+        """
+        full_item_id &= 0xFFFFFFFF
+        word = self._word(full_item_id, convergence)
+        if word is None and full_item_id & 0xF0000000 == _CAT_WEAPON:
+            word = self._word(full_item_id // 10000 * 10000, convergence)
+        if word is None:
+            word = _pack(full_item_id & 0xF0000000)
+        return _decode(word)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+def build_item_table(db: ItemDatabase | None = None) -> ItemTable:
+    """Generate the table from the ItemDatabase and KEY_ITEM_BASE_IDS."""
+    if db is None:
+        from er_save_manager.data.item_database import get_item_database
+
+        db = get_item_database()
+
+    words: dict[int, int] = {}
+    convergence: dict[int, int] = {}
+    for full_id, item in db.items_by_id.items():
+        if not 0 <= full_id <= 0xFFFFFFFF:
+            continue  # placeholder rows such as the empty gem (-1)
+        words[full_id] = _item_word(item)
+        override = db.get_item_by_id(full_id, is_convergence=True)
+        if override is not item:
+            word = _item_word(override)
+            if word != words[full_id]:
+                convergence[full_id] = word
+    for base_id in KEY_ITEM_BASE_IDS:
+        words.setdefault(
+            _CAT_GOODS | base_id, _pack(_CAT_GOODS, key_item=True, known=True)
+        )
+    return ItemTable(words, convergence)
+
+
+# ---- disk cache ---------------------------------------------------------------
+
+
+def _signature() -> bytes:
+    """Digest of everything the table is generated from."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{_FORMAT}|{sys.byteorder}\n".encode())
+    h.update(array("I", sorted(KEY_ITEM_BASE_IDS)).tobytes())
+    for path in sorted(ITEMS_DIR.rglob("*")):
+        if path.suffix in (".csv", ".txt"):
+            st = path.stat()
+            name = path.relative_to(ITEMS_DIR).as_posix()
+            h.update(f"{name}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+    return h.digest()
+
+
+def _read_cache(path: Path, signature: bytes) -> ItemTable | None:
+    try:
+        with open(path, "rb") as f:
+            magic, fmt, sig, n, m = _HEADER.unpack(f.read(_HEADER.size))
+            if (magic, fmt, sig) != (_MAGIC, _FORMAT, signature):
+                return None
+            arrays = []
+            for typecode, count in (("I", n), ("Q", n), ("I", m), ("Q", m)):
+                values = array(typecode)
+                values.fromfile(f, count)
+                arrays.append(values)
+    except (OSError, EOFError, struct.error):
+        return None
+    ids, words, convergence_ids, convergence_words = arrays
+    return ItemTable(
+        dict(zip(ids, words, strict=True)),
+        dict(zip(convergence_ids, convergence_words, strict=True)),
+    )
+
+
+def _write_cache(path: Path, signature: bytes, table: ItemTable) -> None:
+    """Best effort: the cache only saves the next process a rebuild."""
+    parts = [
+        _HEADER.pack(
+            _MAGIC, _FORMAT, signature, len(table.words), len(table.convergence)
+        )
+    ]
+    for mapping in (table.words, table.convergence):
+        parts.append(array("I", mapping.keys()).tobytes())
+        parts.append(array("Q", mapping.values()).tobytes())
+    tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(parts))
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_item_table(cache_path: Path | None = None) -> ItemTable:
+    """
+    Load the table from its cache, generating and caching it when stale.
+
+    Args:
+        cache_path: Cache file, CACHE_PATH by default.
+    """
+    cache_path = cache_path or CACHE_PATH
+    try:
+        signature = _signature()
+    except OSError:
+        return build_item_table()
+    table = _read_cache(cache_path, signature)
+    if table is None:
+        table = build_item_table()
+        _write_cache(cache_path, signature, table)
+    return table
+
+
+_table: ItemTable | None = None
+
+
+def get_item_table() -> ItemTable:
+    global _table
+    if _table is None:
+        _table = load_item_table()
+    return _table
+
+
+def item_traits(full_item_id: int, convergence: bool = False) -> ItemTraits:
+    """Traits of an item id from the shared table; see ItemTable.traits."""
+    return get_item_table().traits(full_item_id, convergence)
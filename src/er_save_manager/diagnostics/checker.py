@@ -5,6 +5,7 @@ import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
+from er_save_manager.parser import trace as parse_trace
 from er_save_manager.platform.utils import PlatformUtils
 
 
@@ -103,6 +104,7 @@ class TroubleshootingChecker:
             results.extend(self._check_save_file_health())
 
         results.extend(self._check_tool_configuration())
+        results.extend(self._check_load_trace())
 
         return results
 
@@ -708,6 +710,19 @@ icacls "{appdata}" /grant %USERNAME%:F /T
 
         return results
 
+    def _check_load_trace(self) -> list[DiagnosticResult]:
+        """Attach the load/save timing trace when tracing is enabled."""
+        trace = parse_trace.active()
+        if trace is None or not trace.events:
+            return []
+        return [
+            DiagnosticResult(
+                name="Load/Save Trace",
+                status="info",
+                message=parse_trace.format_summary(trace.events, limit=12),
+            )
+        ]
+
     def _check_tool_configuration(self) -> list[DiagnosticResult]:
         """Check save manager tool configuration."""
         results = []
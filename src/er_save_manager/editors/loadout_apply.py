@@ -0,0 +1,329 @@
+"""
+Loadout application engine.
+
+apply_loadout places a whole loadout payload (the item dicts the inventory
+editor builds, saves as JSON and shares through
+data.inventory_loadout_sharing) on a character in three passes:
+
+  validate  every entry is checked once: known item (ItemDatabase),
+            location, and quantity and upgrade within the item's limits
+            (the item traits table, data.item_table).
+  dedupe    entries for the same stackable item are merged, and stackable
+            items the character already holds become stack top-ups, found
+            through the slot's handle index (SlotIndex).
+  apply     top-ups and new items are planned in one edit_slot block, so
+            the slot is written back once whatever the loadout size.
+
+Event flags and the matchmaking level that follow an add are left to the
+caller, which gets the placed entries back in the LoadoutResult.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from er_save_manager.data.item_database import ItemCategory, get_item_database
+from er_save_manager.data.item_table import UPGRADE_CAPS, item_traits
+from er_save_manager.parser.inventory_ops import (
+    ItemAlreadyPresentError,
+    _direct_handle,
+    _find_inventory_row,
+    _needs_gaitem,
+    _patch_slot,
+    _plan_add,
+    _plan_set_quantity,
+    _select_inventory,
+    edit_slot,
+)
+from er_save_manager.parser.slot_index import weapon_base
+
+if TYPE_CHECKING:
+    from er_save_manager.data.item_database import Item, ItemDatabase
+    from er_save_manager.parser.save import Save
+
+
+def resolve_item(
+    db: ItemDatabase, full_id: int, is_convergence: bool = False
+) -> Item | None:
+    """
+    Database item a loadout full_id refers to.
+
+    Weapons are stored with infusion and upgrade folded into the id, and
+    upgraded Ashes with the level added to it; both resolve to their base.
+    """
+    item = db.get_item_by_id(full_id, is_convergence)
+    if item is not None:
+        return item
+    cat = full_id & 0xF0000000
+    if cat == ItemCategory.WEAPON:
+        return db.get_item_by_id(weapon_base(full_id), is_convergence)
+    if cat == ItemCategory.GOODS:
+        for delta in range(1, UPGRADE_CAPS["ash"] + 1):
+            item = db.get_item_by_id(full_id - delta, is_convergence)
+            if item is not None and "Ashes" in item.category_name:
+                return item
+    return None
+
+
+@dataclass
+class LoadoutEntry:
+    """One validated payload entry."""
+
+    info: dict[str, Any]
+    item: Item
+    spec: dict[str, Any]
+    max_qty: int
+
+    @property
+    def stackable(self) -> bool:
+        return self.max_qty > 1
+
+
+@dataclass
+class LoadoutResult:
+    """
+    Outcome of apply_loadout.
+
+    items: One dict per payload entry, in order, with keys
+           entry: the payload dict
+           status: "added", "stacked" (merged into an existing or earlier
+                   stack), "skipped" (unique item already held) or "error"
+           error: message, None unless status is "error"
+    """
+
+    items: list[dict[str, Any]] = field(default_factory=list)
+
+    def _with(self, status: str) -> list[dict[str, Any]]:
+        return [item["entry"] for item in self.items if item["status"] == status]
+
+    @property
+    def added(self) -> list[dict[str, Any]]:
+        return self._with("added")
+
+    @property
+    def stacked(self) -> list[dict[str, Any]]:
+        return self._with("stacked")
+
+    @property
+    def skipped(self) -> list[dict[str, Any]]:
+        return self._with("skipped")
+
+    @property
+    def errors(self) -> list[tuple[dict[str, Any], str]]:
+        return [
+            (item["entry"], item["error"])
+            for item in self.items
+            if item["status"] == "error"
+        ]
+
+    @property
+    def count(self) -> int:
+        """Entries that ended up in the inventory."""
+        return len(self.added) + len(self.stacked)
+
+
+def _validate_entry(db: ItemDatabase, info, is_convergence: bool) -> LoadoutEntry | str:
+    if not isinstance(info, dict):
+        return "entry is not an object"
+    try:
+        full_id = int(info["full_id"])
+        qty = int(info.get("qty", 1))
+        upg = int(info.get("upg", 0))
+        aow_id = int(info.get("aow_id") or 0)
+    except (KeyError, TypeError, ValueError):
+        return "missing or invalid full_id, qty, upg or aow_id"
+
+    location = info.get("location", "held")
+    if location not in ("held", "storage"):
+        return f"unknown location {location!r}"
+
+    item = resolve_item(db, full_id, is_convergence)
+    if item is None:
+        return f"unknown item 0x{full_id & 0xFFFFFFFF:08X}"
+
+    traits = item_traits(item.full_id, is_convergence)
+    max_qty = traits.max_stack(location)
+    if not 1 <= qty <= max_qty:
+        return f"quantity must be 1-{max_qty} for this item in {location}"
+
+    reinforcement = info.get("reinforcement") or item.reinforcement
+    if full_id & 0xF0000000 == ItemCategory.WEAPON:
+        cap = traits.upgrade_cap(is_convergence, reinforcement)
+        if not 0 <= upg <= cap:
+            return f"upgrade must be 0-{cap} for this weapon"
+    else:
+        upg = 0
+
+    if aow_id:
+        gem = db.get_item_by_id(aow_id, is_convergence)
+        if gem is None or gem.category != ItemCategory.GEM:
+            return f"unknown Ash of War 0x{aow_id & 0xFFFFFFFF:08X}"
+        if not item.aow_allowed:
+            return f"{item.name} does not take an Ash of War"
+
+    spec = {
+        "full_item_id": full_id,
+        "quantity": qty,
+        "location": location,
+        "upgrade": upg,
+        "gem_full_id": aow_id,
+        "reinforcement": reinforcement,
+        "convergence": is_convergence,
+    }
+    return LoadoutEntry(info, item, spec, max_qty)
+
+
+def validate_loadout(
+    payload, is_convergence: bool = False
+) -> tuple[list[LoadoutEntry | None], list[str | None]]:
+    """
+    Validate every payload entry against the item database and traits table.
+
+    Returns:
+        (entries, errors), both one element per payload entry: a
+        LoadoutEntry and None for a valid entry, None and the message for
+        an invalid one
+    """
+    db = get_item_database()
+    entries: list[LoadoutEntry | None] = []
+    errors: list[str | None] = []
+    for info in payload:
+        checked = _validate_entry(db, info, is_convergence)
+        if isinstance(checked, str):
+            entries.append(None)
+            errors.append(checked)
+        else:
+            entries.append(checked)
+            errors.append(None)
+    return entries, errors
+
+
+def _held_quantity(slot, entry: LoadoutEntry) -> int:
+    """Quantity of entry's item already in its location, 0 if none."""
+    spec = entry.spec
+    inventory = _select_inventory(slot, spec["location"])
+    try:
+        _, _, item_list, inv_slot, _ = _find_inventory_row(
+            slot, inventory, spec["full_item_id"], spec["location"]
+        )
+    except ValueError:
+        return 0
+    return item_list[inv_slot].quantity
+
+
+def _settle(
+    result: LoadoutResult,
+    indices: list[int],
+    status: str,
+    rest: str,
+    error: str | None = None,
+) -> None:
+    """Record the outcome of a group: status for its first entry, rest after."""
+    for n, i in enumerate(indices):
+        result.items[i]["status"] = rest if n else status
+        result.items[i]["error"] = error
+
+
+def apply_loadout(
+    save: Save,
+    slot_idx: int,
+    payload,
+    is_convergence: bool = False,
+    progress: Callable[[int, int], None] | None = None,
+) -> LoadoutResult:
+    """
+    Add every item of a loadout payload to a character in one transaction.
+
+    Args:
+        save: Parsed Save instance.
+        slot_idx: Character slot index 0-9.
+        payload: List of loadout entry dicts (full_id, qty, upg, location,
+                 aow_id, reinforcement, convergence, name_label, ...).
+        is_convergence: Validate against Convergence items and caps.
+        progress: Called as progress(done, total) while entries are placed
+                  (an entry merged into another counts with it); total is
+                  the payload length.
+
+    Returns:
+        LoadoutResult. Checksums are recalculated by the caller.
+
+    Raises:
+        ValueError: Slot is empty.
+    """
+    slot = save.character_slots[slot_idx]
+    if slot.is_empty():
+        raise ValueError(f"slot {slot_idx} is empty")
+
+    entries, errors = validate_loadout(payload, is_convergence)
+    result = LoadoutResult(
+        [
+            {"entry": info, "status": "error", "error": error}
+            for info, error in zip(payload, errors, strict=True)
+        ]
+    )
+
+    # Entries of one stackable item (or one unique direct-handle item) in one
+    # location share a key; the first entry of a key carries the whole group
+    groups: dict[tuple, list[int]] = {}
+    for i, entry in enumerate(entries):
+        if entry is None:
+            continue
+        spec = entry.spec
+        full_id = spec["full_item_id"]
+        if entry.stackable:
+            key = (full_id, spec["location"])
+        elif _needs_gaitem(full_id) or entry.item.category == ItemCategory.TALISMAN:
+            key = (i,)  # every weapon, armor piece and talisman is its own copy
+        else:
+            key = (_direct_handle(full_id), spec["location"])
+        groups.setdefault(key, []).append(i)
+
+    total = len(payload)
+    done = entries.count(None)
+    changed = False
+    with edit_slot(save, slot_idx):
+        for indices in groups.values():
+            first = entries[indices[0]]
+            spec = first.spec
+            # Later entries of a group merge into the first one's stack, or
+            # duplicate a unique item the first one already placed
+            rest = "stacked" if first.stackable else "skipped"
+            try:
+                if first.stackable:
+                    qty = sum(entries[i].spec["quantity"] for i in indices)
+                    held = _held_quantity(slot, first)
+                    if held + qty > first.max_qty:
+                        raise ValueError(
+                            f"{qty} more would exceed the max stack of "
+                            f"{first.max_qty} in {spec['location']} "
+                            f"(already have {held})"
+                        )
+                    if held:
+                        _plan_set_quantity(
+                            slot, spec["full_item_id"], held + qty, spec["location"]
+                        )
+                        status = "stacked"
+                    else:
+                        _plan_add(slot, **{**spec, "quantity": qty})
+                        status = "added"
+                else:
+                    _plan_add(slot, **spec)
+                    status = "added"
+            except ItemAlreadyPresentError:
+                _settle(result, indices, "skipped", "skipped")
+            except ValueError as e:
+                _settle(result, indices, "error", "error", str(e))
+            else:
+                _settle(result, indices, status, rest)
+                changed = True
+            done += len(indices)
+            if progress is not None:
+                progress(done, total)
+        if changed:
+            _patch_slot(save, slot_idx, slot)
+
+    if progress is not None and not groups:
+        progress(total, total)
+    return result
@@ -151,19 +151,22 @@ class WorldStateEditor:
     def _write_map_id_raw(self, map_id: MapId, zero_coords: bool = True) -> None:
         """
         Write map_id to both the header field (offset 0x4) and PlayerCoordinates.map_id
-        (coordinates_offset + 12).
+        (player_coordinates section + 12).
         """
         slot = self._slot
         raw = self._save._raw_data
+        sections = slot.sections
 
         # Header map_id at slot data + 0x4
-        header_offset = slot.data_start + 0x4
+        header_offset = slot.data_start + (
+            sections.start("map_id") if sections.has("map_id") else 0x4
+        )
         raw[header_offset : header_offset + 4] = map_id.data
         slot.map_id = map_id
 
-        # PlayerCoordinates.map_id at coordinates_offset + 12
-        if hasattr(slot, "coordinates_offset") and slot.coordinates_offset:
-            coord_base = slot.coordinates_offset
+        # PlayerCoordinates.map_id at player_coordinates + 12
+        if sections.has("player_coordinates"):
+            coord_base = slot.data_start + sections.start("player_coordinates")
             pc_map_id_offset = coord_base + 12
             raw[pc_map_id_offset : pc_map_id_offset + 4] = map_id.data
             try:
@@ -185,12 +188,12 @@ class WorldStateEditor:
                     pass
 
     def _write_coordinates(self, coords) -> None:
-        """Write player coordinates using parser-tracked coordinates_offset."""
+        """Write player coordinates at the parser-tracked player_coordinates section."""
         slot = self._slot
-        if not hasattr(slot, "coordinates_offset") or slot.coordinates_offset == 0:
-            raise RuntimeError("coordinates_offset not available")
+        if not slot.sections.has("player_coordinates"):
+            raise RuntimeError("player_coordinates offset not available")
 
-        offset = slot.coordinates_offset
+        offset = slot.data_start + slot.sections.start("player_coordinates")
         raw = self._save._raw_data
         raw[offset : offset + 4] = struct.pack("<f", coords.x)
         raw[offset + 4 : offset + 8] = struct.pack("<f", coords.y)
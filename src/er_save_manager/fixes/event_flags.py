@@ -5,7 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from er_save_manager.fixes.base import BaseFix, FixResult
-from er_save_manager.parser.event_flags import CorruptionDetector, CorruptionFixer
+from er_save_manager.parser.event_flags import (
+    CorruptionDetector,
+    CorruptionFixer,
+    write_flags,
+)
 
 if TYPE_CHECKING:
     from er_save_manager.parser import Save
@@ -53,34 +57,21 @@ class EventFlagsFix(BaseFix):
         if not issues:
             return FixResult(applied=False, description="No event flag issues detected")
 
-        # Make event_flags mutable
-        event_flags_mutable = bytearray(slot.event_flags)
-
-        # Apply fixes
-        fixes_count, fix_descriptions = CorruptionFixer.fix_all(
-            event_flags_mutable, issues
-        )
-
-        if fixes_count == 0:
+        # Apply every fix as one batch, in memory and in raw data
+        states, fix_descriptions = CorruptionFixer.fix_states(issues)
+        if not fix_descriptions:
             return FixResult(applied=False, description="Could not apply fixes")
 
-        # Update in memory
-        slot.event_flags = bytes(event_flags_mutable)
+        try:
+            write_flags(save, slot_index, states)
+        except ValueError:
+            return FixResult(applied=False, description="Could not write event flags")
 
-        # Write to raw data
-        if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-            save._raw_data[
-                slot.event_flags_offset : slot.event_flags_offset
-                + len(event_flags_mutable)
-            ] = event_flags_mutable
-
-            return FixResult(
-                applied=True,
-                description=f"Fixed {fixes_count} event flag issue(s)",
-                details=fix_descriptions,
-            )
-
-        return FixResult(applied=False, description="Could not write event flags")
+        return FixResult(
+            applied=True,
+            description=f"Fixed {len(fix_descriptions)} event flag issue(s)",
+            details=fix_descriptions,
+        )
 
 
 class RanniSoftlockFix(BaseFix):
@@ -110,24 +101,20 @@ class RanniSoftlockFix(BaseFix):
         if not self.detect(save, slot_index):
             return FixResult(applied=False, description="Ranni softlock not detected")
 
-        event_flags_mutable = bytearray(slot.event_flags)
-
-        if CorruptionFixer.fix_ranni_softlock(event_flags_mutable):
-            slot.event_flags = bytes(event_flags_mutable)
-
-            if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                save._raw_data[
-                    slot.event_flags_offset : slot.event_flags_offset
-                    + len(event_flags_mutable)
-                ] = event_flags_mutable
-
-                return FixResult(
-                    applied=True,
-                    description="Ranni's Tower soft-lock fixed",
-                    details=[
-                        "Cleared blocking flag 1034500738",
-                        "Enabled 31 progression flags",
-                    ],
-                )
-
-        return FixResult(applied=False, description="Could not apply Ranni fix")
+        states, fixed = CorruptionFixer.fix_states(["ranni_softlock"])
+        try:
+            if fixed:
+                write_flags(save, slot_index, states)
+        except ValueError:
+            fixed = []
+        if not fixed:
+            return FixResult(applied=False, description="Could not apply Ranni fix")
+
+        return FixResult(
+            applied=True,
+            description="Ranni's Tower soft-lock fixed",
+            details=[
+                "Cleared blocking flag 1034500738",
+                "Enabled 31 progression flags",
+            ],
+        )
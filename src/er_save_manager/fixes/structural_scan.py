@@ -14,6 +14,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from er_save_manager.parser.inventory_ops import _patch_slot, _select_inventory
+from er_save_manager.parser.section_table import SECTION_NAMES
 from er_save_manager.parser.slot_rebuild import rebuild_slot_with_map
 
 from .base import BaseFix, FixResult
@@ -50,7 +51,8 @@ class RebuildRoundtripFix(BaseFix):
     Re-serializes the slot from its parsed fields and compares against
     the raw bytes on disk. A mismatch outside
     those means some size-prefixed struct's declared size no longer
-    matches its actual content, or a tracked offset is stale.
+    matches its actual content, or a tracked offset is stale. Stale
+    entries of slot.sections are listed by name.
 
     slot.rest (whatever follows player_data_hash) is excluded on
     purpose, rebuild_slot() itself never writes it, treating it as
@@ -62,9 +64,10 @@ class RebuildRoundtripFix(BaseFix):
         "Checks that the slot re-serializes byte-for-byte up through player_data_hash"
     )
 
-    def _compare(self, save: Save, slot) -> tuple[bytes, bytes, int]:
+    def _compare(self, save: Save, slot) -> tuple[bytes, bytes, int, list[dict]]:
         data_start = slot.data_start
         rebuilt, sections = rebuild_slot_with_map(slot)
+        sections = [section for section in sections if section["name"] != "rest"]
         end = sections[-1]["end"] if sections else len(rebuilt)
         raw = bytearray(save._raw_data[data_start : data_start + end])
         rebuilt = bytearray(rebuilt[:end])
@@ -77,13 +80,13 @@ class RebuildRoundtripFix(BaseFix):
                 raw[s:e] = b"\x00" * (e - s)
                 rebuilt[s:e] = b"\x00" * (e - s)
 
-        return bytes(raw), bytes(rebuilt), end
+        return bytes(raw), bytes(rebuilt), end, sections
 
     def detect(self, save: Save, slot_index: int) -> bool:
         slot = self.get_slot(save, slot_index)
         if slot.is_empty():
             return False
-        raw, rebuilt, _ = self._compare(save, slot)
+        raw, rebuilt, _, _ = self._compare(save, slot)
         return raw != rebuilt
 
     def apply(self, save: Save, slot_index: int) -> FixResult:
@@ -91,7 +94,7 @@ class RebuildRoundtripFix(BaseFix):
         if slot.is_empty():
             return FixResult(applied=False, description="Slot is empty")
 
-        raw, rebuilt, end = self._compare(save, slot)
+        raw, rebuilt, end, sections = self._compare(save, slot)
 
         if raw == rebuilt:
             return FixResult(applied=False, description="Rebuild matches raw data")
@@ -99,15 +102,33 @@ class RebuildRoundtripFix(BaseFix):
         first_diff = next(
             (i for i in range(len(raw)) if raw[i] != rebuilt[i]), len(raw)
         )
+        details = [
+            f"First difference at slot offset 0x{first_diff:x}",
+            f"Compared 0x{end:x} bytes, excluding the slot.rest tail and known-unreliable sections",
+        ]
+        details.extend(self._stale_sections(slot, sections))
         return FixResult(
             applied=False,
             description="Rebuild mismatch detected, no automatic correction available",
-            details=[
-                f"First difference at slot offset 0x{first_diff:x}",
-                f"Compared 0x{end:x} bytes, excluding the slot.rest tail and known-unreliable sections",
-            ],
+            details=details,
         )
 
+    def _stale_sections(self, slot, rebuilt_sections: list[dict]) -> list[str]:
+        """Tracked section starts (slot.sections) that disagree with the rebuild."""
+        table = slot.sections
+        details = []
+        for section in rebuilt_sections:
+            name = section["name"]
+            if name not in SECTION_NAMES or not table.has(name):
+                continue
+            tracked = table.start(name)
+            if tracked != section["start"]:
+                details.append(
+                    f"Stale offset for {name}: tracked 0x{tracked:x}, "
+                    f"rebuilt 0x{section['start']:x}"
+                )
+        return details
+
 
 class DuplicateGaitemHandleFix(BaseFix):
     """
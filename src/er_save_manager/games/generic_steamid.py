@@ -23,6 +23,7 @@ found and no explicit old_steamid is given.
 
 from __future__ import annotations
 
+import mmap
 import struct
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -30,6 +31,8 @@ from pathlib import Path
 # Steam64 ID base constant - all valid IDs are above this
 _STEAM64_BASE = 0x0110000100000000
 _STEAM64_MAX = 0x01100001FFFFFFFF
+# Little-endian high dword shared by every value in that range
+_STEAM64_HIGH = struct.pack("<I", _STEAM64_BASE >> 32)
 
 BND4_MAGIC = b"BND4"
 
@@ -48,23 +51,29 @@ def _is_valid_steam64(value: int) -> bool:
     return _STEAM64_BASE <= value <= _STEAM64_MAX
 
 
-def find_steamids_in_file(data: bytes | bytearray) -> dict[int, list[int]]:
+def find_steamids_in_file(data: bytes | bytearray | mmap.mmap) -> dict[int, list[int]]:
     """
     Scan file bytes for all occurrences of valid Steam64 IDs.
 
+    Every valid ID has the same high dword, so the scan jumps between
+    occurrences of those 4 bytes with find() instead of unpacking at every
+    offset. data can be a read-only mmap, so large files are scanned without
+    being copied into memory.
+
     Returns a dict mapping steamid -> list[offset].
     """
     found: dict[int, list[int]] = {}
-    search = bytes(data)
-    i = 0
+    search = data if hasattr(data, "find") else bytes(data)
     end = len(search) - 8  # need 8 bytes starting at i, so last valid i = len-8
-    while i <= end:
-        val = struct.unpack_from("<Q", search, i)[0]
-        if _is_valid_steam64(val):
+    next_free = 0  # matches don't overlap: skip 8 bytes past each one
+    pos = search.find(_STEAM64_HIGH, 4)
+    while pos != -1 and pos - 4 <= end:
+        i = pos - 4
+        if i >= next_free:
+            val = struct.unpack_from("<Q", search, i)[0]
             found.setdefault(val, []).append(i)
-            i += 8  # Skip past this match
-        else:
-            i += 1
+            next_free = i + 8
+        pos = search.find(_STEAM64_HIGH, pos + 1)
     return found
 
 
@@ -168,14 +177,14 @@ def detect_steamid_in_file(save_path: Path) -> int | None:
     Returns None if no ID can be determined.
     """
     try:
-        data = save_path.read_bytes()
-    except OSError:
-        return None
-
-    if data[:4] != BND4_MAGIC:
+        with open(save_path, "rb") as f:
+            if f.read(4) != BND4_MAGIC:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                found = find_steamids_in_file(data)
+    except (OSError, ValueError):
         return None
 
-    found = find_steamids_in_file(data)
     if found:
         return max(found, key=lambda k: len(found[k]))
 
@@ -18,7 +18,7 @@ from er_save_manager.parser.event_flags import (
 )
 from er_save_manager.parser.save import Save, load_save
 from er_save_manager.parser.user_data_10 import Profile, ProfileSummary, UserData10
-from er_save_manager.parser.user_data_x import UserDataX
+from er_save_manager.parser.user_data_x import LazyUserDataX, UserDataX
 from er_save_manager.parser.world import (
     DLC,
     FaceData,
@@ -33,6 +33,7 @@ __all__ = [
     "Save",
     "load_save",
     "UserDataX",
+    "LazyUserDataX",
     "UserData10",
     "Profile",
     "ProfileSummary",
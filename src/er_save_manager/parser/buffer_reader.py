@@ -0,0 +1,115 @@
+"""
+Elden Ring Save Parser - Buffer Reader
+
+Stream reader over an immutable in-memory snapshot of the save file.
+
+Save.from_file() reads the file once into a bytes object and parses it
+through this reader. BufferReader is a BytesIO subclass, so the hundreds of
+thousands of small field reads stay on BytesIO's C fast path, and BytesIO
+shares the bytes object instead of copying it.
+
+In zero-copy mode, large opaque blobs (event flags, NetMan data, the slot
+tail, USER_DATA_10/11) are handed out as read-only memoryviews instead of
+owned copies. They are taken from ``source`` when given: Save.from_file()
+passes its _raw_data, which holds the same bytes, so the snapshot can be
+freed once parsing finishes and only one copy of the file stays alive.
+"""
+
+from __future__ import annotations
+
+import struct
+from io import BytesIO
+
+
+class BufferReader(BytesIO):
+    """
+    BytesIO over a bytes snapshot with zero-copy views.
+
+    Every existing ``read(f)`` classmethod accepts it unchanged. ``offset``
+    lets a reader over a slice of the file report absolute positions from
+    tell()/seek(), so offsets recorded during a parse match Save._raw_data.
+    """
+
+    def __init__(
+        self,
+        buffer: bytes,
+        pos: int = 0,
+        zero_copy: bool = False,
+        offset: int = 0,
+        source=None,
+    ):
+        """
+        Args:
+            buffer: bytes snapshot to parse (shared, not copied)
+            pos: Initial absolute read position
+            zero_copy: When True, view() returns memoryviews instead of
+                       bytes copies
+            offset: Absolute file position of buffer[0]
+            source: Buffer with the same bytes as buffer that view() slices
+                    (default: buffer)
+        """
+        super().__init__(buffer)
+        self._view = memoryview(buffer).toreadonly()
+        self._source = self._view if source is None else memoryview(source).toreadonly()
+        self._offset = offset
+        self.zero_copy = zero_copy
+        if pos:
+            self.seek(pos)
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def view(self, size: int) -> memoryview | bytes:
+        """
+        Read size bytes without copying when in zero-copy mode.
+
+        Returns a read-only memoryview into the source in zero-copy mode,
+        otherwise an owned bytes copy (same as read()).
+        """
+        if not self.zero_copy:
+            return self.read(size)
+        start = super().tell()
+        data = self._source[start : start + size]
+        super().seek(start + len(data))
+        return data
+
+    def peek_view(self, size: int, advance: bool = False) -> memoryview:
+        """
+        Read-only memoryview of the next size bytes, always zero-copy.
+
+        Lets bulk decoders unpack in place; the position is left unchanged
+        unless advance is True.
+        """
+        start = super().tell()
+        data = self._view[start : start + size]
+        if advance:
+            super().seek(start + len(data))
+        return data
+
+    def unpack(self, fmt: str | struct.Struct) -> tuple:
+        """Unpack a struct at the current position and advance past it."""
+        s = fmt if isinstance(fmt, struct.Struct) else struct.Struct(fmt)
+        start = super().tell()
+        values = s.unpack_from(self._view, start)
+        super().seek(start + s.size)
+        return values
+
+    def tell(self) -> int:
+        return super().tell() + self._offset
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 0:
+            offset = max(0, offset - self._offset)
+        return super().seek(offset, whence) + self._offset
+
+    def release(self) -> None:
+        """Release the reader's own views (views handed out stay valid)."""
+        self._view.release()
+        self._source.release()
+
+
+def read_view(f: BytesIO | BufferReader, size: int) -> memoryview | bytes:
+    """Read a large opaque blob, zero-copy when f is a zero-copy BufferReader."""
+    if isinstance(f, BufferReader):
+        return f.view(size)
+    return f.read(size)
@@ -0,0 +1,324 @@
+"""
+Elden Ring Save Parser - Dirty Range Tracking
+
+TrackedBuffer is the bytearray type used for Save._raw_data. Every slice
+assignment, deletion or growth records the touched byte range, so
+Save.recalculate_checksums() can re-hash only the slots that were edited.
+
+Existing code keeps writing ``save._raw_data[a:b] = data`` unchanged.
+Writes that bypass item assignment (struct.pack_into, writable
+memoryviews) are not seen and must call mark_dirty() themselves.
+
+Ranges are recorded in buffer coordinates at the time of the write. Code
+that inserts and deletes inside a slot (inventory_ops gaitem resizing)
+keeps each slot's size constant, so attributing ranges to slots stays
+correct even though the raw offsets shift by a few bytes mid-operation.
+
+Separately, the buffer keeps a write journal: the exact byte ranges that
+differ from the file last written or loaded, used by Save.to_file(...,
+journaled=True) to patch only those extents. Dirty ranges are cleared by
+every checksum pass, the journal only when the file is written. Because
+an insert followed by a delete shifts every byte in between, size-changing
+operations open a "resize episode" covering the shifted span; the span is
+journaled once the buffer is back to its original length.
+
+Finally, while an undo log is open (start_undo_log, used by
+parser.snapshots), every tracked mutation also records the bytes it
+overwrote as (start, old bytes, new length): writing old bytes back over
+[start, start + new length), newest record first, restores the buffer.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+# Same-length slice writes at least this large are diffed block by block
+_DIFF_MIN_SIZE = 0x10000
+_DIFF_BLOCK = 0x1000
+
+
+class TrackedBuffer(bytearray):
+    """bytearray that records which byte ranges have been modified."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dirty: list[tuple[int, int]] = []
+        self._all_dirty = False
+        self._journal: list[tuple[int, int]] = []
+        self._journal_all = False
+        # Open resize episode: net size change and the span it affects
+        self._shift = 0
+        self._shift_lo = 0
+        self._shift_hi = 0
+        # Open undo log and whether it missed a wholesale replacement
+        self._undo: list[tuple[int, bytearray, int]] | None = None
+        self._undo_lost = False
+        # Called once before the size next changes: bytearray cannot resize
+        # while memoryviews into it are exported (Save.detach_views after a
+        # zero_copy load)
+        self.before_resize: Callable[[], None] | None = None
+
+    # ---- recording ---------------------------------------------------------
+
+    def mark_dirty(self, start: int, end: int) -> None:
+        """Record [start, end) as modified."""
+        if end <= start:
+            return
+        if self._shift:
+            self._shift_lo = min(self._shift_lo, start)
+            self._shift_hi = max(self._shift_hi, end)
+        else:
+            _append_range(self._journal, start, end)
+        _append_range(self._dirty, start, end)
+
+    def mark_all_dirty(self) -> None:
+        """Treat the whole buffer as modified (content replaced wholesale)."""
+        self._all_dirty = True
+        self._journal_all = True
+        if self._undo is not None:
+            self._undo_lost = True
+
+    def _mark_resize(self, start: int, old: int, new: int) -> None:
+        """Record that [start, start + old) was replaced by new bytes."""
+        delta = new - old
+        if not delta:
+            return
+        if not self._shift:
+            self._shift_lo, self._shift_hi = start, start + new
+        else:
+            hi = self._shift_hi
+            if start < hi:
+                hi += delta  # the op moved the end of the span
+            self._shift_lo = min(self._shift_lo, start)
+            self._shift_hi = max(hi, start + new)
+        self._shift += delta
+        if not self._shift:
+            # Back to the original length: bytes past the span are in place
+            _append_range(self._journal, self._shift_lo, self._shift_hi)
+
+    def clear_dirty(self) -> None:
+        """Forget all recorded modifications."""
+        self._dirty = []
+        self._all_dirty = False
+
+    def inherit_dirty(self, other) -> None:
+        """Copy the dirty and journal state of a buffer with identical content."""
+        self._dirty = list(other.dirty_ranges())
+        self._all_dirty = False
+        journal = other.journal_ranges()
+        self._journal = list(journal) if journal is not None else []
+        self._journal_all = journal is None
+        self._undo = getattr(other, "_undo", None)
+        self._undo_lost = getattr(other, "_undo_lost", False)
+
+    def journal_ranges(self) -> list[tuple[int, int]] | None:
+        """
+        Ranges written since the last clear_journal(), sorted and merged.
+
+        Returns:
+            None if the changes cannot be expressed as in-place extents
+            (content replaced wholesale, or the length differs)
+        """
+        if self._journal_all or self._shift:
+            return None
+        return _merge(self._journal)
+
+    def clear_journal(self) -> None:
+        """Forget the write journal (the buffer now matches the file on disk)."""
+        self._journal = []
+        self._journal_all = False
+        self._shift = 0
+
+    def dirty_ranges(self) -> list[tuple[int, int]]:
+        """
+        Recorded modifications as sorted, merged [start, end) ranges.
+
+        Returns:
+            [(0, len(self))] if the buffer was replaced wholesale
+        """
+        if self._all_dirty:
+            return [(0, len(self))]
+        return _merge(self._dirty)
+
+    def is_dirty(self, start: int, end: int) -> bool:
+        """True if any recorded modification overlaps [start, end)."""
+        if self._all_dirty:
+            return True
+        return any(s < end and e > start for s, e in self._dirty)
+
+    # ---- undo log ----------------------------------------------------------
+
+    def start_undo_log(self) -> list[tuple[int, bytearray, int]]:
+        """
+        Start recording the before-image of every tracked mutation.
+
+        Returns:
+            The (live) list records are appended to
+        """
+        self._undo = []
+        self._undo_lost = False
+        return self._undo
+
+    def stop_undo_log(self) -> list[tuple[int, bytearray, int]] | None:
+        """Stop recording and return the records, None if none was open."""
+        undo, self._undo = self._undo, None
+        return undo
+
+    @property
+    def undo_lost(self) -> bool:
+        """True if the open undo log missed a wholesale replacement."""
+        return self._undo_lost
+
+    def _log_undo(self, start: int, stop: int, new: int) -> None:
+        """Record that [start, stop) is about to be replaced by new bytes."""
+        undo = self._undo
+        if undo is None:
+            return
+        if undo and stop - start == new:
+            last_start, last_old, last_new = undo[-1]
+            if last_new == len(last_old):
+                last_end = last_start + last_new
+                if last_start <= start and stop <= last_end:
+                    return  # rewriting bytes whose first before-image is kept
+                if start == last_end:
+                    # Sequential same-length writes (byte loops, field patches)
+                    last_old += bytearray.__getitem__(self, slice(start, stop))
+                    undo[-1] = (last_start, last_old, last_new + new)
+                    return
+        undo.append((start, bytearray.__getitem__(self, slice(start, stop)), new))
+
+    # ---- tracked mutators --------------------------------------------------
+
+    def _span(self, key) -> tuple[int, int]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                lo, hi = (start, stop) if step > 0 else (stop + 1, start + 1)
+                return lo, max(lo, hi)
+            return start, max(start, stop)
+        index = key + len(self) if key < 0 else key
+        return index, index + 1
+
+    def _resizing(self) -> None:
+        hook, self.before_resize = self.before_resize, None
+        if hook is not None:
+            hook()
+
+    def __setitem__(self, key, value):
+        start, stop = self._span(key)
+        if isinstance(key, slice):
+            if not hasattr(value, "__len__") and not isinstance(value, int):
+                value = bytes(value)  # size needed up front
+            size = len(value) if hasattr(value, "__len__") else stop - start
+            if size != stop - start and self.before_resize is not None:
+                if isinstance(value, memoryview):
+                    value = value.tobytes()  # may be one of the views released
+                self._resizing()
+            if size == stop - start >= _DIFF_MIN_SIZE and key.step in (None, 1):
+                # Whole-region rewrites (slot rebuilds, fixes) usually change
+                # only a few bytes: record just the blocks that differ
+                self._mark_changed_blocks(start, value)
+                super().__setitem__(key, value)
+                return
+            if key.step in (None, 1):
+                self._log_undo(start, stop, size)
+            else:
+                self._log_undo(start, stop, stop - start)
+            self.mark_dirty(start, start + max(size, stop - start))
+            super().__setitem__(key, value)
+            if key.step in (None, 1):
+                self._mark_resize(start, stop - start, size)
+            return
+        self._log_undo(start, stop, 1)
+        self.mark_dirty(start, stop)
+        super().__setitem__(key, value)
+
+    def _mark_changed_blocks(self, start: int, value) -> None:
+        with memoryview(self) as old, memoryview(value) as new:
+            new = new.cast("B")
+            for offset in range(0, len(new), _DIFF_BLOCK):
+                end = offset + _DIFF_BLOCK
+                if old[start + offset : start + end] != new[offset:end]:
+                    block_end = start + min(end, len(new))
+                    self._log_undo(
+                        start + offset, block_end, block_end - start - offset
+                    )
+                    self.mark_dirty(start + offset, block_end)
+
+    def __delitem__(self, key):
+        self._resizing()
+        start, stop = self._span(key)
+        removed = len(range(*key.indices(len(self)))) if isinstance(key, slice) else 1
+        self._log_undo(start, stop, stop - start - removed)
+        self.mark_dirty(start, stop)
+        before = len(self)
+        super().__delitem__(key)
+        removed = before - len(self)
+        self._mark_resize(start, stop - start, stop - start - removed)
+
+    def __iadd__(self, other):
+        self._resizing()
+        start = len(self)
+        result = super().__iadd__(other)
+        self._log_undo(start, start, len(self) - start)
+        self.mark_dirty(start, len(self))
+        self._mark_resize(start, 0, len(self) - start)
+        return result
+
+    def extend(self, iterable) -> None:
+        self._resizing()
+        start = len(self)
+        super().extend(iterable)
+        self._log_undo(start, start, len(self) - start)
+        self.mark_dirty(start, len(self))
+        self._mark_resize(start, 0, len(self) - start)
+
+    def append(self, item: int) -> None:
+        self._resizing()
+        super().append(item)
+        self._log_undo(len(self) - 1, len(self) - 1, 1)
+        self.mark_dirty(len(self) - 1, len(self))
+        self._mark_resize(len(self) - 1, 0, 1)
+
+    def insert(self, index: int, item: int) -> None:
+        self._resizing()
+        start, _ = self._span(min(index, len(self)))
+        self._log_undo(start, start, 1)
+        super().insert(index, item)
+        self.mark_dirty(start, start + 1)
+        self._mark_resize(start, 0, 1)
+
+    def pop(self, index: int = -1) -> int:
+        self._resizing()
+        start, stop = self._span(index)
+        self._log_undo(start, stop, 0)
+        self.mark_dirty(start, stop)
+        value = super().pop(index)
+        self._mark_resize(start, 1, 0)
+        return value
+
+    def clear(self) -> None:
+        self._resizing()
+        super().clear()
+        self.mark_all_dirty()
+
+
+def _append_range(ranges: list[tuple[int, int]], start: int, end: int) -> None:
+    if ranges:
+        last_start, last_end = ranges[-1]
+        # Coalesce sequential writes (field-by-field patches, byte loops)
+        if start <= last_end and end >= last_start:
+            ranges[-1] = (min(start, last_start), max(end, last_end))
+            return
+    ranges.append((start, end))
+
+
+def _merge(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
@@ -10,9 +10,19 @@ Refactored to use base class for equipment slots to reduce code duplication.
 from __future__ import annotations
 
 import struct
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from io import BytesIO
 
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    _NUMPY_AVAILABLE = False
+
 # ============================================================================
 # BASE CLASS FOR EQUIPMENT SLOTS
 # ============================================================================
@@ -211,6 +221,166 @@ class InventoryItem:
         f.write(struct.pack("<I", self.acquisition_index))
 
 
+def _item_field(column: int) -> property:
+    """Property reading/writing one column of an InventoryItemView row."""
+
+    def fget(self):
+        return self._rows[self._index * 3 + column]
+
+    def fset(self, value):
+        self._rows[self._index * 3 + column] = value
+
+    return property(fget, fset)
+
+
+class InventoryItemView(InventoryItem):
+    """
+    InventoryItem row backed by an InventoryItemList.
+
+    Behaves like an InventoryItem, but reads and writes go straight to the
+    list's packed array, so ``items[i].quantity = n`` edits the inventory.
+    """
+
+    gaitem_handle = _item_field(0)
+    quantity = _item_field(1)
+    acquisition_index = _item_field(2)
+
+    def __init__(self, rows: array, index: int):
+        self._rows = rows
+        self._index = index
+
+    def __eq__(self, other):
+        if not isinstance(other, InventoryItem):
+            return NotImplemented
+        return (self.gaitem_handle, self.quantity, self.acquisition_index) == (
+            other.gaitem_handle,
+            other.quantity,
+            other.acquisition_index,
+        )
+
+    __hash__ = None
+
+    def to_item(self) -> InventoryItem:
+        """Detached InventoryItem copy of this row."""
+        return InventoryItem(self.gaitem_handle, self.quantity, self.acquisition_index)
+
+    def __copy__(self) -> InventoryItem:
+        return self.to_item()
+
+    def __deepcopy__(self, memo) -> InventoryItem:
+        return self.to_item()
+
+
+class InventoryItemList(Sequence):
+    """
+    Fixed-capacity inventory item list stored as one packed array('I').
+
+    Row i occupies rows[3*i : 3*i + 3] as (gaitem_handle, quantity,
+    acquisition_index), which is exactly the on-disk layout, so reading and
+    writing are single bulk copies. Indexing returns InventoryItemView rows;
+    assigning an InventoryItem copies its fields into the array.
+    """
+
+    def __init__(self, rows: array | None = None):
+        self.rows = rows if rows is not None else array("I")
+
+    @classmethod
+    def read(cls, f: BytesIO, capacity: int) -> InventoryItemList:
+        """Read capacity 12-byte items from stream in one pass."""
+        rows = array("I")
+        rows.frombytes(f.read(capacity * 12))
+        if sys.byteorder == "big":
+            rows.byteswap()
+        return cls(rows)
+
+    def write(self, f: BytesIO):
+        """Write all items to stream in one pass."""
+        if sys.byteorder == "big":
+            rows = array("I", self.rows)
+            rows.byteswap()
+            f.write(rows.tobytes())
+        else:
+            f.write(self.rows.tobytes())
+
+    @property
+    def handles(self) -> array:
+        """Copy of the gaitem_handle column."""
+        return self.rows[0::3]
+
+    @property
+    def quantities(self) -> array:
+        """Copy of the quantity column."""
+        return self.rows[1::3]
+
+    @property
+    def acquisition_indices(self) -> array:
+        """Copy of the acquisition_index column."""
+        return self.rows[2::3]
+
+    def find_handle(self, handle: int) -> int:
+        """Index of the first item with this gaitem_handle, or -1."""
+        try:
+            return self.handles.index(handle)
+        except ValueError:
+            return -1
+
+    def as_numpy(self):
+        """
+        Zero-copy NumPy structured view of the rows (requires NumPy).
+
+        Returns:
+            numpy array with gaitem_handle/quantity/acquisition_index fields
+            sharing memory with this list
+        """
+        if not _NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for InventoryItemList.as_numpy()")
+        dtype = np.dtype(
+            [
+                ("gaitem_handle", "=u4"),
+                ("quantity", "=u4"),
+                ("acquisition_index", "=u4"),
+            ]
+        )
+        return np.frombuffer(self.rows, dtype=dtype)
+
+    def to_list(self) -> list[InventoryItem]:
+        """Detached list of plain InventoryItem objects."""
+        rows = self.rows
+        return [InventoryItem(*rows[i : i + 3]) for i in range(0, len(rows), 3)]
+
+    def __len__(self) -> int:
+        return len(self.rows) // 3
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                InventoryItemView(self.rows, i)
+                for i in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("inventory index out of range")
+        return InventoryItemView(self.rows, index)
+
+    def __setitem__(self, index: int, item: InventoryItem):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("inventory index out of range")
+        self.rows[index * 3 : index * 3 + 3] = array(
+            "I", (item.gaitem_handle, item.quantity, item.acquisition_index)
+        )
+
+    def __iter__(self) -> Iterator[InventoryItemView]:
+        rows = self.rows
+        for i in range(len(rows) // 3):
+            yield InventoryItemView(rows, i)
+
+    def __repr__(self) -> str:
+        return f"InventoryItemList({len(self)} items)"
+
+
 @dataclass
 class Inventory:
     """
@@ -219,12 +389,15 @@ class Inventory:
     Capacities differ between held and storage
     - Held: common_capacity=0xa80 (2688), key_capacity=0x180 (384)
     - Storage: common_capacity=0x780 (1920), key_capacity=0x80 (128)
+
+    Item lists are InventoryItemList (packed array rows with list-like
+    InventoryItem views).
     """
 
     common_item_count: int = 0
-    common_items: list[InventoryItem] = field(default_factory=list)
+    common_items: InventoryItemList = field(default_factory=InventoryItemList)
     key_item_count: int = 0
-    key_items: list[InventoryItem] = field(default_factory=list)
+    key_items: InventoryItemList = field(default_factory=InventoryItemList)
     equip_index_counter: int = 0
     acquisition_index_counter: int = 0
 
@@ -245,11 +418,11 @@ class Inventory:
 
         # Read common items
         obj.common_item_count = struct.unpack("<I", f.read(4))[0]
-        obj.common_items = [InventoryItem.read(f) for _ in range(common_capacity)]
+        obj.common_items = InventoryItemList.read(f, common_capacity)
 
         # Read key items
         obj.key_item_count = struct.unpack("<I", f.read(4))[0]
-        obj.key_items = [InventoryItem.read(f) for _ in range(key_capacity)]
+        obj.key_items = InventoryItemList.read(f, key_capacity)
 
         # Read counters
         obj.equip_index_counter = struct.unpack("<I", f.read(4))[0]
@@ -261,19 +434,26 @@ class Inventory:
         """Write Inventory to stream"""
         # Write common items
         f.write(struct.pack("<I", self.common_item_count))
-        for item in self.common_items:
-            item.write(f)
+        _write_items(f, self.common_items)
 
         # Write key items
         f.write(struct.pack("<I", self.key_item_count))
-        for item in self.key_items:
-            item.write(f)
+        _write_items(f, self.key_items)
 
         # Write counters
         f.write(struct.pack("<I", self.equip_index_counter))
         f.write(struct.pack("<I", self.acquisition_index_counter))
 
 
+def _write_items(f: BytesIO, items):
+    """Write an InventoryItemList in bulk, or a plain list item by item."""
+    if isinstance(items, InventoryItemList):
+        items.write(f)
+        return
+    for item in items:
+        item.write(f)
+
+
 # ============================================================================
 # SPELLS
 # ============================================================================
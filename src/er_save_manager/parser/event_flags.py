@@ -9,21 +9,49 @@ Includes corruption detection and fixes for:
 - Warp sickness (Radahn, Morgott, Radagon, Sealing Tree)
 """
 
-import os
-import sys
-from pathlib import Path
+from __future__ import annotations
+
+import re
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from er_save_manager.parser.flag_index import (
+    BLOCK_SIZE,
+    FLAG_DIVISOR,
+    NO_BLOCK,
+    get_flag_index,
+)
+
+if TYPE_CHECKING:
+    from er_save_manager.parser.save import Save
+
+try:
+    import numpy as np
+
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    _NUMPY_AVAILABLE = False
+
+
+# Runs of non-zero bytes, and the set bits of each byte value (0 = 0x80)
+_NONZERO_RUN = re.compile(rb"[^\x00]+")
+_SET_BITS = tuple(
+    tuple(bit for bit in range(8) if value & (0x80 >> bit)) for value in range(256)
+)
 
 
 class EventFlags:
     """
     Event flag reader/writer for Elden Ring save files.
 
-    Uses pre-computed BST mapping from eventflag_bst.txt to convert
-    event IDs to byte offsets in the event_flags array.
+    Uses the BST mapping compiled from eventflag_bst.txt (flag_index) to
+    convert event IDs to byte offsets in the event_flags array.
     """
 
-    FLAG_DIVISOR = 1000
-    BLOCK_SIZE = 125
+    FLAG_DIVISOR = FLAG_DIVISOR
+    BLOCK_SIZE = BLOCK_SIZE
     EVENT_FLAGS_SIZE = 0x1BF99F
 
     _bst_map: dict[int, int] | None = None
@@ -31,75 +59,14 @@ class EventFlags:
     @classmethod
     def _load_bst_map(cls) -> dict[int, int]:
         """
-        Load the BST mapping from eventflag_bst.txt.
-
-        Format: each line is "block,offset" where:
-        - block = event_id // 1000
-        - offset = byte offset in the event_flags array / 125
+        Load the BST mapping compiled from eventflag_bst.txt (see flag_index).
 
         Returns:
-            Dictionary mapping block numbers to offsets
+            Shared dict (do not modify) of block numbers (event_id // 1000)
+            to offsets (byte offset in the event_flags array / 125)
         """
-        if cls._bst_map is not None:
-            return cls._bst_map
-
-        cls._bst_map = {}
-
-        # Check if running as PyInstaller bundle
-        if getattr(sys, "_MEIPASS", None):
-            # PyInstaller bundle - resources are in _MEIPASS/resources/
-            bundle_path = Path(sys._MEIPASS) / "resources" / "eventflag_bst.txt"
-            possible_paths = [bundle_path]
-        else:
-            # Normal Python execution (handles editable installs, pip packages, AppImage)
-            appdir = os.environ.get("APPDIR")
-            exe_dir = Path(sys.argv[0]).resolve().parent
-            possible_paths = [
-                Path("eventflag_bst.txt"),
-                Path("resources/eventflag_bst.txt"),
-                Path(__file__).parent / "eventflag_bst.txt",
-                Path(__file__).parent / "resources" / "eventflag_bst.txt",
-                Path(__file__).parent.parent / "resources" / "eventflag_bst.txt",
-                Path(__file__).parent.parent.parent
-                / "resources"
-                / "eventflag_bst.txt",  # /src/resources/
-                Path(__file__).parent.parent.parent.parent
-                / "resources"
-                / "eventflag_bst.txt",  # project root /resources when src installed
-                exe_dir
-                / "resources"
-                / "eventflag_bst.txt",  # alongside binary/AppImage squashfs
-            ]
-
-            if appdir:
-                possible_paths.append(Path(appdir) / "resources" / "eventflag_bst.txt")
-
-        loaded = False
-        for path in possible_paths:
-            try:
-                with open(path) as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        parts = line.split(",")
-                        if len(parts) != 2:
-                            continue
-
-                        block = int(parts[0])
-                        offset = int(parts[1])
-                        cls._bst_map[block] = offset
-                loaded = True
-                break
-            except FileNotFoundError:
-                continue
-
-        if not loaded:
-            raise FileNotFoundError(
-                f"eventflag_bst.txt not found. Tried: {[str(p) for p in possible_paths]}"
-            )
-
+        if cls._bst_map is None:
+            cls._bst_map = get_flag_index().bst_map
         return cls._bst_map
 
     @classmethod
@@ -114,11 +81,7 @@ class EventFlags:
         Returns:
             True if the flag is set, False otherwise
         """
-        if len(event_flags) != cls.EVENT_FLAGS_SIZE:
-            raise ValueError(
-                f"event_flags must be {cls.EVENT_FLAGS_SIZE} bytes, "
-                f"got {len(event_flags)}"
-            )
+        cls._check_size(event_flags)
 
         bst_map = cls._load_bst_map()
 
@@ -142,6 +105,87 @@ class EventFlags:
         event_byte = event_flags[byte_pos]
         return ((event_byte >> bit_index) & 1) == 1
 
+    @classmethod
+    def _check_size(cls, event_flags) -> None:
+        if len(event_flags) != cls.EVENT_FLAGS_SIZE:
+            raise ValueError(
+                f"event_flags must be {cls.EVENT_FLAGS_SIZE} bytes, "
+                f"got {len(event_flags)}"
+            )
+
+    @classmethod
+    def flag_set(cls, ids: Iterable[int]) -> FlagSet:
+        """
+        Precomputed positions for a set of event flag ids, cached per id set.
+
+        Args:
+            ids: Event flag IDs, in the order results should come back
+
+        Returns:
+            FlagSet for the ids
+        """
+        return _flag_set(tuple(ids))
+
+    @classmethod
+    def get_flags(cls, event_flags: bytes, ids: Iterable[int]) -> dict[int, bool]:
+        """
+        Get the state of many event flags in one pass.
+
+        Args:
+            event_flags: The event_flags byte array from a character slot
+            ids: Event flag IDs to read
+
+        Returns:
+            Dictionary mapping each ID to its state; IDs whose block is not
+            in the BST read as False
+        """
+        flags = cls.flag_set(ids)
+        return dict(zip(flags.ids, flags.get(event_flags), strict=True))
+
+    @classmethod
+    def count_set(cls, event_flags: bytes, ids: Iterable[int]) -> int:
+        """
+        Count how many of the given event flags are set.
+
+        Args:
+            event_flags: The event_flags byte array from a character slot
+            ids: Event flag IDs to check
+
+        Returns:
+            Number of set flags; IDs whose block is not in the BST count as unset
+        """
+        return cls.flag_set(ids).count(event_flags)
+
+    @classmethod
+    def iter_set_flags(cls, event_flags: bytes) -> Iterator[int]:
+        """
+        Every set event flag, known to the flag databases or not.
+
+        Only non-zero bytes are bit-scanned; each is mapped back to its block
+        id through the flag index's reverse block map. Set bits in bytes
+        that belong to no block are skipped.
+
+        Args:
+            event_flags: The event_flags byte array from a character slot
+
+        Yields:
+            Event flag IDs, in byte order
+        """
+        cls._check_size(event_flags)
+        block_by_position = get_flag_index().block_by_position
+        n_positions = len(block_by_position)
+        for run in _NONZERO_RUN.finditer(event_flags):
+            for byte_pos, value in enumerate(run.group(), run.start()):
+                position, byte_index = divmod(byte_pos, BLOCK_SIZE)
+                if position >= n_positions:
+                    return
+                block = block_by_position[position]
+                if block == NO_BLOCK:
+                    continue
+                base = block * FLAG_DIVISOR + byte_index * 8
+                for bit in _SET_BITS[value]:
+                    yield base + bit
+
     @classmethod
     def set_flag(cls, event_flags: bytearray, event_id: int, state: bool) -> None:
         """
@@ -155,11 +199,7 @@ class EventFlags:
         if not isinstance(event_flags, bytearray):
             raise TypeError("event_flags must be a bytearray for modification")
 
-        if len(event_flags) != cls.EVENT_FLAGS_SIZE:
-            raise ValueError(
-                f"event_flags must be {cls.EVENT_FLAGS_SIZE} bytes, "
-                f"got {len(event_flags)}"
-            )
+        cls._check_size(event_flags)
 
         bst_map = cls._load_bst_map()
 
@@ -189,6 +229,171 @@ class EventFlags:
 
         event_flags[byte_pos] = event_byte
 
+    @classmethod
+    def _byte_writes(
+        cls, event_flags, states: Mapping[int, bool], skip_unknown: bool
+    ) -> dict[int, int]:
+        """New value of every byte that states change, keyed by byte position."""
+        cls._check_size(event_flags)
+        index = get_flag_index()
+        masks: dict[int, list[int]] = {}  # byte_pos -> [bits to set, bits to clear]
+        for event_id, state in states.items():
+            position = index.locate(event_id)
+            if position is None:
+                if skip_unknown:
+                    continue
+                raise ValueError(
+                    f"Event ID {event_id} (block {event_id // cls.FLAG_DIVISOR}) "
+                    "not found in BST"
+                )
+            byte_pos, mask = position
+            bits = masks.setdefault(byte_pos, [0, 0])
+            bits[0 if state else 1] |= mask
+            bits[1 if state else 0] &= ~mask
+        writes = {}
+        for byte_pos, (set_bits, clear_bits) in masks.items():
+            old = event_flags[byte_pos]
+            new = (old | set_bits) & ~clear_bits
+            if new != old:
+                writes[byte_pos] = new
+        return writes
+
+    @classmethod
+    def set_flags(
+        cls,
+        event_flags: bytearray,
+        states: Mapping[int, bool],
+        skip_unknown: bool = False,
+    ) -> tuple[int, int] | None:
+        """
+        Set many event flags, writing each affected byte once.
+
+        Args:
+            event_flags: The event_flags byte array from a character slot (mutable)
+            states: Event flag ID -> True to set, False to clear
+            skip_unknown: Ignore IDs whose block is not in the BST instead of
+                          raising (nothing is written when it raises)
+
+        Returns:
+            [start, end) byte range covering every changed byte, None if no
+            byte changed
+        """
+        if not isinstance(event_flags, bytearray):
+            raise TypeError("event_flags must be a bytearray for modification")
+        writes = cls._byte_writes(event_flags, states, skip_unknown)
+        for byte_pos, value in writes.items():
+            event_flags[byte_pos] = value
+        return (min(writes), max(writes) + 1) if writes else None
+
+
+def write_flags(
+    save: Save,
+    slot_idx: int,
+    states: Mapping[int, bool],
+    skip_unknown: bool = False,
+) -> tuple[int, int] | None:
+    """
+    Set many event flags of a character slot, in memory and in the save buffer.
+
+    Only the bytes that change are written, to slot.event_flags (made a
+    bytearray on first use, so later batches edit it in place) and to the
+    slot's event flag region of save._raw_data; the rest of the buffer is
+    not copied.
+
+    Args:
+        save: Parsed Save instance.
+        slot_idx: Character slot index 0-9.
+        states: Event flag ID -> True to set, False to clear.
+        skip_unknown: Ignore IDs whose block is not in the BST instead of
+                      raising ValueError.
+
+    Returns:
+        Absolute [start, end) range of _raw_data covering every changed
+        byte, None if no byte changed. Checksums are recalculated by the
+        caller.
+
+    Raises:
+        ValueError: Slot is empty, or an ID is not in the BST (nothing is
+                    written).
+    """
+    slot = save.character_slots[slot_idx]
+    if slot.is_empty():
+        raise ValueError(f"slot {slot_idx} is empty")
+
+    flags = slot.event_flags
+    writes = EventFlags._byte_writes(flags, states, skip_unknown)
+    if not writes:
+        return None
+    if not isinstance(flags, bytearray):
+        flags = bytearray(flags)
+        slot.event_flags = flags
+
+    start = slot.event_flags_offset
+    raw = save._raw_data
+    for byte_pos, value in writes.items():
+        flags[byte_pos] = value
+        raw[start + byte_pos] = value
+    return start + min(writes), start + max(writes) + 1
+
+
+class FlagSet:
+    """
+    Byte positions and bit masks of a fixed set of event flag ids.
+
+    Positions come from the compiled flag index once, when the set is built
+    (see EventFlags.flag_set); get() and count() then read every flag in a single
+    pass over the event_flags buffer, with NumPy fancy indexing when NumPy
+    is installed and a memoryview otherwise. IDs whose block is not in the
+    BST get a zero mask and always read as unset.
+    """
+
+    def __init__(self, ids: tuple[int, ...]):
+        index = get_flag_index()
+        self.ids = ids
+        self.positions = array("I")
+        self.masks = array("B")
+        for event_id in ids:
+            position = index.locate(event_id)
+            byte_pos, mask = position if position is not None else (0, 0)
+            self.positions.append(byte_pos)
+            self.masks.append(mask)
+        if _NUMPY_AVAILABLE:
+            self._np_positions = np.frombuffer(self.positions, dtype=np.uint32)
+            self._np_masks = np.frombuffer(self.masks, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get(self, event_flags: bytes) -> list[bool]:
+        """State of every flag in the set, in id order."""
+        EventFlags._check_size(event_flags)
+        if _NUMPY_AVAILABLE:
+            data = np.frombuffer(event_flags, dtype=np.uint8)
+            return ((data[self._np_positions] & self._np_masks) != 0).tolist()
+        with memoryview(event_flags) as data:
+            return [
+                data[pos] & mask != 0
+                for pos, mask in zip(self.positions, self.masks, strict=True)
+            ]
+
+    def count(self, event_flags: bytes) -> int:
+        """Number of set flags in the set."""
+        EventFlags._check_size(event_flags)
+        if _NUMPY_AVAILABLE:
+            data = np.frombuffer(event_flags, dtype=np.uint8)
+            return int(np.count_nonzero(data[self._np_positions] & self._np_masks))
+        with memoryview(event_flags) as data:
+            return sum(
+                1
+                for pos, mask in zip(self.positions, self.masks, strict=True)
+                if data[pos] & mask
+            )
+
+
+@lru_cache(maxsize=64)
+def _flag_set(ids: tuple[int, ...]) -> FlagSet:
+    return FlagSet(ids)
+
 
 class FixFlags:
     """Event flag IDs used for corruption fixes."""
@@ -523,116 +728,178 @@ class CorruptionDetector:
 class CorruptionFixer:
     """Apply fixes for detected corruption issues."""
 
-    @staticmethod
-    def fix_ranni_softlock(event_flags: bytearray) -> bool:
-        """
-        Fix Ranni's Tower quest soft-lock.
+    # Flag states each fix writes; a later state for the same flag wins
+    FIX_STATES: dict[str, dict[int, bool]] = {
+        "ranni_softlock": {
+            FixFlags.RANNI_BLOCKING_FLAG: False,
+            **dict.fromkeys(FixFlags.RANNI_FLAGS_TO_ENABLE, True),
+        },
+        "radahn_alive_warp": {
+            FixFlags.METEORITE_GREEN: False,
+            FixFlags.RADAHN_MAP_MARKER: False,
+        },
+        "radahn_dead_warp": {FixFlags.GRACE_RADAHN: True},
+        "morgott_warp": {
+            FixFlags.MORGOTT_THORNS_TOUCHED: True,
+            FixFlags.MORGOTT_FOG_WALL: True,
+        },
+        "radagon_warp": {FixFlags.GRACE_FRACTURED_MARIKA: True},
+        "sealing_tree_warp": {
+            FixFlags.GRACE_ENIR_ILIM_OUTER_WALL: True,
+            FixFlags.SEALING_TREE_RESTED_AFTER: True,
+        },
+        "romina_missing": {
+            FixFlags.SPIRIT_TREE_BURNING: False,
+            FixFlags.SEALING_TREE_CUTSCENE: False,
+        },
+        "unte_golem_stuck": {FixFlags.GOLEM_DESTROYED: True},
+        "erdtree_pre_giant": {
+            FixFlags.WORLD_TREE_BURNING: False,
+            FixFlags.WORLD_TREE_SPARKS: False,
+            FixFlags.WORLD_TREE_SMALL_FLAME: False,
+        },
+        "erdtree_pre_maliketh": {
+            FixFlags.WORLD_TREE_BURNING: False,
+            FixFlags.WORLD_TREE_SPARKS: False,
+            FixFlags.WORLD_TREE_SMALL_FLAME: True,
+        },
+        "erdtree_post_maliketh": {
+            FixFlags.WORLD_TREE_BURNING: True,
+            FixFlags.WORLD_TREE_SPARKS: True,
+            FixFlags.WORLD_TREE_SMALL_FLAME: False,
+        },
+    }
+
+    # Flags a fix skips when their block is not in the BST (the fix still
+    # applies); any other missing flag makes the fix fail
+    OPTIONAL_FLAGS = frozenset(FixFlags.RANNI_FLAGS_TO_ENABLE)
+
+    FIX_DESCRIPTIONS = {
+        "ranni_softlock": "Ranni quest fixed",
+        "radahn_alive_warp": "Radahn warp sickness fixed (alive variant)",
+        "radahn_dead_warp": "Radahn warp sickness fixed (dead variant)",
+        "morgott_warp": "Morgott warp sickness fixed",
+        "radagon_warp": "Radagon warp sickness fixed",
+        "sealing_tree_warp": "Sealing Tree warp sickness fixed (DLC)",
+        "romina_missing": "Missing Romina fixed",
+        "unte_golem_stuck": "Stuck Unte golem removed",
+        "erdtree_pre_giant": "Invalid Erdtree state fixed (pre-Fire Giant)",
+        "erdtree_pre_maliketh": "Invalid Erdtree state fixed (pre-Maliketh)",
+        "erdtree_post_maliketh": "Invalid Erdtree state fixed (post-Maliketh)",
+    }
 
-        Matches Cheat Engine script behavior:
-        1. Set blocking flag 1034500738 OFF
-        2. Enable all 31 progression flags
+    @classmethod
+    def fix_states(cls, issues: Iterable[str]) -> tuple[dict[int, bool], list[str]]:
         """
-        try:
-            # Set blocking flag OFF
-            EventFlags.set_flag(event_flags, FixFlags.RANNI_BLOCKING_FLAG, False)
-
-            # Enable all progression flags
-            for flag_id in FixFlags.RANNI_FLAGS_TO_ENABLE:
-                try:
-                    EventFlags.set_flag(event_flags, flag_id, True)
-                except ValueError:
-                    # Skip flags not in BST
-                    continue
+        Combined flag states that fix the given issues.
 
+        Args:
+            issues: Issue names from CorruptionDetector.detect_all()
+
+        Returns:
+            (states, fix_descriptions): the flag states to write in one
+            batch (EventFlags.set_flags / write_flags), and a description
+            per issue they fix. Unknown issues, and fixes that need a flag
+            not in the BST, are left out.
+        """
+        index = get_flag_index()
+        states: dict[int, bool] = {}
+        descriptions = []
+        for issue in issues:
+            fix = cls.FIX_STATES.get(issue)
+            if fix is None:
+                continue
+            wanted = {
+                flag_id: state
+                for flag_id, state in fix.items()
+                if flag_id not in cls.OPTIONAL_FLAGS
+                or index.locate(flag_id) is not None
+            }
+            if any(index.locate(flag_id) is None for flag_id in wanted):
+                continue
+            states.update(wanted)
+            descriptions.append(cls.FIX_DESCRIPTIONS[issue])
+        return states, descriptions
+
+    @classmethod
+    def _fix(cls, event_flags: bytearray, issue: str) -> bool:
+        try:
+            states, descriptions = cls.fix_states([issue])
+            if not descriptions:
+                return False
+            EventFlags.set_flags(event_flags, states)
             return True
         except Exception:
             return False
 
-    @staticmethod
-    def fix_radahn_alive_warp(event_flags: bytearray) -> bool:
+    @classmethod
+    def fix_ranni_softlock(cls, event_flags: bytearray) -> bool:
+        """
+        Fix Ranni's Tower quest soft-lock.
+
+        Matches Cheat Engine script behavior:
+        1. Set blocking flag 1034500738 OFF
+        2. Enable all 31 progression flags (skipping any not in the BST)
+        """
+        return cls._fix(event_flags, "ranni_softlock")
+
+    @classmethod
+    def fix_radahn_alive_warp(cls, event_flags: bytearray) -> bool:
         """
         Fix Radahn warp sickness (alive variant).
 
         Closes crater and removes map marker.
         """
-        try:
-            EventFlags.set_flag(event_flags, FixFlags.METEORITE_GREEN, False)
-            EventFlags.set_flag(event_flags, FixFlags.RADAHN_MAP_MARKER, False)
-            return True
-        except Exception:
-            return False
+        return cls._fix(event_flags, "radahn_alive_warp")
 
-    @staticmethod
-    def fix_radahn_dead_warp(event_flags: bytearray) -> bool:
+    @classmethod
+    def fix_radahn_dead_warp(cls, event_flags: bytearray) -> bool:
         """
         Fix Radahn warp sickness (dead variant).
 
         Grants the grace site.
         """
-        try:
-            EventFlags.set_flag(event_flags, FixFlags.GRACE_RADAHN, True)
-            return True
-        except Exception:
-            return False
+        return cls._fix(event_flags, "radahn_dead_warp")
 
-    @staticmethod
-    def fix_morgott_warp(event_flags: bytearray) -> bool:
+    @classmethod
+    def fix_morgott_warp(cls, event_flags: bytearray) -> bool:
         """
         Fix Morgott warp sickness.
 
         Touches thorns and drops fog wall.
         """
-        try:
-            EventFlags.set_flag(event_flags, FixFlags.MORGOTT_THORNS_TOUCHED, True)
-            EventFlags.set_flag(event_flags, FixFlags.MORGOTT_FOG_WALL, True)
-            return True
-        except Exception:
-            return False
+        return cls._fix(event_flags, "morgott_warp")
 
-    @staticmethod
-    def fix_radagon_warp(event_flags: bytearray) -> bool:
+    @classmethod
+    def fix_radagon_warp(cls, event_flags: bytearray) -> bool:
         """
         Fix Radagon/Elden Beast warp sickness.
 
         Grants the grace site.
         """
-        try:
-            EventFlags.set_flag(event_flags, FixFlags.GRACE_FRACTURED_MARIKA, True)
-            return True
-        except Exception:
-            return False
+        return cls._fix(event_flags, "radagon_warp")
 
-    @staticmethod
-    def fix_sealing_tree_warp(event_flags: bytearray) -> bool:
+    @classmethod
+    def fix_sealing_tree_warp(cls, event_flags: bytearray) -> bool:
         """
         Fix Sealing Tree warp sickness (DLC).
 
         Grants grace and blocks warp sickness.
         """
-        try:
-            EventFlags.set_flag(event_flags, FixFlags.GRACE_ENIR_ILIM_OUTER_WALL, True)
-            EventFlags.set_flag(event_flags, FixFlags.SEALING_TREE_RESTED_AFTER, True)
-            return True
-        except Exception:
-            return False
+        return cls._fix(event_flags, "sealing_tree_warp")
 
-    @staticmethod
-    def fix_romina_missing(event_flags: bytearray) -> bool:
+    @classmethod
+    def fix_romina_missing(cls, event_flags: bytearray) -> bool:
         """
         Fix Romina missing (DLC).
 
         Resets the Sealing Tree back to a valid state,
         which allows Romina to properly spawn as well.
         """
-        try:
-            EventFlags.set_flag(event_flags, FixFlags.SPIRIT_TREE_BURNING, False)
-            EventFlags.set_flag(event_flags, FixFlags.SEALING_TREE_CUTSCENE, False)
-            return True
-        except Exception:
-            return False
+        return cls._fix(event_flags, "romina_missing")
 
-    @staticmethod
-    def fix_unte_golem(event_flags: bytearray) -> bool:
+    @classmethod
+    def fix_unte_golem(cls, event_flags: bytearray) -> bool:
         """
         Fix Ruins of Unte Golem (DLC).
 
@@ -640,66 +907,44 @@ class CorruptionFixer:
         destroys the wall never gets set correctly, and
         the event stalls forever. This destroys the wall.
         """
-        try:
-            EventFlags.set_flag(event_flags, FixFlags.GOLEM_DESTROYED, True)
-            return True
-        except Exception:
-            return False
+        return cls._fix(event_flags, "unte_golem_stuck")
 
-    @staticmethod
-    def fix_erdtree_pre_giant(event_flags: bytearray) -> bool:
+    @classmethod
+    def fix_erdtree_pre_giant(cls, event_flags: bytearray) -> bool:
         """
         Fix Erdtree state prior to Fire Giant
 
         Un-burns the Erdtree, which will correct Leyndell
         map connection and fix any invalid appearance
         """
-        try:
-            EventFlags.set_flag(event_flags, FixFlags.WORLD_TREE_BURNING, False)
-            EventFlags.set_flag(event_flags, FixFlags.WORLD_TREE_SPARKS, False)
-            EventFlags.set_flag(event_flags, FixFlags.WORLD_TREE_SMALL_FLAME, False)
-            return True
-        except Exception:
-            return False
+        return cls._fix(event_flags, "erdtree_pre_giant")
 
-    @staticmethod
-    def fix_erdtree_pre_maliketh(event_flags: bytearray) -> bool:
+    @classmethod
+    def fix_erdtree_pre_maliketh(cls, event_flags: bytearray) -> bool:
         """
         Fix Erdtree state post-Fire Giant, pre-Maliketh
 
         Slightly burns the Erdtree, which will correct Leyndell
         map connection and fix any invalid appearance
         """
-        try:
-            EventFlags.set_flag(event_flags, FixFlags.WORLD_TREE_BURNING, False)
-            EventFlags.set_flag(event_flags, FixFlags.WORLD_TREE_SPARKS, False)
-            EventFlags.set_flag(event_flags, FixFlags.WORLD_TREE_SMALL_FLAME, True)
-            return True
-        except Exception:
-            return False
+        return cls._fix(event_flags, "erdtree_pre_maliketh")
 
-    @staticmethod
-    def fix_erdtree_post_maliketh(event_flags: bytearray) -> bool:
+    @classmethod
+    def fix_erdtree_post_maliketh(cls, event_flags: bytearray) -> bool:
         """
         Fix Erdtree state post-Maliketh
 
         Burns the Erdtree, which will correct Leyndell
         map connection and fix any invalid appearance
         """
-        try:
-            EventFlags.set_flag(event_flags, FixFlags.WORLD_TREE_BURNING, True)
-            EventFlags.set_flag(event_flags, FixFlags.WORLD_TREE_SPARKS, True)
-            EventFlags.set_flag(event_flags, FixFlags.WORLD_TREE_SMALL_FLAME, False)
-            return True
-        except Exception:
-            return False
+        return cls._fix(event_flags, "erdtree_post_maliketh")
 
     @classmethod
     def fix_all(
         cls, event_flags: bytearray, issues: list[str]
     ) -> tuple[int, list[str]]:
         """
-        Apply fixes for all detected issues.
+        Apply fixes for all detected issues, as one batch of flag writes.
 
         Args:
             event_flags: Mutable event flags array
@@ -708,46 +953,11 @@ class CorruptionFixer:
         Returns:
             (fixes_applied, list_of_fix_descriptions)
         """
-        fix_map = {
-            "ranni_softlock": (cls.fix_ranni_softlock, "Ranni quest fixed"),
-            "radahn_alive_warp": (
-                cls.fix_radahn_alive_warp,
-                "Radahn warp sickness fixed (alive variant)",
-            ),
-            "radahn_dead_warp": (
-                cls.fix_radahn_dead_warp,
-                "Radahn warp sickness fixed (dead variant)",
-            ),
-            "morgott_warp": (cls.fix_morgott_warp, "Morgott warp sickness fixed"),
-            "radagon_warp": (cls.fix_radagon_warp, "Radagon warp sickness fixed"),
-            "sealing_tree_warp": (
-                cls.fix_sealing_tree_warp,
-                "Sealing Tree warp sickness fixed (DLC)",
-            ),
-            "romina_missing": (cls.fix_romina_missing, "Missing Romina fixed"),
-            "unte_golem_stuck": (cls.fix_unte_golem, "Stuck Unte golem removed"),
-            "erdtree_pre_giant": (
-                cls.fix_erdtree_pre_giant,
-                "Invalid Erdtree state fixed (pre-Fire Giant)",
-            ),
-            "erdtree_pre_maliketh": (
-                cls.fix_erdtree_pre_maliketh,
-                "Invalid Erdtree state fixed (pre-Maliketh)",
-            ),
-            "erdtree_post_maliketh": (
-                cls.fix_erdtree_post_maliketh,
-                "Invalid Erdtree state fixed (post-Maliketh)",
-            ),
-        }
-
-        fixes_applied = 0
-        fix_descriptions = []
-
-        for issue in issues:
-            if issue in fix_map:
-                fixer, description = fix_map[issue]
-                if fixer(event_flags):
-                    fixes_applied += 1
-                    fix_descriptions.append(description)
-
-        return fixes_applied, fix_descriptions
+        states, descriptions = cls.fix_states(issues)
+        if not descriptions:
+            return 0, []
+        try:
+            EventFlags.set_flags(event_flags, states)
+        except Exception:
+            return 0, []
+        return len(descriptions), descriptions
@@ -0,0 +1,189 @@
+"""
+Elden Ring Save Parser - Event Flag Diff
+
+diff_event_flags compares two event_flags regions (0x1BF99F bytes each) and
+lists every flag whose state differs. Identical 4 KB chunks are skipped with
+a plain comparison; inside a differing chunk the two sides are XORed and
+only the non-zero bytes are visited. Each changed bit is mapped back to its
+flag id through the compiled BST index in reverse (byte offset -> block ->
+flag id, see flag_index), then annotated with its name and category from
+EVENT_FLAGS and the NPC quests in QUEST_FLAGS that use it.
+
+diff_slots wraps it for two character slots, of one save (slot vs slot) or
+of two (a backup vs the current save).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING
+
+from er_save_manager.parser.event_flags import EventFlags
+from er_save_manager.parser.flag_index import get_flag_index
+
+if TYPE_CHECKING:
+    from er_save_manager.parser.save import Save
+
+CHUNK_SIZE = 0x1000
+
+_NONZERO = re.compile(rb"[^\x00]")
+
+
+@dataclass
+class FlagChange:
+    """
+    One flag that differs between two event_flags regions.
+
+    before/after: State in the first and second region
+    name/category/subcategory: From EVENT_FLAGS, empty for unlisted flags
+    quests: NPCs in QUEST_FLAGS with a quest step that uses the flag
+    """
+
+    flag_id: int
+    before: bool
+    after: bool
+    name: str = ""
+    category: str = ""
+    subcategory: str = ""
+    quests: tuple[str, ...] = ()
+
+    @property
+    def known(self) -> bool:
+        return bool(self.name or self.quests)
+
+
+@dataclass
+class FlagDiff:
+    """
+    Outcome of diff_event_flags.
+
+    changes: Changed flags, in byte order
+    unmapped_bytes: Differing bytes that belong to no BST block
+    """
+
+    changes: list[FlagChange]
+    unmapped_bytes: int = 0
+
+    @property
+    def turned_on(self) -> list[FlagChange]:
+        return [change for change in self.changes if change.after]
+
+    @property
+    def turned_off(self) -> list[FlagChange]:
+        return [change for change in self.changes if not change.after]
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+
+@cache
+def _quest_npcs() -> dict[int, tuple[str, ...]]:
+    """Flag id -> NPCs whose quest steps use it."""
+    from er_save_manager.data.quest_flags_db import QUEST_FLAGS
+
+    npcs: dict[int, list[str]] = {}
+    for npc, steps in QUEST_FLAGS.items():
+        for step in steps:
+            for flag in step["flags"]:
+                names = npcs.setdefault(flag["id"], [])
+                if npc not in names:
+                    names.append(npc)
+    return {flag_id: tuple(names) for flag_id, names in npcs.items()}
+
+
+def _annotate(change: FlagChange) -> None:
+    from er_save_manager.data.event_flags_db import EVENT_FLAGS
+
+    info = EVENT_FLAGS.get(change.flag_id)
+    if info is not None:
+        change.name = info.get("name", "")
+        change.category = info.get("category", "")
+        change.subcategory = info.get("subcategory", "")
+    change.quests = _quest_npcs().get(change.flag_id, ())
+
+
+def diff_event_flags(before: bytes, after: bytes, annotate: bool = True) -> FlagDiff:
+    """
+    Flags whose state differs between two event_flags regions.
+
+    Args:
+        before: First event_flags region (e.g. from a backup)
+        after: Second event_flags region (e.g. from the current save)
+        annotate: Fill in names, categories and quests
+
+    Returns:
+        FlagDiff
+
+    Raises:
+        ValueError: A region is not EventFlags.EVENT_FLAGS_SIZE bytes
+    """
+    EventFlags._check_size(before)
+    EventFlags._check_size(after)
+    index = get_flag_index()
+    result = FlagDiff([])
+
+    with memoryview(before) as old, memoryview(after) as new:
+        for start in range(0, len(old), CHUNK_SIZE):
+            old_chunk = old[start : start + CHUNK_SIZE]
+            new_chunk = new[start : start + CHUNK_SIZE]
+            if old_chunk == new_chunk:
+                continue
+            old_bytes = old_chunk.tobytes()
+            xor = (
+                int.from_bytes(old_bytes) ^ int.from_bytes(new_chunk.tobytes())
+            ).to_bytes(len(old_bytes))
+            for match in _NONZERO.finditer(xor):
+                i = match.start()
+                byte_pos = start + i
+                changed = xor[i]
+                if index.block_at(byte_pos // EventFlags.BLOCK_SIZE) is None:
+                    result.unmapped_bytes += 1
+                    continue
+                for bit in range(8):
+                    mask = 0x80 >> bit
+                    if changed & mask:
+                        was = bool(old_bytes[i] & mask)
+                        result.changes.append(
+                            FlagChange(index.flag_at(byte_pos, mask), was, not was)
+                        )
+
+    if annotate:
+        for change in result.changes:
+            _annotate(change)
+    return result
+
+
+def diff_slots(
+    save: Save,
+    slot_idx: int,
+    other: Save | None = None,
+    other_slot_idx: int | None = None,
+    annotate: bool = True,
+) -> FlagDiff:
+    """
+    Flags whose state differs between two character slots.
+
+    Args:
+        save: Save holding the first ("before") slot, e.g. a backup.
+        slot_idx: First slot index 0-9.
+        other: Save holding the second ("after") slot, save if None.
+        other_slot_idx: Second slot index 0-9, slot_idx if None.
+        annotate: Fill in names, categories and quests.
+
+    Raises:
+        ValueError: Either slot is empty, or both sides are the same slot.
+    """
+    other = save if other is None else other
+    other_slot_idx = slot_idx if other_slot_idx is None else other_slot_idx
+    if other is save and other_slot_idx == slot_idx:
+        raise ValueError("nothing to compare: both sides are the same slot")
+
+    regions = []
+    for side, i in ((save, slot_idx), (other, other_slot_idx)):
+        slot = side.character_slots[i]
+        if slot.is_empty():
+            raise ValueError(f"slot {i} is empty")
+        regions.append(slot.event_flags)
+    return diff_event_flags(*regions, annotate=annotate)
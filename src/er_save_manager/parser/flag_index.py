@@ -0,0 +1,349 @@
+"""
+Elden Ring Save Parser - Compiled Event Flag Index
+
+eventflag_bst.txt lists, for every event flag block (event_id // 1000), the
+position of its 125-byte block in a slot's event_flags array. This module
+compiles that list, together with the byte position and bit of every flag
+in data/event_flags_db.py and data/quest_flags_db.py, into a binary index
+stored next to the text file as eventflag_bst.idx.
+
+Loading the index is one file read and five array copies. Flags are looked
+up by binary search over the sorted arrays; the block map, which every
+single-flag read and write goes through, becomes a dict built from the
+block arrays on first use. The index is keyed on the sizes and mtimes of
+the BST file and both flag databases; a stale index is rebuilt, and one
+that cannot be written (a read-only install) only means it is compiled
+once per process. Frozen builds ship the index the build scripts compile
+with scripts/compile_flag_index.py.
+
+File layout (native byte order): header, then uint32 arrays of block ids
+(sorted), block positions (in 125-byte units), flag ids (sorted), flag bit
+positions (byte_pos * 8 + bit, bit 0 = most significant) and the reverse
+block map (block id at each position, NO_BLOCK where there is none).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from functools import cached_property
+from pathlib import Path
+
+FLAG_DIVISOR = 1000
+BLOCK_SIZE = 125
+
+BST_FILENAME = "eventflag_bst.txt"
+DATA_DIR = Path(__file__).parent.parent / "data"
+FLAG_DB_FILES = (DATA_DIR / "event_flags_db.py", DATA_DIR / "quest_flags_db.py")
+
+_FORMAT = 2
+_MAGIC = b"EFBI"
+_HEADER = struct.Struct("<4sI16sIII")  # magic, format, signature, counts
+
+NO_BLOCK = 0xFFFFFFFF  # block_by_position entry of a position with no block
+
+
+def bst_candidates() -> list[Path]:
+    """Places eventflag_bst.txt is looked for, in order."""
+    # Check if running as PyInstaller bundle
+    if getattr(sys, "_MEIPASS", None):
+        # PyInstaller bundle - resources are in _MEIPASS/resources/
+        return [Path(sys._MEIPASS) / "resources" / BST_FILENAME]
+
+    # Normal Python execution (handles editable installs, pip packages, AppImage)
+    here = Path(__file__).parent
+    appdir = os.environ.get("APPDIR")
+    exe_dir = Path(sys.argv[0]).resolve().parent
+    possible_paths = [
+        Path(BST_FILENAME),
+        Path("resources") / BST_FILENAME,
+        here / BST_FILENAME,
+        here / "resources" / BST_FILENAME,
+        here.parent / "resources" / BST_FILENAME,
+        here.parent.parent / "resources" / BST_FILENAME,  # /src/resources/
+        # project root /resources when src installed
+        here.parent.parent.parent / "resources" / BST_FILENAME,
+        exe_dir / "resources" / BST_FILENAME,  # alongside binary/AppImage squashfs
+    ]
+    if appdir:
+        possible_paths.append(Path(appdir) / "resources" / BST_FILENAME)
+    return possible_paths
+
+
+def find_bst_file() -> Path:
+    """
+    Locate eventflag_bst.txt.
+
+    Raises:
+        FileNotFoundError: Not in any of bst_candidates()
+    """
+    possible_paths = bst_candidates()
+    for path in possible_paths:
+        if path.is_file():
+            return path
+    raise FileNotFoundError(
+        f"{BST_FILENAME} not found. Tried: {[str(p) for p in possible_paths]}"
+    )
+
+
+class FlagIndex:
+    """
+    Compiled eventflag_bst.txt plus the positions of every known flag.
+
+    blocks/offsets: Sorted block ids and their positions in 125-byte units
+    flag_ids/flag_bits: Sorted ids of the database flags whose block is in
+        the BST, and their byte_pos * 8 + bit (bit 0 = most significant)
+    block_by_position: The reverse of blocks/offsets, indexed by position
+        (byte offset // 125): the block stored there, or NO_BLOCK
+    """
+
+    def __init__(
+        self,
+        blocks: array,
+        offsets: array,
+        flag_ids: array,
+        flag_bits: array,
+        block_by_position: array,
+    ):
+        self.blocks = blocks
+        self.offsets = offsets
+        self.flag_ids = flag_ids
+        self.flag_bits = flag_bits
+        self.block_by_position = block_by_position
+
+    @cached_property
+    def bst_map(self) -> dict[int, int]:
+        """Block id -> block position (in 125-byte units)."""
+        return dict(zip(self.blocks, self.offsets, strict=True))
+
+    def locate(self, event_id: int) -> tuple[int, int] | None:
+        """
+        Byte position and bit mask of an event flag.
+
+        Returns:
+            (byte_pos, mask), None if the flag's block is not in the BST
+        """
+        i = bisect_left(self.flag_ids, event_id)
+        if i < len(self.flag_ids) and self.flag_ids[i] == event_id:
+            bits = self.flag_bits[i]
+            return bits >> 3, 0x80 >> (bits & 7)
+        block, index = divmod(event_id, FLAG_DIVISOR)
+        offset = self.bst_map.get(block)
+        if offset is None:
+            return None
+        return offset * BLOCK_SIZE + (index >> 3), 0x80 >> (index & 7)
+
+    def block_at(self, position: int) -> int | None:
+        """
+        Block stored at a position (byte offset // 125), the reverse of bst_map.
+
+        Returns:
+            Block id, None if no block is stored there
+        """
+        if 0 <= position < len(self.block_by_position):
+            block = self.block_by_position[position]
+            if block != NO_BLOCK:
+                return block
+        return None
+
+    def flag_at(self, byte_pos: int, mask: int) -> int | None:
+        """
+        Event flag id stored at a byte position and single-bit mask.
+
+        Returns:
+            Flag id, None if the byte is not part of any block
+        """
+        position, byte_index = divmod(byte_pos, BLOCK_SIZE)
+        block = self.block_at(position)
+        if block is None:
+            return None
+        return block * FLAG_DIVISOR + byte_index * 8 + 8 - mask.bit_length()
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+
+def _parse_bst(path: Path) -> dict[int, int]:
+    """
+    Parse eventflag_bst.txt.
+
+    Format: each line is "block,offset" where:
+    - block = event_id // 1000
+    - offset = byte offset in the event_flags array / 125
+    """
+    bst_map = {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            parts = line.split(",")
+            if len(parts) != 2:
+                continue
+
+            bst_map[int(parts[0])] = int(parts[1])
+    return bst_map
+
+
+def _database_flag_ids() -> set[int]:
+    from er_save_manager.data.event_flags_db import EVENT_FLAGS
+    from er_save_manager.data.quest_flags_db import QUEST_FLAGS
+
+    ids = set(EVENT_FLAGS)
+    for steps in QUEST_FLAGS.values():
+        for step in steps:
+            ids.update(flag["id"] for flag in step["flags"])
+    return ids
+
+
+def build_flag_index(bst_path: Path | None = None) -> FlagIndex:
+    """Compile the index from eventflag_bst.txt and the flag databases."""
+    bst_map = _parse_bst(bst_path or find_bst_file())
+    blocks = array("I", sorted(bst_map))
+    offsets = array("I", (bst_map[block] for block in blocks))
+
+    flag_ids = array("I")
+    flag_bits = array("I")
+    for event_id in sorted(_database_flag_ids()):
+        if not 0 <= event_id <= 0xFFFFFFFF:
+            continue
+        block, index = divmod(event_id, FLAG_DIVISOR)
+        offset = bst_map.get(block)
+        if offset is None:
+            continue
+        flag_ids.append(event_id)
+        flag_bits.append((offset * BLOCK_SIZE * 8) + index)
+
+    block_by_position = array("I", [NO_BLOCK]) * (max(offsets, default=-1) + 1)
+    for block, offset in zip(blocks, offsets, strict=True):
+        block_by_position[offset] = block
+    return FlagIndex(blocks, offsets, flag_ids, flag_bits, block_by_position)
+
+
+# ---- disk cache ---------------------------------------------------------------
+
+
+def index_path_for(bst_path: Path) -> Path:
+    return bst_path.with_suffix(".idx")
+
+
+def _signature(bst_path: Path) -> bytes | None:
+    """
+    Digest of everything the index is compiled from.
+
+    None in a frozen build, where the sources are fixed and the flag
+    databases are not on disk to stat; the shipped index is trusted.
+    """
+    if getattr(sys, "frozen", False):
+        return None
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{_FORMAT}|{sys.byteorder}\n".encode())
+    for path in (bst_path, *FLAG_DB_FILES):
+        st = path.stat()
+        h.update(f"{path.name}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+    return h.digest()
+
+
+def _read_index(path: Path, signature: bytes | None) -> FlagIndex | None:
+    try:
+        data = path.read_bytes()
+        magic, fmt, sig, n, m, k = _HEADER.unpack_from(data)
+    except (OSError, struct.error):
+        return None
+    if (magic, fmt) != (_MAGIC, _FORMAT) or signature not in (None, sig):
+        return None
+    if len(data) != _HEADER.size + 4 * (2 * n + 2 * m + k):
+        return None
+    view = memoryview(data)
+    arrays = []
+    pos = _HEADER.size
+    for count in (n, n, m, m, k):
+        values = array("I")
+        values.frombytes(view[pos : pos + 4 * count])
+        arrays.append(values)
+        pos += 4 * count
+    return FlagIndex(*arrays)
+
+
+def _write_index(path: Path, signature: bytes | None, index: FlagIndex) -> bool:
+    """Best effort: the index only saves the next process a rebuild."""
+    header = _HEADER.pack(
+        _MAGIC,
+        _FORMAT,
+        signature or bytes(16),
+        len(index.blocks),
+        len(index.flag_ids),
+        len(index.block_by_position),
+    )
+    tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            for values in (
+                index.blocks,
+                index.offsets,
+                index.flag_ids,
+                index.flag_bits,
+                index.block_by_position,
+            ):
+                values.tofile(f)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def load_flag_index(
+    bst_path: Path | None = None, index_path: Path | None = None
+) -> FlagIndex:
+    """
+    Load the index, compiling and saving it when missing or stale.
+
+    Args:
+        bst_path: eventflag_bst.txt, found with find_bst_file() by default.
+        index_path: Compiled index, next to bst_path by default.
+    """
+    bst_path = bst_path or find_bst_file()
+    index_path = index_path or index_path_for(bst_path)
+    try:
+        signature = _signature(bst_path)
+    except OSError:
+        return build_flag_index(bst_path)
+    index = _read_index(index_path, signature)
+    if index is None:
+        index = build_flag_index(bst_path)
+        _write_index(index_path, signature, index)
+    return index
+
+
+_index: FlagIndex | None = None
+
+
+def get_flag_index() -> FlagIndex:
+    global _index
+    if _index is None:
+        _index = load_flag_index()
+    return _index
+
+
+def compile_flag_index() -> Path:
+    """
+    Build step: compile the index next to eventflag_bst.txt.
+
+    Returns:
+        Path of the written index
+
+    Raises:
+        OSError: The index could not be written
+    """
+    bst_path = find_bst_file()
+    index_path = index_path_for(bst_path)
+    if not _write_index(index_path, _signature(bst_path), build_flag_index(bst_path)):
+        raise OSError(f"could not write {index_path}")
+    return index_path
@@ -0,0 +1,243 @@
+"""
+Gaitem map compaction.
+
+Adds and removes leave free entries scattered through a slot's gaitem map.
+compact_gaitem_map rewrites the map into the layout the inventory
+operations allocate from (see inventory_ops._find_empty_gaitem_slot):
+
+  [gems][free entries for gems][other items, first weapon onwards][free entries]
+
+Live entries keep their relative order and their handles. Handles are not
+tied to an entry's position, and the map holds entries referenced from
+parts of the slot the parser does not model, so entries are moved rather
+than renumbered: inventory rows, equipped-item handles and weapon Ash of
+War links stay valid without being rewritten, and are checked to resolve
+to the same entries afterwards.
+
+An entry that repeats an earlier entry's handle and every field is
+unreachable (lookups stop at the first) and is freed. Freeing shrinks the
+map, and the bytes return to the zero padding at the slot end that later
+growth is absorbed by before inventory_ops falls back to rebuild_slot.
+
+The result is verified with RebuildRoundtripFix; on a mismatch the slot is
+restored and ValueError is raised.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from er_save_manager.parser.er_types import Gaitem
+from er_save_manager.parser.gaitem_map import entry_size
+from er_save_manager.parser.inventory_ops import (
+    SLOT_DATA_SIZE,
+    edit_slot,
+    mark_gaitems_changed,
+)
+from er_save_manager.parser.user_data_x import LazyUserDataX
+
+if TYPE_CHECKING:
+    from er_save_manager.parser.gaitem_map import GaitemMap
+    from er_save_manager.parser.save import Save
+
+_PREFIX_MASK = 0xF0000000
+_PREFIX_WEAPON = 0x80000000
+_PREFIX_GEM = 0xC0000000
+_GAITEM_PREFIXES = (0x80000000, 0x90000000, 0xC0000000)
+
+# GaitemMap columns moved with their entry (offsets are recomputed)
+_COLUMNS = (
+    "handles",
+    "item_ids",
+    "sizes",
+    "unk0x10",
+    "unk0x14",
+    "gem_handles",
+    "unk0x1c",
+    "present",
+)
+
+
+@dataclass
+class CompactionReport:
+    """
+    Outcome of compact_gaitem_map.
+
+    moved: Live entries whose index changed
+    freed: Duplicate entries released
+    gem_pool: Free entries left before the first weapon, for new gems
+    reclaimed_bytes: Bytes the map shrank by, now zero padding at the slot end
+    trailing_zeros_before / trailing_zeros_after: Zero bytes at the end of
+        the slot data, the room the map can grow into without a rebuild
+    """
+
+    moved: int = 0
+    freed: int = 0
+    gem_pool: int = 0
+    reclaimed_bytes: int = 0
+    trailing_zeros_before: int = 0
+    trailing_zeros_after: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.moved or self.freed)
+
+
+def _entry(gaitem_map: GaitemMap, i: int) -> tuple:
+    return tuple(getattr(gaitem_map, name)[i] for name in _COLUMNS)
+
+
+def _canonical_order(gaitem_map: GaitemMap) -> tuple[list[int], list[int], int]:
+    """
+    New entry order for a map.
+
+    Returns:
+        (order, freed, gem_pool): order[new_index] = old index; freed are
+        old indices of duplicate entries to release; gem_pool is how many
+        free entries go between the gems and everything else
+    """
+    handles = gaitem_map.handles
+    seen: dict[int, tuple] = {}
+    gems: list[int] = []
+    others: list[int] = []
+    free: list[int] = []
+    freed: list[int] = []
+    first_weapon = -1
+    pool = 0
+    for i, handle in enumerate(handles):
+        if not handle:
+            free.append(i)
+            if first_weapon == -1:
+                pool += 1
+            continue
+        entry = _entry(gaitem_map, i)
+        first = seen.setdefault(handle, entry)
+        if first is not entry and first == entry:
+            freed.append(i)
+            free.append(i)
+            continue
+        prefix = handle & _PREFIX_MASK
+        if prefix == _PREFIX_GEM:
+            gems.append(i)
+            continue
+        if prefix == _PREFIX_WEAPON and first_weapon == -1:
+            first_weapon = i
+        others.append(i)
+
+    if first_weapon == -1:
+        pool = 0  # without weapons every free entry is open to gems
+    order = gems + free[:pool] + others + free[pool:]
+    return order, freed, pool
+
+
+def _resolved(slot, gaitem_map: GaitemMap) -> dict[int, tuple | None]:
+    """Entry every gaitem handle referenced by the slot resolves to."""
+    refs: set[int] = set()
+    for inventory in (slot.inventory_held, slot.inventory_storage_box):
+        for item_list in (inventory.common_items, inventory.key_items):
+            refs.update(item_list.rows[0::3])
+    refs.update(vars(slot.equipped_items_gaitem_handle).values())
+    refs.update(item.gaitem_handle for item in slot.equipped_items.quick_items)
+    refs.update(item.gaitem_handle for item in slot.equipped_items.pouch_items)
+    handles = gaitem_map.handles
+    for i, gem in enumerate(gaitem_map.gem_handles):
+        if handles[i] & _PREFIX_MASK == _PREFIX_WEAPON:
+            refs.add(gem & 0xFFFFFFFF)
+
+    first: dict[int, int] = {}
+    for i, handle in enumerate(handles):
+        first.setdefault(handle, i)
+    resolved = {}
+    for handle in refs:
+        if handle & _PREFIX_MASK in _GAITEM_PREFIXES:
+            i = first.get(handle)
+            resolved[handle] = None if i is None else _entry(gaitem_map, i)
+    return resolved
+
+
+def _trailing_zeros(save: Save, slot_idx: int) -> int:
+    start = save.slot_data_offset(slot_idx)
+    data = bytes(save._raw_data[start : start + SLOT_DATA_SIZE])
+    return len(data) - len(data.rstrip(b"\x00"))
+
+
+def _rearrange(gaitem_map: GaitemMap, order: list[int], freed: list[int]) -> None:
+    """Move entries into order and free the duplicates, in place."""
+    for name in _COLUMNS:
+        column = getattr(gaitem_map, name)
+        column[:] = array(column.typecode, [column[i] for i in order])
+    new_index = {old: new for new, old in enumerate(order)}
+    for old in freed:
+        gaitem_map[new_index[old]] = Gaitem()
+
+
+def compact_gaitem_map(save: Save, slot_idx: int) -> CompactionReport:
+    """
+    Rewrite a slot's gaitem map into canonical order (see module docstring).
+
+    Args:
+        save: Parsed Save instance.
+        slot_idx: Character slot index 0-9.
+
+    Returns:
+        CompactionReport. Checksums are recalculated by the caller.
+
+    Raises:
+        ValueError: Slot is empty, does not round-trip before compaction,
+                    or the compacted slot failed verification (the slot is
+                    left as it was).
+    """
+    from er_save_manager.fixes.structural_scan import RebuildRoundtripFix
+
+    slot = save.character_slots[slot_idx]
+    if slot.is_empty():
+        raise ValueError(f"slot {slot_idx} is empty")
+    roundtrip = RebuildRoundtripFix()
+    if roundtrip.detect(save, slot_idx):
+        raise ValueError(
+            f"slot {slot_idx} does not re-serialize byte-for-byte; "
+            "compaction could not be verified"
+        )
+
+    gaitem_map = slot.gaitem_map
+    order, freed, pool = _canonical_order(gaitem_map)
+    handles = gaitem_map.handles
+    released = set(freed)
+    report = CompactionReport(
+        moved=sum(
+            1
+            for new, old in enumerate(order)
+            if new != old and handles[old] and old not in released
+        ),
+        freed=len(freed),
+        gem_pool=pool,
+        reclaimed_bytes=sum(gaitem_map.sizes[i] - entry_size(0) for i in freed),
+        trailing_zeros_before=_trailing_zeros(save, slot_idx),
+    )
+    if not report.changed:
+        report.trailing_zeros_after = report.trailing_zeros_before
+        return report
+
+    # Work out the new map on a copy and check every reference first
+    compacted = gaitem_map.copy()
+    _rearrange(compacted, order, freed)
+    if _resolved(slot, compacted) != _resolved(slot, gaitem_map):
+        raise ValueError("compaction would change what a referenced handle resolves to")
+
+    start = save.slot_data_offset(slot_idx)
+    original = bytes(save._raw_data[start : start + SLOT_DATA_SIZE])
+    with edit_slot(save, slot_idx):
+        _rearrange(gaitem_map, order, freed)
+        mark_gaitems_changed(slot)
+
+    if roundtrip.detect(save, slot_idx):
+        save._raw_data[start : start + SLOT_DATA_SIZE] = original
+        save.character_slots[slot_idx] = LazyUserDataX(
+            save, slot_idx, start, save.is_ps
+        )
+        raise ValueError("compacted slot failed the rebuild round-trip check")
+
+    report.trailing_zeros_after = _trailing_zeros(save, slot_idx)
+    return report
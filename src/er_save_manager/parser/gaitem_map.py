@@ -0,0 +1,308 @@
+"""
+Elden Ring Save Parser - Gaitem Map
+
+Array-backed storage for the 5118/5120-entry gaitem map at the start of
+every character slot.
+
+The map is decoded in a single pass over the slot buffer: each entry's
+handle type bits decide whether it is 8, 16 or 21 bytes, and the fields are
+unpacked straight into parallel arrays (handles, item ids, offsets, sizes,
+gem handles). Gaitem objects are only created when an entry is accessed,
+as GaitemView rows that read and write through to those arrays.
+"""
+
+from __future__ import annotations
+
+import struct
+from array import array
+from collections.abc import Iterator, Sequence
+from io import BytesIO
+
+from .buffer_reader import BufferReader
+from .er_types import Gaitem
+
+_HEADER = struct.Struct("<II")
+_EXTRA = struct.Struct("<ii")
+_GEM = struct.Struct("<iB")
+
+# Largest possible gaitem entry (handle type 0x80000000)
+MAX_ENTRY_SIZE = 21
+
+# Bits in GaitemMap.present marking which optional fields an entry carries
+_HAS_UNK0X10 = 0x1
+_HAS_UNK0X14 = 0x2
+_HAS_GEM = 0x4
+_HAS_UNK0X1C = 0x8
+
+
+def entry_size(handle: int) -> int:
+    """
+    Size in bytes of a gaitem entry with the given handle.
+
+    Returns:
+        8, 16 or 21 (same rule as Gaitem.get_size)
+    """
+    handle_type = handle & 0xF0000000
+    if handle == 0 or handle_type == 0xC0000000:
+        return 8
+    if handle_type == 0x80000000:
+        return 21
+    return 16
+
+
+def _field(name: str, flag: int) -> property:
+    """Property reading/writing one GaitemMap column for a GaitemView row."""
+
+    def fget(self):
+        gaitem_map = self._map
+        if flag and not gaitem_map.present[self._index] & flag:
+            return None
+        return getattr(gaitem_map, name)[self._index]
+
+    def fset(self, value):
+        gaitem_map = self._map
+        index = self._index
+        if flag:
+            if value is None:
+                gaitem_map.present[index] &= ~flag
+                value = 0
+            else:
+                gaitem_map.present[index] |= flag
+        getattr(gaitem_map, name)[index] = value
+        if name == "handles":
+            gaitem_map.sizes[index] = entry_size(value)
+
+    return property(fget, fset)
+
+
+class GaitemView(Gaitem):
+    """
+    Gaitem row backed by a GaitemMap.
+
+    Behaves like a Gaitem (same fields, read/write/get_size, isinstance),
+    but reads and writes go straight to the owning map's arrays, so in-place
+    edits such as ``slot.gaitem_map[i].item_id = x`` are kept.
+    """
+
+    gaitem_handle = _field("handles", 0)
+    item_id = _field("item_ids", 0)
+    unk0x10 = _field("unk0x10", _HAS_UNK0X10)
+    unk0x14 = _field("unk0x14", _HAS_UNK0X14)
+    gem_gaitem_handle = _field("gem_handles", _HAS_GEM)
+    unk0x1c = _field("unk0x1c", _HAS_UNK0X1C)
+
+    def __init__(self, gaitem_map: GaitemMap, index: int):
+        self._map = gaitem_map
+        self._index = index
+
+    def __eq__(self, other):
+        if not isinstance(other, Gaitem):
+            return NotImplemented
+        return _astuple(self) == _astuple(other)
+
+    __hash__ = None
+
+    def to_gaitem(self) -> Gaitem:
+        """Detached Gaitem copy of this row."""
+        return Gaitem(*_astuple(self))
+
+    def __copy__(self) -> Gaitem:
+        return self.to_gaitem()
+
+    def __deepcopy__(self, memo) -> Gaitem:
+        return self.to_gaitem()
+
+
+def _astuple(g: Gaitem) -> tuple:
+    return (
+        g.gaitem_handle,
+        g.item_id,
+        g.unk0x10,
+        g.unk0x14,
+        g.gem_gaitem_handle,
+        g.unk0x1c,
+    )
+
+
+class GaitemMap(Sequence):
+    """
+    Parallel-array gaitem map.
+
+    Columns (all the same length, one element per entry):
+        handles, item_ids: array('I')
+        offsets: array('I'), entry offset relative to slot data start
+                 (shared with UserDataX.gaitem_offsets)
+        sizes: array('B'), entry size in bytes (8, 16 or 21)
+        unk0x10, unk0x14, gem_handles: array('i')
+        unk0x1c: array('B')
+        present: array('B'), bitmask of optional fields the entry carries
+
+    Indexing returns GaitemView rows; assigning a Gaitem copies its fields
+    into the arrays.
+    """
+
+    def __init__(self):
+        self.handles = array("I")
+        self.item_ids = array("I")
+        self.offsets = array("I")
+        self.sizes = array("B")
+        self.unk0x10 = array("i")
+        self.unk0x14 = array("i")
+        self.gem_handles = array("i")
+        self.unk0x1c = array("B")
+        self.present = array("B")
+
+    @classmethod
+    def decode(
+        cls, buffer, pos: int, count: int, origin: int = 0
+    ) -> tuple[GaitemMap, int]:
+        """
+        Decode count entries from a bytes-like buffer in one pass.
+
+        Args:
+            buffer: bytes, bytearray or memoryview holding the entries
+            pos: Offset of the first entry in buffer
+            count: Number of entries (5118 or 5120)
+            origin: Buffer offset that recorded entry offsets are relative to
+
+        Returns:
+            (GaitemMap, offset just past the last entry)
+        """
+        unpack_header = _HEADER.unpack_from
+        unpack_extra = _EXTRA.unpack_from
+        unpack_gem = _GEM.unpack_from
+
+        handles = [0] * count
+        item_ids = [0] * count
+        offsets = [0] * count
+        sizes = [8] * count
+        unk0x10 = [0] * count
+        unk0x14 = [0] * count
+        gem_handles = [0] * count
+        unk0x1c = [0] * count
+        present = [0] * count
+
+        for i in range(count):
+            handle, item_id = unpack_header(buffer, pos)
+            handles[i] = handle
+            item_ids[i] = item_id
+            offsets[i] = pos - origin
+            handle_type = handle & 0xF0000000
+            if handle == 0 or handle_type == 0xC0000000:
+                pos += 8
+                continue
+            unk0x10[i], unk0x14[i] = unpack_extra(buffer, pos + 8)
+            if handle_type == 0x80000000:
+                gem_handles[i], unk0x1c[i] = unpack_gem(buffer, pos + 16)
+                sizes[i] = 21
+                present[i] = _HAS_UNK0X10 | _HAS_UNK0X14 | _HAS_GEM | _HAS_UNK0X1C
+                pos += 21
+            else:
+                sizes[i] = 16
+                present[i] = _HAS_UNK0X10 | _HAS_UNK0X14
+                pos += 16
+
+        obj = cls()
+        obj.handles = array("I", handles)
+        obj.item_ids = array("I", item_ids)
+        obj.offsets = array("I", offsets)
+        obj.sizes = array("B", sizes)
+        obj.unk0x10 = array("i", unk0x10)
+        obj.unk0x14 = array("i", unk0x14)
+        obj.gem_handles = array("i", gem_handles)
+        obj.unk0x1c = array("B", unk0x1c)
+        obj.present = array("B", present)
+        return obj, pos
+
+    @classmethod
+    def read(cls, f: BytesIO, count: int, origin: int = 0) -> GaitemMap:
+        """
+        Read count entries from a stream and leave it positioned after them.
+
+        Args:
+            f: BytesIO or BufferReader positioned at the first entry
+               (a BufferReader is decoded in place without a copy)
+            count: Number of entries (5118 or 5120)
+            origin: Stream position that entry offsets are relative to
+
+        Returns:
+            GaitemMap instance
+        """
+        start = f.tell()
+        size = count * MAX_ENTRY_SIZE
+        if isinstance(f, BufferReader):
+            with f.peek_view(size) as data:
+                obj, end = cls.decode(data, 0, count, origin - start)
+        else:
+            data = f.read(size)
+            obj, end = cls.decode(data, 0, count, origin - start)
+        f.seek(start + end)
+        return obj
+
+    def write(self, f: BytesIO):
+        """Write all entries to stream (mirrors Gaitem.write per entry)."""
+        out = bytearray()
+        pack_header = _HEADER.pack
+        pack_extra = _EXTRA.pack
+        pack_gem = _GEM.pack
+        for i, handle in enumerate(self.handles):
+            out += pack_header(handle, self.item_ids[i])
+            size = entry_size(handle)
+            if size == 8:
+                continue
+            out += pack_extra(self.unk0x10[i], self.unk0x14[i])
+            if size == 21:
+                out += pack_gem(self.gem_handles[i], self.unk0x1c[i])
+        f.write(out)
+
+    def get_size(self, index: int) -> int:
+        """Size in bytes of entry index, from its current handle."""
+        return entry_size(self.handles[index])
+
+    def find_handle(self, handle: int) -> int:
+        """Index of the first entry with this handle, or -1."""
+        try:
+            return self.handles.index(handle)
+        except ValueError:
+            return -1
+
+    def to_list(self) -> list[Gaitem]:
+        """Detached list of plain Gaitem objects."""
+        return [GaitemView(self, i).to_gaitem() for i in range(len(self))]
+
+    def copy(self) -> GaitemMap:
+        """Independent copy of every column (offsets included)."""
+        clone = GaitemMap()
+        for name, column in vars(self).items():
+            setattr(clone, name, array(column.typecode, column))
+        return clone
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [GaitemView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("gaitem index out of range")
+        return GaitemView(self, index)
+
+    def __setitem__(self, index: int, gaitem: Gaitem):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("gaitem index out of range")
+        values = _astuple(gaitem)
+        row = GaitemView(self, index)
+        row.gaitem_handle, row.item_id = values[0], values[1]
+        row.unk0x10, row.unk0x14 = values[2], values[3]
+        row.gem_gaitem_handle, row.unk0x1c = values[4], values[5]
+
+    def __iter__(self) -> Iterator[GaitemView]:
+        for i in range(len(self.handles)):
+            yield GaitemView(self, i)
+
+    def __repr__(self) -> str:
+        return f"GaitemMap({len(self)} entries)"
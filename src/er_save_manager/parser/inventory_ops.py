@@ -11,12 +11,19 @@ Supported categories and their storage mechanism:
 
 All public functions mutate the Save object in place. The caller must call
 save.recalculate_checksums() and save.to_file() after all operations.
+Wrapping several operations on one slot in edit_slot() writes the slot back
+once at the end instead of after every operation.
 """
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from functools import partial
 from typing import TYPE_CHECKING
 
+from er_save_manager.data.item_table import UPGRADE_CAPS, item_traits
+from er_save_manager.parser.slot_index import slot_index, weapon_base
+
 if TYPE_CHECKING:
     from er_save_manager.parser.save import Save
 
@@ -35,9 +42,13 @@ _PREFIX_GEM = 0xC0000000  # gaitem handle prefix, size 8
 SLOT_DATA_SIZE = 0x280000
 
 # Upgrade caps by reinforcement type
-UPGRADE_CAP_STANDARD = 25
-UPGRADE_CAP_SOMBER = 10
-UPGRADE_CAP_ASH = 10
+UPGRADE_CAP_STANDARD = UPGRADE_CAPS["standard"]
+UPGRADE_CAP_SOMBER = UPGRADE_CAPS["somber"]
+UPGRADE_CAP_ASH = UPGRADE_CAPS["ash"]
+
+
+class ItemAlreadyPresentError(ValueError):
+    """A non-stacking add found the item already in the target inventory."""
 
 
 # ---- category helpers -------------------------------------------------------
@@ -48,472 +59,12 @@ def _category(full_item_id: int) -> int:
 
 
 def _needs_gaitem(full_item_id: int) -> bool:
-    return _category(full_item_id) in (_CAT_WEAPON, _CAT_ARMOR, _CAT_GEM)
-
-
-# Goods base IDs (without 0x40000000) that go in key_items, not common_items.
-# Sourced from KeyItems.csv plus cookbooks/whetblades which appear in separate CSVs.
-_KEY_ITEM_BASE_IDS: frozenset[int] = frozenset(
-    [
-        # Multiplayer items
-        100,  # Tarnished's Furled Finger
-        101,  # Duelist's Furled Finger
-        102,  # Bloody Finger
-        103,  # Finger Severer
-        104,  # White Cipher Ring
-        105,  # Blue Cipher Ring
-        106,  # Tarnished's Wizened Finger
-        107,  # Phantom Bloody Finger
-        108,  # Taunter's Tongue
-        109,  # Small Golden Effigy
-        110,  # Small Red Effigy
-        111,  # Festering Bloody Finger
-        112,  # Recusant Finger
-        113,  # Phantom Bloody Finger
-        114,  # Phantom Recusant Finger
-        115,  # Memory of Grace
-        130,  # Spectral Steed Whistle
-        135,  # Phantom Great Rune
-        # Great Runes (powered)
-        191,  # Godrick's Great Rune
-        192,  # Radahn's Great Rune
-        193,  # Morgott's Great Rune
-        194,  # Rykard's Great Rune
-        195,  # Mohg's Great Rune
-        196,  # Malenia's Great Rune
-        # Other key items
-        2090,  # Deathroot
-        8000,  # Stonesword Key
-        8010,  # Rusty Key
-        8102,  # Lucent Baldachin's Blessing
-        8105,  # Dectus Medallion (Left)
-        8106,  # Dectus Medallion (Right)
-        8107,  # Rold Medallion
-        8109,  # Academy Glintstone Key
-        8111,  # Carian Inverted Statue
-        8121,  # Dark Moon Ring
-        8126,  # Fingerprint Grape
-        8127,  # Letter from Volcano Manor
-        8128,  # Tonic of Forgetfulness
-        8129,  # Serpent's Amnion
-        8130,  # Rya's Necklace
-        8131,  # Irina's Letter
-        8132,  # Letter from Volcano Manor
-        8133,  # Red Letter
-        8134,  # Drawing-Room Key
-        8136,  # Rya's Necklace
-        8137,  # Volcano Manor Invitation
-        8142,  # Amber Starlight
-        8143,  # Seluvis's Introduction
-        8144,  # Sellen's Primal Glintstone
-        8146,  # Miniature Ranni
-        # Great Runes (unpowered)
-        8148,  # Godrick's Great Rune (Unpowered)
-        8149,  # Radahn's Great Rune (Unpowered)
-        8150,  # Morgott's Great Rune (Unpowered)
-        8151,  # Rykard's Great Rune (Unpowered)
-        8152,  # Mohg's Great Rune (Unpowered)
-        8153,  # Malenia's Great Rune (Unpowered)
-        # Quest items continued
-        8154,  # Lord of Blood's Favor
-        8155,  # Lord of Blood's Favor (Soaked)
-        8156,  # Burial Crow's Letter
-        8158,  # Spirit Calling Bell
-        8159,  # Fingerslayer Blade
-        8161,  # Sewing Needle
-        8162,  # Gold Sewing Needle
-        8163,  # Tailoring Tools
-        8164,  # Seluvis's Potion
-        8166,  # Amber Draught
-        8167,  # Letter to Patches
-        8168,  # Dancer's Castanets
-        8169,  # Sellian Sealbreaker
-        8171,  # Chrysalids' Memento
-        8172,  # Black Knifeprint
-        8173,  # Letter to Bernahl
-        8174,  # Academy Glintstone Key (Spare)
-        8175,  # Haligtree Secret Medallion (Left)
-        8176,  # Haligtree Secret Medallion (Right)
-        8181,  # Burial Crow's Letter
-        8182,  # Mending Rune of Perfect Order
-        8183,  # Mending Rune of the Death-Prince
-        8184,  # Mending Rune of the Fell Curse
-        8185,  # Larval Tear
-        8186,  # Imbued Sword Key
-        8187,  # Miniature Ranni (Lifeless)
-        8188,  # Golden Tailoring Tools
-        8189,  # Iji's Confession
-        8190,  # Knifeprint Clue
-        8191,  # Cursemark of Death
-        8192,  # Asimi's Husk
-        8193,  # Seedbed Curse
-        8194,  # The Stormhawk King
-        8196,  # Unalloyed Gold Needle
-        8197,  # Sewer-Gaol Key
-        8198,  # Meeting Place Map
-        8199,  # Discarded Palace Key
-        # Crafting
-        8500,  # Crafting Kit
-        # Whetstone / whetblades
-        8590,  # Whetstone Knife
-        8970,  # Iron Whetblade
-        8971,  # Red-Hot Whetblade
-        8972,  # Sanctified Whetblade
-        8973,  # Glintstone Whetblade
-        8974,  # Black Whetblade
-        8975,  # Unalloyed Gold Needle (Snapped)
-        8976,  # Unalloyed Gold Needle (Repaired)
-        8977,  # Valkyrie's Prosthesis
-        8978,  # Sellia's Secret
-        8979,  # Beast Eye
-        8980,  # Weathered Dagger
-        # Great Rune of the Unborn
-        10080,
-        10060,  # Dragon Heart
-        10070,  # Lost Ashes of War
-        # Containers and upgrades
-        10030,  # Memory Stone
-        10040,  # Talisman Pouch
-        9500,  # Cracked Pot
-        9501,  # Ritual Pot
-        9510,  # Perfume Bottle
-        2009500,  # Hefty Cracked Pot
-        # Vanilla cookbooks
-        9300,
-        9301,
-        9302,
-        9303,
-        9305,
-        9306,
-        9307,
-        9308,
-        9309,
-        9310,
-        9311,
-        9312,
-        9313,
-        9320,
-        9321,
-        9322,
-        9323,
-        9325,
-        9326,
-        9327,
-        9328,
-        9329,
-        9330,
-        9331,
-        9340,
-        9341,
-        9342,
-        9343,
-        9344,
-        9345,
-        9346,
-        9347,
-        9348,
-        9360,
-        9361,
-        9363,
-        9364,
-        9365,
-        9380,
-        9383,
-        9384,
-        9385,
-        9386,
-        9387,
-        9388,
-        9389,
-        9390,
-        9391,
-        9392,
-        9400,
-        9401,
-        9402,
-        9403,
-        9420,
-        9421,
-        9422,
-        9423,
-        9440,
-        9441,
-        # DLC key items
-        2008000,  # Miquella's Great Rune
-        2008003,  # Igon's Furled Finger
-        2008004,  # Well Depths Key
-        2008005,  # Gaol Upper Level Key
-        2008006,  # Gaol Lower Level Key
-        2008007,  # Cross Map
-        2008008,  # Hole-Laden Necklace
-        2008011,  # Heart of Bayle
-        2008012,  # New Cross Map
-        2008013,  # Storeroom Key
-        2008014,  # Secret Rite Scroll
-        2008019,  # Black Syrup
-        2008021,  # Messmer's Kindling
-        2008023,  # Keep Wall Key
-        2008033,  # Larval Tear (Spirit)
-        2008036,  # Prayer Room Key
-        # Crystal Tears
-        11000,  # Crimsonspill Crystal Tear
-        11001,  # Greenspill Crystal Tear
-        11002,  # Crimson Crystal Tear
-        11003,  # Crimson Crystal Tear
-        11004,  # Cerulean Crystal Tear
-        11005,  # Cerulean Crystal Tear
-        11006,  # Speckled Hardtear
-        11007,  # Crimson Bubbletear
-        11008,  # Opaline Bubbletear
-        11009,  # Crimsonburst Crystal Tear
-        11010,  # Greenburst Crystal Tear
-        11011,  # Opaline Hardtear
-        11012,  # Winged Crystal Tear
-        11013,  # Thorny Cracked Tear
-        11014,  # Spiked Cracked Tear
-        11015,  # Windy Crystal Tear
-        11016,  # Ruptured Crystal Tear
-        11017,  # Ruptured Crystal Tear
-        11018,  # Leaden Hardtear
-        11019,  # Twiggy Cracked Tear
-        11020,  # Crimsonwhorl Bubbletear
-        11021,  # Strength-knot Crystal Tear
-        11022,  # Dexterity-knot Crystal Tear
-        11023,  # Intelligence-knot Crystal Tear
-        11024,  # Faith-knot Crystal Tear
-        11025,  # Cerulean Hidden Tear
-        11026,  # Stonebarb Cracked Tear
-        11027,  # Purifying Crystal Tear
-        11028,  # Flame-Shrouding Cracked Tear
-        11029,  # Magic-Shrouding Cracked Tear
-        11030,  # Lightning-Shrouding Cracked Tear
-        11031,  # Holy-Shrouding Cracked Tear
-        # DLC Crystal Tears
-        2011000,  # Viridian Hidden Tear
-        2011010,  # Crimsonburst Dried Tear
-        2011020,  # Crimson-Sapping Cracked Tear
-        2011030,  # Cerulean-Sapping Cracked Tear
-        2011040,  # Oil-Soaked Tear
-        2011050,  # Bloodsucking Cracked Tear
-        2011060,  # Glovewort Crystal Tear
-        2011070,  # Deflecting Hardtear
-        # Maps
-        8600,  # Map: Limgrave
-        8601,  # Map: Weeping Peninsula
-        8602,  # Map: Limgrave
-        8603,  # Map: Liurnia
-        8604,  # Map: Liurnia
-        8605,  # Map: Liurnia
-        8606,  # Map: Altus Plateau
-        8607,  # Map: Leyndell
-        8608,  # Map: Mt. Gelmir
-        8609,  # Map: Caelid
-        8610,  # Map: Dragonbarrow
-        8611,  # Map: Mountaintops of the Giants
-        8612,  # Map: Mountaintops of the Giants
-        8613,  # Map: Ainsel River
-        8614,  # Map: Lake of Rot
-        8615,  # Map: Siofra River
-        8616,  # Map: Mohgwyn Palace
-        8617,  # Map: Deeproot Depths
-        8618,  # Map: Consecrated Snowfield
-        # DLC Maps
-        2008600,  # Map: Gravesite Plain
-        2008601,  # Map: Scadu Altus
-        2008602,  # Map: Southern Shore
-        2008603,  # Map: Rauh Ruins
-        2008604,  # Map: Abyss
-        # Convergence Maps (separate IDs from base game)
-        8620,  # Map: Limgrave
-        8621,  # Map: Caelid
-        8622,  # Map: Liurnia
-        8623,  # Map: Altus Plateau
-        8624,  # Map: Mountaintops of the Giants
-        8625,  # Map: Consecrated Snowfield
-        8626,  # Map: Farum Azula
-        8627,  # Map: Underground
-        8628,  # Map: Realm of Shadow
-        8660,  # Map: Mirage Riddle
-        # Bell Bearings and Spellbooks (MerchantItems)
-        8850,  # Conspectus Scroll
-        8851,  # Royal House Scroll
-        8855,  # Fire Monks' Prayerbook
-        8856,  # Giant's Prayerbook
-        8857,  # Godskin Prayerbook
-        8858,  # Two Fingers' Prayerbook
-        8859,  # Assassin's Prayerbook
-        8860,  # Erdtree Prayerbook
-        8861,  # Erdtree Codex
-        8862,  # Golden Order Principia
-        8863,  # Golden Order Principles
-        8864,  # Dragon Cult Prayerbook
-        8865,  # Ancient Dragon Prayerbook
-        8866,  # Academy Scroll
-        8910,  # Pidia's Bell Bearing
-        8911,  # Seluvis's Bell Bearing
-        8912,  # Patches' Bell Bearing
-        8913,  # Sellen's Bell Bearing
-        8915,  # D's Bell Bearing
-        8916,  # Bernahl's Bell Bearing
-        8917,  # Miriel's Bell Bearing
-        8918,  # Gostoc's Bell Bearing
-        8919,  # Thops's Bell Bearing
-        8920,  # Kale's Bell Bearing
-        8921,  # Nomadic Merchant's Bell Bearing [1]
-        8922,  # Nomadic Merchant's Bell Bearing [2]
-        8923,  # Nomadic Merchant's Bell Bearing [3]
-        8924,  # Nomadic Merchant's Bell Bearing [4]
-        8925,  # Nomadic Merchant's Bell Bearing [5]
-        8926,  # Isolated Merchant's Bell Bearing [1]
-        8927,  # Isolated Merchant's Bell Bearing [2]
-        8928,  # Nomadic Merchant's Bell Bearing [6]
-        8929,  # Hermit Merchant's Bell Bearing [1]
-        8930,  # Nomadic Merchant's Bell Bearing [7]
-        8931,  # Nomadic Merchant's Bell Bearing [8]
-        8932,  # Nomadic Merchant's Bell Bearing [9]
-        8933,  # Nomadic Merchant's Bell Bearing [10]
-        8934,  # Nomadic Merchant's Bell Bearing [11]
-        8935,  # Isolated Merchant's Bell Bearing [3]
-        8936,  # Hermit Merchant's Bell Bearing [2]
-        8937,  # Abandoned Merchant's Bell Bearing
-        8938,  # Hermit Merchant's Bell Bearing [3]
-        8939,  # Imprisoned Merchant's Bell Bearing
-        8940,  # Iji's Bell Bearing
-        8941,  # Rogier's Bell Bearing
-        8942,  # Blackguard's Bell Bearing
-        8943,  # Corhyn's Bell Bearing
-        8944,  # Gowry's Bell Bearing
-        8945,  # Bone Peddler's Bell Bearing
-        8946,  # Meat Peddler's Bell Bearing
-        8947,  # Medicine Peddler's Bell Bearing
-        8948,  # Gravity Stone Peddler's Bell Bearing
-        8951,  # Smithing-Stone Miner's Bell Bearing [1]
-        8952,  # Smithing-Stone Miner's Bell Bearing [2]
-        8953,  # Smithing-Stone Miner's Bell Bearing [3]
-        8954,  # Smithing-Stone Miner's Bell Bearing [4]
-        8955,  # Somberstone Miner's Bell Bearing [1]
-        8956,  # Somberstone Miner's Bell Bearing [2]
-        8957,  # Somberstone Miner's Bell Bearing [3]
-        8958,  # Somberstone Miner's Bell Bearing [4]
-        8959,  # Somberstone Miner's Bell Bearing [5]
-        8960,  # Glovewort Picker's Bell Bearing [1]
-        8961,  # Glovewort Picker's Bell Bearing [2]
-        8962,  # Glovewort Picker's Bell Bearing [3]
-        8963,  # Ghost-Glovewort Picker's Bell Bearing [1]
-        8964,  # Ghost-Glovewort Picker's Bell Bearing [2]
-        8965,  # Ghost-Glovewort Picker's Bell Bearing [3]
-        # DLC Bell Bearings
-        2008900,  # Moore's Bell Bearing
-        2008901,  # Ymir's Bell Bearing
-        2008902,  # Herbalist's Bell Bearing
-        2008903,  # Mushroom-Seller's Bell Bearing [1]
-        2008904,  # Mushroom-Seller's Bell Bearing [2]
-        2008905,  # Greasemonger's Bell Bearing
-        2008906,  # Moldmonger's Bell Bearing
-        2008907,  # Igon's Bell Bearing
-        2008908,  # Spellmachinist's Bell Bearing
-        2008909,  # String-Seller's Bell Bearing
-        # Convergence Crystal Tears
-        11032,  # Stone-Shrouding Cracked Tear
-        11033,  # Arcane-Knot Crystal Tear
-        11034,  # Knight's Crystal Tear
-        11035,  # Battlemage's Crystal Tear
-        11036,  # Templar's Crystal Tear
-        11037,  # Barbarian's Crystal Tear
-        11038,  # Assassin's Crystal Tear
-        11039,  # Inquisitor's Crystal Tear
-        11040,  # Rogue's Crystal Tear
-        11041,  # Zealot's Crystal Tear
-        11042,  # Witch's Crystal Tear
-        11043,  # Cultist's Crystal Tear
-        11050,  # Waterblade Cracked Tear
-        11051,  # Stonetalon Cracked Tear
-        11052,  # Windbarb Cracked Tear
-        11053,  # Shadowblade Cracked Tear
-        11054,  # Stoneblade Cracked Tear
-        11055,  # Stonehoof Cracked Tear
-        11056,  # Ceruleanburst Crystal Tear
-        11057,  # Ceruleanspill Crystal Tear
-        # Convergence Bell Bearings
-        8981,  # Shadow Stone Miner's Bell Bearing [1]
-        8982,  # Shadow Stone Miner's Bell Bearing [2]
-        8983,  # Shadow Stone Miner's Bell Bearing [3]
-        8984,  # Somber Shadow Stone Miner's Bell Bearing [1]
-        8985,  # Somber Shadow Stone Miner's Bell Bearing [2]
-        8986,  # Somber Shadow Stone Miner's Bell Bearing [3]
-        # Convergence Steeds
-        2500,  # Funeral Steed
-        2501,  # Frenzied Mule
-        2502,  # Carian Knight Steed
-        2503,  # Erdtree Steed
-        # Convergence Keystones
-        8060,  # Keystone 1
-        8061,  # Keystone 2
-        8062,  # Keystone 3
-        8063,  # Keystone 4
-        8064,  # Keystone 5
-        # Convergence Perfumer items and Putrid Key
-        8138,  # Putrid Key
-        8510,  # Perfumer Hammer Shell
-        8511,  # Perfumer's Fire Core
-        8512,  # Perfumer's Frost Core
-        8513,  # Perfumer's Lightning Core
-        8514,  # Perfumer's Frenzy Core
-        # DLC cookbooks
-        2009301,
-        2009302,
-        2009303,
-        2009304,
-        2009305,
-        2009306,
-        2009307,
-        2009308,
-        2009309,
-        2009310,
-        2009311,
-        2009312,
-        2009313,
-        2009314,
-        2009315,
-        2009316,
-        2009317,
-        2009318,
-        2009319,
-        2009320,
-        2009321,
-        2009322,
-        2009323,
-        2009324,
-        2009325,
-        2009326,
-        2009327,
-        2009328,
-        2009329,
-        2009330,
-        2009331,
-        2009332,
-        2009333,
-        2009334,
-        2009335,
-        2009336,
-        2009337,
-        2009338,
-        2009339,
-        2009340,
-        2009341,
-        2009342,
-        2009343,
-        2009344,
-        2009345,
-    ]
-)
+    return item_traits(full_item_id).gaitem_size > 0
 
 
 def _is_key_item(full_item_id: int) -> bool:
     """Return True if this goods item belongs in key_items rather than common_items."""
-    if _category(full_item_id) != _CAT_GOODS:
-        return False
-    return (full_item_id & 0x0FFFFFFF) in _KEY_ITEM_BASE_IDS
+    return item_traits(full_item_id).key_item
 
 
 def _gaitem_prefix(full_item_id: int) -> int:
@@ -581,18 +132,9 @@ def _next_gaitem_handle(slot, prefix: int) -> int:
     PC saves use 0x80; PS/Switch saves use 0x81-0x87. Writing 0x80 on console
     saves causes the game engine to treat items as phantom/invalid.
     """
-    max_lower16 = 0
-    second_byte = 0x80  # PC default
-    for g in slot.gaitem_map:
-        if g.gaitem_handle == 0:
-            continue
-        g_prefix = g.gaitem_handle & 0xF0000000
-        if g_prefix in (_PREFIX_WEAPON, _PREFIX_ARMOR, _PREFIX_GEM):
-            lower16 = g.gaitem_handle & 0x0000FFFF
-            if lower16 > max_lower16:
-                max_lower16 = lower16
-            if second_byte == 0x80:
-                second_byte = (g.gaitem_handle >> 16) & 0xFF
+    gaitems = slot_index(slot).gaitems
+    max_lower16 = gaitems.max_counter()
+    second_byte = gaitems.second_byte()  # 0x80 (PC) unless a console save
 
     next_lower16 = (max_lower16 + 1) & 0xFFFF
     category_high = {
@@ -610,33 +152,26 @@ def _find_empty_gaitem_slot(slot, prefix: int) -> int:
     Gems go before the first weapon entry (AoW region), use the first
     available empty there to keep gems compactly packed.
 
-    Weapons and armor go after the first weapon entry. Return the LAST
-    available empty in that region so that the insert position equals the
-    last-empty position. The INSERT-before + DELETE-last-empty algorithm in
-    _patch_slot_with_gaitem_insert is only orphan-free when they coincide.
+    Weapons and armor go after the first weapon entry, in the LAST
+    available empty of that region. The entry is filled in place and grows
+    (8 -> 16 or 21 bytes); when the edit_slot block ends, _flush_slot_edit
+    re-serializes the map and shifts everything after it. Only the entries
+    behind the filled one change position inside the map, so the last empty
+    keeps the rewritten byte range (and the dirty/journaled extents) small.
 
     Returns -1 if no suitable slot exists.
     """
-    first_weapon_idx = -1
-    for i, g in enumerate(slot.gaitem_map):
-        if g.gaitem_handle != 0 and (g.gaitem_handle & 0xF0000000) == _PREFIX_WEAPON:
-            first_weapon_idx = i
-            break
+    gaitems = slot_index(slot).gaitems
+    first_weapon_idx = gaitems.first_weapon()
 
     if prefix == _PREFIX_GEM:
-        for i, g in enumerate(slot.gaitem_map):
-            if first_weapon_idx != -1 and i >= first_weapon_idx:
-                break
-            if g.gaitem_handle == 0:
-                return i
-        return -1
-
-    start = (first_weapon_idx + 1) if first_weapon_idx != -1 else 0
-    result = -1
-    for i in range(start, len(slot.gaitem_map)):
-        if slot.gaitem_map[i].gaitem_handle == 0:
-            result = i
-    return result
+        first_empty = gaitems.first_empty()
+        if first_weapon_idx != -1 and first_empty > first_weapon_idx:
+            return -1
+        return first_empty
+
+    last_empty = gaitems.last_empty()
+    return last_empty if last_empty > first_weapon_idx else -1
 
 
 def _find_gaitem_by_item(slot, full_item_id: int, inventory=None):
@@ -653,96 +188,55 @@ def _find_gaitem_by_item(slot, full_item_id: int, inventory=None):
     """
     cat_bits = _category(full_item_id)
     base_id = full_item_id & 0x0FFFFFFF
-    for i, g in enumerate(slot.gaitem_map):
-        if g.gaitem_handle == 0:
-            continue
-        g_prefix = g.gaitem_handle & 0xF0000000
-
-        match = False
-        if cat_bits == _CAT_WEAPON:
-            if g_prefix == _PREFIX_WEAPON:
-                stored_base = (g.item_id & 0x0FFFFFFF) // 10000 * 10000
-                want_base = base_id // 10000 * 10000
-                if stored_base == want_base:
-                    match = True
-        elif cat_bits == _CAT_GEM:
-            if g_prefix == _PREFIX_GEM:
-                if g.item_id == base_id or g.item_id == full_item_id:
-                    match = True
-        else:
-            if _category(g.item_id) == cat_bits and g.item_id == full_item_id:
-                match = True
+    index = slot_index(slot)
+    gaitems = index.gaitems
+    if cat_bits == _CAT_WEAPON:
+        candidates = gaitems.entries_for_weapon(weapon_base(base_id))
+    elif cat_bits == _CAT_GEM:
+        candidates = sorted(
+            i
+            for key in {base_id, full_item_id}
+            for i in gaitems.entries_for_item(key)
+            if gaitems.handles[i] & 0xF0000000 == _PREFIX_GEM
+        )
+    else:
+        candidates = gaitems.entries_for_item(full_item_id)
 
-        if match:
-            if inventory is None:
-                return i, g
-            else:
-                if (
-                    _find_handle_slot(inventory.common_items, g.gaitem_handle) != -1
-                    or _find_handle_slot(inventory.key_items, g.gaitem_handle) != -1
-                ):
-                    return i, g
+    for i in candidates:
+        if inventory is not None:
+            handle = gaitems.handles[i]
+            if (
+                index.items(inventory.common_items).find_handle(handle) == -1
+                and index.items(inventory.key_items).find_handle(handle) == -1
+            ):
+                continue
+        return i, slot.gaitem_map[i]
 
     return -1, None
 
 
-def _gaitem_last_empty(slot, slot_data_base: int) -> int | None:
-    """Return absolute buffer offset of the last empty gaitem entry, or None."""
-    result = None
-    for i, g in enumerate(slot.gaitem_map):
-        if g.gaitem_handle == 0:
-            result = slot_data_base + slot.gaitem_offsets[i]
-    return result
-
-
 # ---- inventory helpers ------------------------------------------------------
 
 
 def _global_next_acq_index(slot) -> int:
     """Return next globally unique acquisition index (max across all inventories + 2)."""
-    max_seen = 0
-    for inv in (slot.inventory_held, slot.inventory_storage_box):
-        for it in inv.common_items:
-            # Ignore corrupted indices that exceed the 32-bit signed integer limit
-            if (
-                it.gaitem_handle != 0
-                and it.acquisition_index < 0x7FFFFFFF
-                and it.acquisition_index > max_seen
-            ):
-                max_seen = it.acquisition_index
-        for it in inv.key_items:
-            # Ignore corrupted indices that exceed the 32-bit signed integer limit
-            if (
-                it.gaitem_handle != 0
-                and it.acquisition_index < 0x7FFFFFFF
-                and it.acquisition_index > max_seen
-            ):
-                max_seen = it.acquisition_index
-    return max_seen + 2
+    # Corrupted indices past the 32-bit signed integer limit are ignored
+    return slot_index(slot).max_acquisition() + 2
 
 
-def _first_empty_inv_slot(inventory) -> int:
+def _first_empty_inv_slot(slot, inventory) -> int:
     """Return index of first common_items slot with gaitem_handle == 0, or -1."""
-    for i, it in enumerate(inventory.common_items):
-        if it.gaitem_handle == 0:
-            return i
-    return -1
+    return slot_index(slot).items(inventory.common_items).find_handle(0)
 
 
-def _first_empty_key_slot(inventory) -> int:
+def _first_empty_key_slot(slot, inventory) -> int:
     """Return index of first key_items slot with gaitem_handle == 0, or -1."""
-    for i, it in enumerate(inventory.key_items):
-        if it.gaitem_handle == 0:
-            return i
-    return -1
+    return slot_index(slot).items(inventory.key_items).find_handle(0)
 
 
-def _find_handle_slot(item_list, handle: int) -> int:
+def _find_handle_slot(slot, item_list, handle: int) -> int:
     """Return index of the entry with the given gaitem_handle, or -1."""
-    for i, it in enumerate(item_list):
-        if it.gaitem_handle == handle:
-            return i
-    return -1
+    return slot_index(slot).items(item_list).find_handle(handle)
 
 
 def _select_inventory(slot, location: str):
@@ -756,121 +250,170 @@ def _select_inventory(slot, location: str):
 # ---- binary patch helpers ---------------------------------------------------
 
 
+def _write_inventories(buffer, slot_data_base: int, slot) -> None:
+    """Serialize both Inventory structs into buffer at their section starts."""
+    from io import BytesIO
+
+    sections = slot.sections
+    for name, inventory in (
+        ("inventory_held", slot.inventory_held),
+        ("inventory_storage_box", slot.inventory_storage_box),
+    ):
+        if not sections.has(name):
+            continue
+        buf = BytesIO()
+        inventory.write(buf)
+        data = buf.getvalue()
+        abs_off = slot_data_base + sections.start(name)
+        buffer[abs_off : abs_off + len(data)] = data
+
+
 def _patch_slot(save: Save, slot_idx: int, slot) -> None:
     """
     Write modified inventory bytes directly into save._raw_data.
 
     Serializes only the affected Inventory structs and patches their exact byte
-    ranges, leaving all other slot data untouched.
+    ranges, leaving all other slot data untouched. Inside an edit_slot block
+    the write is deferred to the end of the block.
     """
-    from io import BytesIO
+    edit = slot.__dict__.get("_slot_edit")
+    if edit is not None:
+        edit.inventories = True
+        return
+    _write_inventories(save._raw_data, save.slot_data_offset(slot_idx), slot)
 
-    slot_data_base = save.slot_data_offset(slot_idx)
 
-    if slot.inventory_held_offset:
-        buf = BytesIO()
-        slot.inventory_held.write(buf)
-        data = buf.getvalue()
-        abs_off = slot_data_base + slot.inventory_held_offset
-        save._raw_data[abs_off : abs_off + len(data)] = data
+class _SlotEdit:
+    """Pending changes of an open edit_slot block."""
 
-    if slot.inventory_storage_offset:
-        buf = BytesIO()
-        slot.inventory_storage_box.write(buf)
-        data = buf.getvalue()
-        abs_off = slot_data_base + slot.inventory_storage_offset
-        save._raw_data[abs_off : abs_off + len(data)] = data
+    def __init__(self, slot):
+        # Byte span of the gaitem map as it is in the save buffer
+        self.old_map_start, self.old_map_end = slot.sections.span("gaitem_map")
+        self.gaitems = False
+        self.inventories = False
 
 
-def _patch_slot_with_gaitem_insert(
-    save: Save,
-    slot_idx: int,
-    slot,
-    gaitem_idx: int,
-    new_gaitem_bytes: bytes,
-    old_gaitem_size: int,
-) -> int:
+@contextmanager
+def edit_slot(save: Save, slot_idx: int):
     """
-    Insert/replace a gaitem entry in the binary slot data.
+    Group inventory operations on one slot into a single write-back.
 
-    Returns the net byte shift applied to everything after the gaitem region
-    (inventory, event flags, etc.) so the caller can update in-memory offsets.
+    Inside the block, add/remove/set_quantity only change the parsed slot;
+    the gaitem map and inventories are written out when the block exits.
+    A changed map size is handled in a slot-local working copy of the
+    0x280000-byte slot data (gaitem map spliced in, slot end trimmed or
+    zero-padded, inventories written at their new offsets) that is copied
+    back into save._raw_data in one same-length write, so other slots and
+    USER_DATA_10/11 never move and the offsets are fixed up once.
 
-    delta == 0: direct overwrite. Net shift = 0.
+    Blocks nest; only the outermost one writes. save._raw_data is stale
+    for this slot until then.
 
-    delta > 0 (expand, e.g. empty 8 -> armor 16 or weapon 21):
-        1. INSERT new entry at entry_abs.
-        2. Delete 8 bytes at last_ga_empty (shifted position after step 1).
-        3. Trim (new_size - 8) bytes from slot end.
-        Net shift = new_size - 8.
+    Yields:
+        The slot (UserDataX)
+    """
+    slot = save.character_slots[slot_idx]
+    if slot.__dict__.get("_slot_edit") is not None:
+        yield slot
+        return
 
-    delta < 0 (shrink, e.g. weapon 21 -> empty 8):
-        1. INSERT small entry at entry_abs.
-        2. Delete old large entry.
-        3. Append abs(delta) zeros at slot end.
-        Net shift = -(old_size - new_size).
+    edit = _SlotEdit(slot)
+    slot.__dict__["_slot_edit"] = edit
+    try:
+        yield slot
+    finally:
+        del slot.__dict__["_slot_edit"]
+        _flush_slot_edit(save, slot_idx, slot, edit)
+
+
+def mark_gaitems_changed(slot) -> None:
     """
+    Record that the slot's gaitem map was changed in memory.
+
+    The map is written out (and the slot re-laid out around it if its size
+    changed) when the open edit_slot block exits.
+
+    Raises:
+        RuntimeError: No edit_slot block is open on the slot.
+    """
+    edit = slot.__dict__.get("_slot_edit")
+    if edit is None:
+        raise RuntimeError("gaitem map changes must be made inside edit_slot")
+    edit.gaitems = True
+
+
+def _gaitem_changed(slot, gaitem_idx: int) -> None:
+    """Report an in-memory gaitem map change to the index and the open edit."""
+    slot_index(slot).gaitem_changed(gaitem_idx)
+    mark_gaitems_changed(slot)
+
+
+def _flush_slot_edit(save: Save, slot_idx: int, slot, edit: _SlotEdit) -> None:
+    """
+    Write an edit_slot block's changes into save._raw_data.
+
+    growth > 0 (entries expanded, e.g. empty 8 -> armor 16 or weapon 21):
+        everything after the map moves right and the last `growth` bytes of
+        the slot are trimmed.
+    growth < 0 (entries shrank, e.g. weapon 21 -> empty 8):
+        everything after the map moves left and the slot end is zero-padded.
+    """
+    from io import BytesIO
+
+    raw = save._raw_data
     slot_data_base = save.slot_data_offset(slot_idx)
-    entry_abs_off = slot_data_base + slot.gaitem_offsets[gaitem_idx]
-    new_size = len(new_gaitem_bytes)
-    delta = new_size - old_gaitem_size
-
-    if delta == 0:
-        save._raw_data[entry_abs_off : entry_abs_off + new_size] = new_gaitem_bytes
-        return 0
-
-    if delta > 0:
-        trim = delta
-        slot_end_before = slot_data_base + SLOT_DATA_SIZE
-        trailing_zeros = 0
-        for i in range(slot_end_before - 1, slot_end_before - trim - 1, -1):
-            if i >= 0 and save._raw_data[i] == 0:
-                trailing_zeros += 1
-            else:
-                break
-
-        if trailing_zeros < trim:
-            from er_save_manager.parser.slot_rebuild import rebuild_slot
-
-            # rebuild_slot re-serializes the slot from the parsed structure
-            # and preserves every byte captured on read, including
-            # slot.rest - it no longer manufactures extra zero-padding
-            # here (see slot_rebuild.py). If the slot's real trailing
-            # bytes still don't cover `trim` after this, the add proceeds
-            # anyway and the trim below cuts into that trailing data
-            # rather than blocking the add. That trailing region's exact
-            # contents are not currently identified (see slot_rebuild.py
-            # notes on slot.rest).
-            rebuilt = rebuild_slot(slot)
-            save._raw_data[slot_data_base : slot_data_base + SLOT_DATA_SIZE] = rebuilt
-            entry_abs_off = slot_data_base + slot.gaitem_offsets[gaitem_idx]
-
-        last_empty_abs = _gaitem_last_empty(slot, slot_data_base)
-
-        save._raw_data[entry_abs_off:entry_abs_off] = new_gaitem_bytes
-
-        if last_empty_abs is not None:
-            shifted = last_empty_abs + new_size
-            del save._raw_data[shifted : shifted + 8]
+
+    if edit.gaitems:
+        buf = BytesIO()
+        slot.gaitem_map.write(buf)
+        map_bytes = buf.getvalue()
+        map_start, map_end = edit.old_map_start, edit.old_map_end
+        growth = len(map_bytes) - (map_end - map_start)
+
+        # Entries may have changed size (or moved, see gaitem_compact), so
+        # their offsets are the running sum of the new sizes
+        offsets = slot.gaitem_offsets
+        position = map_start
+        sizes = slot.gaitem_map.sizes
+        for i in range(len(offsets)):
+            offsets[i] = position
+            position += sizes[i]
+
+        if growth == 0:
+            abs_start = slot_data_base + map_start
+            raw[abs_start : abs_start + len(map_bytes)] = map_bytes
         else:
-            inv_shifted = slot_data_base + slot.inventory_held_offset + new_size
-            del save._raw_data[inv_shifted - 8 : inv_shifted]
+            work = raw[slot_data_base : slot_data_base + SLOT_DATA_SIZE]
+            if growth > 0 and any(work[SLOT_DATA_SIZE - growth :]):
+                from er_save_manager.parser.slot_rebuild import rebuild_slot
+
+                # Not enough zero padding at the slot end to absorb the
+                # growth. rebuild_slot re-serializes the slot from the
+                # parsed structure (with the new map) and preserves every
+                # byte captured on read, including slot.rest - it no longer
+                # manufactures extra zero-padding here (see slot_rebuild.py).
+                # If slot.rest still doesn't cover the growth, the add
+                # proceeds anyway and the truncation cuts into that trailing
+                # data rather than blocking the add. That trailing region's
+                # exact contents are not currently identified (see
+                # slot_rebuild.py notes on slot.rest).
+                work = bytearray(rebuild_slot(slot))
+            else:
+                work[map_start:map_end] = map_bytes
+                if growth > 0:
+                    del work[SLOT_DATA_SIZE:]
+                else:
+                    work += bytes(-growth)
 
-        if trim > 0:
-            current_end = slot_data_base + SLOT_DATA_SIZE + new_size - 8
-            del save._raw_data[current_end - trim : current_end]
+            # Every section after the map moves by growth
+            slot.sections.relocate(map_end, growth)
 
-        return new_size - 8
+            _write_inventories(work, 0, slot)
+            raw[slot_data_base : slot_data_base + SLOT_DATA_SIZE] = work
+            return
 
-    else:
-        abs_delta = -delta
-        save._raw_data[entry_abs_off:entry_abs_off] = new_gaitem_bytes
-        del save._raw_data[
-            entry_abs_off + new_size : entry_abs_off + new_size + old_gaitem_size
-        ]
-        slot_end = slot_data_base + SLOT_DATA_SIZE - abs_delta
-        save._raw_data[slot_end:slot_end] = bytes(abs_delta)
-        return -abs_delta
+    if edit.inventories:
+        _write_inventories(raw, slot_data_base, slot)
 
 
 # ---- gaitem construction ----------------------------------------------------
@@ -911,6 +454,38 @@ def _make_gaitem(full_item_id: int, handle: int, upgrade: int = 0):
 # ---- core gaitem operations -------------------------------------------------
 
 
+def _plan_gaitem(slot, full_item_id: int, upgrade: int = 0, gem_handle: int = 0):
+    """
+    Assign a new gaitem entry in memory only, inside an edit_slot block.
+
+    Returns:
+        (gaitem_idx, gaitem_handle)
+
+    Raises:
+        ValueError: Category has no gaitem, map is full.
+    """
+    if not _needs_gaitem(full_item_id):
+        raise ValueError(f"item 0x{full_item_id:08X} does not use a gaitem entry")
+
+    prefix = _gaitem_prefix(full_item_id)
+    handle = _next_gaitem_handle(slot, prefix)
+
+    empty_g = _find_empty_gaitem_slot(slot, prefix)
+    if empty_g == -1:
+        raise ValueError("gaitem map is full")
+
+    new_gaitem = _make_gaitem(full_item_id, handle, upgrade)
+
+    if _category(full_item_id) == _CAT_WEAPON and gem_handle:
+        new_gaitem.gem_gaitem_handle = (
+            gem_handle - 0x100000000 if gem_handle >= 0x80000000 else gem_handle
+        )
+
+    slot.gaitem_map[empty_g] = new_gaitem
+    _gaitem_changed(slot, empty_g)
+    return empty_g, handle
+
+
 def insert_gaitem(
     save: Save,
     slot_idx: int,
@@ -921,8 +496,7 @@ def insert_gaitem(
     """
     Insert a gaitem entry into the slot's gaitem map without touching inventory.
 
-    Used for AoW gems (which exist only in the gaitem map) and as the first
-    step of add_item for weapons and armor.
+    Used for AoW gems (which exist only in the gaitem map).
 
     Args:
         save: Parsed Save instance.
@@ -933,13 +507,12 @@ def insert_gaitem(
 
     Returns:
         (gaitem_handle, net_shift) - handle assigned to the new entry, and the
-        net byte shift applied to everything after the gaitem region.
+        net byte shift applied to everything after the gaitem region (when
+        the enclosing edit_slot block exits, if there is one).
 
     Raises:
         ValueError: Category has no gaitem, map is full.
     """
-    from io import BytesIO
-
     if not _needs_gaitem(full_item_id):
         raise ValueError(f"item 0x{full_item_id:08X} does not use a gaitem entry")
 
@@ -947,56 +520,9 @@ def insert_gaitem(
     if slot.is_empty():
         raise ValueError(f"slot {slot_idx} is empty")
 
-    prefix = _gaitem_prefix(full_item_id)
-    handle = _next_gaitem_handle(slot, prefix)
-
-    empty_g = _find_empty_gaitem_slot(slot, prefix)
-    if empty_g == -1:
-        raise ValueError("gaitem map is full")
-
-    new_gaitem = _make_gaitem(full_item_id, handle, upgrade)
-
-    if _category(full_item_id) == _CAT_WEAPON and gem_handle:
-        new_gaitem.gem_gaitem_handle = (
-            gem_handle - 0x100000000 if gem_handle >= 0x80000000 else gem_handle
-        )
-
-    buf = BytesIO()
-    new_gaitem.write(buf)
-    new_gaitem_bytes = buf.getvalue()
-    gaitem_size = len(new_gaitem_bytes)
-    size_delta = gaitem_size - 8
-
-    # Patch the binary first so rebuild_slot (called when trailing zeros
-    # are exhausted) serializes the original map without the new weapon.
-    # Updating gaitem_map before the patch caused rebuild to write the weapon
-    # twice, corrupting everything that followed.
-    net_shift = _patch_slot_with_gaitem_insert(
-        save, slot_idx, slot, empty_g, new_gaitem_bytes, old_gaitem_size=8
-    )
-    slot.gaitem_map[empty_g] = new_gaitem
-
-    entry_rel = slot.gaitem_offsets[empty_g]
-    for i, off in enumerate(slot.gaitem_offsets):
-        if off > entry_rel:
-            slot.gaitem_offsets[i] += size_delta
-
-    if net_shift != 0:
-        slot.player_game_data_offset += net_shift
-        slot.inventory_held_offset += net_shift
-        slot.inventory_storage_offset += net_shift
-        slot.gestures_offset += net_shift
-        slot.horse_offset += net_shift
-        slot.blood_stain_offset += net_shift
-        slot.event_flags_offset += net_shift
-        slot.coordinates_offset += net_shift
-        slot.net_man_offset += net_shift
-        slot.weather_offset += net_shift
-        slot.time_offset += net_shift
-        slot.steamid_offset += net_shift
-        slot.dlc_offset += net_shift
-
-    return handle, net_shift
+    with edit_slot(save, slot_idx):
+        gaitem_idx, handle = _plan_gaitem(slot, full_item_id, upgrade, gem_handle)
+    return handle, slot.gaitem_map.sizes[gaitem_idx] - 8
 
 
 def _remove_gaitem(save: Save, slot_idx: int, slot, gaitem_idx: int) -> int:
@@ -1005,47 +531,13 @@ def _remove_gaitem(save: Save, slot_idx: int, slot, gaitem_idx: int) -> int:
 
     Returns the net byte shift (negative = gaitem region shrank).
     """
-    from io import BytesIO
-
     from er_save_manager.parser.er_types import Gaitem
 
-    old_gaitem_size = slot.gaitem_map[gaitem_idx].get_size()
-    gaitem_size_delta = 8 - old_gaitem_size
-
-    empty_gaitem = Gaitem()
-    buf = BytesIO()
-    empty_gaitem.write(buf)
-    empty_bytes = buf.getvalue()
-
-    slot.gaitem_map[gaitem_idx] = empty_gaitem
-
-    net_shift = _patch_slot_with_gaitem_insert(
-        save,
-        slot_idx,
-        slot,
-        gaitem_idx,
-        empty_bytes,
-        old_gaitem_size=old_gaitem_size,
-    )
-
-    if gaitem_size_delta != 0:
-        for i in range(gaitem_idx + 1, len(slot.gaitem_offsets)):
-            slot.gaitem_offsets[i] += gaitem_size_delta
-        slot.player_game_data_offset += net_shift
-        slot.inventory_held_offset += net_shift
-        slot.inventory_storage_offset += net_shift
-        slot.gestures_offset += net_shift
-        slot.horse_offset += net_shift
-        slot.blood_stain_offset += net_shift
-        slot.event_flags_offset += net_shift
-        slot.coordinates_offset += net_shift
-        slot.net_man_offset += net_shift
-        slot.weather_offset += net_shift
-        slot.time_offset += net_shift
-        slot.steamid_offset += net_shift
-        slot.dlc_offset += net_shift
-
-    return net_shift
+    with edit_slot(save, slot_idx):
+        old_size = slot.gaitem_map.sizes[gaitem_idx]
+        slot.gaitem_map[gaitem_idx] = Gaitem()
+        _gaitem_changed(slot, gaitem_idx)
+    return 8 - old_size
 
 
 def _update_inv_counters(slot, inventory, location: str, acq_idx: int) -> None:
@@ -1061,12 +553,8 @@ def _update_inv_counters(slot, inventory, location: str, acq_idx: int) -> None:
         slot.inventory_held.equip_index_counter += 1
 
 
-# ---- public API -------------------------------------------------------------
-
-
-def add_item(
-    save: Save,
-    slot_idx: int,
+def _plan_add(
+    slot,
     full_item_id: int,
     quantity: int,
     location: str = "held",
@@ -1076,27 +564,17 @@ def add_item(
     convergence: bool = False,
 ) -> dict:
     """
-    Add an item to the character's inventory.
+    Apply one add_item to the slot's in-memory gaitem map and inventory.
 
-    Args:
-        save: Parsed Save instance.
-        slot_idx: Character slot index 0-9.
-        full_item_id: Full item id including category bits.
-        quantity: Stack size (use 1 for weapons/armor/talismans/gems).
-        location: "held" or "storage".
-        upgrade: Upgrade level. Validated against reinforcement type.
-        gem_full_id: Full id of an Ash of War to attach to a weapon. The gem
-                     is added to the gaitem map only (no inventory entry).
-        reinforcement: "standard", "somber", or "ash" - determines upgrade cap.
-        convergence: When True, standard and somber upgrade caps are both 15.
+    Every check runs before anything is changed, so a rejected item leaves
+    the slot untouched. Nothing is written to the save buffer; the
+    enclosing edit_slot block writes the gaitem map and inventories out.
 
     Returns:
-        Dict with keys: gaitem_handle, full_item_id, quantity, acquisition_index,
-        inventory_slot, location, new_common_item_count.
+        The add_item result dict.
 
     Raises:
-        ValueError: Unknown category, invalid upgrade, item already present,
-                    gaitem map full, or inventory full.
+        ValueError: See add_item.
     """
     from er_save_manager.parser.equipment import InventoryItem
 
@@ -1109,86 +587,82 @@ def add_item(
     if cat == _CAT_WEAPON and upgrade:
         upgrade = validate_upgrade(upgrade, reinforcement, convergence)
 
-    # AoW: insert gem into gaitem map only (no inventory entry needed).
-    gem_handle = 0
-    if cat == _CAT_WEAPON and gem_full_id and _category(gem_full_id) == _CAT_GEM:
-        try:
-            gem_handle, _ = insert_gaitem(save, slot_idx, gem_full_id)
-        except Exception:
-            gem_handle = 0  # continue without AoW on failure
-
-    slot = save.character_slots[slot_idx]
-    if slot.is_empty():
-        raise ValueError(f"slot {slot_idx} is empty")
-
     inventory = _select_inventory(slot, location)
-
-    handle = None
-    gaitem_slot = None
-
-    if _needs_gaitem(full_item_id):
-        handle, _ = insert_gaitem(save, slot_idx, full_item_id, upgrade, gem_handle)
-        # Re-read slot after insert_gaitem updated offsets
-        slot = save.character_slots[slot_idx]
-        inventory = _select_inventory(slot, location)
-        # Locate the gaitem slot created by insert_gaitem
-        gaitem_slot = next(
-            (i for i, g in enumerate(slot.gaitem_map) if g.gaitem_handle == handle),
-            None,
-        )
+    traits = item_traits(full_item_id)
+    needs_gaitem = traits.gaitem_size > 0
+    is_key = traits.key_item
+
+    if needs_gaitem:
+        if _find_empty_gaitem_slot(slot, _gaitem_prefix(full_item_id)) == -1:
+            raise ValueError("gaitem map is full")
+        handle = None
     else:
         handle = _direct_handle(full_item_id)
+        # Reject if already in inventory (talismans allow duplicates). New
+        # gaitem handles are always unique, so only direct handles can clash.
+        if cat != _CAT_TALISMAN:
+            item_list = inventory.key_items if is_key else inventory.common_items
+            rows = item_list.rows
+            for i in slot_index(slot).items(item_list).rows_with(handle):
+                if rows[i * 3 + 1] > 0:
+                    raise ItemAlreadyPresentError(
+                        f"item 0x{full_item_id:08X} already present "
+                        f"(handle 0x{handle:08X})"
+                    )
 
-    # Reject if already in inventory (talismans allow duplicates)
-    if cat != _CAT_TALISMAN:
-        item_list = (
-            inventory.key_items
-            if _is_key_item(full_item_id)
-            else inventory.common_items
-        )
-        for it in item_list:
-            if it.gaitem_handle == handle and it.quantity > 0:
-                raise ValueError(
-                    f"item 0x{full_item_id:08X} already present (handle 0x{handle:08X})"
-                )
-
-    acq_idx = _global_next_acq_index(slot)
-
-    is_key = _is_key_item(full_item_id)
     if is_key:
-        inv_slot = _first_empty_key_slot(inventory)
+        inv_slot = _first_empty_key_slot(slot, inventory)
         if inv_slot == -1:
             raise ValueError(f"key_items inventory is full in {location}")
     else:
-        inv_slot = _first_empty_inv_slot(inventory)
+        inv_slot = _first_empty_inv_slot(slot, inventory)
         if inv_slot == -1:
             if location == "held":
                 # Held inventory full - fall back to storage
                 location = "storage"
                 inventory = _select_inventory(slot, location)
-                inv_slot = _first_empty_inv_slot(inventory)
+                inv_slot = _first_empty_inv_slot(slot, inventory)
                 if inv_slot == -1:
                     raise ValueError("both held and storage inventories are full")
             else:
                 raise ValueError("storage inventory is full")
 
+    gaitem_slot = None
+    if needs_gaitem:
+        # AoW: gem goes into the gaitem map only (no inventory entry needed)
+        gem_handle = 0
+        if cat == _CAT_WEAPON and gem_full_id and _category(gem_full_id) == _CAT_GEM:
+            try:
+                gem_slot, gem_handle = _plan_gaitem(slot, gem_full_id)
+            except ValueError:
+                gem_handle = 0  # continue without AoW on failure
+        try:
+            gaitem_slot, handle = _plan_gaitem(slot, full_item_id, upgrade, gem_handle)
+        except ValueError:
+            if gem_handle:
+                # The gem took the last free entry; undo it
+                from er_save_manager.parser.er_types import Gaitem
+
+                slot.gaitem_map[gem_slot] = Gaitem()
+                _gaitem_changed(slot, gem_slot)
+            raise
+
+    acq_idx = _global_next_acq_index(slot)
+
     entry = InventoryItem()
     entry.gaitem_handle = handle
     entry.quantity = quantity
     entry.acquisition_index = acq_idx
 
-    if is_key:
-        inventory.key_items[inv_slot] = entry
-    else:
-        inventory.common_items[inv_slot] = entry
+    item_list = inventory.key_items if is_key else inventory.common_items
+    item_list[inv_slot] = entry
+    slot_index(slot).row_changed(item_list, inv_slot)
     if is_key:
         inventory.key_item_count += 1
     else:
         inventory.common_item_count += 1
     _update_inv_counters(slot, inventory, location, acq_idx)
 
-    _patch_slot(save, slot_idx, slot)
-
     return {
         "gaitem_handle": handle,
         "full_item_id": full_item_id,
@@ -1201,36 +675,111 @@ def add_item(
     }
 
 
-def remove_item(
+# ---- public API -------------------------------------------------------------
+
+
+def add_item(
     save: Save,
     slot_idx: int,
     full_item_id: int,
+    quantity: int,
     location: str = "held",
+    upgrade: int = 0,
+    gem_full_id: int = 0,
+    reinforcement: str = "standard",
+    convergence: bool = False,
 ) -> dict:
     """
-    Remove an item from the inventory.
+    Add an item to the character's inventory.
 
-    Zeros the inventory slot, decrements common_item_count, and for gaitem
-    items also removes the gaitem map entry.
+    Args:
+        save: Parsed Save instance.
+        slot_idx: Character slot index 0-9.
+        full_item_id: Full item id including category bits.
+        quantity: Stack size (use 1 for weapons/armor/talismans/gems).
+        location: "held" or "storage".
+        upgrade: Upgrade level. Validated against reinforcement type.
+        gem_full_id: Full id of an Ash of War to attach to a weapon. The gem
+                     is added to the gaitem map only (no inventory entry).
+        reinforcement: "standard", "somber", or "ash" - determines upgrade cap.
+        convergence: When True, standard and somber upgrade caps are both 15.
 
     Returns:
-        Dict with keys: gaitem_handle, full_item_id, inventory_slot, location,
-        old_quantity, new_common_item_count.
+        Dict with keys: gaitem_handle, full_item_id, quantity, acquisition_index,
+        inventory_slot, location, new_common_item_count.
+
+    Raises:
+        ItemAlreadyPresentError: Item already present (a ValueError).
+        ValueError: Unknown category, invalid upgrade, gaitem map full, or
+                    inventory full.
     """
-    from er_save_manager.parser.equipment import InventoryItem
+    result = add_items(
+        save,
+        slot_idx,
+        [
+            {
+                "full_item_id": full_item_id,
+                "quantity": quantity,
+                "location": location,
+                "upgrade": upgrade,
+                "gem_full_id": gem_full_id,
+                "reinforcement": reinforcement,
+                "convergence": convergence,
+            }
+        ],
+    )[0]
+    if "error" in result:
+        raise result["error"]
+    return result
+
+
+def add_items(save: Save, slot_idx: int, specs) -> list[dict]:
+    """
+    Add many items to the character's inventory in one transaction.
+
+    Every item is planned against the in-memory gaitem map and inventories
+    first, in order, exactly as consecutive add_item calls would place them.
+    The slot's gaitem map and both inventories are then written to the
+    buffer once, with a single offset fix-up, instead of once per item
+    (see edit_slot).
+    Checksums are recalculated once by the caller, as for add_item.
+
+    An item that add_item would reject is skipped; the rest are still added.
 
+    Args:
+        save: Parsed Save instance.
+        slot_idx: Character slot index 0-9.
+        specs: Iterable of dicts holding add_item's keyword arguments
+               (full_item_id and quantity required; location, upgrade,
+               gem_full_id, reinforcement, convergence optional).
+
+    Returns:
+        One dict per spec, in order: the add_item result, or
+        {"full_item_id": ..., "error": ValueError} for a skipped item.
+
+    Raises:
+        ValueError: Slot is empty.
+    """
+    return _apply_batch(save, slot_idx, specs, _plan_add)
+
+
+def _find_inventory_row(slot, inventory, full_item_id: int, location: str):
+    """
+    Locate an item's inventory row.
+
+    Returns:
+        (handle, gaitem_idx, item_list, inv_slot, is_key); gaitem_idx is -1
+        for items without a gaitem entry.
+
+    Raises:
+        ValueError: Unknown category or item not present.
+    """
     cat = _category(full_item_id)
     if cat not in (_CAT_WEAPON, _CAT_ARMOR, _CAT_TALISMAN, _CAT_GOODS, _CAT_GEM):
         raise ValueError(
             f"unknown item category 0x{cat:08X} for item 0x{full_item_id:08X}"
         )
 
-    slot = save.character_slots[slot_idx]
-    if slot.is_empty():
-        raise ValueError(f"slot {slot_idx} is empty")
-
-    inventory = _select_inventory(slot, location)
-
     if _needs_gaitem(full_item_id):
         gaitem_idx, g = _find_gaitem_by_item(slot, full_item_id, inventory=inventory)
         if gaitem_idx == -1:
@@ -1247,10 +796,10 @@ def remove_item(
     # the expected list first, then fall back to the other list.
     is_key = _is_key_item(full_item_id)
     item_list = inventory.key_items if is_key else inventory.common_items
-    inv_slot = _find_handle_slot(item_list, handle)
+    inv_slot = _find_handle_slot(slot, item_list, handle)
     if inv_slot == -1:
         other_list = inventory.common_items if is_key else inventory.key_items
-        other_slot = _find_handle_slot(other_list, handle)
+        other_slot = _find_handle_slot(slot, other_list, handle)
         if other_slot != -1:
             is_key = not is_key
             item_list = other_list
@@ -1261,9 +810,23 @@ def remove_item(
             f"item 0x{full_item_id:08X} not found in {location!r} inventory "
             f"(handle 0x{handle:08X})"
         )
+    return handle, gaitem_idx, item_list, inv_slot, is_key
+
+
+def _plan_remove(
+    save: Save, slot_idx: int, slot, full_item_id: int, location: str = "held"
+):
+    """Remove one item from the parsed slot. Must run inside edit_slot."""
+    from er_save_manager.parser.equipment import InventoryItem
+
+    inventory = _select_inventory(slot, location)
+    handle, gaitem_idx, item_list, inv_slot, is_key = _find_inventory_row(
+        slot, inventory, full_item_id, location
+    )
     old_qty = item_list[inv_slot].quantity
 
     item_list[inv_slot] = InventoryItem()
+    slot_index(slot).row_changed(item_list, inv_slot)
     if is_key:
         inventory.key_item_count = max(0, inventory.key_item_count - 1)
     else:
@@ -1271,11 +834,6 @@ def remove_item(
 
     if gaitem_idx != -1:
         _remove_gaitem(save, slot_idx, slot, gaitem_idx)
-        # Re-read slot after _remove_gaitem updated offsets
-        slot = save.character_slots[slot_idx]
-        inventory = _select_inventory(slot, location)
-
-    _patch_slot(save, slot_idx, slot)
 
     return {
         "gaitem_handle": handle,
@@ -1287,6 +845,104 @@ def remove_item(
     }
 
 
+def _plan_set_quantity(slot, full_item_id: int, quantity: int, location: str = "held"):
+    """Set one stack quantity in the parsed slot."""
+    if quantity < 1:
+        raise ValueError(f"quantity must be >= 1, got {quantity}")
+
+    inventory = _select_inventory(slot, location)
+    handle, _, item_list, inv_slot, _ = _find_inventory_row(
+        slot, inventory, full_item_id, location
+    )
+    old_qty = item_list[inv_slot].quantity
+
+    item_list[inv_slot].quantity = quantity
+    slot_index(slot).row_changed(item_list, inv_slot)
+
+    return {
+        "gaitem_handle": handle,
+        "full_item_id": full_item_id,
+        "inventory_slot": inv_slot,
+        "location": location,
+        "old_quantity": old_qty,
+        "new_quantity": quantity,
+    }
+
+
+def _apply_batch(save: Save, slot_idx: int, specs, plan) -> list[dict]:
+    """
+    Run plan(slot, **spec) for every spec in one edit_slot block.
+
+    A spec that raises ValueError is recorded as an error result and the
+    batch continues. The inventories are written once at the end.
+    """
+    slot = save.character_slots[slot_idx]
+    if slot.is_empty():
+        raise ValueError(f"slot {slot_idx} is empty")
+
+    results = []
+    with edit_slot(save, slot_idx):
+        for spec in specs:
+            try:
+                results.append(plan(slot, **spec))
+            except ValueError as e:
+                results.append({"full_item_id": spec.get("full_item_id"), "error": e})
+        if any("error" not in result for result in results):
+            _patch_slot(save, slot_idx, slot)
+    return results
+
+
+def remove_item(
+    save: Save,
+    slot_idx: int,
+    full_item_id: int,
+    location: str = "held",
+) -> dict:
+    """
+    Remove an item from the inventory.
+
+    Zeros the inventory slot, decrements common_item_count, and for gaitem
+    items also removes the gaitem map entry.
+
+    Returns:
+        Dict with keys: gaitem_handle, full_item_id, inventory_slot, location,
+        old_quantity, new_common_item_count.
+    """
+    result = remove_items(
+        save, slot_idx, [{"full_item_id": full_item_id, "location": location}]
+    )[0]
+    if "error" in result:
+        raise result["error"]
+    return result
+
+
+def remove_items(save: Save, slot_idx: int, specs) -> list[dict]:
+    """
+    Remove many items from the inventory in one transaction.
+
+    Items are removed in order, exactly as consecutive remove_item calls
+    would remove them. All gaitem removals are compacted into one gaitem
+    map write and offset fix-up, and the inventories are written once
+    (see edit_slot).
+
+    An item remove_item would reject is skipped; the rest are still removed.
+
+    Args:
+        save: Parsed Save instance.
+        slot_idx: Character slot index 0-9.
+        specs: Iterable of dicts holding remove_item's keyword arguments
+               (full_item_id required; location optional).
+
+    Returns:
+        One dict per spec, in order: the remove_item result, or
+        {"full_item_id": ..., "error": ValueError} for a skipped item.
+
+    Raises:
+        ValueError: Slot is empty.
+    """
+    return _apply_batch(save, slot_idx, specs, partial(_plan_remove, save, slot_idx))
+
+
 def set_quantity(
     save: Save,
     slot_idx: int,
@@ -1305,57 +961,31 @@ def set_quantity(
     """
     if quantity < 1:
         raise ValueError(f"quantity must be >= 1, got {quantity}")
+    result = set_quantities(
+        save,
+        slot_idx,
+        [{"full_item_id": full_item_id, "quantity": quantity, "location": location}],
+    )[0]
+    if "error" in result:
+        raise result["error"]
+    return result
 
-    cat = _category(full_item_id)
-    if cat not in (_CAT_WEAPON, _CAT_ARMOR, _CAT_TALISMAN, _CAT_GOODS, _CAT_GEM):
-        raise ValueError(
-            f"unknown item category 0x{cat:08X} for item 0x{full_item_id:08X}"
-        )
-
-    slot = save.character_slots[slot_idx]
-    if slot.is_empty():
-        raise ValueError(f"slot {slot_idx} is empty")
-
-    inventory = _select_inventory(slot, location)
-
-    if _needs_gaitem(full_item_id):
-        _, g = _find_gaitem_by_item(slot, full_item_id, inventory=inventory)
-        if g is None:
-            raise ValueError(
-                f"item 0x{full_item_id:08X} not found in gaitem map for {location!r} inventory"
-            )
-        handle = g.gaitem_handle
-    else:
-        handle = _direct_handle(full_item_id)
 
-    # _is_key_item classifies by display category (KeyItems.csv), which does
-    # not always match the raw list the item is actually stored in. Search
-    # the expected list first, then fall back to the other list.
-    is_key = _is_key_item(full_item_id)
-    item_list = inventory.key_items if is_key else inventory.common_items
-    inv_slot = _find_handle_slot(item_list, handle)
-    if inv_slot == -1:
-        other_list = inventory.common_items if is_key else inventory.key_items
-        other_slot = _find_handle_slot(other_list, handle)
-        if other_slot != -1:
-            item_list = other_list
-            inv_slot = other_slot
+def set_quantities(save: Save, slot_idx: int, specs) -> list[dict]:
+    """
+    Set many stack quantities with one inventory write.
 
-    if inv_slot == -1:
-        raise ValueError(
-            f"item 0x{full_item_id:08X} not found in {location!r} inventory "
-            f"(handle 0x{handle:08X})"
-        )
-    old_qty = item_list[inv_slot].quantity
+    Args:
+        save: Parsed Save instance.
+        slot_idx: Character slot index 0-9.
+        specs: Iterable of dicts holding set_quantity's keyword arguments
+               (full_item_id and quantity required; location optional).
 
-    item_list[inv_slot].quantity = quantity
-    _patch_slot(save, slot_idx, slot)
+    Returns:
+        One dict per spec, in order: the set_quantity result, or
+        {"full_item_id": ..., "error": ValueError} for a skipped item.
 
-    return {
-        "gaitem_handle": handle,
-        "full_item_id": full_item_id,
-        "inventory_slot": inv_slot,
-        "location": location,
-        "old_quantity": old_qty,
-        "new_quantity": quantity,
-    }
+    Raises:
+        ValueError: Slot is empty.
+    """
+    return _apply_batch(save, slot_idx, specs, _plan_set_quantity)
@@ -0,0 +1,146 @@
+"""
+Dry-run planning for inventory batches.
+
+plan_items answers "what would add_items do?" without touching the save:
+every spec is placed by the same _plan_add that add_items uses, but
+against a scratch copy of the slot's gaitem map and inventories. The
+result lists the rows, gaitem entries, handles and acquisition indices
+each item would get, which items overflow from held to storage, and the
+capacity left afterwards, so a caller can reject an impossible batch
+before creating a backup.
+
+The slot is never modified, save._raw_data is never read or written.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field, replace
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from er_save_manager.parser.equipment import InventoryItemList
+from er_save_manager.parser.inventory_ops import _plan_add
+from er_save_manager.parser.slot_index import slot_index
+
+if TYPE_CHECKING:
+    from er_save_manager.parser.save import Save
+
+
+@dataclass
+class InventoryPlan:
+    """
+    Outcome of a planned add_items call.
+
+    items: One dict per spec, in order, exactly what add_items would return
+           (the add_item result, or {"full_item_id": ..., "error": ...}).
+           Placed items also carry "overflow": True when a held add spills
+           into storage because held common_items is full.
+    gaitem_slots: Gaitem map indices the batch would fill (AoW gems included)
+    map_growth: Bytes the serialized gaitem map would grow by
+    free_before / free_after: free_capacity() of the slot before and after
+    """
+
+    items: list[dict] = field(default_factory=list)
+    gaitem_slots: list[int] = field(default_factory=list)
+    map_growth: int = 0
+    free_before: dict[str, int] = field(default_factory=dict)
+    free_after: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def added(self) -> list[dict]:
+        return [item for item in self.items if "error" not in item]
+
+    @property
+    def rejected(self) -> list[dict]:
+        return [item for item in self.items if "error" in item]
+
+    @property
+    def overflow(self) -> list[dict]:
+        return [item for item in self.items if item.get("overflow")]
+
+
+def free_capacity(slot) -> dict[str, int]:
+    """
+    Free rows and gaitem entries of a character slot.
+
+    Keys:
+        held_common, held_key, storage_common, storage_key: free inventory rows
+        gaitem: free entries weapons and armor can use (after the first weapon)
+        gaitem_gem: free entries Ashes of War can use (before the first weapon)
+    """
+    handles = slot.gaitem_map.handles
+    first_weapon = slot_index(slot).gaitems.first_weapon()
+    held, storage = slot.inventory_held, slot.inventory_storage_box
+    return {
+        "held_common": held.common_items.handles.count(0),
+        "held_key": held.key_items.handles.count(0),
+        "storage_common": storage.common_items.handles.count(0),
+        "storage_key": storage.key_items.handles.count(0),
+        "gaitem": handles[first_weapon + 1 :].count(0),
+        "gaitem_gem": (
+            handles[:first_weapon].count(0) if first_weapon != -1 else handles.count(0)
+        ),
+    }
+
+
+def _copy_inventory(inventory):
+    return replace(
+        inventory,
+        common_items=InventoryItemList(array("I", inventory.common_items.rows)),
+        key_items=InventoryItemList(array("I", inventory.key_items.rows)),
+    )
+
+
+def _scratch_slot(slot) -> SimpleNamespace:
+    """Copy of the parts of a slot that _plan_add reads and changes."""
+    scratch = SimpleNamespace(
+        gaitem_map=slot.gaitem_map.copy(),
+        inventory_held=_copy_inventory(slot.inventory_held),
+        inventory_storage_box=_copy_inventory(slot.inventory_storage_box),
+    )
+    # Stands in for the edit_slot block _plan_add expects; never flushed
+    scratch._slot_edit = SimpleNamespace(gaitems=False, inventories=False)
+    return scratch
+
+
+def plan_items(save: Save, slot_idx: int, specs) -> InventoryPlan:
+    """
+    Plan add_items(save, slot_idx, specs) without changing anything.
+
+    Args:
+        save: Parsed Save instance.
+        slot_idx: Character slot index 0-9.
+        specs: add_items specs (dicts of add_item keyword arguments).
+
+    Returns:
+        InventoryPlan
+
+    Raises:
+        ValueError: Slot is empty.
+    """
+    slot = save.character_slots[slot_idx]
+    if slot.is_empty():
+        raise ValueError(f"slot {slot_idx} is empty")
+
+    scratch = _scratch_slot(slot)
+    plan = InventoryPlan(free_before=free_capacity(slot))
+    for spec in specs:
+        try:
+            result = _plan_add(scratch, **spec)
+        except ValueError as e:
+            plan.items.append({"full_item_id": spec.get("full_item_id"), "error": e})
+            continue
+        if result["location"] != spec.get("location", "held"):
+            result["overflow"] = True
+        plan.items.append(result)
+
+    before, after = slot.gaitem_map, scratch.gaitem_map
+    plan.gaitem_slots = [
+        i
+        for i, (old, new) in enumerate(zip(before.handles, after.handles, strict=True))
+        if old != new
+    ]
+    plan.map_growth = sum(after.sizes) - sum(before.sizes)
+    plan.free_after = free_capacity(scratch)
+    return plan
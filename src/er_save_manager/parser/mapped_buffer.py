@@ -0,0 +1,173 @@
+"""
+Elden Ring Save Parser - Memory-Mapped Save Buffer
+
+MappedBuffer is the _raw_data used by Save.open_mmap(). It starts out as a
+read-only mmap of the save file, so inspecting a save (listing characters,
+checking for corruption, deep scans, SteamID scans) only pages in the parts
+that are actually read instead of copying the whole ~28 MB file.
+
+The first write of any kind copies the mapping into a TrackedBuffer, closes
+the mapping and continues on the copy; the file on disk is never modified.
+From then on the buffer behaves exactly like the _raw_data of a save loaded
+with Save.from_file().
+"""
+
+from __future__ import annotations
+
+import inspect
+import mmap
+
+from .dirty_tracking import TrackedBuffer
+
+
+class MappedBuffer:
+    """Read-only memory-mapped buffer that copies itself on first write."""
+
+    def __init__(self, mapping: mmap.mmap):
+        self._data: mmap.mmap | TrackedBuffer = mapping
+
+    @classmethod
+    def open(cls, filepath: str) -> MappedBuffer:
+        """
+        Map a file read-only.
+
+        Args:
+            filepath: Path to the file
+
+        Returns:
+            MappedBuffer over the whole file
+
+        Raises:
+            ValueError: If the file is empty (empty files cannot be mapped)
+        """
+        with open(filepath, "rb") as f:
+            try:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise ValueError(f"Save file is empty or too small: {filepath}") from e
+        return cls(mapping)
+
+    @property
+    def mapped(self) -> bool:
+        """True while reads are still served from the file mapping."""
+        return isinstance(self._data, mmap.mmap)
+
+    def detach(self) -> TrackedBuffer:
+        """
+        Copy the mapping into memory and close it.
+
+        Called automatically on the first write. Safe to call repeatedly.
+
+        Returns:
+            The in-memory TrackedBuffer now backing this buffer
+        """
+        mapping = self._data
+        if isinstance(mapping, mmap.mmap):
+            self._data = TrackedBuffer(mapping)
+            try:
+                mapping.close()
+            except BufferError:
+                pass  # a caller still holds a memoryview; closed once released
+        return self._data
+
+    def close(self) -> None:
+        """Release the mapping without copying (the buffer becomes empty)."""
+        mapping = self._data
+        self._data = TrackedBuffer()
+        if isinstance(mapping, mmap.mmap):
+            try:
+                mapping.close()
+            except BufferError:
+                pass
+
+    # ---- reads -------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MappedBuffer):
+            other = other._data
+        return self._data[:] == other
+
+    __hash__ = None
+
+    def __bytes__(self) -> bytes:
+        return self._data[:] if self.mapped else bytes(self._data)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        if flags & inspect.BufferFlags.WRITABLE:
+            self.detach()
+        return memoryview(self._data)
+
+    def find(self, sub, start: int = 0, end: int | None = None) -> int:
+        if end is None:
+            end = len(self._data)
+        return self._data.find(sub, start, end)
+
+    def rfind(self, sub, start: int = 0, end: int | None = None) -> int:
+        if end is None:
+            end = len(self._data)
+        return self._data.rfind(sub, start, end)
+
+    # ---- dirty tracking (clean while mapped) -------------------------------
+
+    def is_dirty(self, start: int, end: int) -> bool:
+        return not self.mapped and self._data.is_dirty(start, end)
+
+    def dirty_ranges(self) -> list[tuple[int, int]]:
+        return [] if self.mapped else self._data.dirty_ranges()
+
+    def clear_dirty(self) -> None:
+        if not self.mapped:
+            self._data.clear_dirty()
+
+    def journal_ranges(self) -> list[tuple[int, int]] | None:
+        return [] if self.mapped else self._data.journal_ranges()
+
+    def clear_journal(self) -> None:
+        if not self.mapped:
+            self._data.clear_journal()
+
+    def mark_dirty(self, start: int, end: int) -> None:
+        self.detach().mark_dirty(start, end)
+
+    def mark_all_dirty(self) -> None:
+        self.detach().mark_all_dirty()
+
+    # ---- writes (copy on first write) --------------------------------------
+
+    def __setitem__(self, key, value):
+        self.detach()[key] = value
+
+    def __delitem__(self, key):
+        del self.detach()[key]
+
+    def __iadd__(self, other):
+        self.detach().__iadd__(other)
+        return self
+
+    def extend(self, iterable) -> None:
+        self.detach().extend(iterable)
+
+    def append(self, item: int) -> None:
+        self.detach().append(item)
+
+    def insert(self, index: int, item: int) -> None:
+        self.detach().insert(index, item)
+
+    def pop(self, index: int = -1) -> int:
+        return self.detach().pop(index)
+
+    def clear(self) -> None:
+        self.detach().clear()
+
+    def __repr__(self) -> str:
+        state = "mapped" if self.mapped else "copied"
+        return f"MappedBuffer({len(self)} bytes, {state})"
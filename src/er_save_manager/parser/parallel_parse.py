@@ -0,0 +1,125 @@
+"""
+Elden Ring Save Parser - Parallel Slot Parsing
+
+Character slots are independent fixed-size regions, so Save.from_file(...,
+workers=N) can decode them concurrently and stitch the results back into
+Save.character_slots in slot order.
+
+Backends:
+    "thread":  ThreadPoolExecutor over the shared in-memory snapshot. No
+               copies, but pure-Python decoding only overlaps on a
+               free-threaded interpreter (python3.13t and later).
+    "process": ProcessPoolExecutor. Each worker is sent only its own
+               slot's bytes (the reader keeps absolute offsets), parses them
+               and sends the parsed UserDataX back (pickled). Zero-copy
+               views cannot cross processes, so blobs are copies.
+
+A slot that fails to parse becomes an empty UserDataX, same as the serial
+path.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .buffer_reader import BufferReader
+from .user_data_x import UserDataX
+
+SLOT_DATA_SIZE = 0x280000
+
+BACKENDS = ("thread", "process")
+
+
+def parse_slot(
+    data: bytes,
+    char_data_start: int,
+    is_ps: bool,
+    zero_copy: bool = False,
+    source=None,
+) -> UserDataX:
+    """
+    Parse one character slot from a snapshot of the whole save.
+
+    Args:
+        data: Save file bytes
+        char_data_start: Absolute offset of the slot data (after checksum)
+        is_ps: True if PlayStation format
+        zero_copy: Hand out memoryview blobs (thread backend only)
+        source: Buffer with the same bytes the blobs are viewed from
+                (see BufferReader)
+
+    Returns:
+        Parsed UserDataX, or an empty UserDataX if the slot fails to parse
+    """
+    f = BufferReader(data, char_data_start, zero_copy=zero_copy, source=source)
+    try:
+        return UserDataX.read(f, is_ps, char_data_start, SLOT_DATA_SIZE)
+    except Exception:
+        return UserDataX()
+    finally:
+        f.release()
+
+
+def _parse_slot_bytes(data: bytes, char_data_start: int, is_ps: bool) -> UserDataX:
+    """Process-pool worker: parse one slot from a copy of just its bytes."""
+    f = BufferReader(data, char_data_start, offset=char_data_start)
+    try:
+        return UserDataX.read(f, is_ps, char_data_start, SLOT_DATA_SIZE)
+    except Exception:
+        return UserDataX()
+    finally:
+        f.release()
+
+
+def parse_slots_parallel(
+    data: bytes,
+    starts: list[int],
+    is_ps: bool,
+    workers: int,
+    backend: str = "thread",
+    zero_copy: bool = False,
+    source=None,
+) -> list[UserDataX]:
+    """
+    Parse several slots concurrently.
+
+    Args:
+        data: Save file bytes
+        starts: Absolute slot data offsets to parse
+        is_ps: True if PlayStation format
+        workers: Pool size
+        backend: "thread" or "process"
+        zero_copy: Hand out memoryview blobs (ignored by the process backend)
+        source: Buffer with the same bytes the blobs are viewed from
+
+    Returns:
+        Parsed slots, in the same order as starts
+    """
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown parse backend {backend!r}, expected one of {BACKENDS}"
+        )
+    if not starts:
+        return []
+
+    workers = min(workers, len(starts))
+    if backend == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lambda start: parse_slot(data, start, is_ps, zero_copy, source),
+                    starts,
+                )
+            )
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _parse_slot_bytes,
+                data[start : start + SLOT_DATA_SIZE],
+                start,
+                is_ps,
+            )
+            for start in starts
+        ]
+        return [future.result() for future in futures]
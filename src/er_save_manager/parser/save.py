@@ -9,11 +9,20 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
-from io import BytesIO
 from pathlib import Path
 
+from er_save_manager.parser.buffer_reader import BufferReader, read_view
+from er_save_manager.parser.dirty_tracking import TrackedBuffer
+from er_save_manager.parser.mapped_buffer import MappedBuffer
+from er_save_manager.parser.parallel_parse import parse_slots_parallel
+from er_save_manager.parser.trace import stage as trace_stage
 from er_save_manager.parser.user_data_10 import UserData10
-from er_save_manager.parser.user_data_x import UserDataX
+from er_save_manager.parser.user_data_x import LazyUserDataX, UserDataX
+from er_save_manager.parser.write_journal import (
+    can_reflink,
+    journaled_write,
+    replay_journal,
+)
 
 
 @dataclass
@@ -55,26 +64,44 @@ class Save:
     _slot_offsets: list[int] = field(default_factory=list)
 
     # Note: _raw_data and _original_filepath are set dynamically in from_file()
+    # (or open_mmap(), where _raw_data is a MappedBuffer)
     # They are not dataclass fields to avoid type conversion issues
 
     def __post_init__(self):
         """Initialize dynamic attributes if not already set."""
         if not hasattr(self, "_raw_data"):
-            self._raw_data = bytearray()
+            self._raw_data = TrackedBuffer()
         if not hasattr(self, "_original_filepath"):
             self._original_filepath = ""
-        # Ensure _raw_data is always bytearray
-        if isinstance(self._raw_data, bytes) and not isinstance(
-            self._raw_data, bytearray
-        ):
-            self._raw_data = bytearray(self._raw_data)
+        if not hasattr(self, "_synced"):
+            # (path, size, mtime_ns) of the file _raw_data was last read from
+            # or written to; journaled writes require it to be unchanged
+            self._synced = None
 
     def __setattr__(self, name, value):
-        """Override to ensure _raw_data is always bytearray"""
-        if name == "_raw_data":
-            # Force conversion to bytearray
-            if isinstance(value, bytes) and not isinstance(value, bytearray):
-                value = bytearray(value)
+        """
+        Override to ensure _raw_data is always a TrackedBuffer (bytearray).
+
+        Replacing the buffer with identical content (the common
+        ``save._raw_data = bytearray(save._raw_data)`` idiom) keeps the
+        current dirty ranges; replacing it with different content marks the
+        whole buffer dirty. A MappedBuffer from open_mmap() is kept as is.
+        Zero-copy views into the previous buffer are detached first.
+        """
+        if name == "_raw_data" and getattr(
+            self.__dict__.get("_raw_data"), "before_resize", None
+        ):
+            self.detach_views()
+        if name == "_raw_data" and not isinstance(value, (TrackedBuffer, MappedBuffer)):
+            previous = self.__dict__.get("_raw_data")
+            value = TrackedBuffer(value)
+            if previous:
+                if previous == value and isinstance(
+                    previous, (TrackedBuffer, MappedBuffer)
+                ):
+                    value.inherit_dirty(previous)
+                else:
+                    value.mark_all_dirty()
         super().__setattr__(name, value)
 
     @property
@@ -91,67 +118,164 @@ class Save:
         return False
 
     @classmethod
-    def from_file(cls, filepath: str) -> Save:
+    def from_file(
+        cls,
+        filepath: str,
+        zero_copy: bool = False,
+        lazy: bool = False,
+        workers: int = 0,
+        backend: str = "thread",
+    ) -> Save:
         """
         Load and parse save file from disk.
 
+        The file is read once into an immutable bytes snapshot that is parsed
+        through a BufferReader (no BytesIO copy); _raw_data is the editable
+        bytearray copy of it. The snapshot is freed when parsing finishes.
+
         Args:
             filepath: Path to save file
+            zero_copy: When True, large blobs (slot event_flags, net_man.data
+                       and rest, user_data_10, user_data_11) are read-only
+                       memoryviews into _raw_data instead of owned copies,
+                       so they show later writes to those bytes. They are
+                       turned into copies (detach_views()) before _raw_data
+                       first changes size or is replaced.
+            lazy: When True, character slots are LazyUserDataX proxies that
+                  only expose version, map_id, name and level until another
+                  attribute is touched, which triggers the full slot parse.
+            workers: Parse character slots concurrently on a pool of this
+                     size (0 or 1 = serial; ignored when lazy)
+            backend: Pool type for workers, "thread" or "process"
+                     (see parallel_parse)
+
+        A journal left next to the file by an interrupted journaled write is
+        replayed (or discarded) first, see write_journal.
 
         Returns:
             Save instance with all data parsed
         """
+        replay_journal(filepath)
 
-        with open(filepath, "rb") as file:
+        with open(filepath, "rb") as file, trace_stage("read_file", file):
             data = file.read()
+            stat = os.fstat(file.fileno())
 
         if len(data) < 4:
             raise ValueError(f"Save file is empty or too small: {filepath}")
 
-        f = BytesIO(data)
         obj = cls()
 
         # Track original filepath for save() method
         obj._original_filepath = filepath
+        obj._raw_data = TrackedBuffer(data)
+        obj._synced = (str(Path(filepath).resolve()), stat.st_size, stat.st_mtime_ns)
+
+        f = BufferReader(data, zero_copy=zero_copy, source=obj._raw_data)
+        try:
+            obj._parse(f, lazy, workers, backend)
+        finally:
+            f.release()
+        if zero_copy:
+            obj._raw_data.before_resize = obj.detach_views
+
+        return obj
+
+    @classmethod
+    def open_mmap(cls, filepath: str) -> Save:
+        """
+        Open a save file memory-mapped, for inspection and scanning.
+
+        _raw_data is a read-only MappedBuffer over the file and character
+        slots are parsed lazily (see LazyUserDataX), so listing or checking a
+        save only reads the pages it touches and many saves can be open at
+        once without holding a full copy of each. The first write to
+        _raw_data copies the mapping into memory; the file itself is only
+        modified to finish an interrupted journaled write (see
+        write_journal), and to_file() works as usual afterwards.
 
-        # Force bytearray, not bytes
-        if isinstance(data, bytes):
-            obj._raw_data = bytearray(data)
-        else:
-            obj._raw_data = data
+        Args:
+            filepath: Path to save file
+
+        Returns:
+            Save instance backed by the file mapping
+        """
+        replay_journal(filepath)
+        raw = MappedBuffer.open(filepath)
+        if len(raw) < 4:
+            raw.close()
+            raise ValueError(f"Save file is empty or too small: {filepath}")
 
-        # Double-check it's actually bytearray
-        assert isinstance(obj._raw_data, bytearray), (
-            f"_raw_data is {type(obj._raw_data)}, not bytearray!"
-        )
+        obj = cls()
+        obj._original_filepath = filepath
+        obj._raw_data = raw
+        obj._synced = _file_state(Path(filepath))
 
-        # Verify it's mutable and non-empty
         try:
-            obj._raw_data[0] = obj._raw_data[0]  # Test write
-        except TypeError as e:
-            raise TypeError(
-                f"_raw_data is not writable! Type: {type(obj._raw_data)}"
-            ) from e
-
-        # Read magic (4 bytes)
-        obj.magic = f.read(4)
-
-        # Detect platform.
-        # PC saves start with BND4. Both Apollo and Save Wizard PS exports start with cb019c2c.
-        if obj.magic in (b"BND4", b"SL2\x00"):
-            obj.is_ps = False
-        elif obj.magic == bytes([0xCB, 0x01, 0x9C, 0x2C]):
-            obj.is_ps = True
-        else:
-            raise ValueError(f"Invalid save file magic: {obj.magic.hex()}")
-
-        # Read header
-        if obj.is_ps:
-            header_size = 0x6C
-        else:
-            header_size = 0x2FC
-
-        obj.header = f.read(header_size)
+            with open(filepath, "rb") as f, trace_stage("open_mmap", f):
+                obj._parse(f, lazy=True)
+        except BaseException:
+            raw.close()
+            raise
+
+        return obj
+
+    def close(self) -> None:
+        """
+        Release the file mapping of a save opened with open_mmap().
+
+        Slots that were not parsed yet can no longer be read afterwards.
+        No-op once the save has been written to (the mapping is already
+        closed) or for saves loaded with from_file().
+        """
+        raw = self.__dict__.get("_raw_data")
+        if isinstance(raw, MappedBuffer) and raw.mapped:
+            raw.close()
+
+    def __enter__(self) -> Save:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _parse(
+        self,
+        f: BufferReader,
+        lazy: bool = False,
+        workers: int = 0,
+        backend: str = "thread",
+    ) -> None:
+        """
+        Parse all sections of the save from a reader positioned at 0.
+
+        f is normally a BufferReader over the file snapshot; open_mmap()
+        passes the open file instead, which is fine since it only parses
+        lazily.
+        """
+        obj = self
+        parallel = workers > 1 and not lazy
+        pending: list[tuple[int, int]] = []  # (slot index, data start)
+
+        with trace_stage("header", f):
+            # Read magic (4 bytes)
+            obj.magic = f.read(4)
+
+            # Detect platform.
+            # PC saves start with BND4. Both Apollo and Save Wizard PS exports start with cb019c2c.
+            if obj.magic in (b"BND4", b"SL2\x00"):
+                obj.is_ps = False
+            elif obj.magic == bytes([0xCB, 0x01, 0x9C, 0x2C]):
+                obj.is_ps = True
+            else:
+                raise ValueError(f"Invalid save file magic: {obj.magic.hex()}")
+
+            # Read header
+            if obj.is_ps:
+                header_size = 0x6C
+            else:
+                header_size = 0x2FC
+
+            obj.header = f.read(header_size)
 
         # Parse 10 character slots
 
@@ -178,7 +302,7 @@ class Save:
                 # Check if slot is empty (all zeros checksum)
                 if checksum == bytes(16):
                     # Skip the character data for this slot
-                    f.read(0x280000)  # Skip empty slot data
+                    f.seek(0x280000, 1)  # Skip empty slot data
                     obj.character_slots.append(UserDataX())  # Add empty slot
                     continue
 
@@ -188,9 +312,30 @@ class Save:
             # Calculate slot size (data portion only, without checksum)
             slot_data_size = 0x280000
 
+            if lazy:
+                obj.character_slots.append(
+                    LazyUserDataX(
+                        obj,
+                        _slot_index,
+                        char_data_start,
+                        obj.is_ps,
+                        getattr(f, "zero_copy", False),
+                    )
+                )
+                f.seek(char_data_start + slot_data_size)
+                continue
+
+            if parallel:
+                # Placeholder, filled in once the pool has parsed the slot
+                pending.append((len(obj.character_slots), char_data_start))
+                obj.character_slots.append(UserDataX())
+                f.seek(char_data_start + slot_data_size)
+                continue
+
             # Parse character data
             try:
-                char = UserDataX.read(f, obj.is_ps, char_data_start, slot_data_size)
+                with trace_stage("slot", f, slot=_slot_index):
+                    char = UserDataX.read(f, obj.is_ps, char_data_start, slot_data_size)
                 obj.character_slots.append(char)
 
                 if char.is_empty():
@@ -210,6 +355,25 @@ class Save:
                 correct_position = slot_start + 0x280010
                 f.seek(correct_position)
 
+        if pending:
+            with trace_stage(
+                "slots_parallel",
+                nbytes=len(pending) * slot_data_size,
+                workers=workers,
+                backend=backend,
+            ):
+                slots = parse_slots_parallel(
+                    f.getvalue(),
+                    [start for _, start in pending],
+                    obj.is_ps,
+                    workers,
+                    backend,
+                    f.zero_copy,
+                    obj._raw_data,
+                )
+            for (index, _), char in zip(pending, slots, strict=True):
+                obj.character_slots[index] = char
+
         # Read and parse USER_DATA_10
 
         user_data_10_start = f.tell()
@@ -217,82 +381,143 @@ class Save:
 
         try:
             # Parse USER_DATA_10
-            obj.user_data_10_parsed = UserData10.read(f, obj.is_ps)
+            with trace_stage("user_data_10", f):
+                obj.user_data_10_parsed = UserData10.read(f, obj.is_ps)
 
             # Also keep raw bytes
             user_data_10_end = f.tell()
             f.seek(user_data_10_start)
-            obj.user_data_10 = f.read(user_data_10_end - user_data_10_start)
+            obj.user_data_10 = read_view(f, user_data_10_end - user_data_10_start)
             f.seek(user_data_10_end)
         except Exception:
             # Fall back to reading raw bytes
             f.seek(user_data_10_start)
             if not obj.is_ps:
                 f.read(16)  # Skip checksum
-            obj.user_data_10 = f.read(0x60000)
+            obj.user_data_10 = read_view(f, 0x60000)
 
         # Read USER_DATA_11
         if not obj.is_ps:
             f.read(16)  # Skip checksum
 
-        if obj.is_ps:
-            obj.user_data_11 = f.read(0x240010)
-        else:
-            obj.user_data_11 = f.read(0x240010)
+        with trace_stage("user_data_11", f):
+            obj.user_data_11 = read_view(f, 0x240010)
 
-        return obj
-
-    def recalculate_checksums(self):
+    def recalculate_checksums(self, full: bool = False) -> list[int]:
         """
-        Recalculate MD5 checksums for all active slots
+        Recalculate MD5 checksums for modified slots
 
         This is called after making modifications to ensure
-        the save file integrity is maintained
+        the save file integrity is maintained. Only slots (and USER_DATA_10)
+        whose bytes were written since the last recalculation are re-hashed;
+        see TrackedBuffer for how writes are recorded.
+
+        Args:
+            full: Re-hash every active slot regardless of recorded writes
+                  (e.g. to repair checksums of a save edited externally)
+
+        Returns:
+            Indices of slots whose stored checksum changed
         """
         if not hasattr(self, "_raw_data"):
             raise RuntimeError("Cannot recalculate checksums: raw data not available")
 
         # PS saves have no per-slot or USER_DATA_10 checksums - nothing to do
         if self.is_ps:
-            return
+            self._raw_data.clear_dirty()
+            return []
 
         import hashlib
 
         SLOT_SIZE = 0x280000
         CHECKSUM_SIZE = 0x10
+        raw = self._raw_data
+        changed = []
+        hashed = 0
+
+        with trace_stage("checksums", full=full) as event:
+            # Recalculate for each modified active slot using tracked offsets
+            for slot_idx in range(10):
+                slot = self.character_slots[slot_idx]
+                if slot.is_empty():
+                    continue
 
-        # Recalculate for each active slot using tracked offsets
-        for slot_idx in range(10):
-            slot = self.character_slots[slot_idx]
-            if slot.is_empty():
-                continue
-
-            # Use tracked offset for this slot
-            slot_offset = self._slot_offsets[slot_idx]
-            checksum_offset = slot_offset
-            data_offset = slot_offset + CHECKSUM_SIZE
+                # Use tracked offset for this slot
+                slot_offset = self._slot_offsets[slot_idx]
+                checksum_offset = slot_offset
+                data_offset = slot_offset + CHECKSUM_SIZE
+                if not full and not raw.is_dirty(data_offset, data_offset + SLOT_SIZE):
+                    continue
 
-            # Calculate MD5 of character data
-            char_data = self._raw_data[data_offset : data_offset + SLOT_SIZE]
-            md5_hash = hashlib.md5(char_data).digest()
+                # Calculate MD5 of character data
+                hashed += SLOT_SIZE
+                with memoryview(raw) as view:
+                    md5_hash = hashlib.md5(
+                        view[data_offset : data_offset + SLOT_SIZE]
+                    ).digest()
+
+                # Write checksum
+                if raw[checksum_offset : checksum_offset + CHECKSUM_SIZE] != md5_hash:
+                    raw[checksum_offset : checksum_offset + CHECKSUM_SIZE] = md5_hash
+                    changed.append(slot_idx)
+
+            # Recalculate USER_DATA_10 checksum using tracked offset
+            userdata10_offset = self._user_data_10_offset
+            userdata10_checksum_offset = userdata10_offset
+            userdata10_data_offset = userdata10_offset + CHECKSUM_SIZE
+
+            if full or raw.is_dirty(
+                userdata10_data_offset, userdata10_data_offset + 0x60000
+            ):
+                hashed += 0x60000
+                with memoryview(raw) as view:
+                    md5_hash = hashlib.md5(
+                        view[userdata10_data_offset : userdata10_data_offset + 0x60000]
+                    ).digest()
+                raw[
+                    userdata10_checksum_offset : userdata10_checksum_offset
+                    + CHECKSUM_SIZE
+                ] = md5_hash
+
+            if event is not None:
+                event["bytes"] = hashed
+                event["changed_slots"] = changed
+
+        raw.clear_dirty()
+        return changed
+
+    def mark_dirty(self, start: int, end: int) -> None:
+        """
+        Record an out-of-band write to _raw_data in [start, end).
 
-            # Write checksum
-            self._raw_data[checksum_offset : checksum_offset + CHECKSUM_SIZE] = md5_hash
+        Only needed for writes that bypass slice assignment, such as
+        struct.pack_into or writable memoryviews.
+        """
+        self._raw_data.mark_dirty(start, end)
 
-        # Recalculate USER_DATA_10 checksum using tracked offset
-        userdata10_offset = self._user_data_10_offset
-        userdata10_checksum_offset = userdata10_offset
-        userdata10_data_offset = userdata10_offset + CHECKSUM_SIZE
+    def patch(self, offset: int, data: bytes) -> None:
+        """
+        Overwrite bytes at an absolute offset (same length, tracked).
 
-        userdata10_data = self._raw_data[
-            userdata10_data_offset : userdata10_data_offset + 0x60000
+        Args:
+            offset: Absolute offset into _raw_data
+            data: Replacement bytes
+        """
+        self._raw_data[offset : offset + len(data)] = data
+
+    def dirty_slots(self) -> list[int]:
+        """Indices of slots with writes not yet covered by recalculate_checksums()."""
+        raw = self._raw_data
+        return [
+            slot_idx
+            for slot_idx in range(len(self._slot_offsets))
+            if raw.is_dirty(
+                self.slot_data_offset(slot_idx),
+                self.slot_data_offset(slot_idx) + 0x280000,
+            )
         ]
-        md5_hash = hashlib.md5(userdata10_data).digest()
-        self._raw_data[
-            userdata10_checksum_offset : userdata10_checksum_offset + CHECKSUM_SIZE
-        ] = md5_hash
 
-    def to_file(self, filepath: str):
+    def to_file(self, filepath: str, journaled: bool = False):
         """
         Write save file to disk.
 
@@ -309,23 +534,76 @@ class Save:
 
         Args:
             filepath: Path where save file will be written
+            journaled: Write only the byte ranges changed since the file was
+                       loaded or last written, via a redo journal and a
+                       reflink clone of the existing file (see
+                       write_journal). Falls back to a full write if the
+                       filesystem cannot reflink, filepath is not that file,
+                       it changed on disk since, or the edits cannot be
+                       expressed as in-place extents. Nothing is written if
+                       nothing changed.
         """
         if not hasattr(self, "_raw_data"):
             raise RuntimeError("Cannot write save file: raw data not available")
 
+        raw = self._raw_data
+        if isinstance(raw, MappedBuffer):
+            # Stop mapping the source before it can be replaced (Windows
+            # refuses to replace a file that is still mapped)
+            raw.detach()
+
         target = Path(filepath)
+        if journaled and self._write_journaled(target):
+            return
+
         tmp_path = target.with_name(f"{target.name}.tmp{os.getpid()}")
 
         try:
-            with open(tmp_path, "wb") as f:
-                f.write(self._raw_data)
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(tmp_path, target)
+            with trace_stage("write", nbytes=len(raw)):
+                with open(tmp_path, "wb") as f:
+                    f.write(raw)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, target)
         except BaseException:
             tmp_path.unlink(missing_ok=True)
             raise
 
+        raw.clear_journal()
+        self._synced = _file_state(target)
+
+    def _write_journaled(self, target: Path) -> bool:
+        """
+        Patch the changed extents of _raw_data into target.
+
+        Returns:
+            False if a journaled write is not possible and a full write is
+            needed instead
+        """
+        raw = self._raw_data
+        ranges = raw.journal_ranges()
+        state = _file_state(target)
+        if ranges is None or state is None or state != self._synced:
+            return False
+        if state[1] != len(raw):
+            return False
+        if ranges and not can_reflink(target):
+            return False  # copying the file would cost more than writing it
+
+        if ranges:
+            extents = [(start, bytes(raw[start:end])) for start, end in ranges]
+            with trace_stage(
+                "write_journaled",
+                nbytes=sum(end - start for start, end in ranges),
+                extents=len(extents),
+            ):
+                journaled_write(target, extents)
+            state = _file_state(target)
+
+        raw.clear_journal()
+        self._synced = state
+        return True
+
     def get_active_slots(self) -> list[int]:
         """
         Get list of slot indices that are marked as active in CSProfileSummary.
@@ -348,6 +626,36 @@ class Save:
         base = self._slot_offsets[slot_idx]
         return base if self.is_ps else base + 0x10
 
+    def detach_views(self) -> None:
+        """
+        Replace zero-copy memoryview fields with owned bytes copies.
+
+        Memoryviews returned by a zero_copy load point into _raw_data, which
+        cannot change size while they exist; TrackedBuffer calls this before
+        it resizes. No-op for saves loaded without zero_copy.
+        """
+        raw = self.__dict__.get("_raw_data")
+        if isinstance(raw, TrackedBuffer):
+            raw.before_resize = None
+        for slot in self.character_slots:
+            if isinstance(slot, LazyUserDataX):
+                continue  # not parsed yet, holds no views
+            for name in ("event_flags", "rest"):
+                value = getattr(slot, name, None)
+                if isinstance(value, memoryview):
+                    setattr(slot, name, value.tobytes())
+                    value.release()
+            net_man = getattr(slot, "net_man", None)
+            if net_man is not None and isinstance(net_man.data, memoryview):
+                value = net_man.data
+                net_man.data = value.tobytes()
+                value.release()
+        for name in ("user_data_10", "user_data_11"):
+            value = getattr(self, name, None)
+            if isinstance(value, memoryview):
+                setattr(self, name, value.tobytes())
+                value.release()
+
     def get_slot(self, index: int) -> UserDataX:
         """
         Get character slot by index.
@@ -403,7 +711,7 @@ class Save:
         """Compatibility alias for character_slots"""
         return self.character_slots
 
-    def save(self, filepath: str = None):
+    def save(self, filepath: str = None, journaled: bool = False):
         """
         Compatibility wrapper for to_file()
 
@@ -415,11 +723,16 @@ class Save:
                 raise ValueError("No filepath specified and original path not tracked")
             filepath = self._original_filepath
 
-        self.to_file(filepath)
+        self.to_file(filepath, journaled=journaled)
 
     @property
     def data(self):
-        """Compatibility alias for _raw_data - always returns bytearray"""
+        """
+        Compatibility alias for _raw_data.
+
+        Returns a bytearray, or the copy-on-write MappedBuffer for saves
+        loaded with open_mmap().
+        """
         if hasattr(self, "_raw_data"):
             # Force conversion if it's somehow bytes
             if isinstance(self._raw_data, bytes) and not isinstance(
@@ -559,41 +872,16 @@ class Save:
 
         if event_flag_issues:
             try:
-                from .event_flags import CorruptionFixer
+                from .event_flags import CorruptionFixer, write_flags
 
                 # Extract issue names (remove 'eventflag:' prefix)
                 issue_names = [
                     issue.replace("eventflag:", "") for issue in event_flag_issues
                 ]
 
-                # Make event_flags mutable
-                event_flags_mutable = bytearray(slot.event_flags)
-
-                # Apply fixes
-                fixes_count, fix_descriptions = CorruptionFixer.fix_all(
-                    event_flags_mutable, issue_names
-                )
-
-                # Update character's event flags in memory
-                slot.event_flags = bytes(event_flags_mutable)
-
-                # Write back to raw data using the tracked offset
-                if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                    self._raw_data[
-                        slot.event_flags_offset : slot.event_flags_offset
-                        + len(event_flags_mutable)
-                    ] = event_flags_mutable
-                else:
-                    # Fallback: derive from the tracked slot offset.
-                    # Event flags sit at 0x8F7 within character data.
-                    EVENT_FLAGS_OFFSET_IN_SLOT = 0x8F7
-
-                    event_flags_start = (
-                        self.slot_data_offset(slot_index) + EVENT_FLAGS_OFFSET_IN_SLOT
-                    )
-                    self._raw_data[
-                        event_flags_start : event_flags_start + len(event_flags_mutable)
-                    ] = event_flags_mutable
+                # Apply all fixes as one batch, in memory and in raw data
+                states, fix_descriptions = CorruptionFixer.fix_states(issue_names)
+                write_flags(self, slot_index, states)
 
                 # Add fix descriptions
                 for fix_desc in fix_descriptions:
@@ -880,17 +1168,38 @@ class Save:
         ] = md5_hash
 
 
-def load_save(filepath: str) -> Save:
+def _file_state(path: Path) -> tuple[str, int, int] | None:
+    """(resolved path, size, mtime_ns) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+def load_save(
+    filepath: str,
+    zero_copy: bool = False,
+    lazy: bool = False,
+    workers: int = 0,
+    backend: str = "thread",
+) -> Save:
     """
     Convenience function to load a save file.
 
     Args:
         filepath: Path to file
+        zero_copy: Keep large blobs as memoryviews into the file buffer
+        lazy: Defer parsing each character slot until it is accessed
+        workers: Parse slots concurrently on a pool of this size
+        backend: "thread" or "process" pool for workers
 
     Returns:
         Parsed Save object
     """
-    return Save.from_file(filepath)
+    return Save.from_file(
+        filepath, zero_copy=zero_copy, lazy=lazy, workers=workers, backend=backend
+    )
 
 
 # Main entry point for testing
@@ -0,0 +1,167 @@
+"""
+Elden Ring Save Parser - Slot Section Table
+
+Relocation table for one character slot: the start offset of every section
+of the slot, relative to the slot data start, recorded while UserDataX.read
+walks the slot. Section names match the ones rebuild_slot_with_map reports.
+
+Everything that moves bytes inside a slot (gaitem map growth, shrink, see
+inventory_ops._flush_slot_edit) calls SectionTable.relocate once, which
+shifts every section at or after the changed point in one pass, so no
+tracked offset can be forgotten. The
+legacy UserDataX.*_offset attributes read and write through this table.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+# Sections in file order. Runs of scalar fields are grouped under one name.
+SECTION_NAMES = (
+    "version",
+    "map_id",
+    "gaitem_map",
+    "player_game_data",
+    "sp_effects",
+    "equipped_items_equip_index",
+    "active_weapon_slots_and_arm_style",
+    "equipped_items_item_id",
+    "equipped_items_gaitem_handle",
+    "inventory_held",
+    "equipped_spells",
+    "equipped_items",
+    "equipped_gestures",
+    "acquired_projectiles",
+    "equipped_armaments_and_items",
+    "equipped_physics",
+    "face_data",
+    "inventory_storage_box",
+    "gestures",
+    "unlocked_regions",
+    "horse",
+    "control_byte_maybe",
+    "blood_stain",
+    "gamedataman_fields",
+    "menu_profile_save_load",
+    "trophy_equip_data",
+    "gaitem_game_data",
+    "tutorial_data",
+    "gameman_fields",
+    "event_flags",
+    "event_flags_terminator",
+    "field_area",
+    "world_area",
+    "world_geom_man",
+    "world_geom_man2",
+    "rend_man",
+    "player_coordinates",
+    "game_man_fields",
+    "net_man",
+    "world_area_weather",
+    "world_area_time",
+    "base_version",
+    "steam_id",
+    "ps5_activity",
+    "dlc",
+    "player_data_hash",
+    "rest",
+)
+
+_INDEX = {name: i for i, name in enumerate(SECTION_NAMES)}
+
+# Marks a section that was not recorded (empty slot, parse stopped early)
+_UNSET = -1
+
+
+class SectionTable:
+    """Start offsets of a slot's sections, relative to slot data start."""
+
+    def __init__(self, slot_size: int = 0x280000):
+        self.slot_size = slot_size
+        self.starts = array("q", [_UNSET]) * len(SECTION_NAMES)
+
+    def mark(self, name: str, start: int) -> None:
+        """Record the start of a section."""
+        self.starts[_INDEX[name]] = start
+
+    def clear(self, name: str) -> None:
+        """Forget the start of a section."""
+        self.starts[_INDEX[name]] = _UNSET
+
+    def has(self, name: str) -> bool:
+        return self.starts[_INDEX[name]] != _UNSET
+
+    def start(self, name: str) -> int:
+        """
+        Start of a section relative to slot data start.
+
+        Raises:
+            KeyError: Unknown or unrecorded section
+        """
+        start = self.starts[_INDEX[name]]
+        if start == _UNSET:
+            raise KeyError(f"section {name!r} was not recorded")
+        return start
+
+    def span(self, name: str) -> tuple[int, int]:
+        """
+        (start, end) of a section relative to slot data start.
+
+        The end is the start of the next recorded section, or the slot size
+        for the last one.
+        """
+        start = self.start(name)
+        for following in self.starts[_INDEX[name] + 1 :]:
+            if following != _UNSET:
+                return start, following
+        return start, self.slot_size
+
+    def spans(self) -> dict[str, tuple[int, int]]:
+        """(start, end) of every recorded section, in file order."""
+        return {name: self.span(name) for name in SECTION_NAMES if self.has(name)}
+
+    def relocate(self, at: int, delta: int) -> None:
+        """Shift every recorded section starting at or after `at` by delta."""
+        starts = self.starts
+        for i, start in enumerate(starts):
+            if start >= at:
+                starts[i] = start + delta
+
+    def __repr__(self) -> str:
+        recorded = sum(1 for start in self.starts if start != _UNSET)
+        return f"SectionTable({recorded}/{len(SECTION_NAMES)} sections)"
+
+
+class SectionOffset:
+    """
+    UserDataX.*_offset attribute backed by the slot's SectionTable.
+
+    absolute offsets are file offsets (slot data start + section start);
+    the others are relative to the slot data start. 0 means "not tracked",
+    as before the table existed.
+    """
+
+    def __init__(self, section: str, absolute: bool):
+        self.section = section
+        self.absolute = absolute
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        table = obj.sections
+        if not table.has(self.section):
+            return 0
+        start = table.start(self.section)
+        return obj.data_start + start if self.absolute else start
+
+    def __set__(self, obj, value: int) -> None:
+        table = obj.sections
+        if not value:
+            table.clear(self.section)
+        elif self.absolute:
+            table.mark(self.section, value - obj.data_start)
+        else:
+            table.mark(self.section, value)
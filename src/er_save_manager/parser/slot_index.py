@@ -0,0 +1,369 @@
+"""
+Elden Ring Save Parser - Slot Item Index
+
+Lookup index over one character slot's gaitem map and inventory lists, so
+inventory operations don't scan the 5120-entry gaitem map and ~4,500
+inventory rows for every lookup:
+
+- gaitem handle -> entry index, item id / weapon base id -> entry indices
+- gaitem handle -> row indices, per inventory item list
+- free-list heaps of empty gaitem entries and empty inventory rows
+- running maxima of the gaitem handle counter and acquisition index
+
+slot_index(slot) returns the index cached on the slot. Each part (the
+gaitem map, each item list) is built on first use, so an operation only
+pays for the parts it touches. inventory_ops reports every entry or row it
+changes (gaitem_changed / row_changed) and the index updates in O(log n).
+Changes made anywhere else (editors, fixes, restored snapshots) are caught
+by comparing the slot's arrays with the index's copy of them, which takes a
+few microseconds, and that part is rebuilt.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import insort
+from collections.abc import Callable
+from heapq import heapify, heappop, heappush
+
+_PREFIX_MASK = 0xF0000000
+_PREFIX_WEAPON = 0x80000000
+_PREFIX_ARMOR = 0x90000000
+_PREFIX_GEM = 0xC0000000
+_COUNTER_PREFIXES = (_PREFIX_WEAPON, _PREFIX_ARMOR, _PREFIX_GEM)
+
+# Acquisition indices at or above this are corrupt and ignored
+_ACQ_LIMIT = 0x7FFFFFFF
+
+
+def weapon_base(item_id: int) -> int:
+    """Weapon id without upgrade level and infusion (stored weapon ids)."""
+    return (item_id & 0x0FFFFFFF) // 10000 * 10000
+
+
+class _MaxCounter:
+    """Multiset of ints with O(log n) maximum (lazily pruned max-heap)."""
+
+    def __init__(self, values=()):
+        self.counts: dict[int, int] = {}
+        for value in values:
+            self.counts[value] = self.counts.get(value, 0) + 1
+        self._heap = [-value for value in self.counts]
+        heapify(self._heap)
+
+    def add(self, value: int) -> None:
+        count = self.counts.get(value, 0)
+        self.counts[value] = count + 1
+        if not count:
+            heappush(self._heap, -value)
+
+    def discard(self, value: int) -> None:
+        count = self.counts.get(value, 0)
+        if count > 1:
+            self.counts[value] = count - 1
+        elif count:
+            del self.counts[value]
+
+    def max(self, default: int = 0) -> int:
+        heap = self._heap
+        while heap and -heap[0] not in self.counts:
+            heappop(heap)
+        return -heap[0] if heap else default
+
+
+class _IndexHeap:
+    """
+    Heap of entry indices with lazy deletion.
+
+    Indices are pushed when they start matching and never removed; the
+    ones that stopped matching (valid(i) is False) are dropped on peek.
+    """
+
+    def __init__(
+        self, indices: list[int], valid: Callable[[int], bool], largest: bool = False
+    ):
+        self._sign = -1 if largest else 1
+        self._heap = [self._sign * i for i in indices]
+        heapify(self._heap)
+        self._valid = valid
+
+    def push(self, index: int) -> None:
+        heappush(self._heap, self._sign * index)
+
+    def peek(self) -> int:
+        """Smallest (or largest) valid index, or -1."""
+        heap, sign, valid = self._heap, self._sign, self._valid
+        while heap and not valid(sign * heap[0]):
+            heappop(heap)
+        return sign * heap[0] if heap else -1
+
+
+def _add(table: dict[int, list[int]], key: int, index: int) -> None:
+    entries = table.get(key)
+    if entries is None:
+        table[key] = [index]
+    else:
+        insort(entries, index)
+
+
+def _discard(table: dict[int, list[int]], key: int, index: int) -> None:
+    entries = table.get(key)
+    if entries is None:
+        return
+    try:
+        entries.remove(index)
+    except ValueError:
+        return
+    if not entries:
+        del table[key]
+
+
+class GaitemIndex:
+    """Index over a GaitemMap (see module docstring)."""
+
+    def __init__(self, gaitem_map):
+        self.map = gaitem_map
+        self.handles = array("I", gaitem_map.handles)
+        self.item_ids = array("I", gaitem_map.item_ids)
+        handles = self.handles
+
+        self.by_handle: dict[int, list[int]] = {}
+        self.by_item: dict[int, list[int]] = {}
+        self.by_weapon_base: dict[int, list[int]] = {}
+        empty: list[int] = []
+        weapons: list[int] = []
+        second_byte: list[int] = []
+        lower16: list[int] = []
+        for i, handle in enumerate(handles):
+            if not handle:
+                empty.append(i)
+                continue
+            self._add_keys(i, handle, self.item_ids[i])
+            prefix = handle & _PREFIX_MASK
+            if prefix == _PREFIX_WEAPON:
+                weapons.append(i)
+            if prefix in _COUNTER_PREFIXES:
+                lower16.append(handle & 0xFFFF)
+                if (handle >> 16) & 0xFF != 0x80:
+                    second_byte.append(i)
+
+        self._first_empty = _IndexHeap(empty, self._is_empty)
+        self._last_empty = _IndexHeap(empty, self._is_empty, largest=True)
+        self._weapons = _IndexHeap(weapons, self._is_weapon)
+        self._second_byte = _IndexHeap(second_byte, self._has_second_byte)
+        self._lower16 = _MaxCounter(lower16)
+
+    def _is_empty(self, i: int) -> bool:
+        return not self.handles[i]
+
+    def _is_weapon(self, i: int) -> bool:
+        return self.handles[i] & _PREFIX_MASK == _PREFIX_WEAPON
+
+    def _has_second_byte(self, i: int) -> bool:
+        handle = self.handles[i]
+        return (
+            handle & _PREFIX_MASK in _COUNTER_PREFIXES and (handle >> 16) & 0xFF != 0x80
+        )
+
+    def _add_keys(self, i: int, handle: int, item_id: int) -> None:
+        _add(self.by_handle, handle, i)
+        _add(self.by_item, item_id, i)
+        if handle & _PREFIX_MASK == _PREFIX_WEAPON:
+            _add(self.by_weapon_base, weapon_base(item_id), i)
+
+    def _discard_keys(self, i: int, handle: int, item_id: int) -> None:
+        _discard(self.by_handle, handle, i)
+        _discard(self.by_item, item_id, i)
+        if handle & _PREFIX_MASK == _PREFIX_WEAPON:
+            _discard(self.by_weapon_base, weapon_base(item_id), i)
+
+    def is_current(self, gaitem_map) -> bool:
+        return (
+            gaitem_map is self.map
+            and gaitem_map.handles == self.handles
+            and gaitem_map.item_ids == self.item_ids
+        )
+
+    def changed(self, i: int) -> None:
+        """Re-index entry i after it was replaced in the map."""
+        old_handle, old_item = self.handles[i], self.item_ids[i]
+        handle, item_id = self.map.handles[i], self.map.item_ids[i]
+        if (handle, item_id) == (old_handle, old_item):
+            return
+        if old_handle:
+            self._discard_keys(i, old_handle, old_item)
+            if old_handle & _PREFIX_MASK in _COUNTER_PREFIXES:
+                self._lower16.discard(old_handle & 0xFFFF)
+        self.handles[i], self.item_ids[i] = handle, item_id
+
+        if not handle:
+            self._first_empty.push(i)
+            self._last_empty.push(i)
+            return
+        self._add_keys(i, handle, item_id)
+        prefix = handle & _PREFIX_MASK
+        if prefix == _PREFIX_WEAPON:
+            self._weapons.push(i)
+        if prefix in _COUNTER_PREFIXES:
+            self._lower16.add(handle & 0xFFFF)
+            if self._has_second_byte(i):
+                self._second_byte.push(i)
+
+    def find_handle(self, handle: int) -> int:
+        """Index of the first entry with this handle, or -1."""
+        if not handle:
+            return self._first_empty.peek()
+        entries = self.by_handle.get(handle)
+        return entries[0] if entries else -1
+
+    def first_weapon(self) -> int:
+        """Index of the first weapon (0x8 prefix) entry, or -1."""
+        return self._weapons.peek()
+
+    def first_empty(self) -> int:
+        return self._first_empty.peek()
+
+    def last_empty(self) -> int:
+        return self._last_empty.peek()
+
+    def max_counter(self) -> int:
+        """Largest lower-16-bit counter of any weapon, armor or gem handle."""
+        return self._lower16.max(0)
+
+    def second_byte(self) -> int:
+        """Bits 16-23 of the first handle that has a non-PC value there, or 0x80."""
+        i = self._second_byte.peek()
+        return (self.handles[i] >> 16) & 0xFF if i != -1 else 0x80
+
+    def entries_for_item(self, key: int) -> list[int]:
+        """Sorted indices of non-empty entries whose stored item_id is key."""
+        return self.by_item.get(key, [])
+
+    def entries_for_weapon(self, base: int) -> list[int]:
+        """Sorted indices of weapon entries with this weapon_base()."""
+        return self.by_weapon_base.get(base, [])
+
+
+class ItemListIndex:
+    """Index over one InventoryItemList (see module docstring)."""
+
+    def __init__(self, item_list):
+        self.list = item_list
+        self.rows = array("I", item_list.rows)
+        rows = self.rows
+
+        self.by_handle: dict[int, list[int]] = {}
+        empty: list[int] = []
+        acquisitions: list[int] = []
+        for i, handle in enumerate(rows[0::3]):
+            if not handle:
+                empty.append(i)
+                continue
+            _add(self.by_handle, handle, i)
+            acq = rows[i * 3 + 2]
+            if acq < _ACQ_LIMIT:
+                acquisitions.append(acq)
+
+        self._free = _IndexHeap(empty, self._is_free)
+        self._acquisitions = _MaxCounter(acquisitions)
+
+    def _is_free(self, i: int) -> bool:
+        return not self.rows[i * 3]
+
+    def is_current(self, item_list) -> bool:
+        return item_list is self.list and item_list.rows == self.rows
+
+    def changed(self, i: int) -> None:
+        """Re-index row i after it was written."""
+        base = i * 3
+        old_handle, old_acq = self.rows[base], self.rows[base + 2]
+        new = self.list.rows[base : base + 3]
+        handle, acq = new[0], new[2]
+        if old_handle:
+            _discard(self.by_handle, old_handle, i)
+            if old_acq < _ACQ_LIMIT:
+                self._acquisitions.discard(old_acq)
+        self.rows[base : base + 3] = new
+
+        if not handle:
+            self._free.push(i)
+            return
+        _add(self.by_handle, handle, i)
+        if acq < _ACQ_LIMIT:
+            self._acquisitions.add(acq)
+
+    def find_handle(self, handle: int) -> int:
+        """Index of the first row with this gaitem_handle (0: first free), or -1."""
+        if not handle:
+            return self._free.peek()
+        entries = self.by_handle.get(handle)
+        return entries[0] if entries else -1
+
+    def rows_with(self, handle: int) -> list[int]:
+        """Sorted indices of the rows holding this (non-zero) handle."""
+        return self.by_handle.get(handle, [])
+
+    def max_acquisition(self) -> int:
+        """Largest valid acquisition index of an occupied row, or 0."""
+        return self._acquisitions.max(0)
+
+
+class SlotIndex:
+    """Per-slot GaitemIndex and ItemListIndex set, built and validated lazily."""
+
+    def __init__(self, slot):
+        self.slot = slot
+        self._gaitems: GaitemIndex | None = None
+        self._lists: dict[int, ItemListIndex] = {}
+
+    @property
+    def gaitems(self) -> GaitemIndex:
+        gaitem_map = self.slot.gaitem_map
+        index = self._gaitems
+        if index is None or not index.is_current(gaitem_map):
+            index = self._gaitems = GaitemIndex(gaitem_map)
+        return index
+
+    def items(self, item_list) -> ItemListIndex:
+        """Index of one of the slot's inventory item lists."""
+        index = self._lists.get(id(item_list))
+        if index is None or not index.is_current(item_list):
+            index = self._lists[id(item_list)] = ItemListIndex(item_list)
+        return index
+
+    def max_acquisition(self) -> int:
+        """Largest valid acquisition index across held and storage inventories."""
+        slot = self.slot
+        return max(
+            self.items(item_list).max_acquisition()
+            for inventory in (slot.inventory_held, slot.inventory_storage_box)
+            for item_list in (inventory.common_items, inventory.key_items)
+        )
+
+    def gaitem_changed(self, i: int) -> None:
+        """Report that gaitem entry i was replaced."""
+        if self._gaitems is not None and self._gaitems.map is self.slot.gaitem_map:
+            self._gaitems.changed(i)
+
+    def row_changed(self, item_list, i: int) -> None:
+        """Report that row i of item_list was written."""
+        index = self._lists.get(id(item_list))
+        if index is not None and index.list is item_list:
+            index.changed(i)
+
+
+def slot_index(slot) -> SlotIndex:
+    """
+    The SlotIndex cached on a character slot, created on first use.
+
+    Args:
+        slot: UserDataX (a LazyUserDataX is materialized)
+
+    Returns:
+        SlotIndex for the slot
+    """
+    index = slot.__dict__.get("_item_index")
+    if index is None or index.slot is not slot:
+        index = SlotIndex(slot)
+        slot.__dict__["_item_index"] = index
+    return index
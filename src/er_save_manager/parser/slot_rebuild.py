@@ -11,6 +11,8 @@ import struct
 from io import BytesIO
 from typing import TYPE_CHECKING, Any
 
+from .gaitem_map import GaitemMap
+
 if TYPE_CHECKING:
     from er_save_manager.parser.user_data_x import UserDataX
 
@@ -60,6 +62,9 @@ def rebuild_slot_with_map(slot: UserDataX) -> tuple[bytes, list[dict[str, Any]]]
 
     # Gaitem map
     def write_gaitem_map():
+        if isinstance(slot.gaitem_map, GaitemMap):
+            slot.gaitem_map.write(buf)
+            return
         for gaitem in slot.gaitem_map:
             gaitem.write(buf)
 
@@ -0,0 +1,303 @@
+"""
+Elden Ring Save Parser - In-Memory Snapshots
+
+Undo/redo for a Save without copying the file. A SnapshotStack keeps the
+buffer's undo log (TrackedBuffer.start_undo_log) open and cuts it into
+steps at every checkpoint(): a step holds only the before-images of the
+byte ranges written since the previous checkpoint, so memory and undo time
+are O(changed bytes), not O(file size).
+
+Undoing a step writes its before-images back (newest first) while logging
+the bytes it overwrites, which becomes the redo step. Parsed objects are
+brought back in line afterwards: only character slots and USER_DATA_10
+whose byte ranges the step touched are re-derived from the restored bytes,
+slots as LazyUserDataX so nothing is parsed until it is used.
+
+Anything the log cannot follow (the buffer replaced by different content,
+mark_all_dirty, a MappedBuffer) acts as a barrier: the history is dropped
+rather than restored against the wrong bytes. Reloading the file after a
+write keeps the history when carry_over() finds the same bytes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from er_save_manager.parser.buffer_reader import BufferReader
+from er_save_manager.parser.dirty_tracking import TrackedBuffer
+from er_save_manager.parser.user_data_10 import UserData10
+from er_save_manager.parser.user_data_x import LazyUserDataX, UserDataX
+
+if TYPE_CHECKING:
+    from er_save_manager.parser.save import Save
+
+SLOT_DATA_SIZE = 0x280000
+
+# Oldest steps are dropped past either limit
+MAX_STEPS = 50
+MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class Snapshot:
+    """One undoable step: (start, old bytes, new length) records, oldest first."""
+
+    label: str
+    records: list
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(old) for _, old, _ in self.records)
+
+    def ranges(self) -> list[tuple[int, int]]:
+        """Buffer ranges the step restores, in the coordinates they apply to."""
+        return [(start, start + max(len(old), new)) for start, old, new in self.records]
+
+
+class SnapshotStack:
+    """
+    Undo/redo history of one Save.
+
+    Usage:
+        stack = snapshots(save)
+        stack.checkpoint("set_runes")
+        ...edit save._raw_data...
+        stack.undo()   # -> "set_runes"
+        stack.redo()
+    """
+
+    def __init__(
+        self, save: Save, max_steps: int = MAX_STEPS, max_bytes: int = MAX_BYTES
+    ):
+        self.save = save
+        self.max_steps = max_steps
+        self.max_bytes = max_bytes
+        self._undo: list[Snapshot] = []
+        self._redo: list[Snapshot] = []
+        self._open: Snapshot | None = None
+        self._buffer = None
+
+    # ---- recording ---------------------------------------------------------
+
+    def checkpoint(self, label: str = "") -> None:
+        """
+        Close the current step and start recording a new one.
+
+        Call before an edit; label names the step undo() and redo() return.
+        A step with no writes is discarded, a non-empty one clears redo.
+        """
+        if self._sync():
+            self._close()
+        self._start(label)
+
+    def _start(self, label: str) -> None:
+        buffer = self.save._raw_data
+        if not isinstance(buffer, TrackedBuffer):
+            self.clear()  # nothing to record writes with
+            return
+        self._buffer = buffer
+        self._open = Snapshot(label, buffer.start_undo_log())
+
+    def _close(self) -> None:
+        step, self._open = self._open, None
+        if step is None:
+            return
+        self._buffer.stop_undo_log()
+        if not step.records:
+            return
+        self._undo.append(step)
+        self._redo.clear()
+        self._trim()
+
+    def _sync(self) -> bool:
+        """False (and the history cleared) if the buffer escaped the log."""
+        if self._open is None:
+            return True
+        buffer = self.save._raw_data
+        # An identical-content replacement inherits the log, anything else
+        # starts without it
+        if getattr(buffer, "_undo", None) is not self._open.records or (
+            buffer.undo_lost
+        ):
+            self.clear()
+            return False
+        self._buffer = buffer
+        return True
+
+    def _trim(self) -> None:
+        total = self.nbytes
+        while self._undo and (
+            len(self._undo) > self.max_steps or total > self.max_bytes
+        ):
+            total -= self._undo.pop(0).nbytes
+
+    # ---- undo / redo ---------------------------------------------------------
+
+    def undo(self) -> str | None:
+        """
+        Revert the most recent step.
+
+        Returns:
+            Label of the reverted step, None if there was nothing to undo
+        """
+        return self._step(self._undo, self._redo)
+
+    def redo(self) -> str | None:
+        """
+        Re-apply the most recently undone step.
+
+        Returns:
+            Label of the re-applied step, None if there was nothing to redo
+        """
+        return self._step(self._redo, self._undo)
+
+    def _step(self, source: list[Snapshot], target: list[Snapshot]) -> str | None:
+        if self._sync():
+            self._close()  # keeps edits made since the last checkpoint
+        if not source:
+            self._start("")
+            return None
+
+        step = source.pop()
+        buffer = self._buffer
+        inverse = buffer.start_undo_log()
+        for start, old, new in reversed(step.records):
+            buffer[start : start + new] = old
+        buffer.stop_undo_log()
+        target.append(Snapshot(step.label, inverse))
+
+        self._refresh(step.ranges())
+        self._start("")
+        return step.label
+
+    def _refresh(self, ranges: list[tuple[int, int]]) -> None:
+        """Re-derive parsed objects whose bytes the restored ranges overlap."""
+        save = self.save
+
+        def touched(lo: int, hi: int) -> bool:
+            return any(start < hi and end > lo for start, end in ranges)
+
+        for i, slot_start in enumerate(save._slot_offsets):
+            data_start = save.slot_data_offset(i)
+            if touched(slot_start, data_start + SLOT_DATA_SIZE):
+                save.character_slots[i] = _reload_slot(save, i, slot_start, data_start)
+
+        start = save._user_data_10_offset
+        if save.user_data_10 and touched(start, start + len(save.user_data_10)):
+            _reload_user_data_10(save, start)
+
+    # ---- state ---------------------------------------------------------------
+
+    @property
+    def can_undo(self) -> bool:
+        self._sync()
+        return bool(self._undo) or bool(self._open and self._open.records)
+
+    @property
+    def can_redo(self) -> bool:
+        self._sync()
+        return bool(self._redo)
+
+    def undo_labels(self) -> list[str]:
+        """Labels of undoable steps, most recent first."""
+        return [step.label for step in reversed(self._undo)]
+
+    def redo_labels(self) -> list[str]:
+        """Labels of redoable steps, next first."""
+        return [step.label for step in reversed(self._redo)]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by all undo and redo steps."""
+        return sum(step.nbytes for step in self._undo + self._redo)
+
+    def rebind(self, save: Save) -> bool:
+        """
+        Move the history to save, a fresh parse of the same file.
+
+        Editors that write and then reload replace the Save; the steps still
+        apply as long as the new buffer holds exactly the bytes the old one
+        does. Otherwise the history is dropped.
+
+        Returns:
+            True if the history now belongs to save
+        """
+        if self._sync():
+            self._close()  # the edit being reloaded becomes an undo step
+        if save._raw_data != self.save._raw_data:
+            self.clear()
+            return False
+        self.save.__dict__.pop("_snapshots", None)
+        self.save = save
+        save.__dict__["_snapshots"] = self
+        self._start("")
+        return True
+
+    def clear(self) -> None:
+        """Forget all history and stop recording."""
+        if self._open is not None and self._buffer is not None:
+            if self._buffer._undo is self._open.records:
+                self._buffer.stop_undo_log()
+        self._undo.clear()
+        self._redo.clear()
+        self._open = None
+        self._buffer = None
+
+    def __repr__(self) -> str:
+        return (
+            f"SnapshotStack({len(self._undo)} undo, {len(self._redo)} redo, "
+            f"{self.nbytes} bytes)"
+        )
+
+
+def _reload_slot(save: Save, slot_idx: int, slot_start: int, data_start: int):
+    if not save.is_ps and not any(save._raw_data[slot_start:data_start]):
+        return UserDataX()  # all-zero checksum: empty slot, as in from_file
+    return LazyUserDataX(save, slot_idx, data_start, save.is_ps)
+
+
+def _reload_user_data_10(save: Save, start: int) -> None:
+    raw = save._raw_data
+    f = BufferReader(raw, start)
+    try:
+        save.user_data_10_parsed = UserData10.read(f, save.is_ps)
+    except Exception:
+        end = start + len(save.user_data_10)
+    else:
+        end = f.tell()
+    save.user_data_10 = bytes(raw[start:end])
+
+
+def snapshots(save: Save) -> SnapshotStack:
+    """
+    The SnapshotStack cached on a Save, created on first use.
+
+    Args:
+        save: Parsed Save instance
+
+    Returns:
+        SnapshotStack for the save
+    """
+    stack = save.__dict__.get("_snapshots")
+    if stack is None:
+        stack = SnapshotStack(save)
+        save.__dict__["_snapshots"] = stack
+    return stack
+
+
+def carry_over(old: Save, new: Save) -> bool:
+    """
+    Hand the undo history of old to new, a reload of the same file.
+
+    Args:
+        old: Save being replaced
+        new: Save parsed from the file old was written to
+
+    Returns:
+        True if new now has old's history
+    """
+    stack = old.__dict__.get("_snapshots")
+    if stack is None or old is new:
+        return False
+    return stack.rebind(new)
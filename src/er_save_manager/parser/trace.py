@@ -0,0 +1,202 @@
+"""
+Elden Ring Save Parser - Stage Tracing
+
+Opt-in instrumentation of the load/save hot paths. When tracing is enabled,
+every instrumented stage (file read, header, each slot's gaitem map,
+inventories, event flags and world structs, USER_DATA_10/11, checksums,
+writes) records its duration and byte count into the active Trace, which
+can be saved as a JSON trace and summarized per stage.
+
+Enable with:
+    ER_SAVE_MANAGER_TRACE=1           trace in memory (e.g. for the
+                                      troubleshooting dialog)
+    ER_SAVE_MANAGER_TRACE=<path>      also write the JSON trace there on exit
+    er-save-manager --trace <path> …  same, for one CLI command
+
+and view a saved trace with ``er-save-manager trace <path>``.
+
+Disabled tracing costs one function call per stage.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import platform
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+ENV_VAR = "ER_SAVE_MANAGER_TRACE"
+
+TRACE_VERSION = 1
+
+_NULL = nullcontext()
+
+
+class Trace:
+    """Collected stage events of one traced session."""
+
+    def __init__(self):
+        self.started = time.time()
+        self._origin = time.perf_counter()
+        self.events: list[dict] = []
+        self._local = threading.local()
+
+    @contextmanager
+    def stage(self, name: str, f=None, nbytes: int | None = None, **attrs):
+        """
+        Time a block of code as one stage.
+
+        Yields a dict that is merged into the event on exit, for values
+        only known at the end (bytes hashed, slots changed, ...).
+
+        Args:
+            name: Dotted stage name, e.g. "slot.gaitem_map"
+            f: Stream being parsed; bytes consumed from it are recorded
+            nbytes: Byte count to record instead (e.g. for writes)
+            **attrs: Extra JSON-serializable fields (slot index, ...)
+        """
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        pos = f.tell() if f is not None else None
+        start = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            end = time.perf_counter()
+            self._local.depth = depth
+            if pos is not None:
+                nbytes = f.tell() - pos
+            event = {
+                "name": name,
+                "start_ms": round((start - self._origin) * 1000, 4),
+                "duration_ms": round((end - start) * 1000, 4),
+                "depth": depth,
+            }
+            if nbytes is not None:
+                event["bytes"] = nbytes
+            event.update(attrs)
+            self.events.append(event)
+
+    def summary(self) -> list[dict]:
+        """
+        Events aggregated per stage name, slowest total first.
+
+        Returns:
+            [{"name", "count", "total_ms", "max_ms", "bytes"}, ...]
+        """
+        return summarize(self.events)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": TRACE_VERSION,
+            "started": self.started,
+            "python": platform.python_version(),
+            "system": platform.system(),
+            "events": sorted(self.events, key=lambda e: e["start_ms"]),
+        }
+
+    def save(self, path: str | Path) -> Path:
+        """Write the trace as JSON and return the path."""
+        path = Path(path)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+
+_active: Trace | None = None
+
+
+def enable() -> Trace:
+    """Start tracing (keeps the current trace if already enabled)."""
+    global _active
+    if _active is None:
+        _active = Trace()
+    return _active
+
+
+def disable() -> Trace | None:
+    """Stop tracing and return the collected trace, if any."""
+    global _active
+    trace, _active = _active, None
+    return trace
+
+
+def active() -> Trace | None:
+    """The active Trace, or None when tracing is disabled."""
+    return _active
+
+
+def stage(name: str, f=None, nbytes: int | None = None, **attrs):
+    """
+    Context manager timing one stage on the active trace (no-op if disabled).
+
+    ``with stage(...) as event`` gives the dict described in Trace.stage, or
+    None when tracing is disabled.
+
+    Args:
+        name: Dotted stage name
+        f: Stream being parsed; bytes consumed from it are recorded
+        nbytes: Byte count to record instead
+        **attrs: Extra JSON-serializable fields
+    """
+    trace = _active
+    if trace is None:
+        return _NULL
+    return trace.stage(name, f, nbytes, **attrs)
+
+
+def summarize(events: list[dict]) -> list[dict]:
+    """Aggregate trace events per stage name, slowest total first."""
+    rows: dict[str, dict] = {}
+    for event in events:
+        row = rows.setdefault(
+            event["name"],
+            {"name": event["name"], "count": 0, "total_ms": 0.0, "max_ms": 0.0},
+        )
+        row["count"] += 1
+        row["total_ms"] += event["duration_ms"]
+        row["max_ms"] = max(row["max_ms"], event["duration_ms"])
+        if "bytes" in event:
+            row["bytes"] = row.get("bytes", 0) + event["bytes"]
+    return sorted(rows.values(), key=lambda r: r["total_ms"], reverse=True)
+
+
+def format_summary(events: list[dict], limit: int | None = None) -> str:
+    """Plain-text table of summarize(events), for the CLI and diagnostics."""
+    rows = summarize(events)[:limit]
+    lines = [f"{'stage':28} {'count':>6} {'total ms':>10} {'max ms':>9} {'bytes':>12}"]
+    for row in rows:
+        nbytes = row.get("bytes")
+        lines.append(
+            f"{row['name']:28} {row['count']:6d} {row['total_ms']:10.2f} "
+            f"{row['max_ms']:9.2f} {nbytes if nbytes is not None else '':>12}"
+        )
+    return "\n".join(lines)
+
+
+def load(path: str | Path) -> dict:
+    """
+    Read a JSON trace written by Trace.save().
+
+    Raises:
+        ValueError: If the file is not a trace
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or "events" not in data:
+        raise ValueError(f"Not an event trace: {path}")
+    return data
+
+
+def _enable_from_env() -> None:
+    value = os.environ.get(ENV_VAR, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return
+    trace = enable()
+    if value.lower() not in ("1", "true", "yes", "on"):
+        atexit.register(trace.save, value)
+
+
+_enable_from_env()
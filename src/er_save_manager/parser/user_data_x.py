@@ -8,9 +8,11 @@ Based on ER-Save-Lib Rust implementation - exact field order.
 from __future__ import annotations
 
 import struct
+from array import array
 from dataclasses import dataclass, field
 from io import BytesIO
 
+from .buffer_reader import BufferReader, read_view
 from .character import PlayerGameData, SPEffect
 from .equipment import (
     AcquiredProjectiles,
@@ -26,7 +28,10 @@ from .equipment import (
     Inventory,
     TrophyEquipData,
 )
-from .er_types import Gaitem, MapId
+from .er_types import MapId
+from .gaitem_map import GaitemMap
+from .section_table import SectionOffset, SectionTable
+from .trace import stage as trace_stage
 from .world import (
     DLC,
     BaseVersion,
@@ -62,27 +67,43 @@ class UserDataX:
 
     # Metadata (not from file, tracking info)
     data_start: int = 0
-    horse_offset: int = 0
-    coordinates_offset: int = 0
-    event_flags_offset: int = 0
-    player_game_data_offset: int = 0
-    net_man_offset: int = 0
-    weather_offset: int = 0
-    gestures_offset: int = 0
-    time_offset: int = 0
-    steamid_offset: int = 0
-    dlc_offset: int = 0
-    inventory_held_offset: int = 0
-    inventory_storage_offset: int = 0
-    blood_stain_offset: int = 0
-    equipped_items_equip_index_offset: int = 0
-    active_weapon_slots_and_arm_style_offset: int = 0
-    equipped_items_item_id_offset: int = 0
-    equipped_items_gaitem_handle_offset: int = 0
-    equipped_spells_offset: int = 0
-    equipped_items_offset: int = 0
-    equipped_armaments_and_items_offset: int = 0
-    equipped_physics_offset: int = 0
+    # Start of every section, relative to data_start (see section_table.py)
+    sections: SectionTable = field(default_factory=SectionTable)
+
+    # Tracked section offsets, read and written through `sections`. File
+    # offsets (absolute) or relative to data_start, as they always were.
+    horse_offset = SectionOffset("horse", absolute=True)
+    coordinates_offset = SectionOffset("player_coordinates", absolute=True)
+    event_flags_offset = SectionOffset("event_flags", absolute=True)
+    player_game_data_offset = SectionOffset("player_game_data", absolute=True)
+    net_man_offset = SectionOffset("net_man", absolute=True)
+    weather_offset = SectionOffset("world_area_weather", absolute=True)
+    gestures_offset = SectionOffset("gestures", absolute=True)
+    time_offset = SectionOffset("world_area_time", absolute=True)
+    steamid_offset = SectionOffset("steam_id", absolute=True)
+    dlc_offset = SectionOffset("dlc", absolute=True)
+    blood_stain_offset = SectionOffset("blood_stain", absolute=True)
+    inventory_held_offset = SectionOffset("inventory_held", absolute=False)
+    inventory_storage_offset = SectionOffset("inventory_storage_box", absolute=False)
+    equipped_items_equip_index_offset = SectionOffset(
+        "equipped_items_equip_index", absolute=False
+    )
+    active_weapon_slots_and_arm_style_offset = SectionOffset(
+        "active_weapon_slots_and_arm_style", absolute=False
+    )
+    equipped_items_item_id_offset = SectionOffset(
+        "equipped_items_item_id", absolute=False
+    )
+    equipped_items_gaitem_handle_offset = SectionOffset(
+        "equipped_items_gaitem_handle", absolute=False
+    )
+    equipped_spells_offset = SectionOffset("equipped_spells", absolute=False)
+    equipped_items_offset = SectionOffset("equipped_items", absolute=False)
+    equipped_armaments_and_items_offset = SectionOffset(
+        "equipped_armaments_and_items", absolute=False
+    )
+    equipped_physics_offset = SectionOffset("equipped_physics", absolute=False)
+
     # Header (4 + 4 + 8 + 16 = 32 bytes)
     version: int = 0
     map_id: MapId = field(default_factory=MapId)
@@ -90,8 +111,8 @@ class UserDataX:
     unk0x10: bytes = field(default_factory=lambda: b"\x00" * 16)
 
     # Gaitem map (VARIABLE LENGTH! 5118 or 5120 entries)
-    gaitem_map: list[Gaitem] = field(default_factory=list)
-    gaitem_offsets: list[int] = field(default_factory=list)
+    gaitem_map: GaitemMap = field(default_factory=GaitemMap)
+    gaitem_offsets: array = field(default_factory=lambda: array("I"))
 
     # Player data (0x1B0 = 432 bytes)
     player_game_data: PlayerGameData = field(default_factory=PlayerGameData)
@@ -280,7 +301,9 @@ class UserDataX:
         version differences and unknown structures added in game updates.
 
         Args:
-            f: BytesIO stream positioned at start of character slot data
+            f: BytesIO or BufferReader positioned at start of character slot data.
+               With a zero-copy BufferReader, event_flags, net_man.data and
+               rest are read-only memoryviews into the save buffer.
             is_ps: True if PlayStation format (no checksum)
             slot_start_offset: Absolute file offset where slot data starts (after checksum)
             slot_size: Total size of slot data (0x280000 = 2,621,440 bytes)
@@ -291,8 +314,13 @@ class UserDataX:
         obj = cls()
         obj.data_start = slot_start_offset
         data_start = f.tell()  # Read start, for offsets tracked below
+        sections = obj.sections
+
+        def mark(name: str) -> None:
+            sections.mark(name, f.tell() - data_start)
 
         # Read version (4 bytes)
+        mark("version")
         obj.version = struct.unpack("<I", f.read(4))[0]
 
         # Empty slot check
@@ -305,133 +333,161 @@ class UserDataX:
             return obj
 
         # Read map_id and header (4 + 8 + 16 = 28 bytes)
+        mark("map_id")
         obj.map_id = MapId.read(f)
         obj.unk0x8 = f.read(8)
         obj.unk0x10 = f.read(16)
 
         # Read Gaitem map (VARIABLE LENGTH!)
-        gaitem_count = 0x13FE if obj.version <= 81 else 0x1400  # 5118 or 5120
-        obj.gaitem_map = []
-        obj.gaitem_offsets = []  # absolute offset of each gaitem entry relative to slot data start
-        for _ in range(gaitem_count):
-            obj.gaitem_offsets.append(f.tell() - data_start)
-            obj.gaitem_map.append(Gaitem.read(f))
+        with trace_stage("slot.gaitem_map", f):
+            gaitem_count = 0x13FE if obj.version <= 81 else 0x1400  # 5118 or 5120
+            mark("gaitem_map")
+            obj.gaitem_map = GaitemMap.read(f, gaitem_count, data_start)
+            # offset of each gaitem entry relative to slot data start (shared array)
+            obj.gaitem_offsets = obj.gaitem_map.offsets
 
         # Read player game data (432 bytes)
-        obj.player_game_data_offset = f.tell()
+        mark("player_game_data")
         obj.player_game_data = PlayerGameData.read(f)
 
         # Read SP effects (13 entries)
+        mark("sp_effects")
         obj.sp_effects = [SPEffect.read(f) for _ in range(13)]
 
         # Read equipment structures
-        obj.equipped_items_equip_index_offset = f.tell() - data_start
+        mark("equipped_items_equip_index")
         obj.equipped_items_equip_index = EquippedItemsEquipIndex.read(f)
-        obj.active_weapon_slots_and_arm_style_offset = f.tell() - data_start
+        mark("active_weapon_slots_and_arm_style")
         obj.active_weapon_slots_and_arm_style = ActiveWeaponSlotsAndArmStyle.read(f)
-        obj.equipped_items_item_id_offset = f.tell() - data_start
+        mark("equipped_items_item_id")
         obj.equipped_items_item_id = EquippedItemsItemIds.read(f)
-        obj.equipped_items_gaitem_handle_offset = f.tell() - data_start
+        mark("equipped_items_gaitem_handle")
         obj.equipped_items_gaitem_handle = EquippedItemsGaitemHandles.read(f)
 
         # Read inventory held
         held_common_cap = 0xA80  # 2,688 common items
         held_key_cap = 0x180  # 384 key items
-        obj.inventory_held_offset = f.tell() - data_start
-        obj.inventory_held = Inventory.read(f, held_common_cap, held_key_cap)
+        with trace_stage("slot.inventory_held", f):
+            mark("inventory_held")
+            obj.inventory_held = Inventory.read(f, held_common_cap, held_key_cap)
 
         # Read more equipment
-        obj.equipped_spells_offset = f.tell() - data_start
+        mark("equipped_spells")
         obj.equipped_spells = EquippedSpells.read(f)
-        obj.equipped_items_offset = f.tell() - data_start
+        mark("equipped_items")
         obj.equipped_items = EquippedItems.read(f)
+        mark("equipped_gestures")
         obj.equipped_gestures = EquippedGestures.read(f)
+        mark("acquired_projectiles")
         obj.acquired_projectiles = AcquiredProjectiles.read(f)
-        obj.equipped_armaments_and_items_offset = f.tell() - data_start
+        mark("equipped_armaments_and_items")
         obj.equipped_armaments_and_items = EquippedArmamentsAndItems.read(f)
-        obj.equipped_physics_offset = f.tell() - data_start
+        mark("equipped_physics")
         obj.equipped_physics = EquippedPhysics.read(f)
 
         # Read face data (303 bytes)
+        mark("face_data")
         obj.face_data = FaceData.read(f, in_profile_summary=False)
 
         # Read inventory storage
-        obj.inventory_storage_offset = f.tell() - data_start
-        obj.inventory_storage_box = Inventory.read(f, 0x780, 0x80)
+        with trace_stage("slot.inventory_storage", f):
+            mark("inventory_storage_box")
+            obj.inventory_storage_box = Inventory.read(f, 0x780, 0x80)
 
         # Parse remaining structures
-        obj.gestures_offset = f.tell()
-        obj.gestures = Gestures.read(f)
-        obj.unlocked_regions = Regions.read(f)
-        obj.horse_offset = f.tell()
-        obj.horse = RideGameData.read(f)
-        obj.control_byte_maybe = struct.unpack("<B", f.read(1))[0]
-        obj.blood_stain_offset = f.tell()
-        obj.blood_stain = BloodStain.read(f)
-        obj.unk_gamedataman_0x120_or_gamedataman_0x130 = struct.unpack("<I", f.read(4))[
-            0
-        ]
-        obj.unk_gamedataman_0x88 = struct.unpack("<I", f.read(4))[0]
+        with trace_stage("slot.game_data", f):
+            mark("gestures")
+            obj.gestures = Gestures.read(f)
+            mark("unlocked_regions")
+            obj.unlocked_regions = Regions.read(f)
+            mark("horse")
+            obj.horse = RideGameData.read(f)
+            mark("control_byte_maybe")
+            obj.control_byte_maybe = struct.unpack("<B", f.read(1))[0]
+            mark("blood_stain")
+            obj.blood_stain = BloodStain.read(f)
+            mark("gamedataman_fields")
+            obj.unk_gamedataman_0x120_or_gamedataman_0x130 = struct.unpack(
+                "<I", f.read(4)
+            )[0]
+            obj.unk_gamedataman_0x88 = struct.unpack("<I", f.read(4))[0]
 
-        try:
-            obj.menu_profile_save_load = MenuSaveLoad.read(f)
-            obj.trophy_equip_data = TrophyEquipData.read(f)
-            obj.gaitem_game_data = GaitemGameData.read(f)
-            obj.tutorial_data = TutorialData.read(f)
-        except Exception:
-            raise
-
-        obj.gameman_0x8c = struct.unpack("<B", f.read(1))[0]
-        obj.gameman_0x8d = struct.unpack("<B", f.read(1))[0]
-        obj.gameman_0x8e = struct.unpack("<B", f.read(1))[0]
-
-        obj.total_deaths_count = struct.unpack("<I", f.read(4))[0]
-        obj.character_type = struct.unpack("<i", f.read(4))[0]
-        obj.in_online_session_flag = struct.unpack("<B", f.read(1))[0]
-        obj.character_type_online = struct.unpack("<I", f.read(4))[0]
-        obj.last_rested_grace = struct.unpack("<I", f.read(4))[0]
-        obj.not_alone_flag = struct.unpack("<B", f.read(1))[0]
-        obj.in_game_countdown_timer = struct.unpack("<I", f.read(4))[0]
-        obj.unk_gamedataman_0x124_or_gamedataman_0x134 = struct.unpack("<I", f.read(4))[
-            0
-        ]
-
-        obj.event_flags_offset = f.tell()
-        obj.event_flags = f.read(0x1BF99F)
-        obj.event_flags_terminator = struct.unpack("<B", f.read(1))[0]
-        # There are 16 more bytes after the terminator
-
-        obj.field_area = FieldArea.read(f)
-        obj.world_area = WorldArea.read(f)
-        obj.world_geom_man = WorldGeomMan.read(f)
-        obj.world_geom_man2 = WorldGeomMan.read(f)
-        obj.rend_man = RendMan.read(f)
-        obj.coordinates_offset = f.tell()
-        obj.player_coordinates = PlayerCoordinates.read(f)
-        obj.game_man_0x5be, obj.game_man_0x5bf = f.read(2)
-        obj.spawn_point_entity_id = struct.unpack("<I", f.read(4))[0]
-        # 4 bytes padding
-        obj.game_man_0xb64 = struct.unpack("<I", f.read(4))[0]
-
-        if obj.version >= 65:
-            obj.temp_spawn_point_entity_id = struct.unpack("<I", f.read(4))[0]
-        if obj.version >= 66:
-            obj.game_man_0xcb3 = struct.unpack("<B", f.read(1))[0]
-
-        obj.net_man_offset = f.tell()
-        obj.net_man = NetMan.read(f)
-
-        obj.weather_offset = f.tell()
-        obj.world_area_weather = WorldAreaWeather.read(f)
-        obj.time_offset = f.tell()
-        obj.world_area_time = WorldAreaTime.read(f)
-        obj.base_version = BaseVersion.read(f)
-        obj.steamid_offset = f.tell()
-        obj.steam_id = struct.unpack("<Q", f.read(8))[0]
-        obj.ps5_activity = PS5Activity.read(f)
-        obj.dlc_offset = f.tell()
-        obj.dlc = DLC.read(f)
-        obj.player_data_hash = PlayerGameDataHash.read(f)
+            try:
+                mark("menu_profile_save_load")
+                obj.menu_profile_save_load = MenuSaveLoad.read(f)
+                mark("trophy_equip_data")
+                obj.trophy_equip_data = TrophyEquipData.read(f)
+                mark("gaitem_game_data")
+                obj.gaitem_game_data = GaitemGameData.read(f)
+                mark("tutorial_data")
+                obj.tutorial_data = TutorialData.read(f)
+            except Exception:
+                raise
+
+            mark("gameman_fields")
+            obj.gameman_0x8c = struct.unpack("<B", f.read(1))[0]
+            obj.gameman_0x8d = struct.unpack("<B", f.read(1))[0]
+            obj.gameman_0x8e = struct.unpack("<B", f.read(1))[0]
+
+            obj.total_deaths_count = struct.unpack("<I", f.read(4))[0]
+            obj.character_type = struct.unpack("<i", f.read(4))[0]
+            obj.in_online_session_flag = struct.unpack("<B", f.read(1))[0]
+            obj.character_type_online = struct.unpack("<I", f.read(4))[0]
+            obj.last_rested_grace = struct.unpack("<I", f.read(4))[0]
+            obj.not_alone_flag = struct.unpack("<B", f.read(1))[0]
+            obj.in_game_countdown_timer = struct.unpack("<I", f.read(4))[0]
+            obj.unk_gamedataman_0x124_or_gamedataman_0x134 = struct.unpack(
+                "<I", f.read(4)
+            )[0]
+
+        with trace_stage("slot.event_flags", f):
+            mark("event_flags")
+            obj.event_flags = read_view(f, 0x1BF99F)
+            mark("event_flags_terminator")
+            obj.event_flags_terminator = struct.unpack("<B", f.read(1))[0]
+            # There are 16 more bytes after the terminator
+
+        with trace_stage("slot.world", f):
+            mark("field_area")
+            obj.field_area = FieldArea.read(f)
+            mark("world_area")
+            obj.world_area = WorldArea.read(f)
+            mark("world_geom_man")
+            obj.world_geom_man = WorldGeomMan.read(f)
+            mark("world_geom_man2")
+            obj.world_geom_man2 = WorldGeomMan.read(f)
+            mark("rend_man")
+            obj.rend_man = RendMan.read(f)
+            mark("player_coordinates")
+            obj.player_coordinates = PlayerCoordinates.read(f)
+            mark("game_man_fields")
+            obj.game_man_0x5be, obj.game_man_0x5bf = f.read(2)
+            obj.spawn_point_entity_id = struct.unpack("<I", f.read(4))[0]
+            # 4 bytes padding
+            obj.game_man_0xb64 = struct.unpack("<I", f.read(4))[0]
+
+            if obj.version >= 65:
+                obj.temp_spawn_point_entity_id = struct.unpack("<I", f.read(4))[0]
+            if obj.version >= 66:
+                obj.game_man_0xcb3 = struct.unpack("<B", f.read(1))[0]
+
+            mark("net_man")
+            obj.net_man = NetMan.read(f)
+
+            mark("world_area_weather")
+            obj.world_area_weather = WorldAreaWeather.read(f)
+            mark("world_area_time")
+            obj.world_area_time = WorldAreaTime.read(f)
+            mark("base_version")
+            obj.base_version = BaseVersion.read(f)
+            mark("steam_id")
+            obj.steam_id = struct.unpack("<Q", f.read(8))[0]
+            mark("ps5_activity")
+            obj.ps5_activity = PS5Activity.read(f)
+            mark("dlc")
+            obj.dlc = DLC.read(f)
+            mark("player_data_hash")
+            obj.player_data_hash = PlayerGameDataHash.read(f)
 
         # Always seek to exact slot boundary, then read rest
         slot_end_position = data_start + slot_size
@@ -443,7 +499,8 @@ class UserDataX:
         elif current_position < slot_end_position:
             # read them as rest
             remaining = slot_end_position - current_position
-            obj.rest = f.read(remaining)
+            mark("rest")
+            obj.rest = read_view(f, remaining)
 
         return obj
 
@@ -693,3 +750,132 @@ class UserDataX:
 
         has_corruption = len(issues) > 0
         return (has_corruption, issues)
+
+
+# Attributes a LazyUserDataX answers without parsing the full slot
+_LAZY_EAGER_ATTRS = frozenset(
+    {
+        "__class__",
+        "__dict__",
+        "_save",
+        "_slot_index",
+        "_is_ps",
+        "_zero_copy",
+        "_profile",
+        "materialize",
+        "data_start",
+        "version",
+        "map_id",
+        "is_empty",
+        "get_character_name",
+        "get_level",
+        "get_slot_map_id",
+    }
+)
+
+
+class LazyUserDataX(UserDataX):
+    """
+    Character slot that defers the full parse until it is needed.
+
+    Only the version, map_id and ProfileSummary-backed name/level are
+    available up front. The first access to any other attribute parses the
+    slot from the owning Save's _raw_data and turns this object into a plain
+    UserDataX in place, so callers never see the difference.
+
+    Created by Save.from_file(..., lazy=True).
+    """
+
+    def __init__(
+        self,
+        save,
+        slot_index: int,
+        data_start: int,
+        is_ps: bool,
+        zero_copy: bool = False,
+    ):
+        """
+        Args:
+            save: Owning Save; its _raw_data is parsed on materialization
+            slot_index: Slot index (0-9), used for the ProfileSummary lookup
+            data_start: Absolute offset of slot data (after checksum)
+            is_ps: True if PlayStation format
+            zero_copy: Parse with a zero-copy BufferReader
+        """
+        object.__setattr__(self, "_save", save)
+        object.__setattr__(self, "_slot_index", slot_index)
+        object.__setattr__(self, "_is_ps", is_ps)
+        object.__setattr__(self, "_zero_copy", zero_copy)
+        object.__setattr__(self, "data_start", data_start)
+
+        raw = save._raw_data
+        version = struct.unpack_from("<I", raw, data_start)[0]
+        object.__setattr__(self, "version", version)
+        if version != 0:
+            map_id = MapId(bytes(raw[data_start + 4 : data_start + 8]))
+            object.__setattr__(self, "map_id", map_id)
+
+    def __getattribute__(self, name: str):
+        if name not in _LAZY_EAGER_ATTRS:
+            object.__getattribute__(self, "materialize")()
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name: str, value) -> None:
+        self.materialize()
+        object.__setattr__(self, name, value)
+
+    def materialize(self) -> UserDataX:
+        """
+        Parse the full slot and become a regular UserDataX.
+
+        Returns:
+            self, now an instance of UserDataX
+        """
+        if type(self) is not LazyUserDataX:
+            return self
+
+        get = object.__getattribute__
+        save = get(self, "_save")
+        data_start = get(self, "data_start")
+        # Parse from the current bytes of this slot only (absolute offsets)
+        data = bytes(save._raw_data[data_start : data_start + 0x280000])
+        reader = BufferReader(
+            data, data_start, zero_copy=get(self, "_zero_copy"), offset=data_start
+        )
+        try:
+            with trace_stage("slot", reader, slot=get(self, "_slot_index"), lazy=True):
+                full = UserDataX.read(reader, get(self, "_is_ps"), data_start, 0x280000)
+        except Exception:
+            full = UserDataX()
+        finally:
+            reader.release()
+
+        state = get(self, "__dict__")
+        state.clear()
+        state.update(full.__dict__)
+        object.__setattr__(self, "__class__", UserDataX)
+        return self
+
+    def _profile(self):
+        """ProfileSummary entry for this slot, or None if unavailable."""
+        save = object.__getattribute__(self, "_save")
+        ud10 = getattr(save, "user_data_10_parsed", None)
+        summary = getattr(ud10, "profile_summary", None) if ud10 else None
+        index = object.__getattribute__(self, "_slot_index")
+        if summary is None or index >= len(summary.profiles):
+            return None
+        return summary.profiles[index]
+
+    def get_character_name(self) -> str:
+        """Get character name from ProfileSummary without a full parse"""
+        profile = self._profile()
+        if profile is None:
+            return self.materialize().get_character_name()
+        return profile.character_name
+
+    def get_level(self) -> int:
+        """Get character level from ProfileSummary without a full parse"""
+        profile = self._profile()
+        if profile is None:
+            return self.materialize().get_level()
+        return profile.level
@@ -11,6 +11,7 @@ import struct
 from dataclasses import dataclass, field
 from io import BytesIO
 
+from er_save_manager.parser.buffer_reader import read_view
 from er_save_manager.parser.er_types import (
     FloatVector3,
     FloatVector4,
@@ -803,7 +804,7 @@ class NetMan:
         """Read NetMan from stream (131,076 bytes)"""
         return cls(
             unk0x0=struct.unpack("<I", f.read(4))[0],
-            data=f.read(0x20000),
+            data=read_view(f, 0x20000),
         )
 
     def write(self, f: BytesIO):
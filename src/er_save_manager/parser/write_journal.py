@@ -0,0 +1,267 @@
+"""
+Elden Ring Save Parser - Journaled Writes
+
+Save.to_file(..., journaled=True) writes only the byte extents that changed
+since the file was loaded or last written, instead of the whole ~28 MB:
+
+1. The changed extents are written to a redo journal next to the save
+   (<save>.journal) and fsynced, together with the bytes they replace and
+   the save's size and mtime.
+2. The current save is cloned to a temp file with a reflink (FICLONE).
+3. The extents are patched into the clone, which is fsynced and atomically
+   renamed over the save, exactly like a full write.
+4. The journal is deleted.
+
+This only pays off where the clone shares data blocks (btrfs, XFS,
+bcachefs). can_reflink() probes that once per filesystem; elsewhere (ext4,
+exFAT, NTFS) Save.to_file does a plain full write instead, which costs less
+than copying the file and journaling on top.
+
+A crash before step 3 completes leaves the original save untouched.
+Save.from_file and Save.open_mmap call replay_journal() first, which
+re-applies a leftover journal if the save still is the file it was
+written against (same size and mtime, old bytes still in every extent),
+and discards it otherwise (the write already completed, or the save was
+replaced since).
+
+Journal format (little-endian):
+    magic "ERJ3", file size (u64), file mtime_ns (i64), extent count (u32)
+    per extent: offset (u64), length (u32), old data, new data
+    MD5 of everything above (16 bytes)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import struct
+from pathlib import Path
+
+try:
+    import fcntl
+
+    _FCNTL_AVAILABLE = True
+except ImportError:
+    _FCNTL_AVAILABLE = False
+
+JOURNAL_SUFFIX = ".journal"
+
+_MAGIC = b"ERJ3"
+_HEADER = struct.Struct("<4sQqI")
+_EXTENT = struct.Struct("<QI")
+
+# linux/fs.h: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+# st_dev -> whether FICLONE works on that filesystem
+_reflink_support: dict[int, bool] = {}
+
+
+def journal_path(target: Path) -> Path:
+    """Path of the redo journal for a save file."""
+    return target.with_name(target.name + JOURNAL_SUFFIX)
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    if not _FCNTL_AVAILABLE:
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        return False
+    return True
+
+
+def clone_file(src: Path, dst: Path) -> bool:
+    """
+    Copy src to dst, sharing data blocks when the filesystem allows it.
+
+    Returns:
+        True if dst is a reflink clone, False if the data was copied
+    """
+    if _reflink(src, dst):
+        return True
+    shutil.copyfile(src, dst)
+    return False
+
+
+def can_reflink(target: Path) -> bool:
+    """
+    Whether target can be reflink-cloned, probed once per filesystem.
+
+    Args:
+        target: Existing save file
+    """
+    if not _FCNTL_AVAILABLE:
+        return False
+    try:
+        dev = target.stat().st_dev
+    except OSError:
+        return False
+    supported = _reflink_support.get(dev)
+    if supported is None:
+        probe = target.with_name(f"{target.name}.tmp{os.getpid()}")
+        try:
+            supported = _reflink(target, probe)
+        finally:
+            probe.unlink(missing_ok=True)
+        _reflink_support[dev] = supported
+    return supported
+
+
+def write_journal(
+    path: Path,
+    file_size: int,
+    mtime_ns: int,
+    extents: list[tuple[int, bytes, bytes]],
+) -> None:
+    """
+    Write and fsync a redo journal.
+
+    Args:
+        path: Journal file path
+        file_size: Size of the save the extents apply to
+        mtime_ns: Modification time of that save
+        extents: (offset, old data, new data) triples, old and new of equal
+                 length
+    """
+    body = bytearray(_HEADER.pack(_MAGIC, file_size, mtime_ns, len(extents)))
+    for offset, old, new in extents:
+        body += _EXTENT.pack(offset, len(new))
+        body += old
+        body += new
+    body += hashlib.md5(body).digest()
+    with open(path, "wb") as f:
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_journal(
+    path: Path,
+) -> tuple[int, int, list[tuple[int, bytes, bytes]]] | None:
+    """
+    Read a redo journal.
+
+    Returns:
+        (file_size, mtime_ns, extents), or None if the journal is missing,
+        torn or not a journal
+    """
+    try:
+        body = Path(path).read_bytes()
+    except OSError:
+        return None
+    if len(body) < _HEADER.size + 16:
+        return None
+    payload, digest = body[:-16], body[-16:]
+    if hashlib.md5(payload).digest() != digest:
+        return None
+    magic, file_size, mtime_ns, count = _HEADER.unpack_from(payload, 0)
+    if magic != _MAGIC:
+        return None
+
+    extents = []
+    pos = _HEADER.size
+    for _ in range(count):
+        offset, length = _EXTENT.unpack_from(payload, pos)
+        pos += _EXTENT.size
+        old = payload[pos : pos + length]
+        new = payload[pos + length : pos + 2 * length]
+        extents.append((offset, old, new))
+        pos += 2 * length
+    return file_size, mtime_ns, extents
+
+
+def apply_extents(target: Path, extents: list[tuple[int, bytes]]) -> None:
+    """
+    Patch extents into a clone of target and atomically replace target.
+
+    Args:
+        target: Existing save file
+        extents: (offset, data) pairs, all within the current file size
+    """
+    tmp_path = target.with_name(f"{target.name}.tmp{os.getpid()}")
+    try:
+        clone_file(target, tmp_path)
+        with open(tmp_path, "r+b") as f:
+            for offset, data in extents:
+                f.seek(offset)
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_extents(target: Path, extents) -> list[bytes]:
+    with open(target, "rb") as f:
+        chunks = []
+        for offset, data, *_ in extents:
+            f.seek(offset)
+            chunks.append(f.read(len(data)))
+    return chunks
+
+
+def journaled_write(target: Path, extents: list[tuple[int, bytes]]) -> None:
+    """
+    Journal extents, apply them to target atomically, then drop the journal.
+
+    Args:
+        target: Existing save file
+        extents: (offset, data) pairs, all within the current file size
+    """
+    journal = journal_path(target)
+    stat = target.stat()
+    old = _read_extents(target, extents)
+    write_journal(
+        journal,
+        stat.st_size,
+        stat.st_mtime_ns,
+        [
+            (offset, before, data)
+            for (offset, data), before in zip(extents, old, strict=True)
+        ],
+    )
+    apply_extents(target, extents)
+    journal.unlink(missing_ok=True)
+
+
+def replay_journal(target: str | Path) -> bool:
+    """
+    Re-apply a journal left behind by an interrupted journaled write.
+
+    The journal is only applied while the save is still the file it was
+    written against: same size and mtime, and the old bytes still in
+    every extent. Otherwise the interrupted write already replaced the
+    save, or the save changed since, and the journal is discarded, as are
+    torn or invalid journals.
+
+    Args:
+        target: Save file path
+
+    Returns:
+        True if a journal was applied
+    """
+    target = Path(target)
+    journal = journal_path(target)
+    if not journal.exists():
+        return False
+
+    entry = read_journal(journal)
+    applied = False
+    if entry is not None and target.exists():
+        file_size, mtime_ns, extents = entry
+        stat = target.stat()
+        if (
+            stat.st_size == file_size
+            and stat.st_mtime_ns == mtime_ns
+            and _read_extents(target, extents) == [old for _, old, _ in extents]
+        ):
+            apply_extents(target, [(offset, new) for offset, _, new in extents])
+            applied = True
+    journal.unlink(missing_ok=True)
+    return applied
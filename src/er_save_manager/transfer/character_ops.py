@@ -701,9 +701,8 @@ class CharacterOperations:
         slot_char = save.character_slots[slot_index]
         if not slot_char.is_empty() and hasattr(slot_char, "steamid_offset"):
             # steamid_offset is an absolute file offset from f.tell() at parse time
-            struct.pack_into(
-                "<Q", save._raw_data, slot_char.steamid_offset, target_steamid
-            )
+            offset = slot_char.steamid_offset
+            save._raw_data[offset : offset + 8] = struct.pack("<Q", target_steamid)
 
     @staticmethod
     def _reparse_user_data_10(save: Save) -> None:
@@ -1135,14 +1134,14 @@ class CharacterOperations:
                 return 0
 
             # Count all flags in "Bosses" category that are set
-            boss_count = 0
-            for flag_id, flag_data in EVENT_FLAGS.items():
-                if flag_data.get("category") == "Bosses" and EventFlags.get_flag(
-                    event_flags, flag_id
-                ):
-                    boss_count += 1
-
-            return boss_count
+            return EventFlags.count_set(
+                event_flags,
+                (
+                    flag_id
+                    for flag_id, flag_data in EVENT_FLAGS.items()
+                    if flag_data.get("category") == "Bosses"
+                ),
+            )
         except Exception:
             return 0
 
@@ -1158,14 +1157,14 @@ class CharacterOperations:
                 return 0
 
             # Count all flags in "Grace" category that are set
-            grace_count = 0
-            for flag_id, flag_data in EVENT_FLAGS.items():
-                if flag_data.get("category") == "Grace" and EventFlags.get_flag(
-                    event_flags, flag_id
-                ):
-                    grace_count += 1
-
-            return grace_count
+            return EventFlags.count_set(
+                event_flags,
+                (
+                    flag_id
+                    for flag_id, flag_data in EVENT_FLAGS.items()
+                    if flag_data.get("category") == "Grace"
+                ),
+            )
         except Exception:
             return 0
 
@@ -364,7 +364,7 @@ class CharacterInfoEditor:
             save_path = self.get_save_path()
             if save_path:
                 manager = BackupManager(Path(save_path))
-                manager.create_backup(
+                manager.checkpoint(
                     description=f"before_edit_character_info_slot_{slot_idx + 1}",
                     operation=f"edit_character_info_slot_{slot_idx + 1}",
                     save=save_file,
@@ -1611,7 +1611,7 @@ class EquipmentEditor:
             if save_path:
                 from er_save_manager.backup.manager import BackupManager
 
-                BackupManager(Path(save_path)).create_backup(
+                BackupManager(Path(save_path)).checkpoint(
                     description=f"before_edit_equipment_slot_{slot_idx + 1}",
                     operation=f"edit_equipment_slot_{slot_idx + 1}",
                     save=save_file,
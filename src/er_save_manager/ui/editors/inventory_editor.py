@@ -1115,6 +1115,7 @@ class InventoryEditor:
         self.inventory_listbox = tk.Listbox(
             lb_frame,
             yscrollcommand=sb.set,
+            selectmode=tk.EXTENDED,
             font=("Consolas", 10),
             bg=lb_bg,
             fg=lb_fg,
@@ -1846,15 +1847,9 @@ class InventoryEditor:
             return location
 
     def _max_qty_for_location(self, item, location: str) -> int:
-        max_arrow = getattr(item, "max_arrow_quantity", 1)
-        if location == "storage":
-            repo = getattr(item, "max_repository_num", 0)
-            if repo > 0:
-                return repo
-            return max_arrow if max_arrow > 1 else getattr(item, "max_num", 1)
-        if max_arrow > 1:
-            return max_arrow
-        return getattr(item, "max_num", 1)
+        from er_save_manager.data.item_table import max_quantity
+
+        return max_quantity(item, location)
 
     def _validate_add_item(
         self,
@@ -1865,41 +1860,29 @@ class InventoryEditor:
         slot,
     ) -> tuple[bool, str]:
         """Pre-flight validation before calling inventory_ops.add_item."""
-        from er_save_manager.data.item_database import get_item_database
+        from er_save_manager.data.item_table import item_traits
 
-        cat = full_id & 0xF0000000
-        db = get_item_database()
+        sf = self.get_save_file()
+        is_cnv = (
+            sf.is_convergence
+            if sf
+            else (".cnv" in str(self.get_save_path() or "").lower())
+        )
+        traits = item_traits(full_id, is_cnv)
 
         # Upgrade range - CNV saves cap standard/somber at +15
-        if cat == 0x00000000:
-            item = db.get_item_by_id(full_id & 0xFFFF0000)
-            reinforcement = (
-                getattr(item, "reinforcement", "standard") if item else "standard"
-            )
-            sf = self.get_save_file()
-            is_cnv = (
-                sf.is_convergence
-                if sf
-                else (".cnv" in str(self.get_save_path() or "").lower())
-            )
-            if is_cnv and reinforcement in ("standard", "somber"):
-                cap = 15
-            else:
-                cap = {"standard": 25, "somber": 10, "ash": 10, "none": 0}.get(
-                    reinforcement, 25
-                )
+        if traits.category == 0x00000000:
+            cap = traits.upgrade_cap(is_cnv)
             if upgrade < 0 or upgrade > cap:
                 return False, f"Upgrade must be 0-{cap} for this weapon."
 
         # Quantity range
-        item_for_qty = db.get_item_by_id(full_id)
-        if item_for_qty is not None:
-            max_qty = self._max_qty_for_location(item_for_qty, location)
-            if qty < 1 or qty > max_qty:
-                return (
-                    False,
-                    f"Quantity must be 1-{max_qty} for this item in {location}.",
-                )
+        max_qty = traits.max_stack(location)
+        if max_qty and (qty < 1 or qty > max_qty):
+            return (
+                False,
+                f"Quantity must be 1-{max_qty} for this item in {location}.",
+            )
 
         return True, ""
 
@@ -1973,7 +1956,16 @@ class InventoryEditor:
             "base_name": self.selected_item.name,
         }
 
-    def _process_single_add(self, save_file, slot_idx, slot, item_info: dict) -> dict:
+    def _process_single_add(
+        self, save_file, slot_idx, slot, item_info: dict, pending: list | None = None
+    ) -> dict:
+        """
+        Add (or stack onto) one item.
+
+        When pending is given, a new item is validated and queued there as
+        (add_items spec, item_info) instead of being added; the caller adds
+        the queue with one add_items call and then runs _finish_add.
+        """
         full_id = item_info["full_id"]
         qty = item_info["qty"]
         upg = item_info["upg"]
@@ -2023,28 +2015,36 @@ class InventoryEditor:
         if not ok:
             raise ValueError(err)
 
-        res = add_item(
-            save_file,
-            slot_idx,
-            full_id,
-            qty,
-            location,
-            upgrade=upg,
-            gem_full_id=item_info.get("aow_id", 0),
-            reinforcement=item_info.get("reinforcement", "standard"),
-            convergence=item_info.get("convergence", False),
-        )
+        spec = {
+            "full_item_id": full_id,
+            "quantity": qty,
+            "location": location,
+            "upgrade": upg,
+            "gem_full_id": item_info.get("aow_id", 0),
+            "reinforcement": item_info.get("reinforcement", "standard"),
+            "convergence": item_info.get("convergence", False),
+        }
+        if pending is not None:
+            pending.append((spec, item_info))
+            return {"stacked": False, "qty": qty, "location": location}
+
+        res = add_item(save_file, slot_idx, **spec)
+        self._finish_add(save_file, slot_idx, item_info)
+
+        return {"stacked": False, "qty": res["quantity"], "location": res["location"]}
+
+    def _finish_add(self, save_file, slot_idx, item_info: dict) -> None:
+        """Event flags and matchmaking level that follow adding an item."""
+        full_id = item_info["full_id"]
         _apply_item_event_flags(save_file, slot_idx, full_id, True)
         _bump_matchmaking_level(
             save_file,
             slot_idx,
             full_id,
-            upg,
+            item_info.get("upg", 0),
             item_info.get("reinforcement", "standard"),
         )
 
-        return {"stacked": False, "qty": res["quantity"], "location": res["location"]}
-
     def add_to_loadout(self):
         if not self.selected_item:
             CTkMessageBox.showwarning(
@@ -2195,64 +2195,123 @@ class InventoryEditor:
         except Exception:
             return
 
+        target_upg = 0
         try:
-            self.ensure_mutable()
-            self._create_backup(save_file, slot_idx, "batch_add_category")
+            target_upg = int(self.inv_upgrade_var.get())
+        except ValueError:
+            pass
 
-            target_upg = 0
-            try:
-                target_upg = int(self.inv_upgrade_var.get())
-            except ValueError:
-                pass
+        target_qty = 1
+        try:
+            target_qty = max(1, int(self.inv_quantity_var.get()))
+        except ValueError:
+            pass
 
-            target_qty = 1
-            try:
-                target_qty = max(1, int(self.inv_quantity_var.get()))
-            except ValueError:
-                pass
+        is_cnv = self._is_cnv_save()
+        # Adds are applied together at the end, so held stays as full as it
+        # is now for the whole batch
+        location = self._resolve_add_location(
+            save_file, slot_idx, self.inv_location_var.get()
+        )
+        item_infos = []
+        for item in items:
+            max_qty = self._max_qty_for_location(item, location)
+            item_qty = max(1, min(target_qty, max_qty))
+            item_upg = 0
+            if target_upg > 0 and (
+                item.category == 0x00000000
+                or "Ashes" in getattr(item, "category_name", "")
+            ):
+                reinforcement = getattr(item, "reinforcement", "standard")
+                cap = 25 if reinforcement == "standard" else 10
+                if is_cnv and reinforcement in ("standard", "somber"):
+                    cap = 15
+                explicit_cap = getattr(item, "max_upgrade", -1)
+                if explicit_cap >= 0:
+                    cap = explicit_cap
+                item_upg = min(target_upg, cap)
+
+            item_info = {
+                "full_id": item.full_id,
+                "qty": item_qty,
+                "upg": item_upg,
+                "location": location,
+                "aow_id": 0,
+                "is_ashes": "Ashes" in getattr(item, "category_name", ""),
+                "reinforcement": getattr(item, "reinforcement", "standard"),
+                "convergence": is_cnv,
+                "max_qty": max_qty,
+                "name_label": f"{item.name} +{item_upg}" if item_upg else item.name,
+                "base_name": item.name,
+            }
+            item_infos.append(item_info)
+
+        # Reject a batch that cannot place anything before backing up
+        from er_save_manager.parser.inventory_ops import ItemAlreadyPresentError
+        from er_save_manager.parser.inventory_plan import plan_items
+
+        try:
+            plan = plan_items(
+                save_file,
+                slot_idx,
+                [
+                    {
+                        "full_item_id": info["full_id"],
+                        "quantity": info["qty"],
+                        "location": info["location"],
+                        "upgrade": info["upg"],
+                        "reinforcement": info["reinforcement"],
+                        "convergence": info["convergence"],
+                    }
+                    for info in item_infos
+                ],
+            )
+        except ValueError as e:
+            CTkMessageBox.showerror("Batch Add", str(e), parent=parent_window)
+            return
+        stackable = any(
+            isinstance(item["error"], ItemAlreadyPresentError) and info["max_qty"] > 1
+            for item, info in zip(plan.items, item_infos, strict=True)
+            if "error" in item
+        )
+        if not plan.added and not stackable:
+            reason = plan.rejected[0]["error"] if plan.rejected else "no items"
+            CTkMessageBox.showerror(
+                "Batch Add",
+                f"None of the {len(items)} items from '{cat}' can be added:\n{reason}",
+                parent=parent_window,
+            )
+            return
+
+        try:
+            self.ensure_mutable()
+            self._create_backup(save_file, slot_idx, "batch_add_category")
 
-            is_cnv = self._is_cnv_save()
             success = 0
             errors = []
-            for item in items:
-                location = self._resolve_add_location(
-                    save_file, slot_idx, self.inv_location_var.get()
-                )
-                max_qty = self._max_qty_for_location(item, location)
-                item_qty = max(1, min(target_qty, max_qty))
-                item_upg = 0
-                if target_upg > 0 and (
-                    item.category == 0x00000000
-                    or "Ashes" in getattr(item, "category_name", "")
-                ):
-                    reinforcement = getattr(item, "reinforcement", "standard")
-                    cap = 25 if reinforcement == "standard" else 10
-                    if is_cnv and reinforcement in ("standard", "somber"):
-                        cap = 15
-                    explicit_cap = getattr(item, "max_upgrade", -1)
-                    if explicit_cap >= 0:
-                        cap = explicit_cap
-                    item_upg = min(target_upg, cap)
-
-                item_info = {
-                    "full_id": item.full_id,
-                    "qty": item_qty,
-                    "upg": item_upg,
-                    "location": location,
-                    "aow_id": 0,
-                    "is_ashes": "Ashes" in getattr(item, "category_name", ""),
-                    "reinforcement": getattr(item, "reinforcement", "standard"),
-                    "convergence": is_cnv,
-                    "max_qty": max_qty,
-                    "name_label": f"{item.name} +{item_upg}" if item_upg else item.name,
-                    "base_name": item.name,
-                }
+            pending = []
+            for item_info in item_infos:
                 try:
-                    self._process_single_add(save_file, slot_idx, slot, item_info)
-                    success += 1
+                    res = self._process_single_add(
+                        save_file, slot_idx, slot, item_info, pending
+                    )
+                    if res["stacked"]:
+                        success += 1
+                except ItemAlreadyPresentError:
+                    pass
                 except Exception as e:
-                    if "already in the inventory" not in str(e):
-                        errors.append(f"{item.name}: {e}")
+                    errors.append(f"{item_info['base_name']}: {e}")
+
+            from er_save_manager.parser.inventory_ops import add_items
+
+            results = add_items(save_file, slot_idx, [spec for spec, _ in pending])
+            for (_, item_info), res in zip(pending, results, strict=True):
+                error = res.get("error")
+                if error is None:
+                    self._finish_add(save_file, slot_idx, item_info)
+                    success += 1
+                elif not isinstance(error, ItemAlreadyPresentError):
+                    errors.append(f"{item_info['base_name']}: {error}")
 
             save_file.recalculate_checksums()
             save_path = self.get_save_path()
@@ -2274,24 +2333,24 @@ class InventoryEditor:
             )
 
     def remove_item(self):
-        result = self._get_forced_or_listbox()
-        if result is None:
+        selected = self._get_selected_items()
+        if not selected:
             CTkMessageBox.showwarning(
                 "No Selection", "Select an item to remove.", parent=self.parent
             )
             return
-        full_id, location, gaitem_handle = result
-        item_label = f"0x{full_id:08X}"
-        if self._forced_selection is None and self.inventory_listbox:
-            sel = self.inventory_listbox.curselection()
-            if sel:
-                item_label = self.inventory_listbox.get(sel[0]).strip()
+        if len(selected) == 1:
+            full_id, location, _ = selected[0]
+            item_label = f"0x{full_id:08X}"
+            if self._forced_selection is None and self.inventory_listbox:
+                sel = self.inventory_listbox.curselection()
+                if sel:
+                    item_label = self.inventory_listbox.get(sel[0]).strip()
+            prompt = f"Remove this item from {location}?\n\n{item_label}"
+        else:
+            prompt = f"Remove the {len(selected)} selected items?"
 
-        if not CTkMessageBox.askyesno(
-            "Confirm Remove",
-            f"Remove this item from {location}?\n\n{item_label}",
-            parent=self.parent,
-        ):
+        if not CTkMessageBox.askyesno("Confirm Remove", prompt, parent=self.parent):
             return
 
         save_file = self.get_save_file()
@@ -2301,11 +2360,23 @@ class InventoryEditor:
             self.ensure_mutable()
             self._create_backup(save_file, slot_idx, "remove_item")
 
-            from er_save_manager.parser.inventory_ops import remove_item
+            from er_save_manager.parser.inventory_ops import remove_items
 
-            remove_item(save_file, slot_idx, full_id, location)
+            results = remove_items(
+                save_file,
+                slot_idx,
+                [
+                    {"full_item_id": full_id, "location": location}
+                    for full_id, location, _ in selected
+                ],
+            )
+            removed = [r for r in results if "error" not in r]
+            failed = [r for r in results if "error" in r]
+            if not removed:
+                raise failed[0]["error"]
 
-            _apply_item_event_flags(save_file, slot_idx, full_id, False)
+            for res in removed:
+                _apply_item_event_flags(save_file, slot_idx, res["full_item_id"], False)
 
             save_file.recalculate_checksums()
             save_path = self.get_save_path()
@@ -2315,41 +2386,54 @@ class InventoryEditor:
             self.refresh_inventory()
             if self._on_inventory_changed:
                 self._on_inventory_changed()
-            show_toast(self.parent.winfo_toplevel(), "Item removed.", type="success")
+            if len(selected) == 1:
+                message = "Item removed."
+            else:
+                message = f"Removed {len(removed)} items."
+                if failed:
+                    message += f" {len(failed)} could not be removed."
+            show_toast(self.parent.winfo_toplevel(), message, type="success")
         except Exception as e:
             CTkMessageBox.showerror(
                 "Error", f"Failed to remove item:\n{e}", parent=self.parent
             )
 
     def set_quantity(self):
-        result = self._get_forced_or_listbox()
-        if result is None:
+        selected = self._get_selected_items()
+        if not selected:
             CTkMessageBox.showwarning(
                 "No Selection", "Select an item first.", parent=self.parent
             )
             return
-        full_id, location, gaitem_handle = result
-        cat = full_id & 0xF0000000
 
+        stackable = []
         max_qty = None
-        try:
-            from er_save_manager.data.item_database import get_item_database
+        for full_id, location, _ in selected:
+            cat = full_id & 0xF0000000
+            item_max = None
+            try:
+                from er_save_manager.data.item_database import get_item_database
 
-            db = get_item_database()
-            item = db.get_item_by_id(full_id)
-            if item is None and cat == 0x00000000:
-                item = db.get_item_by_id(full_id & 0xFFFF0000)
-            if item:
-                max_qty = self._max_qty_for_location(item, location)
-        except Exception:
-            pass
+                db = get_item_database()
+                item = db.get_item_by_id(full_id)
+                if item is None and cat == 0x00000000:
+                    item = db.get_item_by_id(full_id & 0xFFFF0000)
+                if item:
+                    item_max = self._max_qty_for_location(item, location)
+            except Exception:
+                pass
 
-        is_weapon = cat == 0x00000000
-        is_armor = cat == 0x10000000
-        is_gem = cat == 0x80000000
-        is_ammo = is_weapon and max_qty is not None and max_qty > 1
+            is_weapon = cat == 0x00000000
+            is_armor = cat == 0x10000000
+            is_gem = cat == 0x80000000
+            is_ammo = is_weapon and item_max is not None and item_max > 1
+            if (is_weapon and not is_ammo) or is_armor or is_gem:
+                continue
+            stackable.append((full_id, location))
+            if item_max is not None:
+                max_qty = item_max if max_qty is None else min(max_qty, item_max)
 
-        if (is_weapon and not is_ammo) or is_armor or is_gem:
+        if not stackable:
             CTkMessageBox.showinfo(
                 "Not Stackable",
                 "Quantity editing does not apply to this item type.",
@@ -2390,9 +2474,20 @@ class InventoryEditor:
         try:
             self.ensure_mutable()
             self._create_backup(save_file, slot_idx, "set_quantity")
-            from er_save_manager.parser.inventory_ops import set_quantity
-
-            set_quantity(save_file, slot_idx, full_id, new_qty, location)
+            from er_save_manager.parser.inventory_ops import set_quantities
+
+            results = set_quantities(
+                save_file,
+                slot_idx,
+                [
+                    {"full_item_id": full_id, "quantity": new_qty, "location": location}
+                    for full_id, location in stackable
+                ],
+            )
+            updated = [r for r in results if "error" not in r]
+            failed = [r for r in results if "error" in r]
+            if not updated:
+                raise failed[0]["error"]
             save_file.recalculate_checksums()
             save_path = self.get_save_path()
             if save_path:
@@ -2400,6 +2495,13 @@ class InventoryEditor:
             self.refresh_inventory()
             if self._on_inventory_changed:
                 self._on_inventory_changed()
+            if failed:
+                show_toast(
+                    self.parent.winfo_toplevel(),
+                    f"Set quantity on {len(updated)} items. "
+                    f"{len(failed)} could not be updated.",
+                    type="warning",
+                )
         except Exception as e:
             CTkMessageBox.showerror(
                 "Error", f"Failed to set quantity:\n{e}", parent=self.parent
@@ -2416,18 +2518,17 @@ class InventoryEditor:
         data = buf.getvalue()
         save_file._raw_data[entry_abs : entry_abs + len(data)] = data
 
-    def _get_forced_or_listbox(self):
+    def _get_selected_items(self) -> list[tuple[int, str, int]]:
+        """Every selected (full_id, location, gaitem_handle), forced selection first."""
         if self._forced_selection is not None:
-            return self._forced_selection
+            return [self._forced_selection]
         if self.inventory_listbox is None:
-            return None
-        sel = self.inventory_listbox.curselection()
-        if not sel:
-            return None
-        idx = sel[0]
-        if idx >= len(self._item_data) or self._item_data[idx] is None:
-            return None
-        return self._item_data[idx]
+            return []
+        return [
+            self._item_data[idx]
+            for idx in self.inventory_listbox.curselection()
+            if idx < len(self._item_data) and self._item_data[idx] is not None
+        ]
 
     def _get_selected_weapon(self) -> tuple[int, str, int] | None:
         # Support forced selection from the visual inventory popup
@@ -3084,7 +3185,7 @@ class InventoryEditor:
         from er_save_manager.backup.manager import BackupManager
 
         manager = BackupManager(Path(save_path))
-        manager.create_backup(
+        manager.checkpoint(
             description=f"before_{operation}_slot_{slot_idx + 1}",
             operation=operation,
             save=save_file,
@@ -3478,27 +3579,32 @@ class LoadoutManagerWindow(ctk.CTkToplevel):
 
         slot_idx = self.editor.get_char_slot()
 
+        from er_save_manager.editors.loadout_apply import apply_loadout
+        from er_save_manager.ui.progress_dialog import ProgressDialog
+
         try:
             self.editor.ensure_mutable()
             self.editor._create_backup(save_file, slot_idx, "apply_loadout")
 
-            slot = save_file.characters[slot_idx]
-            success_count = 0
-            errors = []
+            with ProgressDialog(self, "Apply Loadout", "Applying loadout...") as dialog:
+                result = apply_loadout(
+                    save_file,
+                    slot_idx,
+                    self.editor.loadout,
+                    is_convergence=self.editor._is_cnv_save(),
+                    progress=lambda done, total: dialog.update_status(
+                        "Applying loadout...", f"{done} / {total} items"
+                    ),
+                )
+            self.grab_set()
 
-            for item_info in self.editor.loadout:
-                try:
-                    location = self.editor._resolve_add_location(
-                        save_file, slot_idx, item_info.get("location", "held")
-                    )
-                    to_add = item_info
-                    if location != item_info.get("location"):
-                        to_add = dict(item_info)
-                        to_add["location"] = location
-                    self.editor._process_single_add(save_file, slot_idx, slot, to_add)
-                    success_count += 1
-                except Exception as ex:
-                    errors.append(f"{item_info.get('name_label', 'item')}: {ex}")
+            for item_info in result.added:
+                self.editor._finish_add(save_file, slot_idx, item_info)
+            success_count = result.count
+            errors = [
+                f"{info.get('name_label', 'item')}: {error}"
+                for info, error in result.errors
+            ]
 
             save_file.recalculate_checksums()
             save_path = self.editor.get_save_path()
@@ -3519,9 +3625,12 @@ class LoadoutManagerWindow(ctk.CTkToplevel):
                     parent=self,
                 )
             else:
+                skipped = len(result.skipped)
                 show_toast(
                     self.editor.parent.winfo_toplevel(),
-                    f"Loadout applied successfully ({success_count} items).",
+                    f"Loadout applied successfully ({success_count} items"
+                    + (f", {skipped} already owned" if skipped else "")
+                    + ").",
                     type="success",
                 )
                 self.destroy()
@@ -665,7 +665,7 @@ class StatsEditor:
             save_path = self.get_save_path()
             if save_path:
                 manager = BackupManager(Path(save_path))
-                manager.create_backup(
+                manager.checkpoint(
                     description=f"before_edit_stats_slot_{slot_idx + 1}",
                     operation=f"edit_stats_slot_{slot_idx + 1}",
                     save=save_file,
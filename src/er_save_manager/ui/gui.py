@@ -200,6 +200,10 @@ class SaveManagerGUI:
         # Show external-modification dialog when the user refocuses the window
         self.root.bind("<FocusIn>", self._on_window_focus)
 
+        # Undo / redo the in-memory edit history (text fields keep their own)
+        self.root.bind("<Control-z>", lambda e: self._step_edit_history(e, redo=False))
+        self.root.bind("<Control-y>", lambda e: self._step_edit_history(e, redo=True))
+
         # Start auto-backup process monitor
         self.root.after(2000, self._init_process_monitor)
 
@@ -1376,6 +1380,35 @@ class SaveManagerGUI:
         """
         self._update_watched_mtime()
 
+    def _step_edit_history(self, event, redo: bool):
+        """Undo or redo the last editor checkpoint and write the save."""
+        if isinstance(event.widget, (tk.Entry, tk.Text)):
+            return None
+        if not self.save_file or not self.save_path:
+            return None
+        from er_save_manager.parser.snapshots import snapshots
+
+        stack = snapshots(self.save_file)
+        label = stack.redo() if redo else stack.undo()
+        if label is None:
+            self.show_toast(
+                "Nothing to redo" if redo else "Nothing to undo", type="info"
+            )
+            return "break"
+
+        try:
+            self.save_file.recalculate_checksums()
+            self.save_file.to_file(self.save_path)
+        except Exception as e:
+            CTkMessageBox.showerror(
+                "Error", f"Failed to write save:\n{e}", parent=self.root
+            )
+            return "break"
+        self.acknowledge_save_written()
+        self._finalize_save_load(self.save_file, self.save_path, silent=True)
+        self.show_toast(f"{'Redo' if redo else 'Undo'}: {label or 'edit'}")
+        return "break"
+
     def _on_inventory_changed(self) -> None:
         """Refresh matchmaking weapon level floor after inventory changes."""
         self.acknowledge_save_written()
@@ -2380,6 +2413,11 @@ class SaveManagerGUI:
 
     def _finalize_save_load(self, save_file, save_path, silent=False):
         """Finalize save loading on main thread"""
+        if self.save_file is not None and self.save_path == Path(save_path):
+            from er_save_manager.parser.snapshots import carry_over
+
+            # Tabs reload after writing; keep their undo history
+            carry_over(self.save_file, save_file)
         self.save_file = save_file
         self.save_path = Path(save_path)
         self._update_watched_mtime()
@@ -93,7 +93,8 @@ def import_nyasu(
     )
 
     from er_save_manager.data.item_database import get_item_database
-    from er_save_manager.parser.inventory_ops import add_item as _add_item
+    from er_save_manager.parser.inventory_ops import ItemAlreadyPresentError
+    from er_save_manager.parser.inventory_ops import add_items as _add_items
 
     is_cnv = save_file.is_convergence
     db = get_item_database()
@@ -391,28 +392,32 @@ def import_nyasu(
     added: list[str] = []
     skipped: list[str] = []
 
-    for full_id, qty, upgrade, gem_id, reinf, label in queue:
-        loc = _pick_location()
-        try:
-            _add_item(
-                save_file,
-                slot_idx,
-                full_id,
-                qty,
-                loc,
-                upgrade=upgrade,
-                gem_full_id=gem_id,
-                reinforcement=reinf,
-            )
+    # One transaction: held falls back to storage per item once it fills up
+    loc = _pick_location()
+    specs = [
+        {
+            "full_item_id": full_id,
+            "quantity": qty,
+            "location": loc,
+            "upgrade": upgrade,
+            "gem_full_id": gem_id,
+            "reinforcement": reinf,
+        }
+        for full_id, qty, upgrade, gem_id, reinf, _ in queue
+    ]
+    try:
+        results = _add_items(save_file, slot_idx, specs)
+    except Exception as e:
+        results = [{"error": e}] * len(queue)
+
+    for (*_, label), result in zip(queue, results, strict=True):
+        error = result.get("error")
+        if error is None:
             added.append(label)
-        except ValueError as e:
-            msg = str(e)
-            if "already" in msg:
-                skipped.append(label)
-            else:
-                failed.append(f"{label}: {msg}")
-        except Exception as e:
-            failed.append(f"{label}: {e}")
+        elif isinstance(error, ItemAlreadyPresentError):
+            skipped.append(label)
+        else:
+            failed.append(f"{label}: {error}")
 
     try:
         save_file.recalculate_checksums()
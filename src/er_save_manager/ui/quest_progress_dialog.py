@@ -16,8 +16,8 @@ class QuestProgressDialog:
     """
     Dialog for viewing and modifying NPC quest progress.
 
-    Reads/writes event flags via an accessor that has get_flag(id) -> bool
-    and set_flag(id, state) methods.
+    Reads/writes event flags via an accessor that has get_flags(ids) ->
+    dict[int, bool] and set_flag(id, state) methods.
     """
 
     @staticmethod
@@ -127,15 +127,25 @@ class QuestProgressDialog:
         npc_buttons = {}
         step_widgets = []  # list of (step_dict, completion_label, apply_btn)
 
-        def _safe_get_flag(flag_id):
-            try:
-                return event_flag_accessor.get_flag(flag_id)
-            except (ValueError, KeyError):
-                return False
+        # Every quest flag is read in one pass and re-read after each save;
+        # flags outside the BST read as unset
+        quest_flag_ids = list(
+            dict.fromkeys(
+                f["id"]
+                for steps in QUEST_FLAGS.values()
+                for step in steps
+                for f in step["flags"]
+            )
+        )
+        flag_states = {}
+
+        def _refresh_flag_states():
+            flag_states.update(event_flag_accessor.get_flags(quest_flag_ids))
 
         def _step_is_complete(step):
             return all(
-                bool(_safe_get_flag(f["id"])) == bool(f["value"]) for f in step["flags"]
+                flag_states.get(f["id"], False) == bool(f["value"])
+                for f in step["flags"]
             )
 
         def _count_complete(npc_name):
@@ -304,7 +314,7 @@ class QuestProgressDialog:
 
             if save_path and save_path.is_file():
                 try:
-                    BackupManager(save_path).create_backup(
+                    BackupManager(save_path).checkpoint(
                         description=f"before_quest_edit_slot_{slot_idx + 1}",
                         operation="quest_progress_edit",
                         save=save_file,
@@ -330,6 +340,7 @@ class QuestProgressDialog:
                 show_toast(toast_msg, duration=2500)
 
             # Re-render step list with fresh flag states
+            _refresh_flag_states()
             _render_steps(npc_name)
             _rebuild_npc_list(search_var.get())
 
@@ -390,4 +401,5 @@ class QuestProgressDialog:
             _rebuild_npc_list(search_var.get())
 
         search_var.trace_add("write", _on_search)
+        _refresh_flag_states()
         _rebuild_npc_list()
@@ -277,8 +277,9 @@ class AdvancedToolsTab:
                     save=save_file,
                 )
 
-            # Recalculate checksums and save back to file
-            save_file.recalculate_checksums()
+            # Re-hash every slot, not only ones edited since load: this repairs
+            # checksums broken outside the editor. Then save back to file.
+            save_file.recalculate_checksums(full=True)
 
             if save_path:
                 save_file.to_file(save_path)
@@ -313,7 +313,7 @@ class AppearanceTab:
                     from er_save_manager.backup.manager import BackupManager
 
                     manager = BackupManager(Path(save_path))
-                    manager.create_backup(
+                    manager.checkpoint(
                         description=f"before_warped_face_sliders_slot_{self.selected_slot + 1}",
                         operation="warped_face_sliders",
                         save=save_file,
@@ -1316,7 +1316,7 @@ class AppearanceTab:
                     save_path = self.get_save_path()
                     if save_path:
                         manager = BackupManager(Path(save_path))
-                        manager.create_backup(
+                        manager.checkpoint(
                             description=f"before_import_preset_to_slot_{target_slot + 1}",
                             operation="import_preset",
                             save=save_file,
@@ -1359,7 +1359,7 @@ class AppearanceTab:
                     save_path = self.get_save_path()
                     if save_path:
                         manager = BackupManager(Path(save_path))
-                        manager.create_backup(
+                        manager.checkpoint(
                             description="before_import_all_presets",
                             operation="import_preset",
                             save=save_file,
@@ -1592,7 +1592,7 @@ class AppearanceTab:
             save_path = self.get_save_path()
             if save_path:
                 manager = BackupManager(Path(save_path))
-                manager.create_backup(
+                manager.checkpoint(
                     description=f"before_delete_preset_slot_{self.selected_slot + 1}",
                     operation="delete_preset",
                     save=save_file,
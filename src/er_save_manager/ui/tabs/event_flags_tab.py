@@ -24,7 +24,8 @@ from er_save_manager.data.summoning_pools_data import (
     SUMMONING_POOL_FLAGS_BASE,
     SUMMONING_POOL_FLAGS_DLC,
 )
-from er_save_manager.parser.event_flags import EventFlags
+from er_save_manager.parser.event_flags import EventFlags, write_flags
+from er_save_manager.parser.flag_index import get_flag_index
 from er_save_manager.ui.messagebox import CTkMessageBox
 from er_save_manager.ui.utils import bind_mousewheel, pick_file
 
@@ -37,20 +38,25 @@ class EventFlagsTab:
 
         def __init__(self, slot):
             self.slot = slot
-            # Keep a mutable buffer for repeated writes
-            self.buffer = (
-                bytearray(slot.event_flags)
-                if not isinstance(slot.event_flags, bytearray)
-                else slot.event_flags
-            )
+            # Make slot.event_flags mutable once; writes then edit it in place
+            if not isinstance(slot.event_flags, bytearray):
+                slot.event_flags = bytearray(slot.event_flags)
+            self.buffer = slot.event_flags
 
         def get_flag(self, flag_id: int) -> bool:
-            return EventFlags.get_flag(bytes(self.buffer), flag_id)
+            return EventFlags.get_flag(self.buffer, flag_id)
+
+        def get_flags(self, flag_ids) -> dict[int, bool]:
+            return EventFlags.get_flags(self.buffer, flag_ids)
+
+        def count_set(self, flag_ids) -> int:
+            return EventFlags.count_set(self.buffer, flag_ids)
+
+        def iter_set_flags(self):
+            return EventFlags.iter_set_flags(self.buffer)
 
         def set_flag(self, flag_id: int, state: bool) -> None:
             EventFlags.set_flag(self.buffer, flag_id, state)
-            # Persist back onto the slot so saves use updated bytes
-            self.slot.event_flags = bytes(self.buffer)
 
     def __init__(
         self,
@@ -642,29 +648,14 @@ class EventFlagsTab:
         save_path = self.get_save_path()
         if save_path:
             backup_mgr = BackupManager(save_path)
-            backup_mgr.create_backup(
+            backup_mgr.checkpoint(
                 description=f"Before event flag changes (Slot {self.current_slot + 1})",
                 operation="event_flag_changes",
                 save=save_file,
             )
 
-        # Apply changes
-        for flag_id, new_state in self.flag_states.items():
-            self.current_event_flags.set_flag(flag_id, new_state)
-
-        # set_flag() only updates slot.event_flags in memory. The raw data
-        # buffer is what gets written to disk, so it needs the same write.
-        slot = save_file.character_slots[self.current_slot]
-
-        if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-            # Calculate absolute offset in the raw data
-            absolute_offset = slot.event_flags_offset
-            event_flags_size = 0x1BF99F  # 1,833,375 bytes
-
-            # Write the modified event_flags buffer to raw_data
-            save_file._raw_data[
-                absolute_offset : absolute_offset + event_flags_size
-            ] = slot.event_flags
+        # Apply changes to slot.event_flags and the raw data in one batch
+        write_flags(save_file, self.current_slot, self.flag_states)
 
         # Recalculate checksums before saving
         save_file.recalculate_checksums()
@@ -706,42 +697,12 @@ class EventFlagsTab:
             return
 
         try:
-            set_flags = []
-            seen: set[int] = set()
-
-            for category in CATEGORIES:
-                subcats = get_subcategories(category)
-                if subcats:
-                    for subcat in subcats:
-                        for flag_id in get_category_flags(category, subcat):
-                            if flag_id in seen:
-                                continue
-                            seen.add(flag_id)
-                            try:
-                                if self.current_event_flags.get_flag(flag_id):
-                                    set_flags.append(
-                                        {
-                                            "id": flag_id,
-                                            "name": get_flag_name(flag_id),
-                                        }
-                                    )
-                            except Exception:
-                                pass
-                else:
-                    for flag_id in get_category_flags(category, None):
-                        if flag_id in seen:
-                            continue
-                        seen.add(flag_id)
-                        try:
-                            if self.current_event_flags.get_flag(flag_id):
-                                set_flags.append(
-                                    {
-                                        "id": flag_id,
-                                        "name": get_flag_name(flag_id),
-                                    }
-                                )
-                        except Exception:
-                            pass
+            # Every set flag in the slot, including ones the database
+            # doesn't name
+            set_flags = [
+                {"id": flag_id, "name": get_flag_name(flag_id)}
+                for flag_id in self.current_event_flags.iter_set_flags()
+            ]
 
             data = {
                 "slot": slot_num,
@@ -830,7 +791,7 @@ class EventFlagsTab:
 
         try:
             backup_mgr = BackupManager(save_path)
-            backup_mgr.create_backup(
+            backup_mgr.checkpoint(
                 description=f"Before flag import (Slot {self.current_slot + 1})",
                 operation="flag_import",
                 save=save_file,
@@ -842,21 +803,11 @@ class EventFlagsTab:
                 parent=self.parent,
             )
 
-        applied = 0
-        for flag_id, state in flag_ops:
-            try:
-                self.current_event_flags.set_flag(flag_id, state)
-                applied += 1
-            except Exception:
-                pass
-
-        slot = save_file.character_slots[self.current_slot]
-        if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-            absolute_offset = slot.event_flags_offset
-            event_flags_size = 0x1BF99F
-            save_file._raw_data[
-                absolute_offset : absolute_offset + event_flags_size
-            ] = slot.event_flags
+        # Flags whose block is not in the BST are skipped
+        states = dict(flag_ops)
+        index = get_flag_index()
+        applied = sum(1 for flag_id in states if index.locate(flag_id) is not None)
+        write_flags(save_file, self.current_slot, states, skip_unknown=True)
 
         save_file.recalculate_checksums()
         save_file.save(self.get_save_path())
@@ -938,7 +889,7 @@ class EventFlagsTab:
 
                 try:
                     backup_mgr = BackupManager(save_path)
-                    backup_mgr.create_backup(
+                    backup_mgr.checkpoint(
                         description=f"Before advanced flag toggle {flag_id} (Slot {self.current_slot + 1})",
                         operation="advanced_flag_toggle",
                         save=save_file,
@@ -952,15 +903,7 @@ class EventFlagsTab:
 
                 current = self.current_event_flags.get_flag(flag_id)
                 new_state = not current
-                self.current_event_flags.set_flag(flag_id, new_state)
-
-                slot = save_file.character_slots[self.current_slot]
-                if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                    absolute_offset = slot.event_flags_offset
-                    event_flags_size = 0x1BF99F
-                    save_file._raw_data[
-                        absolute_offset : absolute_offset + event_flags_size
-                    ] = slot.event_flags
+                write_flags(save_file, self.current_slot, {flag_id: new_state})
 
                 save_file.recalculate_checksums()
                 save_file.save(save_path)
@@ -1077,13 +1020,16 @@ class EventFlagsTab:
             text_color=("gray50", "gray70"),
         ).pack(pady=(0, 10), padx=15)
 
+        # Only flags[0] is the documented encounter "Defeated" trigger flag.
+        # Remaining flags are side effects (stat counters, reward pickups,
+        # grace unlocks) and are not reliable defeat indicators on their own.
+        defeated_flags = self.current_event_flags.get_flags(
+            data["flags"][0] for data in BOSSES.values() if data.get("flags")
+        )
         all_entries: list[tuple[str, str, str]] = []
         for boss_name, data in BOSSES.items():
             flags = data.get("flags", [])
-            # Only flags[0] is the documented encounter "Defeated" trigger flag.
-            # Remaining flags are side effects (stat counters, reward pickups,
-            # grace unlocks) and are not reliable defeat indicators on their own.
-            defeated = bool(flags) and self.current_event_flags.get_flag(flags[0])
+            defeated = bool(flags) and defeated_flags[flags[0]]
             all_entries.append(
                 (
                     boss_name,
@@ -1306,12 +1252,12 @@ class EventFlagsTab:
                 return
 
             count = 0
+            states = {}
             for _boss_name, (flags, var) in boss_vars.items():
                 if var.get():  # user explicitly selected this boss
                     is_defeated_now = self.current_event_flags.get_flag(flags[0])
                     if is_defeated_now:
-                        for flag_id in flags:
-                            self.current_event_flags.set_flag(flag_id, False)
+                        states.update(dict.fromkeys(flags, False))
                         count += 1
 
             if count == 0:
@@ -1328,7 +1274,7 @@ class EventFlagsTab:
             if save_path and save_path.is_file():
                 try:
                     backup_mgr = BackupManager(save_path)
-                    backup_mgr.create_backup(
+                    backup_mgr.checkpoint(
                         description=f"Before boss respawn (Slot {self.current_slot + 1})",
                         operation="respawn_boss",
                         save=save_file,
@@ -1346,15 +1292,8 @@ class EventFlagsTab:
                     " Proceeding without backup.",
                 )
 
-            # Write to raw data and recalculate checksums
-            slot = save_file.character_slots[self.current_slot]
-
-            if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                absolute_offset = slot.event_flags_offset
-                event_flags_size = 0x1BF99F
-                save_file._raw_data[
-                    absolute_offset : absolute_offset + event_flags_size
-                ] = slot.event_flags
+            # Write the flags (after the backup) and recalculate checksums
+            write_flags(save_file, self.current_slot, states)
 
             save_file.recalculate_checksums()
             save_file.save(self.get_save_path())
@@ -1402,9 +1341,9 @@ class EventFlagsTab:
                 return
 
             count = 0
+            states = {}
             for _boss_name, (flags, _var) in boss_vars.items():
-                for flag_id in flags:
-                    self.current_event_flags.set_flag(flag_id, False)
+                states.update(dict.fromkeys(flags, False))
                 count += 1
 
             # Get save file for backup
@@ -1415,7 +1354,7 @@ class EventFlagsTab:
             if save_path and save_path.is_file():
                 try:
                     backup_mgr = BackupManager(save_path)
-                    backup_mgr.create_backup(
+                    backup_mgr.checkpoint(
                         description=f"Before respawn all ({boss_category_var.get()}, Slot {self.current_slot + 1})",
                         operation="respawn_all_bosses",
                         save=save_file,
@@ -1435,15 +1374,8 @@ class EventFlagsTab:
                     parent=dialog,
                 )
 
-            # Write to raw data and recalculate checksums
-            slot = save_file.character_slots[self.current_slot]
-
-            if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                absolute_offset = slot.event_flags_offset
-                event_flags_size = 0x1BF99F
-                save_file._raw_data[
-                    absolute_offset : absolute_offset + event_flags_size
-                ] = slot.event_flags
+            # Write the flags (after the backup) and recalculate checksums
+            write_flags(save_file, self.current_slot, states)
 
             save_file.recalculate_checksums()
             save_file.save(self.get_save_path())
@@ -1483,12 +1415,12 @@ class EventFlagsTab:
                 return
 
             count = 0
+            states = {}
             for _boss_name, (flags, var) in boss_vars.items():
                 if var.get():  # user explicitly selected this boss
                     is_defeated_now = self.current_event_flags.get_flag(flags[0])
                     if not is_defeated_now:
-                        for flag_id in flags:
-                            self.current_event_flags.set_flag(flag_id, True)
+                        states.update(dict.fromkeys(flags, True))
                         count += 1
 
             if count == 0:
@@ -1505,7 +1437,7 @@ class EventFlagsTab:
             if save_path and save_path.is_file():
                 try:
                     backup_mgr = BackupManager(save_path)
-                    backup_mgr.create_backup(
+                    backup_mgr.checkpoint(
                         description=f"Before boss kill (Slot {self.current_slot + 1})",
                         operation="kill_boss",
                         save=save_file,
@@ -1523,15 +1455,8 @@ class EventFlagsTab:
                     " Proceeding without backup.",
                 )
 
-            # Write to raw data and recalculate checksums
-            slot = save_file.character_slots[self.current_slot]
-
-            if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                absolute_offset = slot.event_flags_offset
-                event_flags_size = 0x1BF99F
-                save_file._raw_data[
-                    absolute_offset : absolute_offset + event_flags_size
-                ] = slot.event_flags
+            # Write the flags (after the backup) and recalculate checksums
+            write_flags(save_file, self.current_slot, states)
 
             save_file.recalculate_checksums()
             save_file.save(self.get_save_path())
@@ -1580,9 +1505,9 @@ class EventFlagsTab:
                 return
 
             count = 0
+            states = {}
             for _boss_name, (flags, _var) in boss_vars.items():
-                for flag_id in flags:
-                    self.current_event_flags.set_flag(flag_id, True)
+                states.update(dict.fromkeys(flags, True))
                 count += 1
 
             # Get save file for backup
@@ -1593,7 +1518,7 @@ class EventFlagsTab:
             if save_path and save_path.is_file():
                 try:
                     backup_mgr = BackupManager(save_path)
-                    backup_mgr.create_backup(
+                    backup_mgr.checkpoint(
                         description=f"Before kill all ({boss_category_var.get()}, Slot {self.current_slot + 1})",
                         operation="kill_all_bosses",
                         save=save_file,
@@ -1613,15 +1538,8 @@ class EventFlagsTab:
                     parent=dialog,
                 )
 
-            # Write to raw data and recalculate checksums
-            slot = save_file.character_slots[self.current_slot]
-
-            if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                absolute_offset = slot.event_flags_offset
-                event_flags_size = 0x1BF99F
-                save_file._raw_data[
-                    absolute_offset : absolute_offset + event_flags_size
-                ] = slot.event_flags
+            # Write the flags (after the backup) and recalculate checksums
+            write_flags(save_file, self.current_slot, states)
 
             save_file.recalculate_checksums()
             save_file.save(self.get_save_path())
@@ -1781,7 +1699,7 @@ class EventFlagsTab:
             if save_path:
                 try:
                     backup_mgr = BackupManager(save_path)
-                    backup_mgr.create_backup(
+                    backup_mgr.checkpoint(
                         description=f"Before NPC revival (Slot {self.current_slot + 1})",
                         operation="npc_revival",
                         save=save_file,
@@ -1986,7 +1904,7 @@ class EventFlagsTab:
             if save_path and save_path.is_file():
                 try:
                     backup_mgr = BackupManager(save_path)
-                    backup_mgr.create_backup(
+                    backup_mgr.checkpoint(
                         description=f"Before summoning pool {action.lower()} (Slot {self.current_slot + 1})",
                         operation="summoning_pools",
                         save=save_file,
@@ -1998,16 +1916,7 @@ class EventFlagsTab:
                         parent=dialog,
                     )
 
-            for flag_id in selected:
-                self.current_event_flags.set_flag(flag_id, state)
-
-            slot = save_file.character_slots[self.current_slot]
-            if hasattr(slot, "event_flags_offset") and slot.event_flags_offset > 0:
-                absolute_offset = slot.event_flags_offset
-                event_flags_size = 0x1BF99F
-                save_file._raw_data[
-                    absolute_offset : absolute_offset + event_flags_size
-                ] = slot.event_flags
+            write_flags(save_file, self.current_slot, dict.fromkeys(selected, state))
 
             save_file.recalculate_checksums()
             save_file.save(self.get_save_path())
@@ -336,7 +336,7 @@ class GesturesRegionsTab:
             save_path = self.get_save_path()
             if save_path:
                 manager = BackupManager(Path(save_path))
-                manager.create_backup(
+                manager.checkpoint(
                     description=f"before_gesture_changes_slot_{slot_idx + 1}",
                     operation=f"gesture_changes_slot_{slot_idx + 1}",
                     save=save_file,
@@ -538,7 +538,7 @@ class GesturesRegionsTab:
 
             try:
                 backup_mgr = BackupManager(save_path)
-                backup_mgr.create_backup(
+                backup_mgr.checkpoint(
                     description=f"Before unlocked region edit (Slot {self.current_slot + 1})",
                     operation="unlocked_regions",
                     save=save_file,
@@ -699,7 +699,7 @@ class GesturesRegionsTab:
 
             try:
                 backup_mgr = BackupManager(save_path)
-                backup_mgr.create_backup(
+                backup_mgr.checkpoint(
                     description="Before game settings edit",
                     operation="game_settings",
                     save=save_file,
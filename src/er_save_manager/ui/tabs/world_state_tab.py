@@ -271,7 +271,7 @@ class WorldStateTab:
 
         save_path = self.get_save_path()
         if save_path:
-            BackupManager(Path(save_path)).create_backup(
+            BackupManager(Path(save_path)).checkpoint(
                 description="before_bloodstain_sync",
                 operation="world_state_bloodstain_sync",
                 save=self.get_save_file(),
@@ -463,7 +463,7 @@ class WorldStateTab:
 
         save_path = self.get_save_path()
         if save_path:
-            BackupManager(Path(save_path)).create_backup(
+            BackupManager(Path(save_path)).checkpoint(
                 description=f"before_teleport_{loc.map_id_str}",
                 operation="world_state_teleport",
                 save=self.get_save_file(),
@@ -618,7 +618,7 @@ class WorldStateTab:
 
         save_path = self.get_save_path()
         if save_path:
-            BackupManager(Path(save_path)).create_backup(
+            BackupManager(Path(save_path)).checkpoint(
                 description="before_custom_teleport",
                 operation="world_state_custom_teleport",
                 save=self.get_save_file(),
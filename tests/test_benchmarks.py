@@ -0,0 +1,36 @@
+"""Tests for the regression check of the benchmark runner (benchmarks/run.py)."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+RUN_PY = Path(__file__).parent.parent / "benchmarks" / "run.py"
+
+
+def _load_runner():
+    spec = importlib.util.spec_from_file_location("bench_run", RUN_PY)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_compare_flags_only_stages_past_threshold():
+    run = _load_runner()
+    baseline = {"a": {"min": 1.0}, "b": {"min": 1.0}}
+    results = {"a": {"min": 1.15}, "b": {"min": 1.25}, "new": {"min": 9.0}}
+
+    assert run.compare(results, baseline, threshold=20) == ["b"]
+    assert run.compare(results, baseline, threshold=10) == ["a", "b"]
+
+
+def test_measure_runs_setup_before_every_repetition():
+    run = _load_runner()
+    calls = []
+    stage = run.Stage("count", lambda state: calls.append(state), lambda: len(calls))
+
+    result = run.measure(stage, repeat=3)
+
+    assert calls == [0, 1, 2]
+    assert result["repeat"] == 3
+    assert result["min"] <= result["median"]
@@ -58,3 +58,65 @@ def _first_active_slot(save) -> int:
         if not slot.is_empty():
             return i
     raise AssertionError("fixture save has no active character slots")
+
+
+def _flip_byte(save, slot_index: int, rel: int = 0x100) -> int:
+    offset = save.slot_data_offset(slot_index) + rel
+    save._raw_data[offset] ^= 0xFF
+    return offset
+
+
+def test_recalculate_on_clean_save_touches_nothing(sanitized_save):
+    before = bytes(sanitized_save._raw_data)
+    assert sanitized_save.recalculate_checksums() == []
+    assert bytes(sanitized_save._raw_data) == before
+
+
+def test_recalculate_rehashes_only_dirty_slots(sanitized_save):
+    _flip_byte(sanitized_save, 3)
+    _flip_byte(sanitized_save, 7)
+    assert sanitized_save.dirty_slots() == [3, 7]
+
+    assert sanitized_save.recalculate_checksums() == [3, 7]
+    assert sanitized_save.dirty_slots() == []
+    for slot_index in range(ACTIVE_SLOT_COUNT):
+        valid, _, _ = check_slot_checksum(sanitized_save, slot_index)
+        assert valid
+
+
+def test_out_of_band_write_needs_mark_dirty(sanitized_save):
+    import struct
+
+    offset = sanitized_save.slot_data_offset(2) + 0x100
+    struct.pack_into("<I", sanitized_save._raw_data, offset, 0xDEADBEEF)
+    assert sanitized_save.recalculate_checksums() == []
+
+    sanitized_save.mark_dirty(offset, offset + 4)
+    assert sanitized_save.recalculate_checksums() == [2]
+
+
+def test_full_recalculate_repairs_untracked_changes(sanitized_save):
+    import struct
+
+    offset = sanitized_save.slot_data_offset(5) + 0x100
+    struct.pack_into("<I", sanitized_save._raw_data, offset, 0xDEADBEEF)
+
+    assert sanitized_save.recalculate_checksums(full=True) == [5]
+
+
+def test_bytearray_reassignment_keeps_dirty_state(sanitized_save):
+    _flip_byte(sanitized_save, 1)
+    sanitized_save._raw_data = bytearray(sanitized_save._raw_data)
+    assert sanitized_save.dirty_slots() == [1]
+
+    sanitized_save._raw_data = bytes(len(sanitized_save._raw_data))
+    assert sanitized_save.dirty_slots() == list(range(ACTIVE_SLOT_COUNT))
+
+
+def test_add_item_dirties_only_its_slot(sanitized_save):
+    from er_save_manager.parser.inventory_ops import add_item
+
+    add_item(sanitized_save, 4, 88880000, quantity=1, location="held")
+
+    assert sanitized_save.dirty_slots() == [4]
+    assert sanitized_save.recalculate_checksums() == [4]
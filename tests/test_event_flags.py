@@ -10,6 +10,7 @@ from er_save_manager.parser.event_flags import (
     CorruptionFixer,
     EventFlags,
     FixFlags,
+    write_flags,
 )
 
 
@@ -97,6 +98,113 @@ def test_unknown_block_raises():
         EventFlags.get_flag(ef, 999_999_999_999)
 
 
+def test_get_flags_matches_get_flag(sanitized_save):
+    from er_save_manager.data.event_flags_db import EVENT_FLAGS
+
+    slot = sanitized_save.character_slots[_first_active_slot(sanitized_save)]
+    ids = [flag_id for flag_id in EVENT_FLAGS if _flag_exists_in_bst(flag_id)]
+    expected = {
+        flag_id: EventFlags.get_flag(slot.event_flags, flag_id) for flag_id in ids
+    }
+
+    assert EventFlags.get_flags(slot.event_flags, ids) == expected
+    assert EventFlags.count_set(slot.event_flags, ids) == sum(expected.values())
+    assert any(expected.values())
+
+
+def test_get_flags_reads_unknown_blocks_as_unset():
+    ef = bytearray(b"\xff" * EventFlags.EVENT_FLAGS_SIZE)
+    ids = [999_999_999_999, FixFlags.RANNI_BLOCKING_FLAG]
+    assert EventFlags.get_flags(ef, ids) == {
+        999_999_999_999: False,
+        FixFlags.RANNI_BLOCKING_FLAG: True,
+    }
+    assert EventFlags.count_set(ef, ids) == 1
+
+
+def test_iter_set_flags_lists_every_set_flag(sanitized_save):
+    from er_save_manager.data.event_flags_db import EVENT_FLAGS
+
+    slot = sanitized_save.character_slots[_first_active_slot(sanitized_save)]
+    flags = bytearray(slot.event_flags)
+    unnamed = FixFlags.RANNI_BLOCKING_FLAG + 1
+    assert unnamed not in EVENT_FLAGS
+    EventFlags.set_flag(flags, unnamed, True)
+
+    set_flags = list(EventFlags.iter_set_flags(flags))
+
+    assert len(set_flags) == len(set(set_flags))
+    assert unnamed in set_flags
+    assert all(EventFlags.get_flag(flags, flag_id) for flag_id in set_flags)
+    listed = set(set_flags)
+    for flag_id, state in EventFlags.get_flags(flags, EVENT_FLAGS).items():
+        assert state == (flag_id in listed)
+    assert list(EventFlags.iter_set_flags(bytes(EventFlags.EVENT_FLAGS_SIZE))) == []
+
+
+def _boss_states(state: bool) -> dict[int, bool]:
+    from er_save_manager.data.boss_data import BOSSES
+
+    return {
+        flag_id: state
+        for boss in BOSSES.values()
+        for flag_id in boss["flags"]
+        if _flag_exists_in_bst(flag_id)
+    }
+
+
+def test_set_flags_matches_sequential_set_flag(sanitized_save):
+    slot = sanitized_save.character_slots[_first_active_slot(sanitized_save)]
+    states = {**_boss_states(True), FixFlags.RANNI_BLOCKING_FLAG: True}
+    states[FixFlags.RANNI_BLOCKING_FLAG + 1] = False
+    expected = bytearray(slot.event_flags)
+    for flag_id, state in states.items():
+        EventFlags.set_flag(expected, flag_id, state)
+
+    flags = bytearray(slot.event_flags)
+    span = EventFlags.set_flags(flags, states)
+
+    assert flags == expected
+    changed = [i for i in range(len(flags)) if flags[i] != slot.event_flags[i]]
+    assert span == (min(changed), max(changed) + 1)
+    assert EventFlags.set_flags(flags, states) is None
+
+
+def test_set_flags_unknown_id_writes_nothing():
+    import pytest
+
+    ef = bytearray(EventFlags.EVENT_FLAGS_SIZE)
+    states = {FixFlags.RANNI_BLOCKING_FLAG: True, 999_999_999_999: True}
+    with pytest.raises(ValueError):
+        EventFlags.set_flags(ef, states)
+    assert not any(ef)
+
+    assert EventFlags.set_flags(ef, states, skip_unknown=True) is not None
+    assert EventFlags.get_flag(ef, FixFlags.RANNI_BLOCKING_FLAG) is True
+
+
+def test_write_flags_only_touches_changed_bytes(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    slot = sanitized_save.character_slots[i]
+    states = _boss_states(False)
+    expected = bytearray(slot.event_flags)
+    EventFlags.set_flags(expected, states)
+    raw = sanitized_save._raw_data
+    before = bytes(raw)
+    raw.clear_dirty()
+
+    span = write_flags(sanitized_save, i, states)
+
+    start = slot.event_flags_offset
+    assert slot.event_flags == expected
+    assert raw[start : start + len(expected)] == expected
+    changed = [n for n in range(len(raw)) if raw[n] != before[n]]
+    assert changed and span == (changed[0], changed[-1] + 1)
+    assert all(lo >= span[0] and hi <= span[1] for lo, hi in raw.dirty_ranges())
+    assert sum(hi - lo for lo, hi in raw.dirty_ranges()) == len(changed)
+    assert write_flags(sanitized_save, i, states) is None
+
+
 # ---------------------------------------------------------------------------
 # CorruptionDetector - no false positives on a real, healthy save
 # ---------------------------------------------------------------------------
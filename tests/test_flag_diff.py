@@ -0,0 +1,71 @@
+"""
+Tests for er_save_manager.parser.flag_diff.
+
+The diff must report exactly the flags whose bits differ, mapped back to
+their ids, with database annotations, for raw regions and for slots.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from er_save_manager.data.event_flags_db import EVENT_FLAGS
+from er_save_manager.parser.event_flags import EventFlags, FixFlags
+from er_save_manager.parser.flag_diff import diff_event_flags, diff_slots
+
+
+def _active_slots(save):
+    return [i for i, slot in enumerate(save.character_slots) if not slot.is_empty()]
+
+
+def test_diff_reports_changed_flags_by_id(sanitized_save):
+    before = sanitized_save.character_slots[_active_slots(sanitized_save)[0]]
+    before = before.event_flags
+    after = bytearray(before)
+    named = next(flag_id for flag_id in EVENT_FLAGS if flag_id > 1000)
+    # Neighbouring bits of one byte, a named flag and a quest flag
+    flipped = [
+        FixFlags.RANNI_BLOCKING_FLAG,
+        FixFlags.RANNI_BLOCKING_FLAG + 1,
+        named,
+        FixFlags.RANNI_FLAGS_TO_ENABLE[0],
+    ]
+    for flag_id in flipped:
+        EventFlags.set_flag(after, flag_id, not EventFlags.get_flag(after, flag_id))
+
+    diff = diff_event_flags(before, after)
+
+    changes = {change.flag_id: change for change in diff.changes}
+    assert sorted(changes) == sorted(flipped)
+    for flag_id, change in changes.items():
+        assert change.before == EventFlags.get_flag(before, flag_id)
+        assert change.after == EventFlags.get_flag(after, flag_id)
+    assert changes[named].name == EVENT_FLAGS[named]["name"]
+    assert changes[named].category == EVENT_FLAGS[named]["category"]
+    assert "Ranni the Witch" in changes[FixFlags.RANNI_BLOCKING_FLAG].quests
+    assert diff.unmapped_bytes == 0
+    assert len(diff_event_flags(before, bytes(before))) == 0
+
+
+def test_diff_slots_matches_per_flag_reads(sanitized_save):
+    first, second = _active_slots(sanitized_save)[:2]
+    diff = diff_slots(sanitized_save, first, other_slot_idx=second)
+
+    a = sanitized_save.character_slots[first].event_flags
+    b = sanitized_save.character_slots[second].event_flags
+    assert len(diff) > 0
+    for change in diff.changes:
+        assert EventFlags.get_flag(a, change.flag_id) == change.before
+        assert EventFlags.get_flag(b, change.flag_id) == change.after
+    # Every differing database flag is reported
+    listed = {change.flag_id for change in diff.changes}
+    states = zip(
+        EventFlags.get_flags(a, EVENT_FLAGS).items(),
+        EventFlags.get_flags(b, EVENT_FLAGS).values(),
+        strict=True,
+    )
+    for (flag_id, old), new in states:
+        assert (old != new) == (flag_id in listed)
+
+    with pytest.raises(ValueError):
+        diff_slots(sanitized_save, first)
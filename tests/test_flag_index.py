@@ -0,0 +1,77 @@
+"""
+Tests for er_save_manager.parser.flag_index.
+
+The compiled index must agree with eventflag_bst.txt and the flag
+databases, and its file must round-trip and be recompiled when stale.
+"""
+
+from __future__ import annotations
+
+import os
+
+from er_save_manager.parser import flag_index
+from er_save_manager.parser.flag_index import (
+    BLOCK_SIZE,
+    FLAG_DIVISOR,
+    _parse_bst,
+    build_flag_index,
+    find_bst_file,
+    load_flag_index,
+)
+
+
+def test_index_matches_bst_file():
+    bst_path = find_bst_file()
+    bst_map = _parse_bst(bst_path)
+    index = build_flag_index(bst_path)
+
+    assert dict(index.bst_map) == bst_map
+    assert 999_999_999 not in index.bst_map
+    assert len(index.flag_ids) > 1000
+    for event_id in index.flag_ids:
+        block, bit = divmod(event_id, FLAG_DIVISOR)
+        expected = (bst_map[block] * BLOCK_SIZE + bit // 8, 0x80 >> (bit % 8))
+        assert index.locate(event_id) == expected
+        assert index.flag_at(*expected) == event_id
+
+    # Ids outside the databases are located through the block map
+    block = index.blocks[0]
+    assert index.locate(block * FLAG_DIVISOR + 9) == (
+        bst_map[block] * BLOCK_SIZE + 1,
+        0x40,
+    )
+    assert index.locate(999_999_999_999) is None
+
+    # The reverse block map inverts the BST
+    for block, offset in bst_map.items():
+        assert index.block_at(offset) == block
+    unused = set(range(len(index.block_by_position))) - set(bst_map.values())
+    assert all(index.block_at(position) is None for position in unused)
+
+
+def test_index_file_round_trips_and_rebuilds_when_stale(tmp_path, monkeypatch):
+    bst_path = tmp_path / "eventflag_bst.txt"
+    bst_path.write_bytes(find_bst_file().read_bytes())
+    index_path = tmp_path / "eventflag_bst.idx"
+
+    built = load_flag_index(bst_path, index_path)
+    assert index_path.is_file()
+
+    def fail():
+        raise AssertionError("index should have been read from disk")
+
+    monkeypatch.setattr(flag_index, "_database_flag_ids", fail)
+    cached = load_flag_index(bst_path, index_path)
+    assert cached.blocks == built.blocks
+    assert cached.offsets == built.offsets
+    assert cached.flag_ids == built.flag_ids
+    assert cached.flag_bits == built.flag_bits
+    assert cached.block_by_position == built.block_by_position
+    monkeypatch.undo()
+
+    # A changed BST file invalidates the index
+    with open(bst_path, "a") as f:
+        f.write("\n999999,1\n")
+    os.utime(bst_path, ns=(0, 0))
+    rebuilt = load_flag_index(bst_path, index_path)
+    assert rebuilt.bst_map[999999] == 1
@@ -0,0 +1,82 @@
+"""
+Tests for er_save_manager.parser.gaitem_compact.
+
+Compaction must pack the gaitem map into the layout inventory_ops
+allocates from, keep every referenced handle resolving to the same entry,
+free exact duplicates into the slot's trailing zero padding, and leave a
+slot that re-parses and re-serializes identically.
+"""
+
+from __future__ import annotations
+
+from er_save_manager.fixes.structural_scan import RebuildRoundtripFix
+from er_save_manager.parser import load_save
+from er_save_manager.parser.gaitem_compact import _resolved, compact_gaitem_map
+from er_save_manager.parser.inventory_ops import _gaitem_changed, add_item, edit_slot
+
+TEST_WEAPON_ID = 88880000
+
+
+def _first_active_slot(save):
+    for i, slot in enumerate(save.character_slots):
+        if not slot.is_empty():
+            return i
+    raise AssertionError("fixture save has no active character slots")
+
+
+def _runs(handles):
+    """Map layout as (kind, length) runs: g(em), o(ther) and f(ree)."""
+    runs = []
+    for handle in handles:
+        kind = "f" if not handle else "g" if handle >> 28 == 0xC else "o"
+        if runs and runs[-1][0] == kind:
+            runs[-1][1] += 1
+        else:
+            runs.append([kind, 1])
+    return [kind for kind, _ in runs]
+
+
+def test_compaction_packs_map_and_keeps_references(sanitized_save, tmp_path):
+    i = _first_active_slot(sanitized_save)
+    slot = sanitized_save.character_slots[i]
+    handles = sorted(h for h in slot.gaitem_map.handles if h)
+    resolved = _resolved(slot, slot.gaitem_map)
+
+    report = compact_gaitem_map(sanitized_save, i)
+
+    assert report.moved and not report.freed
+    assert _runs(slot.gaitem_map.handles) == ["g", "f", "o", "f"]
+    assert sorted(h for h in slot.gaitem_map.handles if h) == handles
+    assert _resolved(slot, slot.gaitem_map) == resolved
+
+    path = tmp_path / "compacted.sl2"
+    sanitized_save.recalculate_checksums()
+    sanitized_save.to_file(str(path))
+    reloaded = load_save(str(path))
+    assert not RebuildRoundtripFix().detect(reloaded, i)
+    assert (
+        reloaded.character_slots[i].gaitem_map.handles.tobytes()
+        == slot.gaitem_map.handles.tobytes()
+    )
+    # New weapons land in the trailing free run
+    result = add_item(reloaded, i, TEST_WEAPON_ID, quantity=1, location="held")
+    assert result["gaitem_slot"] == len(slot.gaitem_map) - 1
+
+
+def test_duplicate_entries_are_freed_into_trailing_padding(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    slot = sanitized_save.character_slots[i]
+    gaitem_map = slot.gaitem_map
+    weapon = next(j for j, h in enumerate(gaitem_map.handles) if h >> 28 == 0x8)
+    handle = gaitem_map.handles[weapon]
+    with edit_slot(sanitized_save, i):
+        free = gaitem_map.handles.index(0)
+        gaitem_map[free] = gaitem_map[weapon]
+        _gaitem_changed(slot, free)
+
+    report = compact_gaitem_map(sanitized_save, i)
+
+    assert report.freed == 1
+    assert report.reclaimed_bytes == 21 - 8
+    assert report.trailing_zeros_after >= report.trailing_zeros_before + 13
+    assert list(gaitem_map.handles).count(handle) == 1
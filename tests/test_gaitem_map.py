@@ -0,0 +1,69 @@
+"""Tests for er_save_manager.parser.gaitem_map against a real save file."""
+
+from __future__ import annotations
+
+from io import BytesIO
+
+from er_save_manager.parser import Gaitem
+from er_save_manager.parser.gaitem_map import GaitemMap, GaitemView
+
+
+def _slot_gaitem_bytes(save, slot_idx: int = 0):
+    slot = save.character_slots[slot_idx]
+    base = save.slot_data_offset(slot_idx)
+    start = base + slot.gaitem_offsets[0]
+    end = base + slot.player_game_data_offset - slot.data_start
+    return slot, bytes(save._raw_data[start:end])
+
+
+def test_decode_matches_per_entry_gaitem_read(sanitized_save):
+    slot, data = _slot_gaitem_bytes(sanitized_save)
+    f = BytesIO(data)
+    expected = [Gaitem.read(f) for _ in range(len(slot.gaitem_map))]
+
+    assert slot.gaitem_map.to_list() == expected
+    assert list(slot.gaitem_map.sizes) == [g.get_size() for g in expected]
+
+
+def test_offsets_are_shared_with_slot_and_contiguous(sanitized_save):
+    slot = sanitized_save.character_slots[0]
+    gaitem_map = slot.gaitem_map
+
+    assert slot.gaitem_offsets is gaitem_map.offsets
+    for i in range(1, len(gaitem_map)):
+        assert (
+            gaitem_map.offsets[i] == gaitem_map.offsets[i - 1] + gaitem_map.sizes[i - 1]
+        )
+
+
+def test_write_round_trips_slot_bytes(sanitized_save):
+    slot, data = _slot_gaitem_bytes(sanitized_save)
+    buf = BytesIO()
+    slot.gaitem_map.write(buf)
+    assert buf.getvalue() == data
+
+
+def test_view_edits_write_through_to_arrays(sanitized_save):
+    gaitem_map = sanitized_save.character_slots[0].gaitem_map
+    i = next(i for i, h in enumerate(gaitem_map.handles) if h >> 28 == 0x8)
+
+    row = gaitem_map[i]
+    assert isinstance(row, GaitemView)
+    row.item_id = 1234500
+    assert gaitem_map.item_ids[i] == 1234500
+
+    gaitem_map[i] = Gaitem()
+    assert gaitem_map[i].gaitem_handle == 0
+    assert gaitem_map[i].unk0x10 is None
+    assert gaitem_map.sizes[i] == 8
+    assert gaitem_map.find_handle(0) <= i
+
+
+def test_read_from_plain_bytesio_leaves_stream_after_map(sanitized_save):
+    slot, data = _slot_gaitem_bytes(sanitized_save)
+    f = BytesIO(data + b"tail")
+
+    decoded = GaitemMap.read(f, len(slot.gaitem_map))
+
+    assert f.read() == b"tail"
+    assert decoded.to_list() == slot.gaitem_map.to_list()
@@ -0,0 +1,72 @@
+"""Tests for the array-backed InventoryItemList in er_save_manager.parser.equipment."""
+
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+
+from er_save_manager.parser import Inventory
+from er_save_manager.parser.equipment import (
+    _NUMPY_AVAILABLE,
+    InventoryItem,
+    InventoryItemList,
+    InventoryItemView,
+)
+
+HELD_COMMON_CAPACITY = 0xA80
+HELD_KEY_CAPACITY = 0x180
+
+
+def _held_bytes(save, slot_idx: int = 0) -> bytes:
+    slot = save.character_slots[slot_idx]
+    start = save.slot_data_offset(slot_idx) + slot.inventory_held_offset
+    size = 4 + HELD_COMMON_CAPACITY * 12 + 4 + HELD_KEY_CAPACITY * 12 + 8
+    return bytes(save._raw_data[start : start + size])
+
+
+def test_inventory_round_trips_in_bulk(sanitized_save):
+    data = _held_bytes(sanitized_save)
+    inv = Inventory.read(BytesIO(data), HELD_COMMON_CAPACITY, HELD_KEY_CAPACITY)
+
+    assert isinstance(inv.common_items, InventoryItemList)
+    assert len(inv.common_items) == HELD_COMMON_CAPACITY
+    assert len(inv.key_items) == HELD_KEY_CAPACITY
+
+    buf = BytesIO()
+    inv.write(buf)
+    assert buf.getvalue() == data
+
+
+def test_rows_match_per_item_read(sanitized_save):
+    data = _held_bytes(sanitized_save)
+    inv = Inventory.read(BytesIO(data), HELD_COMMON_CAPACITY, HELD_KEY_CAPACITY)
+
+    f = BytesIO(data[4:])
+    expected = [InventoryItem.read(f) for _ in range(HELD_COMMON_CAPACITY)]
+    assert inv.common_items.to_list() == expected
+    assert list(inv.common_items) == expected
+
+
+def test_view_edits_and_assignment_write_through():
+    items = InventoryItemList.read(BytesIO(bytes(12 * 4)), 4)
+
+    items[1] = InventoryItem(0xB0000001, 3, 7)
+    row = items[1]
+    assert isinstance(row, InventoryItemView)
+    row.quantity = 9
+
+    assert items.to_list()[1] == InventoryItem(0xB0000001, 9, 7)
+    assert items.find_handle(0xB0000001) == 1
+    assert items.find_handle(0) == 0
+    assert items[-1] == InventoryItem()
+    with pytest.raises(IndexError):
+        items[4]
+
+
+@pytest.mark.skipif(not _NUMPY_AVAILABLE, reason="NumPy not installed")
+def test_as_numpy_shares_memory():
+    items = InventoryItemList.read(BytesIO(bytes(12 * 2)), 2)
+    view = items.as_numpy()
+    view["quantity"][0] = 5
+    assert items[0].quantity == 5
@@ -23,8 +23,13 @@ from er_save_manager.parser.inventory_ops import (
     UPGRADE_CAP_ASH,
     UPGRADE_CAP_SOMBER,
     UPGRADE_CAP_STANDARD,
+    ItemAlreadyPresentError,
     add_item,
+    add_items,
+    edit_slot,
     remove_item,
+    remove_items,
+    set_quantities,
     set_quantity,
     validate_upgrade,
 )
@@ -168,7 +173,7 @@ def test_add_item_rejects_unknown_category(sanitized_save):
 def test_add_item_rejects_duplicate_non_talisman(sanitized_save):
     i = _first_active_slot(sanitized_save)
     add_item(sanitized_save, i, TEST_GOODS_ID, quantity=1, location="held")
-    with pytest.raises(ValueError):
+    with pytest.raises(ItemAlreadyPresentError):
         add_item(sanitized_save, i, TEST_GOODS_ID, quantity=1, location="held")
 
 
@@ -361,3 +366,206 @@ def test_set_quantity_does_not_touch_offsets_or_gaitem_map(sanitized_save):
         sanitized_save._raw_data[slot.data_start : slot.data_start + 0x280000]
     )
     _assert_only_inventory_sections_changed(slot, before, after)
+
+
+def test_add_item_weapon_after_zero_copy_load(sanitized_save_path, sanitized_save):
+    from er_save_manager.parser import load_save
+
+    save = load_save(str(sanitized_save_path), zero_copy=True)
+    i = _first_active_slot(save)
+
+    result = add_item(save, i, TEST_WEAPON_ID, quantity=1, location="held")
+
+    slot = save.character_slots[i]
+    assert (
+        slot.gaitem_map[result["gaitem_slot"]].gaitem_handle == result["gaitem_handle"]
+    )
+
+    add_item(sanitized_save, i, TEST_WEAPON_ID, quantity=1, location="held")
+    assert bytes(save._raw_data) == bytes(sanitized_save._raw_data)
+
+
+def test_add_item_on_lazy_loaded_save(sanitized_save_path, sanitized_save):
+    from er_save_manager.parser import load_save
+
+    save = load_save(str(sanitized_save_path), lazy=True)
+    i = _first_active_slot(save)
+
+    add_item(save, i, TEST_WEAPON_ID, quantity=1, location="held")
+    add_item(sanitized_save, i, TEST_WEAPON_ID, quantity=1, location="held")
+
+    assert bytes(save._raw_data) == bytes(sanitized_save._raw_data)
+
+
+# ---------------------------------------------------------------------------
+# add_items (batched transaction)
+# ---------------------------------------------------------------------------
+
+_BATCH_SPECS = [
+    {"full_item_id": TEST_WEAPON_ID, "quantity": 1, "upgrade": 5},
+    {"full_item_id": TEST_ARMOR_ID, "quantity": 1, "location": "storage"},
+    {"full_item_id": TEST_GOODS_ID, "quantity": 3},
+    {"full_item_id": TEST_TALISMAN_ID, "quantity": 1},
+    {"full_item_id": TEST_WEAPON_ID + 10000, "quantity": 1},
+]
+
+
+def test_add_items_matches_consecutive_add_item(sanitized_save_path, sanitized_save):
+    from er_save_manager.parser import load_save
+
+    save = load_save(str(sanitized_save_path))
+    i = _first_active_slot(save)
+
+    expected = [add_item(save, i, **spec) for spec in _BATCH_SPECS]
+    results = add_items(sanitized_save, i, _BATCH_SPECS)
+
+    assert results == expected
+    assert bytes(sanitized_save._raw_data) == bytes(save._raw_data)
+    slot, batched = save.character_slots[i], sanitized_save.character_slots[i]
+    assert batched.event_flags_offset == slot.event_flags_offset
+    assert list(batched.gaitem_offsets) == list(slot.gaitem_offsets)
+
+
+def test_add_items_skips_rejected_items(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    specs = [
+        {"full_item_id": TEST_GOODS_ID, "quantity": 1},
+        {"full_item_id": TEST_GOODS_ID, "quantity": 1},  # duplicate
+        {"full_item_id": 0x30000000 | 1, "quantity": 1},  # unknown category
+        {"full_item_id": TEST_ARMOR_ID, "quantity": 1},
+    ]
+
+    results = add_items(sanitized_save, i, specs)
+
+    assert [isinstance(r.get("error"), ValueError) for r in results] == [
+        False,
+        True,
+        True,
+        False,
+    ]
+    assert str(results[1]["error"]).startswith("item 0x")
+    assert results[3]["gaitem_slot"] is not None
+
+
+def test_add_items_keeps_whole_file_length(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    before = len(sanitized_save._raw_data)
+
+    results = add_items(
+        sanitized_save,
+        i,
+        [{"full_item_id": TEST_WEAPON_ID + n * 10000, "quantity": 1} for n in range(8)],
+    )
+
+    slot = sanitized_save.character_slots[i]
+    assert len(sanitized_save._raw_data) == before
+    for result in results:
+        gaitem = slot.gaitem_map[result["gaitem_slot"]]
+        assert gaitem.gaitem_handle == result["gaitem_handle"]
+
+
+_REMOVE_SPECS = [
+    {"full_item_id": TEST_GOODS_ID},
+    {"full_item_id": TEST_WEAPON_ID},
+    {"full_item_id": TEST_ARMOR_ID, "location": "storage"},
+    {"full_item_id": TEST_WEAPON_ID + 10000},
+]
+
+
+def test_remove_items_matches_consecutive_remove_item(
+    sanitized_save_path, sanitized_save
+):
+    from er_save_manager.parser import load_save
+
+    save = load_save(str(sanitized_save_path))
+    i = _first_active_slot(save)
+    add_items(save, i, _BATCH_SPECS)
+    add_items(sanitized_save, i, _BATCH_SPECS)
+
+    expected = [remove_item(save, i, **spec) for spec in _REMOVE_SPECS]
+    results = remove_items(sanitized_save, i, _REMOVE_SPECS)
+
+    assert results == expected
+    assert bytes(sanitized_save._raw_data) == bytes(save._raw_data)
+    slot, batched = save.character_slots[i], sanitized_save.character_slots[i]
+    assert batched.event_flags_offset == slot.event_flags_offset
+    assert list(batched.gaitem_offsets) == list(slot.gaitem_offsets)
+
+
+def test_remove_items_skips_missing_items(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    add_item(sanitized_save, i, TEST_GOODS_ID, quantity=1, location="held")
+
+    results = remove_items(
+        sanitized_save,
+        i,
+        [{"full_item_id": TEST_GOODS_ID}, {"full_item_id": TEST_GOODS_ID}],
+    )
+
+    assert "error" not in results[0]
+    assert isinstance(results[1]["error"], ValueError)
+
+
+def test_set_quantities_matches_consecutive_set_quantity(
+    sanitized_save_path, sanitized_save
+):
+    from er_save_manager.parser import load_save
+
+    save = load_save(str(sanitized_save_path))
+    i = _first_active_slot(save)
+    specs = [
+        {"full_item_id": TEST_GOODS_ID, "quantity": 9},
+        {"full_item_id": TEST_TALISMAN_ID, "quantity": 2},
+        {"full_item_id": TEST_GOODS_ID, "quantity": 0},  # rejected
+    ]
+    for target in (save, sanitized_save):
+        add_item(target, i, TEST_GOODS_ID, quantity=3, location="held")
+        add_item(target, i, TEST_TALISMAN_ID, quantity=1, location="held")
+
+    for spec in specs[:2]:
+        set_quantity(save, i, **spec)
+    results = set_quantities(sanitized_save, i, specs)
+
+    assert [r["new_quantity"] for r in results[:2]] == [9, 2]
+    assert isinstance(results[2]["error"], ValueError)
+    assert bytes(sanitized_save._raw_data) == bytes(save._raw_data)
+
+
+# ---------------------------------------------------------------------------
+# edit_slot (slot-local write-back)
+# ---------------------------------------------------------------------------
+
+
+def test_edit_slot_defers_writes_to_block_exit(sanitized_save_path, sanitized_save):
+    from er_save_manager.parser import load_save
+
+    save = load_save(str(sanitized_save_path))
+    i = _first_active_slot(save)
+    for spec in _BATCH_SPECS:
+        add_item(save, i, **spec)
+    set_quantity(save, i, TEST_GOODS_ID, quantity=7, location="held")
+
+    before = bytes(sanitized_save._raw_data)
+    with edit_slot(sanitized_save, i):
+        for spec in _BATCH_SPECS:
+            add_item(sanitized_save, i, **spec)
+        set_quantity(sanitized_save, i, TEST_GOODS_ID, quantity=7, location="held")
+        assert bytes(sanitized_save._raw_data) == before
+
+    assert bytes(sanitized_save._raw_data) == bytes(save._raw_data)
+
+
+def test_edit_slot_never_moves_other_slots(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    slot_start = sanitized_save.slot_data_offset(i)
+    before = bytes(sanitized_save._raw_data)
+
+    with edit_slot(sanitized_save, i):
+        add_item(sanitized_save, i, TEST_WEAPON_ID, quantity=1, location="held")
+        add_item(sanitized_save, i, TEST_ARMOR_ID, quantity=1, location="held")
+        remove_item(sanitized_save, i, TEST_WEAPON_ID, location="held")
+
+    after = bytes(sanitized_save._raw_data)
+    assert len(after) == len(before)
+    assert after[:slot_start] == before[:slot_start]
+    assert after[slot_start + 0x280000 :] == before[slot_start + 0x280000 :]
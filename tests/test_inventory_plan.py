@@ -0,0 +1,85 @@
+"""
+Tests for er_save_manager.parser.inventory_plan.
+
+A plan must predict add_items exactly while leaving both the parsed slot
+and the save buffer untouched.
+"""
+
+from __future__ import annotations
+
+from er_save_manager.parser.inventory_ops import add_items
+from er_save_manager.parser.inventory_plan import free_capacity, plan_items
+
+TEST_WEAPON_ID = 88880000
+TEST_ARMOR_ID = 0x10000000 | 88880000
+TEST_TALISMAN_ID = 0x20000000 | 88880000
+TEST_GOODS_ID = 0x40000000 | 88880000
+TEST_GEM_ID = 0x80000000 | 10000
+
+_SPECS = [
+    {"full_item_id": TEST_WEAPON_ID, "quantity": 1, "gem_full_id": TEST_GEM_ID},
+    {"full_item_id": TEST_ARMOR_ID, "quantity": 1, "location": "storage"},
+    {"full_item_id": TEST_GOODS_ID, "quantity": 3},
+    {"full_item_id": TEST_GOODS_ID, "quantity": 3},  # duplicate, rejected
+    {"full_item_id": TEST_TALISMAN_ID, "quantity": 1},
+]
+
+
+def _first_active_slot(save):
+    for i, slot in enumerate(save.character_slots):
+        if not slot.is_empty():
+            return i
+    raise AssertionError("fixture save has no active character slots")
+
+
+def _comparable(items):
+    return [
+        {key: str(value) if key == "error" else value for key, value in item.items()}
+        for item in items
+    ]
+
+
+def _fill_held_common(slot):
+    rows = slot.inventory_held.common_items.rows
+    for i in range(0, len(rows), 3):
+        if not rows[i]:
+            rows[i : i + 3] = type(rows)("I", [0xB0000000 | 0x700000 | i, 1, 0])
+
+
+def test_plan_matches_add_items_and_changes_nothing(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    slot = sanitized_save.character_slots[i]
+    raw = bytes(sanitized_save._raw_data)
+    handles = slot.gaitem_map.handles.tobytes()
+    held_rows = slot.inventory_held.common_items.rows.tobytes()
+
+    plan = plan_items(sanitized_save, i, _SPECS)
+
+    assert bytes(sanitized_save._raw_data) == raw
+    assert slot.gaitem_map.handles.tobytes() == handles
+    assert slot.inventory_held.common_items.rows.tobytes() == held_rows
+
+    free_before = free_capacity(slot)
+    results = add_items(sanitized_save, i, _SPECS)
+    assert _comparable(plan.items) == _comparable(results)
+    assert len(plan.added) == 4 and len(plan.rejected) == 1
+    assert plan.free_before == free_before
+    assert plan.free_after == free_capacity(slot)
+    # Weapon (8 -> 21 bytes), its Ash of War (8 -> 8) and the armor (8 -> 16)
+    assert len(plan.gaitem_slots) == 3
+    assert plan.map_growth == 13 + 0 + 8
+
+
+def test_plan_reports_held_to_storage_overflow(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    slot = sanitized_save.character_slots[i]
+    _fill_held_common(slot)
+
+    plan = plan_items(
+        sanitized_save, i, [{"full_item_id": TEST_GOODS_ID, "quantity": 1}]
+    )
+
+    assert plan.free_before["held_common"] == 0
+    (item,) = plan.overflow
+    assert item["location"] == "storage"
+    assert plan.free_after["storage_common"] == plan.free_before["storage_common"] - 1
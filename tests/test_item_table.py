@@ -0,0 +1,88 @@
+"""
+Tests for er_save_manager.data.item_table.
+
+The generated table must agree with the ItemDatabase and the key id list it
+is built from, and its disk cache must round-trip and be rebuilt when stale.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from er_save_manager.data import item_table
+from er_save_manager.data.item_database import ItemCategory, get_item_database
+from er_save_manager.data.item_table import (
+    KEY_ITEM_BASE_IDS,
+    build_item_table,
+    load_item_table,
+    max_quantity,
+)
+
+_GAITEM_SIZES = {ItemCategory.WEAPON: 21, ItemCategory.ARMOR: 16, ItemCategory.GEM: 8}
+
+
+def test_table_matches_item_database():
+    db = get_item_database()
+    table = build_item_table(db)
+
+    for full_id, item in db.items_by_id.items():
+        if full_id < 0:
+            continue
+        traits = table.traits(full_id)
+        assert traits.known
+        assert traits.category == item.category
+        assert traits.gaitem_size == _GAITEM_SIZES.get(item.category, 0)
+        assert traits.max_held == max_quantity(item, "held")
+        assert traits.max_storage == max_quantity(item, "storage")
+        assert traits.max_upgrade == item.max_upgrade
+        assert traits.key_item == (
+            item.category == ItemCategory.GOODS
+            and (full_id & 0x0FFFFFFF) in KEY_ITEM_BASE_IDS
+        )
+
+    for base_id in KEY_ITEM_BASE_IDS:
+        assert table.traits(ItemCategory.GOODS | base_id).key_item
+        assert not table.traits(ItemCategory.TALISMAN | base_id).key_item
+
+
+def test_traits_fallbacks_and_caps():
+    db = get_item_database()
+    table = build_item_table(db)
+    weapon = next(
+        item
+        for item in db.get_items_by_category("Melee Weapons")
+        if item.reinforcement == "somber"
+    )
+
+    # Infusion and upgrade folded into the id resolve to the base weapon
+    infused = table.traits(weapon.full_id + 100 + 5)
+    assert infused == table.traits(weapon.full_id)
+    assert infused.upgrade_cap() == 10
+    assert infused.upgrade_cap(convergence=True) == 15
+    assert infused.upgrade_cap(reinforcement="standard") == 25
+
+    ashes = db.get_items_by_category("Ashes")[0]
+    assert table.traits(ashes.full_id).reinforcement == "ash"
+
+    unknown = table.traits(ItemCategory.ARMOR | 0x0FFFFFF0)
+    assert not unknown.known
+    assert unknown.gaitem_size == 16
+    assert unknown.max_stack("held") == unknown.max_stack("storage") == 0
+
+
+def test_cache_round_trips_and_rebuilds_when_stale(tmp_path, monkeypatch):
+    path = tmp_path / "item_table.bin"
+    built = load_item_table(path)
+    assert path.exists()
+
+    def no_build(db=None):
+        raise AssertionError("table rebuilt from a fresh cache")
+
+    monkeypatch.setattr(item_table, "build_item_table", no_build)
+    cached = load_item_table(path)
+    assert cached.words == built.words
+    assert cached.convergence == built.convergence
+
+    monkeypatch.setattr(item_table, "_signature", lambda: b"\0" * 16)
+    with pytest.raises(AssertionError, match="rebuilt"):
+        load_item_table(path)
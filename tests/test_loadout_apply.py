@@ -0,0 +1,109 @@
+"""
+Tests for er_save_manager.editors.loadout_apply.
+
+A loadout must land exactly as add_items would place it, with duplicate
+and already-held stacks merged and invalid entries reported, not added.
+"""
+
+from __future__ import annotations
+
+from er_save_manager.data.item_database import get_item_database
+from er_save_manager.editors.loadout_apply import apply_loadout
+from er_save_manager.parser.inventory_ops import add_items
+
+
+def _first_active_slot(save):
+    for i, slot in enumerate(save.character_slots):
+        if not slot.is_empty():
+            return i
+    raise AssertionError("fixture save has no active character slots")
+
+
+def _entry(item, qty=1, location="held"):
+    return {
+        "full_id": item.full_id,
+        "qty": qty,
+        "upg": 0,
+        "location": location,
+        "aow_id": 0,
+        "reinforcement": item.reinforcement,
+        "name_label": item.name,
+    }
+
+
+def _payload():
+    db = get_item_database()
+    return (
+        [_entry(item) for item in db.get_items_by_category("Melee Weapons")[:40]]
+        + [_entry(item) for item in db.get_items_by_category("Armor")[:40]]
+        + [_entry(item) for item in db.get_items_by_category("Talismans")[:20]]
+    )
+
+
+def test_loadout_matches_add_items(sanitized_save, sanitized_save_path):
+    from er_save_manager.parser import load_save
+
+    i = _first_active_slot(sanitized_save)
+    payload = _payload()
+    reports = []
+
+    result = apply_loadout(
+        sanitized_save, i, payload, progress=lambda *args: reports.append(args)
+    )
+
+    expected = load_save(str(sanitized_save_path))
+    add_items(
+        expected,
+        i,
+        [
+            {
+                "full_item_id": entry["full_id"],
+                "quantity": 1,
+                "location": "held",
+                "reinforcement": entry["reinforcement"],
+            }
+            for entry in payload
+        ],
+    )
+    assert result.added == payload
+    assert bytes(sanitized_save._raw_data) == bytes(expected._raw_data)
+    assert reports[-1] == (len(payload), len(payload))
+
+
+def test_loadout_merges_stacks_and_reports_bad_entries(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    db = get_item_database()
+    stackable = next(
+        item
+        for item in db.get_items_by_category("Crafting Materials")
+        if item.max_num >= 10
+    )
+    unique = db.get_items_by_category("Key Items")[0]
+    weapon = db.get_items_by_category("Melee Weapons")[0]
+
+    apply_loadout(sanitized_save, i, [_entry(stackable, 2, "storage")])
+    payload = [
+        _entry(stackable, 3, "storage"),
+        _entry(stackable, 4, "storage"),
+        _entry(unique),
+        _entry(unique),
+        {**_entry(weapon), "full_id": 0x0FFFFFF0},
+        {**_entry(weapon), "upg": 99},
+        _entry(stackable, 10_000),
+    ]
+    result = apply_loadout(sanitized_save, i, payload)
+
+    statuses = [item["status"] for item in result.items]
+    assert statuses[:2] == ["stacked", "stacked"]
+    assert statuses[2] in ("added", "skipped")
+    assert statuses[3] == "skipped"
+    assert statuses[4:] == ["error"] * 3
+
+    slot = sanitized_save.character_slots[i]
+    handle = 0xB0000000 | (stackable.full_id & 0x0FFFFFFF)
+    rows = [
+        row
+        for row in slot.inventory_storage_box.common_items
+        if row.gaitem_handle == handle
+    ]
+    assert rows[0].quantity >= 2 + 3 + 4
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from er_save_manager.parser import Save, load_save
+from er_save_manager.parser import LazyUserDataX, Save, UserDataX, load_save
 
 SLOT_COUNT = 10
 CHECKSUM_SIZE = 0x10
@@ -54,3 +54,119 @@ def test_get_slot_rejects_out_of_range_index(sanitized_save):
 
     with pytest.raises(IndexError):
         sanitized_save.get_slot(-1)
+
+
+def test_zero_copy_load_parses_identically(sanitized_save_path, sanitized_save):
+    save = load_save(str(sanitized_save_path), zero_copy=True)
+
+    for a, b in zip(save.character_slots, sanitized_save.character_slots, strict=True):
+        if a.is_empty():
+            continue
+        assert isinstance(a.event_flags, memoryview)
+        assert bytes(a.event_flags) == bytes(b.event_flags)
+        assert bytes(a.rest) == bytes(b.rest)
+        assert a.gaitem_offsets == b.gaitem_offsets
+    assert bytes(save.user_data_11) == bytes(sanitized_save.user_data_11)
+
+
+def test_zero_copy_views_share_raw_data(sanitized_save_path):
+    save = load_save(str(sanitized_save_path), zero_copy=True)
+    slot = save.character_slots[0]
+    assert slot.event_flags.obj is save._raw_data
+
+    start = slot.event_flags_offset
+    save._raw_data[start : start + 4] = b"\xff\xff\xff\xff"
+    assert bytes(slot.event_flags[:4]) == b"\xff\xff\xff\xff"
+    edited = bytes(slot.event_flags)
+
+    save._raw_data.extend(b"\x00")  # resizing detaches the views first
+    assert isinstance(slot.event_flags, bytes)
+    assert slot.event_flags == edited
+    assert isinstance(save.user_data_11, bytes)
+
+
+def test_replacing_raw_data_detaches_zero_copy_views(sanitized_save_path):
+    save = load_save(str(sanitized_save_path), zero_copy=True)
+    slot = save.character_slots[0]
+    before = bytes(slot.event_flags)
+
+    save._raw_data = bytearray(save._raw_data)
+
+    assert isinstance(slot.event_flags, bytes)
+    assert slot.event_flags == before
+
+
+def test_lazy_load_defers_slot_parse(sanitized_save_path, sanitized_save):
+    save = load_save(str(sanitized_save_path), lazy=True)
+
+    for lazy, eager in zip(
+        save.character_slots, sanitized_save.character_slots, strict=True
+    ):
+        assert type(lazy) is LazyUserDataX
+        assert lazy.get_level() == eager.get_level()
+        assert lazy.get_character_name() == eager.get_character_name()
+        assert lazy.map_id.to_decimal() == eager.map_id.to_decimal()
+        assert type(lazy) is LazyUserDataX
+
+
+def test_lazy_slot_materializes_on_first_access(sanitized_save_path, sanitized_save):
+    save = load_save(str(sanitized_save_path), lazy=True)
+    slot = save.character_slots[0]
+    eager = sanitized_save.character_slots[0]
+
+    assert slot.gaitem_offsets == eager.gaitem_offsets
+    assert type(slot) is UserDataX
+    assert slot.inventory_held_offset == eager.inventory_held_offset
+    assert slot.steamid_offset == eager.steamid_offset
+    assert type(save.character_slots[1]) is LazyUserDataX
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_parallel_parse_matches_serial(sanitized_save_path, sanitized_save, backend):
+    from er_save_manager.parser.slot_rebuild import rebuild_slot
+
+    save = load_save(str(sanitized_save_path), workers=2, backend=backend)
+
+    assert len(save.character_slots) == SLOT_COUNT
+    for parallel, serial in zip(
+        save.character_slots, sanitized_save.character_slots, strict=True
+    ):
+        assert parallel.data_start == serial.data_start
+        assert parallel.steamid_offset == serial.steamid_offset
+        assert rebuild_slot(parallel) == rebuild_slot(serial)
+
+
+def test_parallel_parse_rejects_unknown_backend(sanitized_save_path):
+    with pytest.raises(ValueError):
+        load_save(str(sanitized_save_path), workers=2, backend="gpu")
+
+
+def test_open_mmap_parses_like_from_file(sanitized_save_path, sanitized_save):
+    with Save.open_mmap(str(sanitized_save_path)) as save:
+        assert save._raw_data.mapped
+        assert save._raw_data == sanitized_save._raw_data
+        assert save.user_data_11 == sanitized_save.user_data_11
+        for mapped, eager in zip(
+            save.character_slots, sanitized_save.character_slots, strict=True
+        ):
+            assert mapped.get_character_name() == eager.get_character_name()
+            assert mapped.has_corruption() == eager.has_corruption()
+        assert save._raw_data.mapped
+
+
+def test_open_mmap_copies_on_first_write(sanitized_save_copy):
+    original = sanitized_save_copy.read_bytes()
+    save = Save.open_mmap(str(sanitized_save_copy))
+    offset = save.slot_data_offset(0)
+
+    save._raw_data[offset : offset + 4] = b"\xff\xff\xff\xff"
+
+    assert not save._raw_data.mapped
+    assert save.dirty_slots() == [0]
+    assert sanitized_save_copy.read_bytes() == original
+
+    save.recalculate_checksums()
+    save.to_file(str(sanitized_save_copy))
+    reloaded = load_save(str(sanitized_save_copy))
+    assert reloaded._raw_data[offset : offset + 4] == b"\xff\xff\xff\xff"
+    assert reloaded._raw_data[offset + 4 :] == original[offset + 4 :]
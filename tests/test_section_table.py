@@ -0,0 +1,98 @@
+"""
+Tests for er_save_manager.parser.section_table.
+
+The table recorded on read must agree with the layout rebuild_slot_with_map
+produces, keep the legacy *_offset attributes working, and stay correct
+when inventory_ops grows the gaitem map.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from er_save_manager.parser.inventory_ops import add_item
+from er_save_manager.parser.section_table import SECTION_NAMES, SectionTable
+from er_save_manager.parser.slot_rebuild import rebuild_slot_with_map
+
+TEST_WEAPON_ID = 88880000
+
+_EQUIPPED_OFFSETS = (
+    "equipped_items_equip_index_offset",
+    "active_weapon_slots_and_arm_style_offset",
+    "equipped_items_item_id_offset",
+    "equipped_items_gaitem_handle_offset",
+    "equipped_spells_offset",
+    "equipped_items_offset",
+    "equipped_armaments_and_items_offset",
+    "equipped_physics_offset",
+)
+
+
+def _first_active_slot(save):
+    for i, slot in enumerate(save.character_slots):
+        if not slot.is_empty():
+            return i
+    raise AssertionError("fixture save has no active character slots")
+
+
+def _assert_matches_rebuild(slot):
+    _, rebuilt = rebuild_slot_with_map(slot)
+    table = slot.sections
+    checked = 0
+    for section in rebuilt:
+        if section["name"] in SECTION_NAMES and table.has(section["name"]):
+            assert table.start(section["name"]) == section["start"], section["name"]
+            checked += 1
+    assert checked > 40
+
+
+def test_table_matches_rebuild_layout(sanitized_save):
+    slot = sanitized_save.character_slots[_first_active_slot(sanitized_save)]
+    _assert_matches_rebuild(slot)
+
+    start, end = slot.sections.span("gaitem_map")
+    assert start == slot.gaitem_offsets[0]
+    assert end - start == sum(slot.gaitem_map.sizes)
+
+
+def test_legacy_offsets_read_through_table(sanitized_save):
+    slot = sanitized_save.character_slots[_first_active_slot(sanitized_save)]
+    sections = slot.sections
+
+    # Absolute file offsets
+    assert slot.horse_offset == slot.data_start + sections.start("horse")
+    assert slot.coordinates_offset == slot.data_start + sections.start(
+        "player_coordinates"
+    )
+    # Relative to slot data start
+    assert slot.inventory_held_offset == sections.start("inventory_held")
+    assert slot.inventory_storage_offset == sections.start("inventory_storage_box")
+
+    slot.horse_offset = 0
+    assert not sections.has("horse")
+    assert slot.horse_offset == 0
+
+
+def test_relocate_shifts_every_later_section(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    slot = sanitized_save.character_slots[i]
+    before = {name: getattr(slot, name) for name in _EQUIPPED_OFFSETS}
+    map_start = slot.sections.start("gaitem_map")
+
+    # A weapon replacing an empty entry grows the map by 13 bytes
+    add_item(sanitized_save, i, TEST_WEAPON_ID, quantity=1, location="held")
+
+    assert slot.sections.start("gaitem_map") == map_start
+    for name, offset in before.items():
+        assert getattr(slot, name) == offset + 13, name
+    _assert_matches_rebuild(slot)
+
+
+def test_unrecorded_section_raises():
+    table = SectionTable()
+    table.mark("version", 0)
+    table.mark("map_id", 4)
+    assert table.span("version") == (0, 4)
+    assert table.span("map_id") == (4, 0x280000)
+    with pytest.raises(KeyError):
+        table.start("horse")
@@ -0,0 +1,116 @@
+"""
+Tests for er_save_manager.parser.slot_index.
+
+The index must answer every lookup exactly like the linear scans it
+replaces, both on a freshly parsed slot and after inventory_ops has
+added and removed items through it.
+"""
+
+from __future__ import annotations
+
+from er_save_manager.parser.gaitem_map import Gaitem
+from er_save_manager.parser.inventory_ops import add_item, remove_item
+from er_save_manager.parser.slot_index import slot_index
+
+_PREFIX_WEAPON = 0x80000000
+_PREFIX_ARMOR = 0x90000000
+_PREFIX_GEM = 0xC0000000
+
+TEST_WEAPON_ID = 88880000
+TEST_ARMOR_ID = 0x10000000 | 88880000
+TEST_GOODS_ID = 0x40000000 | 88880000
+
+
+def _first_active_slot(save):
+    for i, slot in enumerate(save.character_slots):
+        if not slot.is_empty():
+            return i
+    raise AssertionError("fixture save has no active character slots")
+
+
+def _scan_max_counter(handles) -> int:
+    return max(
+        (
+            h & 0xFFFF
+            for h in handles
+            if h and h & 0xF0000000 in (_PREFIX_WEAPON, _PREFIX_ARMOR, _PREFIX_GEM)
+        ),
+        default=0,
+    )
+
+
+def _scan_max_acquisition(slot) -> int:
+    max_seen = 0
+    for inv in (slot.inventory_held, slot.inventory_storage_box):
+        for items in (inv.common_items, inv.key_items):
+            rows = items.rows
+            for i in range(0, len(rows), 3):
+                acq = rows[i + 2]
+                if rows[i] != 0 and acq < 0x7FFFFFFF and acq > max_seen:
+                    max_seen = acq
+    return max_seen
+
+
+def _assert_matches_scan(slot):
+    index = slot_index(slot)
+    gaitems = index.gaitems
+    handles = list(slot.gaitem_map.handles)
+    empty = [i for i, h in enumerate(handles) if h == 0]
+    weapons = [i for i, h in enumerate(handles) if h & 0xF0000000 == _PREFIX_WEAPON]
+
+    assert gaitems.first_empty() == (empty[0] if empty else -1)
+    assert gaitems.last_empty() == (empty[-1] if empty else -1)
+    assert gaitems.first_weapon() == (weapons[0] if weapons else -1)
+    assert gaitems.max_counter() == _scan_max_counter(handles)
+    for i, handle in enumerate(handles):
+        if handle:
+            assert gaitems.find_handle(handle) == handles.index(handle)
+            assert i in gaitems.entries_for_item(slot.gaitem_map.item_ids[i])
+
+    for inv in (slot.inventory_held, slot.inventory_storage_box):
+        for items in (inv.common_items, inv.key_items):
+            item_handles = list(items.rows[0::3])
+            for handle in set(item_handles):
+                assert index.items(items).find_handle(handle) == item_handles.index(
+                    handle
+                )
+    assert index.max_acquisition() == _scan_max_acquisition(slot)
+
+
+def test_index_matches_linear_scans_on_parsed_slot(sanitized_save):
+    slot = sanitized_save.character_slots[_first_active_slot(sanitized_save)]
+    _assert_matches_scan(slot)
+
+
+def test_index_tracks_add_and_remove(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    slot = sanitized_save.character_slots[i]
+    gaitems = slot_index(slot).gaitems
+
+    weapon = add_item(sanitized_save, i, TEST_WEAPON_ID, quantity=1, location="held")
+    add_item(sanitized_save, i, TEST_ARMOR_ID, quantity=1, location="storage")
+    add_item(sanitized_save, i, TEST_GOODS_ID, quantity=3, location="held")
+    _assert_matches_scan(slot)
+    assert gaitems.find_handle(weapon["gaitem_handle"]) == weapon["gaitem_slot"]
+
+    remove_item(sanitized_save, i, TEST_WEAPON_ID, location="held")
+    remove_item(sanitized_save, i, TEST_GOODS_ID, location="held")
+    _assert_matches_scan(slot)
+    assert gaitems.find_handle(weapon["gaitem_handle"]) == -1
+    # Kept in sync by the ops themselves, never rebuilt
+    assert slot_index(slot).gaitems is gaitems
+
+
+def test_index_rebuilds_after_external_edit(sanitized_save):
+    slot = sanitized_save.character_slots[_first_active_slot(sanitized_save)]
+    gaitems = slot_index(slot).gaitems
+    last_empty = gaitems.last_empty()
+
+    # An editor writing the map directly, without reporting the change
+    slot.gaitem_map[last_empty] = Gaitem(
+        gaitem_handle=_PREFIX_ARMOR | 0x00800000 | 0xFFF0,
+        item_id=TEST_ARMOR_ID,
+    )
+
+    assert slot_index(slot).gaitems.last_empty() != last_empty
+    _assert_matches_scan(slot)
@@ -0,0 +1,158 @@
+"""
+Tests for er_save_manager.parser.snapshots.
+
+Undo and redo must restore the exact bytes, keep only the changed extents,
+re-derive the parsed slots they touch, and drop the history when the
+buffer is replaced behind the log's back, and carry the history over a
+reload of the file the app itself wrote.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from er_save_manager.backup.manager import BackupManager
+from er_save_manager.parser import load_save
+from er_save_manager.parser.dirty_tracking import TrackedBuffer
+from er_save_manager.parser.inventory_ops import add_item
+from er_save_manager.parser.snapshots import carry_over, snapshots
+
+TEST_WEAPON_ID = 88880000
+
+
+def _first_active_slot(save):
+    for i, slot in enumerate(save.character_slots):
+        if not slot.is_empty():
+            return i
+    raise AssertionError("fixture save has no active character slots")
+
+
+def test_undo_redo_restore_exact_bytes(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    stack = snapshots(sanitized_save)
+    original = bytes(sanitized_save._raw_data)
+
+    stack.checkpoint("add_item")
+    # Grows the gaitem map: an insert/delete pair inside the slot
+    add_item(sanitized_save, i, TEST_WEAPON_ID, quantity=1, location="held")
+    stack.checkpoint("runes")
+    offset = sanitized_save.slot_data_offset(i) + 0x100
+    sanitized_save._raw_data[offset : offset + 4] = b"\x01\x02\x03\x04"
+    edited = bytes(sanitized_save._raw_data)
+
+    assert stack.undo_labels() == ["add_item"]
+    assert stack.undo() == "runes"
+    assert stack.undo() == "add_item"
+    assert stack.undo() is None
+    assert bytes(sanitized_save._raw_data) == original
+
+    assert stack.redo() == "add_item"
+    assert stack.redo() == "runes"
+    assert bytes(sanitized_save._raw_data) == edited
+    assert not stack.can_redo
+
+
+def test_step_stores_only_changed_bytes(sanitized_save):
+    stack = snapshots(sanitized_save)
+    start = sanitized_save.slot_data_offset(_first_active_slot(sanitized_save))
+
+    stack.checkpoint("byte_loop")
+    for offset in range(start, start + 64):
+        sanitized_save._raw_data[offset] = 0xAB
+    # A whole-slot rewrite that changes one block is diffed block by block
+    slot_bytes = bytearray(sanitized_save._raw_data[start : start + 0x280000])
+    slot_bytes[0x20000] ^= 0xFF
+    sanitized_save._raw_data[start : start + 0x280000] = slot_bytes
+    stack.checkpoint("next")
+
+    assert stack.nbytes == 64 + 0x1000
+
+
+def test_undo_rederives_touched_slots(sanitized_save):
+    i = _first_active_slot(sanitized_save)
+    before = sanitized_save.character_slots[i].gaitem_map.handles.tobytes()
+    others = list(sanitized_save.character_slots)
+    stack = snapshots(sanitized_save)
+
+    stack.checkpoint("add_item")
+    add_item(sanitized_save, i, TEST_WEAPON_ID, quantity=1, location="held")
+    assert sanitized_save.character_slots[i].gaitem_map.handles.tobytes() != before
+
+    stack.undo()
+    slot = sanitized_save.character_slots[i]
+    assert slot is not others[i]
+    assert slot.gaitem_map.handles.tobytes() == before
+    for j, other in enumerate(others):
+        if j != i:
+            assert sanitized_save.character_slots[j] is other
+
+
+def test_replaced_buffer_clears_history(sanitized_save):
+    stack = snapshots(sanitized_save)
+    start = sanitized_save.slot_data_offset(_first_active_slot(sanitized_save))
+
+    stack.checkpoint("edit")
+    sanitized_save._raw_data[start] ^= 0xFF
+    # Same content: the log follows the new buffer
+    sanitized_save._raw_data = bytearray(sanitized_save._raw_data)
+    assert stack.can_undo
+
+    data = bytearray(sanitized_save._raw_data)
+    data[start + 1] ^= 0xFF
+    sanitized_save._raw_data = data
+    assert isinstance(sanitized_save._raw_data, TrackedBuffer)
+    assert not stack.can_undo
+    assert stack.undo() is None
+
+
+def test_reload_after_write_keeps_history(sanitized_save_copy):
+    save = load_save(str(sanitized_save_copy))
+    start = save.slot_data_offset(_first_active_slot(save))
+    stack = snapshots(save)
+
+    stack.checkpoint("edit")
+    save._raw_data[start] ^= 0xFF
+    save.to_file(str(sanitized_save_copy))
+    reloaded = load_save(str(sanitized_save_copy))
+
+    assert carry_over(save, reloaded)
+    assert snapshots(reloaded) is stack
+    assert stack.undo() == "edit"
+    assert reloaded._raw_data[start] == save._raw_data[start] ^ 0xFF
+
+
+def test_reload_of_changed_file_drops_history(sanitized_save_copy):
+    save = load_save(str(sanitized_save_copy))
+    start = save.slot_data_offset(_first_active_slot(save))
+    stack = snapshots(save)
+
+    stack.checkpoint("edit")
+    save._raw_data[start] ^= 0xFF
+    # Written elsewhere (the game), not from save
+    reloaded = load_save(str(sanitized_save_copy))
+
+    assert not carry_over(save, reloaded)
+    assert not stack.can_undo
+    assert snapshots(reloaded) is not stack
+
+
+def test_checkpoint_backs_up_each_external_file_state(sanitized_save_copy):
+    pytest.importorskip("customtkinter")  # create_backup reads the UI settings
+    manager = BackupManager(sanitized_save_copy)
+    save = load_save(str(sanitized_save_copy))
+    start = save.slot_data_offset(_first_active_slot(save))
+
+    assert manager.checkpoint(operation="first", save=save) is not None
+    save._raw_data[start] ^= 0xFF
+    save.to_file(str(sanitized_save_copy))
+    reloaded = load_save(str(sanitized_save_copy))
+    carry_over(save, reloaded)
+    # Only this app wrote the file since the last backup
+    assert manager.checkpoint(operation="second", save=reloaded) is None
+
+    data = bytearray(sanitized_save_copy.read_bytes())
+    data[start + 1] ^= 0xFF
+    sanitized_save_copy.write_bytes(data)
+    rewritten = load_save(str(sanitized_save_copy))
+    carry_over(reloaded, rewritten)
+    assert manager.checkpoint(operation="third", save=rewritten) is not None
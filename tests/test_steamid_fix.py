@@ -74,3 +74,26 @@ def test_apply_is_no_op_when_already_synced(sanitized_save):
 
     result = SteamIdFix().apply(sanitized_save, i)
     assert result.applied is False
+
+
+def test_find_steamids_in_mapped_file_matches_bytes_scan(sanitized_save_copy):
+    import mmap
+    import struct
+
+    from er_save_manager.games.generic_steamid import find_steamids_in_file
+
+    steam_id = 76561198000000001
+    data = bytearray(sanitized_save_copy.read_bytes())
+    data[0x1000:0x1008] = struct.pack("<Q", steam_id)
+    data[-8:] = struct.pack("<Q", steam_id)
+    sanitized_save_copy.write_bytes(data)
+
+    with (
+        open(sanitized_save_copy, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        found = find_steamids_in_file(mapped)
+
+    assert found == find_steamids_in_file(bytes(data))
+    assert found[steam_id][0] == 0x1000
+    assert found[steam_id][-1] == len(data) - 8
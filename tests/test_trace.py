@@ -0,0 +1,80 @@
+"""Tests for opt-in stage tracing of the load/save paths."""
+
+from __future__ import annotations
+
+import pytest
+
+from er_save_manager import cli
+from er_save_manager.parser import load_save
+from er_save_manager.parser import trace as parse_trace
+
+
+@pytest.fixture
+def tracing():
+    parse_trace.disable()
+    trace = parse_trace.enable()
+    yield trace
+    parse_trace.disable()
+
+
+def test_load_and_save_record_stages_with_bytes(tracing, sanitized_save_copy):
+    save = load_save(str(sanitized_save_copy))
+    save.patch(save.slot_data_offset(0), b"\x01")
+    save.recalculate_checksums()
+    save.to_file(str(sanitized_save_copy))
+
+    by_name = {row["name"]: row for row in tracing.summary()}
+    for name in ("read_file", "header", "slot", "slot.gaitem_map", "checksums"):
+        assert name in by_name
+    assert by_name["read_file"]["bytes"] == sanitized_save_copy.stat().st_size
+    assert by_name["write"]["bytes"] == sanitized_save_copy.stat().st_size
+    assert by_name["slot.event_flags"]["bytes"] > 0
+
+    slot_events = [e for e in tracing.events if e["name"] == "slot"]
+    assert {e["slot"] for e in slot_events} <= set(range(10))
+    nested = [e for e in tracing.events if e["name"] == "slot.gaitem_map"]
+    assert all(e["depth"] > 0 for e in nested)
+
+
+def test_disabled_tracing_records_nothing(sanitized_save_path):
+    parse_trace.disable()
+    load_save(str(sanitized_save_path))
+    assert parse_trace.active() is None
+    with parse_trace.stage("noop") as event:
+        assert event is None
+
+
+def test_format_summary_lists_slowest_first():
+    events = [
+        {"name": "fast", "duration_ms": 1.0, "start_ms": 0.0, "depth": 0},
+        {"name": "slow", "duration_ms": 5.0, "start_ms": 1.0, "depth": 0},
+        {"name": "slow", "duration_ms": 4.0, "start_ms": 6.0, "depth": 0},
+    ]
+    lines = parse_trace.format_summary(events).splitlines()
+    assert lines[1].split()[:3] == ["slow", "2", "9.00"]
+    assert lines[2].split()[0] == "fast"
+
+
+def test_cli_trace_flag_writes_readable_trace(sanitized_save_path, tmp_path, capsys):
+    trace_file = tmp_path / "trace.json"
+    assert (
+        cli.main(
+            ["--trace", str(trace_file), "list", "--save", str(sanitized_save_path)]
+        )
+        == 0
+    )
+    assert parse_trace.active() is None
+
+    data = parse_trace.load(trace_file)
+    assert any(e["name"] == "open_mmap" for e in data["events"])
+
+    capsys.readouterr()
+    assert cli.main(["trace", str(trace_file), "--events"]) == 0
+    assert "open_mmap" in capsys.readouterr().out
+
+
+def test_load_rejects_non_trace_json(tmp_path):
+    path = tmp_path / "other.json"
+    path.write_text("[]", encoding="utf-8")
+    with pytest.raises(ValueError):
+        parse_trace.load(path)
@@ -0,0 +1,187 @@
+"""Tests for journaled (changed-extents-only) writes via Save.to_file."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from er_save_manager.parser import load_save
+from er_save_manager.parser import save as save_module
+from er_save_manager.parser.inventory_ops import add_item
+from er_save_manager.parser.write_journal import (
+    can_reflink,
+    journal_path,
+    journaled_write,
+    read_journal,
+    replay_journal,
+    write_journal,
+)
+
+TEST_WEAPON_ID = 88880000
+
+
+def _leftovers(directory) -> list[str]:
+    return [
+        p.name for p in directory.iterdir() if ".tmp" in p.name or "journal" in p.name
+    ]
+
+
+@pytest.fixture
+def reflink(monkeypatch):
+    """Take the journaled path even where the test filesystem cannot reflink."""
+    monkeypatch.setattr(save_module, "can_reflink", lambda target: True)
+
+
+def test_journaled_write_matches_full_write(sanitized_save_copy, reflink):
+    save = load_save(str(sanitized_save_copy))
+    offset = save.slot_data_offset(2) + 0x100
+    save.patch(offset, b"\x01\x02\x03\x04")
+    save.recalculate_checksums()
+    ranges = save._raw_data.journal_ranges()
+
+    save.to_file(str(sanitized_save_copy), journaled=True)
+
+    assert sanitized_save_copy.read_bytes() == bytes(save._raw_data)
+    checksum = save._slot_offsets[2]
+    assert ranges == [(checksum, checksum + 16), (offset, offset + 4)]
+    assert save._raw_data.journal_ranges() == []
+    assert _leftovers(sanitized_save_copy.parent) == []
+
+
+def test_journaled_write_after_gaitem_insert_matches_full_write(
+    sanitized_save_copy, reflink
+):
+    save = load_save(str(sanitized_save_copy))
+    i = next(i for i, slot in enumerate(save.character_slots) if not slot.is_empty())
+
+    add_item(save, i, TEST_WEAPON_ID, quantity=1, location="held")
+    save.recalculate_checksums()
+    save.to_file(str(sanitized_save_copy), journaled=True)
+
+    assert sanitized_save_copy.read_bytes() == bytes(save._raw_data)
+
+
+def test_journaled_write_falls_back_when_file_changed_on_disk(sanitized_save_copy):
+    save = load_save(str(sanitized_save_copy))
+    save.patch(save.slot_data_offset(0), b"\xaa")
+    st = sanitized_save_copy.stat()
+    os.utime(sanitized_save_copy, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    save.to_file(str(sanitized_save_copy), journaled=True)
+
+    assert sanitized_save_copy.read_bytes() == bytes(save._raw_data)
+
+
+def test_journaled_write_without_changes_leaves_file_alone(sanitized_save_copy):
+    save = load_save(str(sanitized_save_copy))
+    mtime = sanitized_save_copy.stat().st_mtime_ns
+
+    save.to_file(str(sanitized_save_copy), journaled=True)
+
+    assert sanitized_save_copy.stat().st_mtime_ns == mtime
+
+
+def test_journaled_write_without_reflink_writes_whole_file(
+    sanitized_save_copy, monkeypatch
+):
+    def no_journal(*args):
+        raise AssertionError("journaled without reflink support")
+
+    monkeypatch.setattr(save_module, "can_reflink", lambda target: False)
+    monkeypatch.setattr(save_module, "journaled_write", no_journal)
+    save = load_save(str(sanitized_save_copy))
+    save.patch(save.slot_data_offset(0), b"\xaa")
+
+    save.to_file(str(sanitized_save_copy), journaled=True)
+
+    assert sanitized_save_copy.read_bytes() == bytes(save._raw_data)
+    assert save._raw_data.journal_ranges() == []
+
+
+def test_can_reflink_probes_once_without_leftovers(sanitized_save_copy):
+    first = can_reflink(sanitized_save_copy)
+
+    assert can_reflink(sanitized_save_copy) is first
+    assert _leftovers(sanitized_save_copy.parent) == []
+
+
+def test_journaled_write_patches_extents(sanitized_save_copy):
+    expected = bytearray(sanitized_save_copy.read_bytes())
+    expected[0x400:0x407] = b"JOURNAL"
+
+    journaled_write(sanitized_save_copy, [(0x400, b"JOURNAL")])
+
+    assert sanitized_save_copy.read_bytes() == expected
+    assert _leftovers(sanitized_save_copy.parent) == []
+
+
+def _journal_for(target, extents) -> None:
+    data = target.read_bytes()
+    stat = target.stat()
+    write_journal(
+        journal_path(target),
+        stat.st_size,
+        stat.st_mtime_ns,
+        [
+            (offset, data[offset : offset + len(chunk)], chunk)
+            for offset, chunk in extents
+        ],
+    )
+
+
+def test_replay_journal_applies_and_discards(sanitized_save_copy):
+    size = sanitized_save_copy.stat().st_size
+    old = sanitized_save_copy.read_bytes()[0x400:0x407]
+    journal = journal_path(sanitized_save_copy)
+    _journal_for(sanitized_save_copy, [(0x400, b"JOURNAL")])
+    assert read_journal(journal)[::2] == (size, [(0x400, old, b"JOURNAL")])
+
+    assert replay_journal(sanitized_save_copy) is True
+    assert sanitized_save_copy.read_bytes()[0x400:0x407] == b"JOURNAL"
+    assert not journal.exists()
+
+
+def test_replay_journal_skips_a_save_it_was_not_written_against(
+    sanitized_save_copy,
+):
+    _journal_for(sanitized_save_copy, [(0x400, b"JOURNAL")])
+    newer = bytearray(sanitized_save_copy.read_bytes())
+    newer[0x800] ^= 0xFF  # same size, different content
+    sanitized_save_copy.write_bytes(newer)
+
+    assert replay_journal(sanitized_save_copy) is False
+    assert sanitized_save_copy.read_bytes() == newer
+    assert not journal_path(sanitized_save_copy).exists()
+
+
+def test_replay_journal_skips_a_save_whose_extents_changed(sanitized_save_copy):
+    _journal_for(sanitized_save_copy, [(0x400, b"JOURNAL")])
+    st = sanitized_save_copy.stat()
+    newer = bytearray(sanitized_save_copy.read_bytes())
+    newer[0x402] ^= 0xFF
+    sanitized_save_copy.write_bytes(newer)
+    os.utime(sanitized_save_copy, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert replay_journal(sanitized_save_copy) is False
+    assert sanitized_save_copy.read_bytes() == newer
+
+
+def test_load_replays_leftover_journal(sanitized_save_copy):
+    _journal_for(sanitized_save_copy, [(0x400, b"JOURNAL")])
+
+    save = load_save(str(sanitized_save_copy))
+
+    assert bytes(save._raw_data[0x400:0x407]) == b"JOURNAL"
+    assert not journal_path(sanitized_save_copy).exists()
+
+
+def test_replay_journal_ignores_torn_journal(sanitized_save_copy):
+    original = sanitized_save_copy.read_bytes()
+    journal = journal_path(sanitized_save_copy)
+    _journal_for(sanitized_save_copy, [(0x400, b"JOURNAL")])
+    journal.write_bytes(journal.read_bytes()[:-3])
+
+    assert replay_journal(sanitized_save_copy) is False
+    assert sanitized_save_copy.read_bytes() == original
+    assert not journal.exists()